@@ -57,6 +57,8 @@ export class WebhookFormComponent implements OnInit {
             url: ['', [Validators.required, Validators.pattern(/^https?:\/\/[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(\/.*)?$/)]],
             event_types: [[], Validators.required],
             active: [true],
+            batch_size: [1, [Validators.required, Validators.min(1)]],
+            batch_window: [0, [Validators.required, Validators.min(0)]],
         });
     }
 
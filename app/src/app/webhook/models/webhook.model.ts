@@ -21,6 +21,8 @@ export interface Webhook {
     url: string;
     event_types: string[];
     active: boolean;
+    batch_size?: number;
+    batch_window?: number;
 }
 
 export interface WebhookCreate {
@@ -28,6 +30,8 @@ export interface WebhookCreate {
     url: string;
     event_types: string[];
     active: boolean;
+    batch_size?: number;
+    batch_window?: number;
 }
 
 export interface WebhookUpdate extends WebhookCreate {
@@ -0,0 +1,159 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Command line interface of the benchmarks
+
+Example:
+    python -m benchmarks --objects 50000 --output results.json
+    python -m benchmarks --objects 50000 --output results.json --baseline baseline.json --threshold 0.2
+"""
+import sys
+import json
+import logging
+import platform
+import subprocess
+from datetime import datetime, timezone
+from argparse import ArgumentParser, Namespace
+
+from cmdb.framework.data_generator.data_generator import DataGenerator
+
+from benchmarks.benchmark_cases import build_cases
+from benchmarks.benchmark_environment import BenchmarkEnvironment
+from benchmarks.benchmark_runner import BenchmarkRunner, compare_results
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def _parse_arguments() -> Namespace:
+    """
+    Parses the command line arguments
+
+    Returns:
+        Namespace: The parsed arguments
+    """
+    parser = ArgumentParser(prog='python -m benchmarks', description='Benchmarks of the DataGerry hot paths')
+
+    parser.add_argument('--mongodb-host', default='localhost', help='host of the MongoDB server')
+    parser.add_argument('--mongodb-port', default=27017, type=int, help='port of the MongoDB server')
+    parser.add_argument('--mongodb-database', default='cmdb-benchmark',
+                        help='benchmark database, it is dropped before and after the run')
+    parser.add_argument('--mongod', default=None, metavar='BINARY',
+                        help='start a temporary mongod with this binary instead of using a running server')
+    parser.add_argument('--objects', default=10000, type=int, help='number of seeded objects')
+    parser.add_argument('--types', default=5, type=int, help='number of seeded types besides the site type')
+    parser.add_argument('--risk-assessments', default=1000, type=int, help='number of seeded risk assessments')
+    parser.add_argument('--repeat', default=10, type=int, help='timed runs per case')
+    parser.add_argument('--warmup', default=2, type=int, help='untimed runs per case')
+    parser.add_argument('--cases', default=None, help='comma separated names of the cases to run, default all')
+    parser.add_argument('--output', default=None, help='write the results as JSON to this file')
+    parser.add_argument('--baseline', default=None, help='compare with the JSON results of a previous run')
+    parser.add_argument('--threshold', default=0.2, type=float,
+                        help='relative slowdown of the median which fails the run, default 0.2')
+    parser.add_argument('--min-delta-ms', default=1.0, type=float,
+                        help='absolute slowdown below which a case never fails the run, default 1.0')
+
+    return parser.parse_args()
+
+
+def _get_commit() -> str:
+    """
+    Retrieves the checked out commit
+
+    Returns:
+        str: The commit hash, None outside of a git repository
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    """
+    Seeds the benchmark database, runs the cases and compares the results with the baseline
+
+    Returns:
+        int: 1 if a case failed or regressed, else 0
+    """
+    args = _parse_arguments()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    # The REST API logs every handled error, the benchmarks report failing cases themselves
+    logging.getLogger('cmdb').setLevel(logging.CRITICAL)
+
+    with BenchmarkEnvironment(args.mongodb_host, args.mongodb_port, args.mongodb_database, args.mongod) as env:
+        seed = DataGenerator(env.dbm, args.mongodb_database).generate(types=args.types,
+                                                                      objects=args.objects,
+                                                                      risk_assessments=args.risk_assessments)
+        cases = build_cases(env, seed)
+
+        if args.cases:
+            selected = args.cases.split(',')
+            cases = {name: case for name, case in cases.items() if name in selected}
+
+        results = BenchmarkRunner(args.repeat, args.warmup).run(cases)
+
+    current = {
+        'meta': {
+            'commit': _get_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'objects': args.objects,
+            'types': args.types,
+            'risk_assessments': args.risk_assessments,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(current, output_file, indent=2)
+
+    failed = [name for name, result in results.items() if 'error' in result]
+
+    if not args.baseline:
+        return 1 if failed else 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)
+
+    comparison = compare_results(current, baseline, args.threshold, args.min_delta_ms)
+
+    LOGGER.info("\n%-40s %12s %12s %9s", 'case', 'baseline ms', 'current ms', 'change')
+
+    for entry in comparison:
+        LOGGER.info("%-40s %12.2f %12.2f %+8.1f%%%s",
+                    entry['name'],
+                    entry['baseline_ms'],
+                    entry['current_ms'],
+                    entry['change'] * 100,
+                    '  REGRESSION' if entry['regression'] else '')
+
+    regressions = [entry['name'] for entry in comparison if entry['regression']]
+
+    if regressions or failed:
+        LOGGER.error("\nRegressed: %s, failed: %s", ', '.join(regressions) or '-', ', '.join(failed) or '-')
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
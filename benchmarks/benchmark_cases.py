@@ -0,0 +1,196 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+The benchmark cases of the DataGerry hot paths
+"""
+import io
+import json
+import logging
+from typing import Callable, Optional
+from urllib.parse import quote
+
+from cmdb.manager import ObjectsManager
+from cmdb.manager.query_builder.builder_parameters import BuilderParameters
+from cmdb.models.object_model import CmdbObject
+from cmdb.models.log_model.cmdb_object_log import CmdbObjectLog
+from cmdb.security.acl.permission import AccessControlPermission
+from cmdb.security.token.validator import TokenValidator
+
+from benchmarks.benchmark_environment import BenchmarkEnvironment
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ('CsvExportFormat', 'JsonExportFormat', 'XlsxExportFormat', 'XmlExportFormat')
+
+ISMS_REPORTS = ('risk_matrix', 'risk_treatment_plan', 'soa', 'risk_assessments')
+
+# Objects per page of the list, export and import cases
+PAGE_SIZE = 100
+
+# Description of the objects imported by the CSV import case, identifies them for the cleanup
+IMPORTED_DESCRIPTION = 'imported by benchmark'
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def build_cases(env: BenchmarkEnvironment, seed: dict) -> dict[str, Callable[[], Optional[Callable[[], None]]]]:
+    """
+    Creates the benchmark cases for a seeded database
+
+    Args:
+        env (BenchmarkEnvironment): The started environment
+        seed (dict): The public_ids returned by DataGenerator.generate()
+
+    Returns:
+        dict[str, Callable[[], Optional[Callable[[], None]]]]: The cases by their name, every case raises an
+                                                               exception if it failed and returns its cleanup
+                                                               function if it changed the database
+    """
+    # The DataGenerator activates the ACL of every second type
+    acl_type_id = seed['type_ids'][1] if len(seed['type_ids']) > 1 else seed['type_ids'][0]
+    site_id = seed['object_ids'][seed['site_type_id']][0]
+    type_filter = quote(json.dumps({'type_id': acl_type_id}))
+
+    cases = {
+        'objects_iterate_acl': lambda: _iterate_objects(env, acl_type_id),
+        'objects_render_list': _get(env, f"/objects/?filter={type_filter}&limit={PAGE_SIZE}&view=render"),
+        'quick_search_count': _get(env, "/search/quick/count/?searchValue=gen_type_1%201"),
+        'object_references': _get(env, f"/objects/references/{site_id}?limit={PAGE_SIZE}"),
+        'csv_import': lambda: _import_csv(env, acl_type_id, site_id),
+        'location_tree': _get(env, "/locations/tree"),
+        'auth_token_validation': lambda: _validate_token(env),
+    }
+
+    for export_format in EXPORT_FORMATS:
+        cases[f"export_{export_format[:-len('ExportFormat')].lower()}"] = _get(
+            env,
+            f"/exporter/?filter={type_filter}&classname={export_format}&limit={PAGE_SIZE}"
+        )
+
+    cases['export_zip'] = _get(env, f"/exporter/?filter={type_filter}&classname=JsonExportFormat&zip=true")
+
+    for report in ISMS_REPORTS:
+        cases[f"isms_report_{report}"] = _get(env, f"/isms/reports/{report}")
+
+    return cases
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def _get(env: BenchmarkEnvironment, url: str) -> Callable[[], None]:
+    """
+    Creates a case which requests a REST API route
+
+    Args:
+        env (BenchmarkEnvironment): The started environment
+        url (str): The route relative to the REST API
+
+    Returns:
+        Callable[[], None]: The case
+    """
+    def case() -> None:
+        response = env.client.get(url)
+
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {url} returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+
+    return case
+
+
+def _iterate_objects(env: BenchmarkEnvironment, type_id: int) -> None:
+    """
+    Iterates a page of objects of a type with an activated ACL directly with the ObjectsManager
+
+    Args:
+        env (BenchmarkEnvironment): The started environment
+        type_id (int): public_id of the type
+    """
+    ObjectsManager(env.dbm).iterate(
+        BuilderParameters({'type_id': type_id}, limit=PAGE_SIZE),
+        env.admin_user,
+        AccessControlPermission.READ
+    )
+
+
+def _import_csv(env: BenchmarkEnvironment, type_id: int, site_id: int) -> Callable[[], None]:
+    """
+    Imports a page of objects from a CSV file through the REST API
+
+    Args:
+        env (BenchmarkEnvironment): The started environment
+        type_id (int): public_id of the type of the imported objects
+        site_id (int): public_id of the site referenced by the imported objects
+
+    Returns:
+        Callable[[], None]: Removes the imported objects, so every run imports into the seeded database
+    """
+    rows = ['name,description,cost,site']
+    rows.extend(f"imported {index},{IMPORTED_DESCRIPTION},{index},{site_id}" for index in range(PAGE_SIZE))
+
+    mapping = [
+        {'name': name, 'value': index, 'type': 'field'}
+        for index, name in enumerate(('name', 'description', 'cost', 'site'))
+    ]
+
+    response = env.client.post(
+        '/import/object/',
+        data={
+            'file': (io.BytesIO('\n'.join(rows).encode('utf-8')), 'benchmark.csv'),
+            'file_format': 'csv',
+            'parser_config': json.dumps({'delimiter': ',', 'newline': '', 'quoteChar': '"', 'escapeChar': None,
+                                       'header': True}),
+            'importer_config': json.dumps({'type_id': type_id, 'mapping': mapping}),
+        },
+        content_type='multipart/form-data'
+    )
+
+    if response.status_code != 200:
+        raise RuntimeError(f"CSV import returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+
+    return lambda: _remove_imported_objects(env, type_id)
+
+
+def _remove_imported_objects(env: BenchmarkEnvironment, type_id: int) -> None:
+    """
+    Deletes the objects imported by the CSV import case together with their creation logs
+
+    Args:
+        env (BenchmarkEnvironment): The started environment
+        type_id (int): public_id of the type of the imported objects
+    """
+    imported_objects = env.dbm.find(
+        CmdbObject.COLLECTION,
+        env.database_name,
+        filter={
+            'type_id': type_id,
+            'fields': {'$elemMatch': {'name': 'description', 'value': IMPORTED_DESCRIPTION}},
+        },
+        projection={'_id': 0, 'public_id': 1}
+    )
+    public_ids = [imported_object['public_id'] for imported_object in imported_objects]
+
+    env.dbm.delete_many(CmdbObject.COLLECTION, env.database_name, public_id={'$in': public_ids})
+    env.dbm.delete_many(CmdbObjectLog.COLLECTION, env.database_name, object_id={'$in': public_ids})
+
+
+def _validate_token(env: BenchmarkEnvironment) -> None:
+    """
+    Decodes and validates the token of the admin user like every authorized request does
+
+    Args:
+        env (BenchmarkEnvironment): The started environment
+    """
+    validator = TokenValidator(env.dbm)
+    validator.validate_token(validator.decode_token(env.token))
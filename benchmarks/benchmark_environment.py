@@ -0,0 +1,175 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the BenchmarkEnvironment which provides the database and the REST API for the benchmarks
+"""
+import time
+import shutil
+import logging
+import tempfile
+import subprocess
+from typing import Optional
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+import cmdb
+from cmdb.database import MongoDatabaseManager
+from cmdb.database.database_services import CollectionValidator
+from cmdb.manager import UsersManager
+from cmdb.manager.system_manager.system_config_reader import SystemConfigReader
+from cmdb.models.user_model import CmdbUser
+from cmdb.security.token.generator import TokenGenerator
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                             BenchmarkEnvironment - CLASS                                             #
+# -------------------------------------------------------------------------------------------------------------------- #
+class BenchmarkEnvironment:
+    """
+    Connects to a MongoDB server, or starts a temporary mongod, and prepares a fresh benchmark database with the
+    same setup routine as a new DataGerry installation. The REST API is called in-process with the Flask test
+    client, so the benchmarks measure DataGerry and not the network
+    """
+    def __init__(self, host: str, port: int, database_name: str, mongod_binary: Optional[str] = None):
+        """
+        Initializes the BenchmarkEnvironment
+
+        Args:
+            host (str): Host of the MongoDB server
+            port (int): Port of the MongoDB server, also used for the temporary mongod
+            database_name (str): Name of the benchmark database, it is dropped before and after the benchmarks
+            mongod_binary (Optional[str], optional): Path of a mongod binary, if set a temporary mongod with an
+                                                     own data directory is started. Defaults to None
+        """
+        self.host = host
+        self.port = port
+        self.database_name = database_name
+        self.mongod_binary = mongod_binary
+
+        self.dbm: MongoDatabaseManager = None
+        self.client = None
+        self.admin_user: CmdbUser = None
+        self.token: str = None
+
+        self.__mongod: subprocess.Popen = None
+        self.__data_directory: str = None
+
+
+    def __enter__(self) -> "BenchmarkEnvironment":
+        self.start()
+        return self
+
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+    def start(self) -> None:
+        """
+        Starts the mongod if requested, prepares the database and creates the REST API with an authorized client
+        """
+        if self.mongod_binary:
+            self.__start_mongod()
+
+        self.__wait_for_mongodb()
+
+        # Without a config file the Database section is set manually, the optional sections keep their defaults
+        config = SystemConfigReader(None, None)
+        config.add_section('Database')
+        config.set('Database', 'host', self.host)
+        config.set('Database', 'port', str(self.port))
+        config.set('Database', 'database_name', self.database_name)
+
+        self.dbm = MongoDatabaseManager(self.host, self.port, self.database_name)
+
+        if self.dbm.check_database_exists(self.database_name):
+            self.dbm.drop_database(self.database_name)
+
+        CollectionValidator(self.database_name, self.dbm, local_mode=True).validate_collections()
+
+        self.admin_user = UsersManager(self.dbm).get_user(1)
+        self.token = TokenGenerator(self.dbm).generate_token(payload={'user': {
+            'public_id': self.admin_user.public_id
+        }}).decode('UTF-8')
+
+        # The setup routine already ran, TESTING skips it when the app is created
+        cmdb.__MODE__ = 'TESTING'
+
+        #pylint: disable=import-outside-toplevel
+        from cmdb.interface.rest_api.init_rest_api import create_rest_api
+
+        app = create_rest_api(self.dbm)
+        self.client = app.test_client()
+        self.client.environ_base['HTTP_AUTHORIZATION'] = f'Bearer {self.token}'
+
+
+    def stop(self) -> None:
+        """
+        Drops the benchmark database and stops the temporary mongod
+        """
+        try:
+            if self.dbm:
+                self.dbm.drop_database(self.database_name)
+                self.dbm.connector.disconnect()
+        except Exception as err:
+            LOGGER.warning("Failed to drop the benchmark database: %s", err)
+
+        if self.__mongod:
+            self.__mongod.terminate()
+            self.__mongod.wait(timeout=30)
+            shutil.rmtree(self.__data_directory, ignore_errors=True)
+
+
+    def __start_mongod(self) -> None:
+        """
+        Starts a mongod which only listens on localhost and keeps its data in a temporary directory
+        """
+        self.__data_directory = tempfile.mkdtemp(prefix='datagerry_benchmark_')
+        self.host = '127.0.0.1'
+
+        LOGGER.info("Starting mongod on port %s with data directory %s", self.port, self.__data_directory)
+
+        self.__mongod = subprocess.Popen(
+            [self.mongod_binary, '--dbpath', self.__data_directory, '--port', str(self.port),
+             '--bind_ip', self.host, '--quiet'],
+            stdout=subprocess.DEVNULL,
+        )
+
+
+    def __wait_for_mongodb(self, timeout: float = 30.0) -> None:
+        """
+        Waits until the MongoDB server answers
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to 30.0
+
+        Raises:
+            ConnectionError: If the MongoDB server did not answer in time
+        """
+        deadline = time.monotonic() + timeout
+
+        with MongoClient(self.host, self.port, serverSelectionTimeoutMS=500) as client:
+            while True:
+                try:
+                    client.admin.command('ping')
+                    return
+                except PyMongoError as err:
+                    if time.monotonic() > deadline:
+                        raise ConnectionError(f"MongoDB at {self.host}:{self.port} is not reachable: {err}") from err
+
+                    time.sleep(0.5)
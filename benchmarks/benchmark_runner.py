@@ -0,0 +1,155 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the BenchmarkRunner which times benchmark cases and compares results across commits
+"""
+import gc
+import time
+import logging
+import statistics
+from typing import Callable, Optional
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                BenchmarkRunner - CLASS                                               #
+# -------------------------------------------------------------------------------------------------------------------- #
+class BenchmarkRunner:
+    """
+    Runs every benchmark case 'warmup' times untimed and 'repeat' times timed. The median is compared across commits,
+    because single outliers of a shared machine do not move it
+
+    A case which changes the database returns a cleanup function, it is called untimed after every run so that all
+    runs work on the same data
+    """
+    def __init__(self, repeat: int = 10, warmup: int = 2):
+        """
+        Initializes the BenchmarkRunner
+
+        Args:
+            repeat (int, optional): Timed runs per case. Defaults to 10
+            warmup (int, optional): Untimed runs per case to fill caches and connection pools. Defaults to 2
+        """
+        self.repeat = repeat
+        self.warmup = warmup
+
+
+    def run(self, cases: dict[str, Callable[[], Optional[Callable[[], None]]]]) -> dict[str, dict]:
+        """
+        Times all cases, a failing case is reported with its error instead of timings
+
+        Args:
+            cases (dict[str, Callable[[], Optional[Callable[[], None]]]]): The cases by their name
+
+        Returns:
+            dict[str, dict]: The timings in milliseconds of every case
+        """
+        results = {}
+
+        for name, case in cases.items():
+            try:
+                results[name] = self.run_case(case)
+                LOGGER.info("%-40s median %10.2f ms", name, results[name]['median_ms'])
+            except Exception as err:
+                LOGGER.error("%-40s failed: %s", name, err)
+                results[name] = {'error': str(err)}
+
+        return results
+
+
+    def run_case(self, case: Callable[[], Optional[Callable[[], None]]]) -> dict:
+        """
+        Times a single case. The garbage collector is disabled during a run, so that collections triggered by the
+        previous run do not count for this one
+
+        Args:
+            case (Callable[[], Optional[Callable[[], None]]]): The case, raises an exception if it failed and returns
+                                                              its cleanup function if it changed the database
+
+        Returns:
+            dict: Minimum, median, mean, 95th percentile and standard deviation in milliseconds
+        """
+        for _ in range(self.warmup):
+            cleanup = case()
+
+            if cleanup:
+                cleanup()
+
+        durations = []
+
+        for _ in range(self.repeat):
+            gc.collect()
+            gc.disable()
+
+            try:
+                start = time.perf_counter()
+                cleanup = case()
+                durations.append((time.perf_counter() - start) * 1000)
+            finally:
+                gc.enable()
+
+            if cleanup:
+                cleanup()
+
+        durations.sort()
+
+        return {
+            'runs': len(durations),
+            'min_ms': round(durations[0], 3),
+            'median_ms': round(statistics.median(durations), 3),
+            'mean_ms': round(statistics.fmean(durations), 3),
+            'p95_ms': round(durations[min(len(durations) - 1, int(len(durations) * 0.95))], 3),
+            'stdev_ms': round(statistics.stdev(durations), 3) if len(durations) > 1 else 0.0,
+        }
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def compare_results(current: dict, baseline: dict, threshold: float, min_delta_ms: float) -> list[dict]:
+    """
+    Compares the medians of two benchmark results
+
+    Args:
+        current (dict): The results of this run
+        baseline (dict): The results of the baseline run
+        threshold (float): Relative slowdown of the median which counts as regression, e.g. 0.2 for 20%
+        min_delta_ms (float): Absolute slowdown below which a case never counts as regression, because
+                              the relative change of very fast cases is dominated by noise
+
+    Returns:
+        list[dict]: Name, baseline median, current median, relative change and regression flag of every case
+                    which exists in both results
+    """
+    comparison = []
+
+    for name, result in current['results'].items():
+        baseline_result = baseline['results'].get(name)
+
+        if not baseline_result or 'error' in result or 'error' in baseline_result:
+            continue
+
+        before, after = baseline_result['median_ms'], result['median_ms']
+        change = (after - before) / before if before else 0.0
+
+        comparison.append({
+            'name': name,
+            'baseline_ms': before,
+            'current_ms': after,
+            'change': round(change, 4),
+            'regression': change > threshold and after - before > min_delta_ms,
+        })
+
+    return comparison
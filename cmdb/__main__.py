@@ -28,6 +28,7 @@
 from cmdb import __title__
 
 from cmdb.utils.logger import get_logging_conf
+from cmdb.utils.startup_profiler import profile_startup
 from cmdb.manager.system_manager.system_config_reader import SystemConfigReader
 from cmdb.process_management.process_manager import ProcessManager
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -49,6 +50,10 @@ def main(args: Namespace):
     """
     try:
         # dbm = None
+        if args.profile_startup:
+            profile_startup()
+            return
+
         LOGGER.info("Starting DataGerry...")
 
         __activate_debug_mode(args)
@@ -113,6 +118,14 @@ def build_arg_parser() -> Namespace:
         help="starting cmdb core system - enables services"
     )
 
+    _parser.add_argument(
+        '--profile-startup',
+        action='store_true',
+        default=False,
+        dest='profile_startup',
+        help="report the import time per module needed to start DataGerry"
+    )
+
     _parser.add_argument(
         '-c',
         '--config',
@@ -0,0 +1,241 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the CircuitBreaker which rejects database operations while MongoDB is unavailable
+"""
+import time
+import logging
+import threading
+from typing import Any, Callable, Optional
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pymongo.errors import ConnectionFailure
+
+from cmdb.utils.configurable import Configurable
+
+from cmdb.errors.database import DatabaseUnavailableError
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                CircuitBreaker - CLASS                                                #
+# -------------------------------------------------------------------------------------------------------------------- #
+class CircuitBreaker(Configurable):
+    """
+    Rejects the database operations of a MongoDatabaseManager while MongoDB is unavailable
+
+    The breaker opens after 'failure_threshold' consecutive connection failures. While it is open, operations fail
+    immediately with a DatabaseUnavailableError instead of blocking the worker with retries, and a background thread
+    pings MongoDB every 'probe_interval' seconds. The first successful ping closes the breaker again
+
+    The options are set with configure(), which receives the options of the optional [CircuitBreaker] section of
+    the config file, and are shared by the breakers of all MongoDatabaseManagers of the process
+
+    The 'max_retry_time' is shared by all operations of a request, which starts with begin_request(). Operations
+    outside of a request (setup, CLI, background threads) get the whole 'max_retry_time' each
+    """
+    CONFIG_SECTION = 'CircuitBreaker'
+
+    DEFAULT_OPTIONS = {
+        'active': True,
+        'failure_threshold': 5,
+        'probe_interval': 2.0,
+        'max_retry_time': 5.0,
+    }
+
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+
+    # Time (time.monotonic()) after which the operations of the current request are not retried anymore
+    __retry_deadline: ContextVar[Optional[float]] = ContextVar('circuit_breaker_retry_deadline', default=None)
+
+
+    def __init__(self, probe: Callable[[], Any]):
+        """
+        Initializes a closed CircuitBreaker
+
+        Args:
+            probe (Callable[[], Any]): Checks if MongoDB is available again, raises an exception if not
+        """
+        self.__probe = probe
+        self.__lock = threading.Lock()
+
+        self.state: str = self.CLOSED
+        self.failures: int = 0
+        self.rejected: int = 0
+        self.opened_at: Optional[datetime] = None
+
+
+    @classmethod
+    def get_max_retry_time(cls) -> float:
+        """
+        Retrieves the maximum time a request may spend waiting between the retries of its database operations
+
+        Returns:
+            float: The maximum retry time in seconds
+        """
+        return cls._options['max_retry_time']
+
+
+    @classmethod
+    def begin_request(cls) -> None:
+        """
+        Starts the retry time of a request, which is shared by all its database operations
+        """
+        cls.__retry_deadline.set(time.monotonic() + cls.get_max_retry_time())
+
+
+    @classmethod
+    def get_retry_deadline(cls) -> float:
+        """
+        Retrieves the time after which a database operation is not retried anymore
+
+        Returns:
+            float: The deadline of the current request or, outside of requests, the deadline of an operation which
+                   starts now (as time.monotonic())
+        """
+        deadline = cls.__retry_deadline.get()
+
+        return deadline if deadline is not None else time.monotonic() + cls.get_max_retry_time()
+
+
+    @staticmethod
+    def is_connection_error(error: BaseException) -> bool:
+        """
+        Checks if an error or one of the errors it was raised from is a failed connection to MongoDB. The database
+        layer usually wraps the errors of PyMongo in its own errors
+
+        Args:
+            error (BaseException): The raised error
+
+        Returns:
+            bool: True if the error was caused by a failed connection
+        """
+        seen = set()
+
+        while error is not None and id(error) not in seen:
+            if isinstance(error, ConnectionFailure):
+                return True
+
+            seen.add(id(error))
+            error = error.__cause__ or error.__context__
+
+        return False
+
+
+    def is_open(self) -> bool:
+        """
+        Checks if the breaker currently rejects operations
+
+        Returns:
+            bool: True if the breaker is open
+        """
+        return self.state == self.OPEN
+
+
+    def allow(self) -> None:
+        """
+        Checks if an operation may be executed
+
+        Raises:
+            DatabaseUnavailableError: If the breaker is open
+        """
+        if self.state == self.OPEN:
+            with self.__lock:
+                self.rejected += 1
+
+            raise DatabaseUnavailableError(
+                f"MongoDB is unavailable since {self.opened_at.isoformat()}, the operation was rejected"
+            )
+
+
+    def record_success(self) -> None:
+        """
+        Resets the consecutive failures after a successful operation
+        """
+        if self.failures:
+            with self.__lock:
+                self.failures = 0
+
+
+    def record_failure(self) -> None:
+        """
+        Counts a connection failure and opens the breaker once the threshold is reached
+        """
+        with self.__lock:
+            self.failures += 1
+
+            if self.state == self.OPEN or self.failures < self._options['failure_threshold']:
+                return
+
+            self.state = self.OPEN
+            self.opened_at = datetime.now(timezone.utc)
+
+        LOGGER.error("Circuit breaker opened after %s connection failures, database operations are rejected",
+                     self.failures)
+
+        threading.Thread(target=self.__probe_until_available, name='circuit-breaker-probe', daemon=True).start()
+
+
+    def reset(self) -> None:
+        """
+        Closes the breaker, used in a forked worker whose probe thread was not copied from the parent process
+        """
+        self.__lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+
+    def get_state(self) -> dict:
+        """
+        Retrieves the current state of the breaker
+
+        Returns:
+            dict: The state, the consecutive failures, the time the breaker was last opened and the number of
+                  rejected operations
+        """
+        return {
+            'active': self.is_active(),
+            'state': self.state,
+            'failures': self.failures,
+            'opened_at': self.opened_at.isoformat() if self.opened_at else None,
+            'rejected': self.rejected,
+        }
+
+
+    def __probe_until_available(self) -> None:
+        """
+        Pings MongoDB until it answers and closes the breaker
+        """
+        opened_at = self.opened_at
+
+        while self.state == self.OPEN:
+            time.sleep(self._options['probe_interval'])
+
+            try:
+                self.__probe()
+            except Exception as err:
+                LOGGER.debug("[__probe_until_available] MongoDB is still unavailable: %s", err)
+                continue
+
+            with self.__lock:
+                self.state = self.CLOSED
+                self.failures = 0
+
+            LOGGER.info("Circuit breaker closed, MongoDB is available again after %.1fs",
+                        (datetime.now(timezone.utc) - opened_at).total_seconds())
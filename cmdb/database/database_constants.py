@@ -19,4 +19,6 @@
 # -------------------------------------------------------------------------------------------------------------------- #
 
 PUBLIC_ID_COUNTER_COLLECTION = "datastorage.counter"
+COLLECTION_GENERATION_COLLECTION = "datastorage.generation"
+SLOW_QUERY_COLLECTION = "datastorage.slow_queries"
 MIN_CLOUD_UPDATER_VERSION = 20240603
@@ -53,6 +53,7 @@
 )
 
 from cmdb.framework.constants import __COLLECTIONS__ as FRAMEWORK_CLASSES
+from cmdb.framework.media_library.media_file_blob import MediaFileBlob
 from cmdb.framework.section_templates.section_template_creator import SectionTemplateCreator
 
 from cmdb.security.key.generator import KeyGenerator
@@ -109,6 +110,7 @@ def validate_collections(self) -> None:
             self.init_database()
             self.init_framework_collections()
             self.init_management_collections()
+            self.init_media_library_collections()
         except Exception as err:
             LOGGER.error("[validate_collections] Exception: %s. Type: %s.", err, type(err), exc_info=True)
             raise CollectionValidationError(err) from err
@@ -228,6 +230,30 @@ def init_management_collections(self) -> None:
         except Exception as err:
             LOGGER.error("[init_management_collections] Exception: %s. Type: %s.", err, type(err), exc_info=True)
             raise CollectionInitError(err) from err
+
+
+    def init_media_library_collections(self) -> None:
+        """
+        Checks if the collections of the deduplicated MediaFile blobs exist, else initialises them with their indexes
+
+        Raises:
+            CollectionInitError: If the initialisation of a collection failed
+        """
+        try:
+            all_collections = self.get_all_db_collections(self.db_name)
+
+            blob_collections = {
+                f'{MediaFileBlob.COLLECTION}.files': MediaFileBlob.get_index_keys(),
+                f'{MediaFileBlob.COLLECTION}.chunks': MediaFileBlob.get_chunk_index_keys(),
+            }
+
+            for collection, index_keys in blob_collections.items():
+                if collection not in all_collections:
+                    self.dbm.create_collection(collection, self.db_name)
+                    self.dbm.create_indexes(collection, self.db_name, index_keys)
+        except Exception as err:
+            LOGGER.error("[init_media_library_collections] Exception: %s. Type: %s.", err, type(err), exc_info=True)
+            raise CollectionInitError(err) from err
 # -------------------------------------------------- HELEPER METHODS ------------------------------------------------- #
 
     def get_all_db_collections(self, db_name: str) -> list[str]:
@@ -41,6 +41,10 @@ class DatabaseUpdater:
         20200513,
         20240603,
         20250619,
+        20261019,
+        20261020,
+        20261021,
+        20261022,
     ]
 
 
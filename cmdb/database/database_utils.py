@@ -23,6 +23,7 @@
 import time
 import datetime
 import random
+from contextvars import ContextVar
 from functools import wraps
 from bson.dbref import DBRef
 from bson.max_key import MaxKey
@@ -31,9 +32,17 @@
 from bson.timestamp import Timestamp
 from bson.tz_util import utc
 
-from pymongo.errors import PyMongoError, ServerSelectionTimeoutError, NetworkTimeout, ConnectionFailure
+from pymongo.errors import (
+    PyMongoError,
+    ServerSelectionTimeoutError,
+    NetworkTimeout,
+    ConnectionFailure,
+    ExecutionTimeout,
+)
 from azure.core.exceptions import HttpResponseError
 
+from cmdb.database.circuit_breaker import CircuitBreaker
+
 # from cmdb.framework.docapi.docapi_template.docapi_template_base import TemplateManagementBase
 # from cmdb.framework.rendering.render_result import RenderResult
 # from cmdb.framework.media_library.base_media_file import BaseMediaFile
@@ -186,56 +195,96 @@ def default(obj):
     419: "Conflict",
 }
 
+# Number of retry_operation wrappers the current call is running in, decorated methods call each other
+_RETRY_DEPTH: ContextVar[int] = ContextVar('retry_operation_depth', default=0)
+
 def retry_operation(func):
     """
     Decorator to retry database operations with exponential backoff in case of recoverable errors.
     Also catches Cosmos DB-specific error codes and implements retries with exponential backoff.
+
+    If the decorated object has a CircuitBreaker, its operations are rejected immediately while the breaker is open
+    and connection failures are reported to the breaker. The retries stop early once the next delay would exceed the
+    'max_retry_time' of the CircuitBreaker (shared by all operations of a request) or the breaker was opened in the
+    meantime, so a failover does not keep every worker sleeping
+
+    A failure is only reported to the breaker by the outermost decorated call. Decorated methods which call other
+    decorated methods (e.g. insert() calling get_next_public_id()) would otherwise count the same failure once per
+    nesting level
     """
     @wraps(func)
     def wrapper(self, *args, **kwargs):
         retries = 0
         retry_delay = INITIAL_RETRY_DELAY  # Initial delay in seconds
+        breaker: CircuitBreaker = getattr(self, 'circuit_breaker', None) if CircuitBreaker.is_active() else None
+        deadline = CircuitBreaker.get_retry_deadline()
+        is_outermost = _RETRY_DEPTH.get() == 0
+
+        def record_failure(err: Exception) -> None:
+            if breaker and is_outermost and CircuitBreaker.is_connection_error(err):
+                breaker.record_failure()
+
+        def wait_before_retry(reason: str) -> bool:
+            """Sleeps before the next attempt, returns False if the operation should not be retried anymore"""
+            nonlocal retries, retry_delay
+
+            retries += 1
+            # Exponential backoff with some random jitter to prevent thundering herd problem
+            backoff_delay = retry_delay + random.uniform(0, 1)
+
+            if retries >= MAX_RETRIES:
+                LOGGER.error(f"All {MAX_RETRIES} attempts failed for {func.__name__}: {reason}")
+                return False
+
+            if time.monotonic() + backoff_delay > deadline or (breaker and breaker.is_open()):
+                LOGGER.error(f"Attempt {retries} failed for {func.__name__}: {reason}. No retry, the retry time "
+                             f"is exhausted or the database is unavailable")
+                return False
+
+            LOGGER.warning(
+                f"Attempt {retries} failed for {func.__name__}: {reason}. Retrying in {backoff_delay:.2f}s..."
+            )
+            time.sleep(backoff_delay)
+            retry_delay *= 2  # Exponentially increase the delay
+
+            return True
+
+        while True:
+            if breaker:
+                breaker.allow()
+
+            depth_token = _RETRY_DEPTH.set(_RETRY_DEPTH.get() + 1)
 
-        while retries < MAX_RETRIES:
             try:
-                return func(self, *args, **kwargs)
-            except (PyMongoError, ServerSelectionTimeoutError, NetworkTimeout, ConnectionFailure) as e:
+                result = func(self, *args, **kwargs)
+            except ExecutionTimeout:
+                # The operation exceeded its QueryBudget, a retry would only exceed it again
+                raise
+            except (PyMongoError, ServerSelectionTimeoutError, NetworkTimeout, ConnectionFailure) as err:
                 # Handle MongoDB-specific exceptions
-                retries += 1
-                if retries < MAX_RETRIES:
-                    # Exponential backoff with some random jitter
-                    backoff_delay = retry_delay + random.uniform(0, 1)  # Add jitter to prevent thundering herd problem
-                    LOGGER.warning(
-                        f"Attempt {retries} failed for {func.__name__}: {str(e)}. Retrying in {backoff_delay:.2f}s..."
-                    )
-                    time.sleep(backoff_delay)
-                    retry_delay *= 2  # Exponentially increase the delay
-                else:
-                    LOGGER.error(f"All {MAX_RETRIES} attempts failed for {func.__name__}: {str(e)}")
+                record_failure(err)
+
+                if not wait_before_retry(str(err)):
                     raise
-            except HttpResponseError as e:
-                # Handle Cosmos DB specific error codes
-                if e.status_code in COSMOS_DB_ERROR_CODES:
-                    retries += 1
-                    error_message = COSMOS_DB_ERROR_CODES[e.status_code]
-                    backoff_delay = retry_delay + random.uniform(0, 1)  # Add jitter to prevent thundering herd problem
-                    LOGGER.warning(
-                        f"Attempt {retries} failed for {func.__name__} with Cosmos DB error {error_message}:"
-                        f" {e.message}. Retrying in {backoff_delay:.2f}s..."
-                    )
-
-                    if retries < MAX_RETRIES:
-                        time.sleep(backoff_delay)
-                        retry_delay *= 2  # Exponentially increase the delay
-                    else:
-                        LOGGER.error(
-                            f"All {MAX_RETRIES} attempts failed for {func.__name__} with Cosmos DB error {error_message}:"
-                            f" {e.message}"
-                        )
-                        raise
-                else:
+            except HttpResponseError as err:
+                if err.status_code not in COSMOS_DB_ERROR_CODES:
                     # If the error is not recognized, log and raise it
-                    LOGGER.error(f"Unrecognized error for {func.__name__}: {str(e)}")
+                    LOGGER.error(f"Unrecognized error for {func.__name__}: {str(err)}")
+                    raise
+
+                # Handle Cosmos DB specific error codes
+                if not wait_before_retry(f"Cosmos DB error {COSMOS_DB_ERROR_CODES[err.status_code]}: {err.message}"):
                     raise
+            except Exception as err:
+                # e.g. errors of nested decorated operations which were wrapped by the database layer
+                record_failure(err)
+                raise
+            else:
+                if breaker:
+                    breaker.record_success()
+
+                return result
+            finally:
+                _RETRY_DEPTH.reset(depth_token)
 
     return wrapper
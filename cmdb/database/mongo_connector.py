@@ -19,11 +19,15 @@
 """
 import os
 import logging
+from threading import Lock
 from pymongo import MongoClient
 from pymongo.database import Database
 
 from cmdb.database.connection_status import ConnectionStatus
 from cmdb.database.database_utils import retry_operation
+from cmdb.framework.metrics.metrics_collector import MetricsCollector
+from cmdb.framework.metrics.mongo_command_listener import MongoCommandListener
+from cmdb.framework.metrics.request_profiler import RequestProfiler
 
 from cmdb.errors.database import DatabaseConnectionError
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -38,6 +42,7 @@ class MongoConnector:
     MongoConnector is managing the connection to a MongoDB database using PyMongo
     """
     _instance = None # Singleton instance
+    _client_lock = Lock() # Guards the lazy MongoClient creation against concurrent requests of gthread workers
 
 
     # def __new__(cls, host: str, port: int, database_name: str, client_options: dict = None):
@@ -94,17 +99,32 @@ def __init__(self, host: str, port: int, client_options: dict = None):
     @property
     def client(self):
         """
-        Lazy-loads MongoClient to prevent pre-fork initialization issues
+        Lazy-loads MongoClient to prevent pre-fork initialization issues. The MongoClient itself is thread-safe and
+        shared by all threads of a worker
         """
         if self._client is None:
-            try:
-                if self.connection_string:
-                    self._client = MongoClient(self.connection_string, **self.client_options)
-                else:
-                    self._client = MongoClient(host=self.host, port=self.port, connect=False, **self.client_options)
-            except Exception as err:
-                LOGGER.error("Failed to initialize MongoClient. Exception: %s. Type: %s", err, type(err), exc_info=True)
-                raise DatabaseConnectionError("Failed to initialize MongoDB connection.") from err
+            with self._client_lock:
+                if self._client is None:
+                    client_options = dict(self.client_options)
+
+                    if MetricsCollector.is_active() or RequestProfiler.is_active():
+                        client_options['event_listeners'] = [MongoCommandListener()]
+
+                    try:
+                        if self.connection_string:
+                            self._client = MongoClient(self.connection_string, **client_options)
+                        else:
+                            self._client = MongoClient(
+                                host=self.host,
+                                port=self.port,
+                                connect=False,
+                                **client_options
+                            )
+                    except Exception as err:
+                        LOGGER.error(
+                            "Failed to initialize MongoClient. Exception: %s. Type: %s", err, type(err), exc_info=True
+                        )
+                        raise DatabaseConnectionError("Failed to initialize MongoDB connection.") from err
         return self._client
 
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -153,17 +173,29 @@ def disconnect(self) -> ConnectionStatus:
             ConnectionStatus: The status indicating the disconnection result
         """
         try:
-            if self._client:
-                self._client.close()
-                self._client = None
-                # self._database = None
-                return ConnectionStatus(connected=False, message="Successfully disconnected from the database.")
+            with self._client_lock:
+                if self._client:
+                    self._client.close()
+                    self._client = None
+                    # self._database = None
+                    return ConnectionStatus(connected=False, message="Successfully disconnected from the database.")
 
             return ConnectionStatus(connected=False, message="No active database connection to close.")
         except Exception as err:
             return ConnectionStatus(connected=False, message=f"Error while disconnecting: {err}")
 
 
+    def release_after_fork(self) -> None:
+        """
+        Drops the MongoClient inherited from the parent process without closing it, because closing would also end
+        the sessions and sockets the parent process still uses. The next access of 'client' creates a new MongoClient
+        for this process
+        """
+        # The lock could have been held by another thread of the parent process during the fork
+        MongoConnector._client_lock = Lock()
+        self._client = None
+
+
     @retry_operation
     def is_connected(self) -> bool:
         """
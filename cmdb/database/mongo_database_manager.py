@@ -16,19 +16,23 @@
 """
 This module provides the MongoDatabaseManager
 """
+import time
 import logging
 from typing import Union, Any
 from collections.abc import MutableMapping
 from pymongo.database import Database
-from pymongo.errors import CollectionInvalid
-from pymongo import IndexModel
+from pymongo.errors import CollectionInvalid, ExecutionTimeout
+from pymongo import IndexModel, ReturnDocument
 from pymongo.collection import Collection
 from pymongo.cursor import Cursor
 from pymongo.results import DeleteResult, UpdateResult
 
 from cmdb.database.mongo_connector import MongoConnector
-from cmdb.database.database_constants import PUBLIC_ID_COUNTER_COLLECTION
+from cmdb.database.circuit_breaker import CircuitBreaker
+from cmdb.database.database_constants import PUBLIC_ID_COUNTER_COLLECTION, COLLECTION_GENERATION_COLLECTION
 from cmdb.database.database_utils import retry_operation
+from cmdb.database.slow_query_recorder import SlowQueryRecorder
+from cmdb.database.query_budget import QueryBudget
 
 from cmdb.errors.database import (
     CollectionAlreadyExistsError,
@@ -87,6 +91,9 @@ def __init__(self, host: str, port: int, database_name: str, mode: str = 'local'
         # self.connector = MongoConnector(self.host, self.port, self.db_name, self.client_options)
         self.connector = MongoConnector(self.host, self.port, self.client_options)
 
+        # Shared by all requests using this manager, checked by 'retry_operation'
+        self.circuit_breaker = CircuitBreaker(lambda: self.connector.client.admin.command('ping'))
+
 
     @retry_operation
     def reset_connection(self):
@@ -98,6 +105,16 @@ def reset_connection(self):
         self.connector = MongoConnector(self.host, self.port, self.client_options)
 
 
+    def reconnect_after_fork(self) -> None:
+        """
+        Replaces the MongoDB connection inherited from the parent process with a fresh one of this process. Only the
+        MongoConnector and the CircuitBreaker are renewed, everything else built before the fork stays shared
+        copy-on-write
+        """
+        self.connector.release_after_fork()
+        self.circuit_breaker.reset()
+
+
     def __enter__(self):
         """
         Support with-statement for connection management
@@ -635,6 +652,33 @@ def update_public_id_counter(
         except Exception as err:
             raise DocumentUpdateError(f"Failed to update PublicID counter for '{collection}': {err}") from err
 
+
+    def increase_collection_generation(self, collection: str, db_name: str) -> int:
+        """
+        Increments the generation of a collection, which marks a change of its documents for in-memory caches
+        of all processes
+
+        Args:
+            collection (str): Name of the changed collection
+
+        Raises:
+            DocumentUpdateError: If the generation could not be incremented
+
+        Returns:
+            int: The new generation of the collection
+        """
+        try:
+            generation = self.get_collection(COLLECTION_GENERATION_COLLECTION, db_name).find_one_and_update(
+                {'_id': collection},
+                {'$inc': {'generation': 1}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+
+            return generation['generation']
+        except Exception as err:
+            raise DocumentUpdateError(f"Failed to increment the generation of '{collection}': {err}") from err
+
 # ---------------------------------------------------- CRUD - READ --------------------------------------------------- #
 
     @retry_operation
@@ -648,6 +692,7 @@ def find_all(self, collection: str, db_name: str, *args, **kwargs) -> list:
             **kwargs: Keyword arguments for filtering, sorting, etc
 
         Raises:
+            QueryBudgetExceededError: If MongoDB cancelled the find operation because it exceeded its budget
             DocumentGetError: When documents could not be retrieved
 
         Returns:
@@ -657,6 +702,8 @@ def find_all(self, collection: str, db_name: str, *args, **kwargs) -> list:
             found_documents = self.find(collection, db_name, *args, **kwargs)
 
             return list(found_documents)
+        except ExecutionTimeout as err:
+            raise QueryBudget.get_exceeded_error('Find', collection) from err
         except Exception as err:
             LOGGER.debug("[find_all] Can't retrive documents. Error: %s", err)
             raise DocumentGetError(f"Failed to retrieve documents from '{collection}': {err}") from err
@@ -671,7 +718,8 @@ def find(self, collection: str, db_name: str, *args, **kwargs) -> Cursor:
             collection (str): The name of the collection to search in.
             *args: Positional arguments for the find operation (e.g., query filter).
             **kwargs: Keyword arguments for filtering, sorting, limiting, etc.
-                    Automatically adds 'projection' to exclude _id if not provided
+                    Automatically adds 'projection' to exclude _id if not provided and 'max_time_ms' with the
+                    QueryBudget of the current request. The budget is checked while the cursor is iterated
 
         Raises:
             DocumentGetError: When documents could not be retrieved
@@ -683,6 +731,8 @@ def find(self, collection: str, db_name: str, *args, **kwargs) -> Cursor:
             if 'projection' not in kwargs:
                 kwargs.update({'projection': {'_id': 0}})
 
+            QueryBudget.apply(kwargs, 'max_time_ms')
+
             return self.get_collection(collection, db_name).find(*args, **kwargs)
         except Exception as err:
             raise DocumentGetError(f"Failed to retrieve documents from collection '{collection}': {err}") from err
@@ -699,6 +749,7 @@ def find_one_by(self, collection: str, db_name: str, *args, **kwargs) -> dict:
             **kwargs: Keyword arguments for filtering, sorting, limiting, etc
 
         Raises:
+            QueryBudgetExceededError: If MongoDB cancelled the find operation because it exceeded its budget
             DocumentGetError: If the retrieval fails due to an error
 
         Returns:
@@ -710,6 +761,8 @@ def find_one_by(self, collection: str, db_name: str, *args, **kwargs) -> dict:
             result = next(cursor_result, None)
 
             return result  # Return None if no result is found
+        except ExecutionTimeout as err:
+            raise QueryBudget.get_exceeded_error('Find', collection) from err
         except Exception as err:
             raise DocumentGetError(f"Failed to retrieve document from collection '{collection}': {err}") from err
 
@@ -726,6 +779,7 @@ def find_one(self, collection: str, db_name: str, public_id: int, *args, **kwarg
             **kwargs: Additional keyword arguments for the find operation
 
         Raises:
+            QueryBudgetExceededError: If MongoDB cancelled the find operation because it exceeded its budget
             DocumentGetError: If there is an issue retrieving the document
 
         Returns:
@@ -736,6 +790,8 @@ def find_one(self, collection: str, db_name: str, public_id: int, *args, **kwarg
 
             for result in cursor_result.limit(-1):
                 return result
+        except ExecutionTimeout as err:
+            raise QueryBudget.get_exceeded_error('Find', collection) from err
         except Exception as err:
             raise DocumentGetError(
                 f"Failed to retrieve document with public_id {public_id} from collection '{collection}': {err}"
@@ -754,6 +810,7 @@ def count(self, collection: str, db_name: str, *args, criteria: dict = None, **k
             **kwargs: Additional keyword arguments for the count operation
 
         Raises:
+            QueryBudgetExceededError: If MongoDB cancelled the count operation because it exceeded its budget
             DocumentGetError: When the count operation fails
 
         Returns:
@@ -763,7 +820,11 @@ def count(self, collection: str, db_name: str, *args, criteria: dict = None, **k
         criteria = criteria or {}
 
         try:
+            QueryBudget.apply(kwargs)
+
             return self.get_collection(collection, db_name).count_documents(criteria, *args, **kwargs)
+        except ExecutionTimeout as err:
+            raise QueryBudget.get_exceeded_error('Count', collection) from err
         except Exception as err:
             raise DocumentGetError(
                 f"Failed to count documents in collection '{collection}': {err}"
@@ -778,15 +839,33 @@ def aggregate(self, collection: str, db_name: str, *args, **kwargs) -> Cursor:
         Args:
             collection (str): Name of the database collection
             *args: Additional arguments for the aggregation pipeline
-            **kwargs: Additional keyword arguments for the aggregation operation
+            **kwargs: Additional keyword arguments for the aggregation operation, 'maxTimeMS' is set to the
+                      QueryBudget of the current request if not provided
         Raises:
+            QueryBudgetExceededError: If MongoDB cancelled the aggregation because it exceeded its budget
             DocumentAggregationError: If the aggregation operation fails
 
         Returns:
             Cursor: The computed aggregation results as a cursor
         """
         try:
-            return self.get_collection(collection, db_name).aggregate(*args, **kwargs)
+            target_collection = self.get_collection(collection, db_name)
+            QueryBudget.apply(kwargs)
+
+            # The aggregate command returns with the first batch, which contains the complete work of blocking stages
+            start = time.perf_counter()
+            cursor = target_collection.aggregate(*args, **kwargs)
+
+            SlowQueryRecorder.observe(
+                target_collection.database,
+                collection,
+                kwargs.get('pipeline', args[0] if args else []),
+                time.perf_counter() - start
+            )
+
+            return cursor
+        except ExecutionTimeout as err:
+            raise QueryBudget.get_exceeded_error('Aggregation', collection) from err
         except Exception as err:
             raise DocumentAggregationError(f"Aggregation operation failed: {err}") from err
 
@@ -852,6 +931,59 @@ def get_next_public_id(self, collection: str, db_name: str, inc_id: bool = False
         except Exception as err:
             raise DocumentGetError(f"Error retrieving next public_id for collection '{collection}': {err}") from err
 
+
+    @retry_operation
+    def reserve_public_ids(self, collection: str, db_name: str, count: int) -> int:
+        """
+        Atomically reserves a range of consecutive public_ids for the specified collection
+
+        Args:
+            collection (str): Name of the database collection
+            count (int): Number of public_ids which should be reserved
+
+        Raises:
+            DocumentGetError: If the counter could not be incremented
+
+        Returns:
+            int: The first public_id of the reserved range
+        """
+        try:
+            counters = self.get_collection(PUBLIC_ID_COUNTER_COLLECTION, db_name)
+
+            if not counters.find_one({'_id': collection}):
+                self.init_public_id_counter(collection, db_name)
+
+            counter = counters.find_one_and_update(
+                {'_id': collection},
+                {'$inc': {'counter': count}},
+                return_document=ReturnDocument.AFTER
+            )
+
+            return counter['counter'] - count + 1
+        except Exception as err:
+            raise DocumentGetError(f"Error reserving public_ids for collection '{collection}': {err}") from err
+
+
+    def get_collection_generation(self, collection: str, db_name: str) -> int:
+        """
+        Retrieves the generation of a collection, see 'increase_collection_generation()'
+
+        Args:
+            collection (str): Name of the collection
+
+        Raises:
+            DocumentGetError: If the generation could not be retrieved
+
+        Returns:
+            int: The generation of the collection, 0 if it was never incremented
+        """
+        try:
+            generation = self.get_collection(COLLECTION_GENERATION_COLLECTION, db_name).find_one({'_id': collection})
+
+            return generation['generation'] if generation else 0
+        except Exception as err:
+            raise DocumentGetError(f"Error retrieving the generation of '{collection}': {err}") from err
+
 # --------------------------------------------------- CRUD - DELETE -------------------------------------------------- #
 
     @retry_operation
@@ -32,5 +32,6 @@ def get_root_location_data() -> dict:
         "type_id":0,
         "type_label":"Root",
         "type_icon":"fas fa-globe",
-        "type_selectable":True
+        "type_selectable":True,
+        "path":[]
     }
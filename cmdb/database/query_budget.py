@@ -0,0 +1,181 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the QueryBudget which limits the server-side execution time of the queries of a request
+"""
+import logging
+from typing import Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pymongo.errors import ExecutionTimeout
+
+from cmdb.utils.configurable import Configurable
+
+from cmdb.errors.database import QueryBudgetExceededError
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                  QueryBudget - CLASS                                                 #
+# -------------------------------------------------------------------------------------------------------------------- #
+class QueryBudget(Configurable):
+    """
+    Limits the execution time of the find, count and aggregate operations of the MongoDatabaseManager with maxTimeMS
+
+    Every request of the REST API starts with the 'interactive' budget, routes which are expected to run longer
+    select the 'report' or 'export' budget with the scope() decorator. MongoDB cancels an operation which exceeds
+    its budget on the server, so a query does not keep running after gunicorn killed the worker which started it.
+    Operations outside of a request (setup, CLI, background threads) have no budget
+
+    The budgets are set with configure(), which receives the options of the optional [QueryBudgets] section of the
+    config file. The budgets are inactive by default and have to be enabled with 'active = true', a budget of 0
+    disables the limit of its class
+    """
+    CONFIG_SECTION = 'QueryBudgets'
+
+    DEFAULT_OPTIONS = {
+        'active': False,
+        'interactive_ms': 15000,
+        'report_ms': 60000,
+        'export_ms': 110000,
+    }
+
+    INTERACTIVE = 'interactive'
+    REPORT = 'report'
+    EXPORT = 'export'
+
+    # Budget class of the current request, None outside of requests
+    __budget_class: ContextVar[Optional[str]] = ContextVar('query_budget_class', default=None)
+
+
+    @classmethod
+    def begin(cls, budget_class: str = INTERACTIVE) -> None:
+        """
+        Sets the budget class at the start of a request
+
+        Args:
+            budget_class (str): One of INTERACTIVE, REPORT or EXPORT. Defaults to INTERACTIVE
+        """
+        cls.__budget_class.set(budget_class)
+
+
+    @classmethod
+    @contextmanager
+    def scope(cls, budget_class: str):
+        """
+        Applies another budget class within a with-statement or to a decorated route
+
+        Args:
+            budget_class (str): One of INTERACTIVE, REPORT or EXPORT
+        """
+        token = cls.__budget_class.set(budget_class)
+
+        try:
+            yield
+        finally:
+            cls.__budget_class.reset(token)
+
+
+    @classmethod
+    def get_budget_class(cls) -> Optional[str]:
+        """
+        Retrieves the budget class of the current request
+
+        Returns:
+            Optional[str]: The budget class, None outside of requests
+        """
+        return cls.__budget_class.get()
+
+
+    @classmethod
+    def get_max_time_ms(cls) -> Optional[int]:
+        """
+        Retrieves the budget of the current request
+
+        Returns:
+            Optional[int]: The budget in milliseconds, None if the operations of the request are not limited
+        """
+        budget_class = cls.__budget_class.get()
+
+        if budget_class is None or not cls.is_active():
+            return None
+
+        return cls._options.get(f'{budget_class}_ms') or None
+
+
+    @classmethod
+    def apply(cls, options: dict, name: str = 'maxTimeMS') -> dict:
+        """
+        Adds the budget of the current request to the options of an operation, unless the caller set its own limit
+
+        Args:
+            options (dict): Keyword arguments of the PyMongo operation
+            name (str): Name of the option, 'max_time_ms' for find() and 'maxTimeMS' for the commands
+
+        Returns:
+            dict: The options
+        """
+        max_time_ms = cls.get_max_time_ms()
+
+        if max_time_ms and name not in options:
+            options[name] = max_time_ms
+
+        return options
+
+
+    @classmethod
+    def get_exceeded_error(cls, operation: str, collection: str) -> QueryBudgetExceededError:
+        """
+        Creates the error for an operation which MongoDB cancelled because it exceeded the budget of the request
+
+        Args:
+            operation (str): Name of the operation, e.g. 'Find'
+            collection (str): Name of the collection of the operation
+
+        Returns:
+            QueryBudgetExceededError: The error which is raised from the ExecutionTimeout of PyMongo
+        """
+        return QueryBudgetExceededError(
+            f"{operation} on '{collection}' exceeded the {cls.get_budget_class()} query budget "
+            f"of {cls.get_max_time_ms()} ms and was cancelled"
+        )
+
+
+    @staticmethod
+    def is_exceeded(error: BaseException) -> bool:
+        """
+        Checks if an error or one of the errors it was raised from or while handling is a cancelled operation. The
+        MongoDatabaseManager raises a QueryBudgetExceededError for cancelled operations, but routes usually abort()
+        while handling the error of a manager and cursors which are iterated outside of the database layer raise the
+        ExecutionTimeout of PyMongo
+
+        Args:
+            error (BaseException): The raised error
+
+        Returns:
+            bool: True if an operation exceeded its budget
+        """
+        seen = set()
+
+        while error is not None and id(error) not in seen:
+            if isinstance(error, (ExecutionTimeout, QueryBudgetExceededError)):
+                return True
+
+            seen.add(id(error))
+            error = error.__cause__ or error.__context__ or getattr(error, 'original_exception', None)
+
+        return False
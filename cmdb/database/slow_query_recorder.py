@@ -0,0 +1,273 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the SlowQueryRecorder which stores slow aggregations together with their explain plans
+"""
+import time
+import queue
+import logging
+import threading
+from typing import Optional
+from datetime import datetime, timezone
+from bson import json_util
+from flask import has_request_context, request
+from pymongo.database import Database
+from pymongo.errors import CollectionInvalid
+
+from cmdb.database.database_constants import SLOW_QUERY_COLLECTION
+from cmdb.utils.configurable import Configurable
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                               SlowQueryRecorder - CLASS                                              #
+# -------------------------------------------------------------------------------------------------------------------- #
+class SlowQueryRecorder(Configurable):
+    """
+    Stores aggregations which exceed a duration threshold in a capped collection of their database
+
+    The recorder is enabled with configure(), which receives the options of the optional [SlowQueries] section of
+    the config file. The explain plan of a slow aggregation is retrieved by a background thread, because it runs the
+    pipeline a second time. Pipelines with the same stages on the same collection are recorded at most once per
+    'cooldown' seconds, so a slow route which is called frequently does not double the load of the database
+
+    A single worker thread per process retrieves the explain plans one after another from a queue of 'queue_size'
+    entries. Aggregations which do not fit into the queue are not recorded, and every explain is cancelled by
+    MongoDB after 'explain_timeout_factor' times the threshold, so the recorder never adds more than one bounded
+    query per process to a database which is already struggling
+    """
+    CONFIG_SECTION = 'SlowQueries'
+
+    DEFAULT_OPTIONS = {
+        'active': False,
+        'threshold_ms': 500,
+        'cooldown': 60.0,
+        'max_entries': 1000,
+        'max_size_mb': 16,
+        'queue_size': 16,
+        'explain_timeout_factor': 2.0,
+    }
+
+    __lock = threading.Lock()
+    __queue: Optional[queue.Queue] = None
+    __worker: Optional[threading.Thread] = None
+    # (db_name, collection, stage names): time of the last recording
+    __last_recorded: dict[tuple, float] = {}
+    # Databases in which the capped collection was already created by this process
+    __prepared_databases: set[str] = set()
+
+
+    @classmethod
+    def configure(cls, options: dict) -> None:
+        """
+        Sets the options of the recorder, unknown options are ignored
+
+        Args:
+            options (dict): Options of the [SlowQueries] section of the config file
+        """
+        with cls.__lock:
+            super().configure(options)
+
+
+    @classmethod
+    def observe(cls, database: Database, collection: str, pipeline: list[dict], duration: float) -> None:
+        """
+        Records an aggregation in the background if it exceeded the threshold and its pipeline was not recorded
+        within the cooldown
+
+        Args:
+            database (Database): Database of the aggregation
+            collection (str): Collection of the aggregation
+            pipeline (list[dict]): The executed pipeline
+            duration (float): Duration of the aggregation in seconds
+        """
+        if not cls.is_active() or duration * 1000 < cls._options['threshold_ms']:
+            return
+
+        key = (database.name, collection, tuple(next(iter(stage), '') for stage in pipeline))
+        now = time.monotonic()
+
+        with cls.__lock:
+            if now - cls.__last_recorded.get(key, -cls._options['cooldown']) < cls._options['cooldown']:
+                return
+
+            cls.__last_recorded[key] = now
+
+        entry = {
+            'timestamp': datetime.now(timezone.utc),
+            'collection': collection,
+            'duration_ms': round(duration * 1000, 1),
+            'route': f"{request.method} {request.path}" if has_request_context() else None,
+            # Stored as JSON because MongoDB rejects the '$' of the stage names in field names of older versions
+            'pipeline': json_util.dumps(pipeline),
+        }
+
+        try:
+            cls.__get_queue().put_nowait((database, collection, pipeline, entry))
+        except queue.Full:
+            LOGGER.debug("[observe] Slow aggregation on '%s' not recorded, the explain queue is full", collection)
+
+
+    @classmethod
+    def __get_queue(cls) -> queue.Queue:
+        """
+        Retrieves the queue of the aggregations which should be recorded and starts the worker thread if it is not
+        running in this process, e.g. after the app was preloaded before the workers were forked
+
+        Returns:
+            queue.Queue: The queue consumed by the worker thread
+        """
+        with cls.__lock:
+            if not cls.__worker or not cls.__worker.is_alive():
+                cls.__queue = queue.Queue(maxsize=cls._options['queue_size'])
+                cls.__worker = threading.Thread(target=cls.__work,
+                                                args=(cls.__queue,),
+                                                name='SlowQueryRecorder',
+                                                daemon=True)
+                cls.__worker.start()
+
+            return cls.__queue
+
+
+    @classmethod
+    def __work(cls, entries: queue.Queue) -> None:
+        """
+        Records the queued aggregations one after another
+
+        Args:
+            entries (queue.Queue): Queue of the aggregations which should be recorded
+        """
+        while True:
+            cls.__record(*entries.get())
+
+
+    @classmethod
+    def __record(cls, database: Database, collection: str, pipeline: list[dict], entry: dict) -> None:
+        """
+        Retrieves the explain plan of an aggregation and stores the entry in the capped collection
+
+        Args:
+            database (Database): Database of the aggregation
+            collection (str): Collection of the aggregation
+            pipeline (list[dict]): The executed pipeline
+            entry (dict): The entry without the explain plan
+        """
+        try:
+            explain = database.command({
+                'explain': {
+                    'aggregate': collection,
+                    'pipeline': pipeline,
+                    'cursor': {},
+                    'maxTimeMS': int(cls._options['threshold_ms'] * cls._options['explain_timeout_factor']),
+                },
+                'verbosity': 'executionStats',
+            })
+            entry['explain'] = summarize_explain(explain)
+        except Exception as err:
+            # e.g. pipelines with $out or $merge can not be explained with 'executionStats' or the explain timed out
+            entry['explain'] = {'error': str(err)}
+
+        try:
+            cls.__prepare_database(database)
+            database[SLOW_QUERY_COLLECTION].insert_one(entry)
+        except Exception as err:
+            LOGGER.warning("[__record] Failed to record slow aggregation on '%s': %s", collection, err)
+
+
+    @classmethod
+    def __prepare_database(cls, database: Database) -> None:
+        """
+        Creates the capped collection of the slow aggregations in a database if it does not exist yet
+
+        Args:
+            database (Database): The database of the aggregation
+        """
+        if database.name in cls.__prepared_databases:
+            return
+
+        try:
+            database.create_collection(
+                SLOW_QUERY_COLLECTION,
+                capped=True,
+                size=cls._options['max_size_mb'] * 1024 * 1024,
+                max=cls._options['max_entries']
+            )
+        except CollectionInvalid:
+            pass
+
+        cls.__prepared_databases.add(database.name)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def summarize_explain(explain: dict) -> dict:
+    """
+    Reduces the output of explain("executionStats") of an aggregation to the values relevant for index tuning
+
+    The structure of the output depends on the MongoDB version, on whether the pipeline was pushed down into the
+    query layer and on sharding, therefore all nested 'executionStats' and 'winningPlan' documents are collected
+
+    Args:
+        explain (dict): Output of the explain command
+
+    Returns:
+        dict: Examined keys and documents, returned documents, execution time, plan stages and used indexes
+    """
+    summary = {
+        'pipeline_stages': [next(iter(stage)) for stage in explain.get('stages', []) if isinstance(stage, dict)],
+        'plan_stages': [],
+        'indexes': [],
+        'keys_examined': 0,
+        'docs_examined': 0,
+        'returned': 0,
+        'execution_time_ms': 0,
+    }
+
+    def collect_plan(plan) -> None:
+        if isinstance(plan, dict):
+            if 'stage' in plan and plan['stage'] not in summary['plan_stages']:
+                summary['plan_stages'].append(plan['stage'])
+
+            if 'indexName' in plan and plan['indexName'] not in summary['indexes']:
+                summary['indexes'].append(plan['indexName'])
+
+            for value in plan.values():
+                collect_plan(value)
+        elif isinstance(plan, list):
+            for value in plan:
+                collect_plan(value)
+
+    def walk(node) -> None:
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == 'executionStats' and isinstance(value, dict):
+                    summary['keys_examined'] += value.get('totalKeysExamined', 0)
+                    summary['docs_examined'] += value.get('totalDocsExamined', 0)
+                    summary['returned'] += value.get('nReturned', 0)
+                    summary['execution_time_ms'] = max(summary['execution_time_ms'],
+                                                       value.get('executionTimeMillis', 0))
+                    collect_plan(value.get('executionStages'))
+                elif key == 'winningPlan':
+                    collect_plan(value)
+                else:
+                    walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    walk(explain)
+
+    return summary
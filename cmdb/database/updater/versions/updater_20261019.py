@@ -0,0 +1,126 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of Update20261019
+"""
+import json
+import logging
+from pymongo import UpdateOne
+
+from cmdb.database.updater.base_database_update import BaseDatabaseUpdate
+from cmdb.manager import LogsManager
+
+from cmdb.models.log_model.cmdb_meta_log import CmdbMetaLog
+from cmdb.models.log_model.cmdb_object_log import CmdbObjectLog
+from cmdb.models.log_model.render_state_codec import RenderStateCodec
+
+from cmdb.errors.updater import UpdaterException
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                Update20261019 - CLASS                                                #
+# -------------------------------------------------------------------------------------------------------------------- #
+class Update20261019(BaseDatabaseUpdate):
+    """
+    Implementation of Update20261019
+    """
+    BULK_SIZE = 500
+
+
+    def creation_date(self) -> int:
+        return 20261019
+
+
+    def description(self) -> str:
+        return """
+               Create the index on 'object_id' and 'public_id' for logs
+
+               Encode the 'render_state' of all CmdbObjectLogs as compressed snapshots and deltas
+               """
+
+
+    def start_update(self) -> None:
+        try:
+            collection = CmdbMetaLog.COLLECTION
+            self.dbm.create_indexes(collection, self.db_name, CmdbMetaLog.get_index_keys())
+
+            logs_manager = LogsManager(self.dbm, self.db_name)
+
+            object_logs = self.dbm.find(
+                collection,
+                self.db_name,
+                filter={'log_type': CmdbObjectLog.__name__, 'render_state': {'$ne': None}},
+                sort=[('object_id', CmdbMetaLog.DAO_ASCENDING), ('public_id', CmdbMetaLog.DAO_ASCENDING)],
+            )
+
+            operations = []
+            encoded_logs = 0
+            size_before = 0
+            size_after = 0
+            previous_object_id = None
+            previous_id = None
+            previous_state = None
+            previous_depth = 0
+
+            for object_log in object_logs:
+                # Deltas are only calculated between logs of the same object
+                if object_log['object_id'] != previous_object_id:
+                    previous_id = None
+                    previous_state = None
+                    previous_depth = 0
+
+                if object_log.get('render_encoding'):
+                    states = {previous_id: previous_state} if previous_id is not None else {}
+                    state = logs_manager.reconstruct_render_state(object_log, states)
+                else:
+                    state = json.loads(object_log['render_state'])
+
+                    encoded_fields = RenderStateCodec.encode(state, previous_id, previous_state, previous_depth)
+
+                    operations.append(UpdateOne({'_id': object_log['_id']}, {'$set': encoded_fields}))
+                    size_before += len(object_log['render_state'])
+                    size_after += len(encoded_fields['render_state'])
+                    encoded_logs += 1
+
+                    object_log.update(encoded_fields)
+
+                previous_object_id = object_log['object_id']
+                previous_id = object_log['public_id']
+                previous_state = state
+                previous_depth = object_log.get('render_depth', 0)
+
+                if len(operations) >= self.BULK_SIZE:
+                    self.dbm.bulk_write(collection, self.db_name, operations)
+                    operations = []
+
+            if operations:
+                self.dbm.bulk_write(collection, self.db_name, operations)
+
+            saved = size_before - size_after
+            LOGGER.info(
+                "Encoded the render states of %s object logs: %s bytes before, %s bytes after, %s bytes (%.1f%%) saved",
+                encoded_logs,
+                size_before,
+                size_after,
+                saved,
+                saved / size_before * 100 if size_before else 0,
+            )
+
+            self.increase_updater_version(self.creation_date())
+        except Exception as err:
+            raise UpdaterException(err) from err
@@ -0,0 +1,82 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of Update20261020
+"""
+import logging
+
+from cmdb.database.updater.base_database_update import BaseDatabaseUpdate
+
+from cmdb.models.log_model.cmdb_meta_log import CmdbMetaLog
+from cmdb.models.log_model.cmdb_object_log import CmdbObjectLog
+from cmdb.models.object_model import CmdbObject
+
+from cmdb.errors.updater import UpdaterException
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                Update20261020 - CLASS                                                #
+# -------------------------------------------------------------------------------------------------------------------- #
+class Update20261020(BaseDatabaseUpdate):
+    """
+    Implementation of Update20261020
+    """
+    BULK_SIZE = 1000
+
+
+    def creation_date(self) -> int:
+        return 20261020
+
+
+    def description(self) -> str:
+        return """
+               Flag all CmdbObjectLogs with 'object_deleted' if their object does not exist anymore
+
+               Create the index on 'log_type', 'object_deleted' and 'log_time' for logs
+               """
+
+
+    def start_update(self) -> None:
+        try:
+            logs_collection = self.dbm.get_collection(CmdbMetaLog.COLLECTION, self.db_name)
+            object_log_filter = {'log_type': CmdbObjectLog.__name__}
+
+            existing_object_ids = set(
+                self.dbm.get_collection(CmdbObject.COLLECTION, self.db_name).distinct('public_id')
+            )
+            deleted_object_ids = [object_id for object_id in logs_collection.distinct('object_id', object_log_filter)
+                                  if object_id not in existing_object_ids]
+
+            for index in range(0, len(deleted_object_ids), self.BULK_SIZE):
+                logs_collection.update_many(
+                    {**object_log_filter, 'object_id': {'$in': deleted_object_ids[index:index + self.BULK_SIZE]}},
+                    {'$set': {'object_deleted': True}}
+                )
+
+            logs_collection.update_many(
+                {**object_log_filter, 'object_deleted': {'$exists': False}},
+                {'$set': {'object_deleted': False}}
+            )
+
+            self.dbm.create_indexes(CmdbMetaLog.COLLECTION, self.db_name, CmdbMetaLog.get_index_keys())
+
+            LOGGER.info("Flagged the logs of %s deleted objects", len(deleted_object_ids))
+
+            self.increase_updater_version(self.creation_date())
+        except Exception as err:
+            raise UpdaterException(err) from err
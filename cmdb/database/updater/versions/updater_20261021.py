@@ -0,0 +1,123 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of Update20261021
+"""
+import logging
+from pymongo import UpdateOne
+
+from cmdb.database.updater.base_database_update import BaseDatabaseUpdate
+
+from cmdb.models.location_model.cmdb_location import CmdbLocation
+
+from cmdb.errors.updater import UpdaterException
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                Update20261021 - CLASS                                                #
+# -------------------------------------------------------------------------------------------------------------------- #
+class Update20261021(BaseDatabaseUpdate):
+    """
+    Implementation of Update20261021
+    """
+    BULK_SIZE = 1000
+
+
+    def creation_date(self) -> int:
+        return 20261021
+
+
+    def description(self) -> str:
+        return """
+               Store the ancestor path of every CmdbLocation
+
+               Create the indexes on 'path' and 'parent' for locations
+               """
+
+
+    def start_update(self) -> None:
+        try:
+            locations = list(self.dbm.find(
+                CmdbLocation.COLLECTION,
+                self.db_name,
+                filter={},
+                projection={'_id': 1, 'public_id': 1, 'parent': 1},
+            ))
+            parents = {location['public_id']: location.get('parent') for location in locations}
+            paths: dict[int, list[int]] = {}
+
+            operations = []
+
+            for location in locations:
+                path = self.__get_path(location['public_id'], parents, paths)
+                operations.append(UpdateOne({'_id': location['_id']}, {'$set': {'path': path}}))
+
+                if len(operations) >= self.BULK_SIZE:
+                    self.dbm.bulk_write(CmdbLocation.COLLECTION, self.db_name, operations)
+                    operations = []
+
+            if operations:
+                self.dbm.bulk_write(CmdbLocation.COLLECTION, self.db_name, operations)
+
+            self.dbm.create_indexes(CmdbLocation.COLLECTION, self.db_name, CmdbLocation.get_index_keys())
+
+            LOGGER.info("Stored the ancestor paths of %s locations", len(locations))
+
+            self.increase_updater_version(self.creation_date())
+        except Exception as err:
+            raise UpdaterException(err) from err
+
+
+    def __get_path(self, public_id: int, parents: dict[int, int], paths: dict[int, list[int]]) -> list[int]:
+        """
+        Builds the ancestor path of a location by walking up to the root location
+
+        Args:
+            public_id (int): public_id of the location
+            parents (dict[int, int]): parent of every location by public_id
+            paths (dict[int, list[int]]): Already built paths by public_id, is extended by this call
+
+        Returns:
+            list[int]: public_ids of all ancestors, starting with the root location
+        """
+        chain = []
+        current_id = public_id
+
+        # Walk up until a known path, the root location or a missing parent is reached
+        while current_id not in paths and current_id not in chain:
+            chain.append(current_id)
+            parent_id = parents.get(current_id)
+
+            if not parent_id or parent_id not in parents:
+                if parent_id:
+                    # The parent was deleted, keep it as the topmost ancestor
+                    paths[current_id] = [parent_id]
+                else:
+                    paths[current_id] = []
+
+                chain.pop()
+                break
+
+            current_id = parent_id
+
+        for location_id in reversed(chain):
+            path = [*paths.get(parents[location_id], []), parents[location_id]]
+            # Locations of a parent cycle must not be their own ancestors
+            paths[location_id] = [ancestor_id for ancestor_id in path if ancestor_id != location_id]
+
+        return paths[public_id]
@@ -0,0 +1,56 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of Update20261022
+"""
+import logging
+
+from cmdb.database.updater.base_database_update import BaseDatabaseUpdate
+
+from cmdb.models.object_relation_model.cmdb_object_relation import CmdbObjectRelation
+
+from cmdb.errors.updater import UpdaterException
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                Update20261022 - CLASS                                                #
+# -------------------------------------------------------------------------------------------------------------------- #
+class Update20261022(BaseDatabaseUpdate):
+    """
+    Implementation of Update20261022
+    """
+
+    def creation_date(self) -> int:
+        return 20261022
+
+
+    def description(self) -> str:
+        return """
+               Create the indexes on 'relation_parent_id' and 'relation_child_id' for object relations
+               """
+
+
+    def start_update(self) -> None:
+        try:
+            self.dbm.create_indexes(CmdbObjectRelation.COLLECTION,
+                                    self.db_name,
+                                    CmdbObjectRelation.get_index_keys())
+
+            self.increase_updater_version(self.creation_date())
+        except Exception as err:
+            raise UpdaterException(err) from err
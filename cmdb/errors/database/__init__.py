@@ -19,6 +19,7 @@
 from .database_errors import (
     DataBaseError,
     DatabaseConnectionError,
+    DatabaseUnavailableError,
     ServerTimeoutError,
     DatabaseAlreadyExistsError,
     DatabaseNotFoundError,
@@ -34,6 +35,7 @@
     DocumentUpdateError,
     DocumentGetError,
     DocumentAggregationError,
+    QueryBudgetExceededError,
     PublicIdCounterInitError,
     CollectionInitError,
 )
@@ -42,6 +44,7 @@
 __all__ = [
     'DataBaseError',
     'DatabaseConnectionError',
+    'DatabaseUnavailableError',
     'ServerTimeoutError',
     'DatabaseAlreadyExistsError',
     'DatabaseNotFoundError',
@@ -57,6 +60,7 @@
     'DocumentUpdateError',
     'DocumentGetError',
     'DocumentAggregationError',
+    'QueryBudgetExceededError',
     'PublicIdCounterInitError',
     'CollectionInitError',
 ]
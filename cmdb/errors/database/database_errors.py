@@ -42,6 +42,12 @@ class ServerTimeoutError(DataBaseError):
     """
 
 
+class DatabaseUnavailableError(DatabaseConnectionError):
+    """
+    Raised when the circuit breaker rejects an operation because the database is unavailable
+    """
+
+
 class DatabaseAlreadyExistsError(DataBaseError):
     """
     Error when database already exists
@@ -126,6 +132,13 @@ class DocumentAggregationError(DataBaseError):
     """
 
 
+class QueryBudgetExceededError(DocumentGetError, DocumentAggregationError):
+    """
+    Raised when MongoDB cancelled a find, count or aggregate operation because it exceeded the maxTimeMS budget of
+    the request
+    """
+
+
 class PublicIdCounterInitError(DataBaseError):
     """
     Raised if a public_id counter could not be initialised
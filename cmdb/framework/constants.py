@@ -34,6 +34,7 @@
 from cmdb.models.log_model.cmdb_object_log import CmdbObjectLog
 from cmdb.models.webhook_model.cmdb_webhook_model import CmdbWebhook
 from cmdb.models.webhook_model.cmdb_webhook_event import CmdbWebhookEvent
+from cmdb.models.webhook_model.cmdb_webhook_delivery import CmdbWebhookDelivery
 from cmdb.models.relation_model import CmdbRelation
 from cmdb.models.object_relation_model import CmdbObjectRelation
 from cmdb.models.log_model import CmdbObjectRelationLog
@@ -72,6 +73,7 @@
     CmdbReport,
     CmdbWebhook,
     CmdbWebhookEvent,
+    CmdbWebhookDelivery,
     CmdbRelation,
     CmdbObjectRelation,
     CmdbObjectRelationLog,
@@ -0,0 +1,112 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Command line interface of the DataGenerator
+
+Example:
+    python -m cmdb.framework.data_generator -c ./etc/cmdb.conf --database cmdb-scale --objects 1000000
+"""
+import os
+import sys
+import logging
+from argparse import ArgumentParser, Namespace
+
+from cmdb.database import MongoDatabaseManager
+from cmdb.database.database_services import CollectionValidator
+from cmdb.manager.system_manager.system_config_reader import SystemConfigReader
+
+from cmdb.framework.data_generator.data_generator import BATCH_SIZE, DataGenerator
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def build_arg_parser() -> Namespace:
+    """
+    Generates the parser of the generator options
+
+    Returns:
+        Namespace: The parsed arguments
+    """
+    parser = ArgumentParser(prog='python -m cmdb.framework.data_generator',
+                            description='Writes a synthetic CMDB for scale tests into a DataGerry database')
+
+    parser.add_argument('-c', '--config', default='./etc/cmdb.conf', dest='config_file',
+                        help="path to the config file with the [Database] section")
+    parser.add_argument('--database', default=None,
+                        help="target database, defaults to the database_name of the config file")
+    parser.add_argument('--types', default=5, type=int, help="number of types besides the site type")
+    parser.add_argument('--objects', default=10000, type=int, help="number of objects including the sites")
+    parser.add_argument('--locations', default=None, type=int,
+                        help="number of objects besides the sites placed in the location tree, default a fifth")
+    parser.add_argument('--mds-entries', default=2, type=int, dest='mds_entries',
+                        help="entries of the multi data section of every object")
+    parser.add_argument('--relations', default=None, type=int,
+                        help="number of object relations, default a tenth of the objects")
+    parser.add_argument('--risk-assessments', default=0, type=int, dest='risk_assessments',
+                        help="number of ISMS risk assessments")
+    parser.add_argument('--no-logs', action='store_false', dest='logs', help="do not write the object logs")
+    parser.add_argument('--prefix', default='gen', help="prefix of the generated type names")
+    parser.add_argument('--seed', default=42, type=int, help="seed of the random generator")
+    parser.add_argument('--batch-size', default=BATCH_SIZE, type=int, dest='batch_size',
+                        help="documents per bulk write")
+
+    return parser.parse_args()
+
+
+def main(args: Namespace) -> int:
+    """
+    Sets up the target database if required and generates the data
+
+    Args:
+        args (Namespace): The parsed arguments
+
+    Returns:
+        int: Exit code
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+    path, filename = os.path.split(args.config_file)
+    config = SystemConfigReader(filename, f"{path or '.'}/")
+
+    if not config.status():
+        LOGGER.error("Config file %s could not be loaded", args.config_file)
+        return 1
+
+    database_config = config.get_all_values_from_section('Database')
+    db_name = args.database or database_config['database_name']
+
+    dbm = MongoDatabaseManager(database_config['host'], database_config['port'], db_name)
+
+    # Creates the collections, the admin user and the root location of a new database
+    CollectionValidator(db_name, dbm, local_mode=True).validate_collections()
+
+    DataGenerator(dbm, db_name, args.seed, args.prefix, args.batch_size).generate(
+        types=args.types,
+        objects=args.objects,
+        locations=args.locations,
+        mds_entries=args.mds_entries,
+        relations=args.relations,
+        logs=args.logs,
+        risk_assessments=args.risk_assessments,
+    )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(build_arg_parser()))
@@ -0,0 +1,843 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the DataGenerator which writes a synthetic CMDB for scale tests
+"""
+import json
+import time
+import random
+import logging
+from datetime import datetime, timedelta, timezone
+from pymongo import InsertOne
+
+from cmdb.database import MongoDatabaseManager
+from cmdb.database.database_utils import default
+from cmdb.database.predefined_data.cmdb_data import get_root_location_data
+from cmdb.manager import LogsManager
+
+from cmdb.models.type_model import CmdbType
+from cmdb.models.object_model import CmdbObject
+from cmdb.models.location_model.cmdb_location import CmdbLocation
+from cmdb.models.relation_model import CmdbRelation
+from cmdb.models.object_relation_model import CmdbObjectRelation
+from cmdb.models.log_model.log_action_enum import LogAction
+from cmdb.models.log_model.cmdb_object_log import CmdbObjectLog
+from cmdb.models.log_model.render_state_codec import RenderStateCodec
+from cmdb.models.isms_model import (
+    IsmsImpact,
+    IsmsLikelihood,
+    IsmsRisk,
+    IsmsRiskAssessment,
+    IsmsRiskClass,
+    IsmsRiskMatrix,
+)
+from cmdb.framework.rendering.render_result import RenderResult
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+# One site for this many objects, the sites are the top level of the location tree
+OBJECTS_PER_SITE = 50
+
+# Locations are only placed below parents which are less deep, root is depth 0
+MAX_LOCATION_DEPTH = 5
+
+# The admin user and group created by the setup routine
+ADMIN_USER_ID = 1
+ADMIN_USER_NAME = 'admin'
+ADMIN_GROUP_ID = 1
+
+STATUS_OPTIONS = [
+    {'name': 'planned', 'label': 'Planned'},
+    {'name': 'active', 'label': 'Active'},
+    {'name': 'maintenance', 'label': 'Maintenance'},
+    {'name': 'retired', 'label': 'Retired'},
+]
+
+ENVIRONMENT_OPTIONS = [
+    {'name': 'production', 'label': 'Production'},
+    {'name': 'staging', 'label': 'Staging'},
+    {'name': 'development', 'label': 'Development'},
+]
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                 DataGenerator - CLASS                                                #
+# -------------------------------------------------------------------------------------------------------------------- #
+class DataGenerator:
+    """
+    Writes a synthetic CMDB with bulk inserts. Every type uses all field kinds, a multi data section and a
+    reference section, objects are placed in a location hierarchy below sites and are connected by object
+    relations. Optionally every object gets its creation log and the ISMS is filled with risk assessments
+
+    The random generator is seeded, so the same arguments always generate the same data
+    """
+    def __init__(self,
+                 dbm: MongoDatabaseManager,
+                 db_name: str,
+                 seed: int = 42,
+                 prefix: str = 'gen',
+                 batch_size: int = BATCH_SIZE):
+        """
+        Initializes the DataGenerator
+
+        Args:
+            dbm (MongoDatabaseManager): Database manager of the target database
+            db_name (str): Name of the target database, it must already be set up
+            seed (int, optional): Seed of the random generator. Defaults to 42
+            prefix (str, optional): Prefix of the generated type names, it allows multiple runs on the same
+                                    database. Defaults to 'gen'
+            batch_size (int, optional): Documents per bulk write. Defaults to BATCH_SIZE
+        """
+        self.dbm = dbm
+        self.db_name = db_name
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.rand = random.Random(seed)
+        self.now = datetime.now(timezone.utc)
+        self.logs_manager = LogsManager(dbm, db_name)
+
+        self.__site_type_id: int = None
+        # (public_id, path) of all locations which can still have children
+        self.__parent_locations: list[tuple[int, list[int]]] = []
+
+
+    def generate(self,
+                 types: int = 5,
+                 objects: int = 10000,
+                 locations: int = None,
+                 mds_entries: int = 2,
+                 relations: int = None,
+                 logs: bool = True,
+                 risk_assessments: int = 0) -> dict:
+        """
+        Generates the complete dataset
+
+        Args:
+            types (int, optional): Number of types besides the site type. Defaults to 5
+            objects (int, optional): Number of objects including the sites. Defaults to 10000
+            locations (int, optional): Number of objects besides the sites which are placed in the location tree.
+                                       Defaults to a fifth of the objects
+            mds_entries (int, optional): Entries of the multi data section of every object. Defaults to 2
+            relations (int, optional): Number of object relations. Defaults to a tenth of the objects
+            logs (bool, optional): Writes the creation log of every object. Defaults to True
+            risk_assessments (int, optional): Number of IsmsRiskAssessments. Defaults to 0
+
+        Returns:
+            dict: 'site_type_id', 'type_ids' and 'object_ids', the range of object public_ids per type
+        """
+        types = max(1, types)
+        site_count = max(1, objects // OBJECTS_PER_SITE)
+        objects = max(objects, site_count + types)
+        locations = (objects - site_count) // 5 if locations is None else locations
+        relations = objects // 10 if relations is None else relations
+
+        start = time.perf_counter()
+
+        site_type, generic_types = self.__create_types(types)
+        object_ids = self.__reserve_object_ids(site_type, generic_types, objects, site_count)
+
+        self.__parent_locations = [(get_root_location_data()['public_id'], [])]
+
+        self.__create_objects(site_type, object_ids, 0, 1.0, logs)
+        location_ratio = min(1.0, locations / (objects - site_count))
+
+        for type_document in generic_types:
+            self.__create_objects(type_document, object_ids, mds_entries, location_ratio, logs)
+
+        self.__create_relations(generic_types, object_ids, relations)
+
+        if risk_assessments:
+            self.__create_isms(risk_assessments, object_ids)
+
+        LOGGER.info("Generated %s objects of %s types in %.1fs", objects, types + 1, time.perf_counter() - start)
+
+        return {
+            'site_type_id': site_type['public_id'],
+            'type_ids': [type_document['public_id'] for type_document in generic_types],
+            'object_ids': object_ids,
+        }
+
+# ------------------------------------------------------- TYPES ------------------------------------------------------ #
+
+    def __create_types(self, count: int) -> tuple[dict, list[dict]]:
+        """
+        Creates the site type and the generic types. Every generic type references the sites and the previous
+        generic type, every second generic type has an activated ACL
+
+        Args:
+            count (int): Number of generic types
+
+        Returns:
+            tuple[dict, list[dict]]: The site type and the generic types
+        """
+        first_type_id = self.dbm.reserve_public_ids(CmdbType.COLLECTION, self.db_name, count + 1)
+        site_name = f"{self.prefix}_site"
+        self.__site_type_id = first_type_id
+
+        site_type = self.__type_document(first_type_id, site_name, 'fas fa-building', [
+            {
+                'type': 'section',
+                'name': f"{site_name}-general",
+                'label': 'General',
+                'fields': [
+                    {'type': 'text', 'name': 'name', 'label': 'Name'},
+                    {'type': 'text', 'name': 'city', 'label': 'City'},
+                    {'type': 'textarea', 'name': 'address', 'label': 'Address'},
+                    {'type': 'location', 'name': 'dg_location', 'label': 'Location'},
+                ],
+            },
+        ], False)
+
+        generic_types = []
+
+        for index in range(count):
+            public_id = first_type_id + 1 + index
+            name = f"{self.prefix}_type_{index + 1}"
+
+            general_fields = [
+                {'type': 'text', 'name': 'name', 'label': 'Name'},
+                {'type': 'textarea', 'name': 'description', 'label': 'Description'},
+                {'type': 'password', 'name': 'password', 'label': 'Password'},
+                {'type': 'number', 'name': 'cost', 'label': 'Cost'},
+                {'type': 'checkbox', 'name': 'monitored', 'label': 'Monitored'},
+                {'type': 'radio', 'name': 'environment', 'label': 'Environment', 'options': ENVIRONMENT_OPTIONS},
+                {'type': 'select', 'name': 'status', 'label': 'Status', 'options': STATUS_OPTIONS},
+                {'type': 'date', 'name': 'purchase_date', 'label': 'Purchase date'},
+                {'type': 'ref', 'name': 'site', 'label': 'Site', 'ref_types': [first_type_id], 'summaries': []},
+                {'type': 'location', 'name': 'dg_location', 'label': 'Location'},
+            ]
+
+            if index:
+                general_fields.append({'type': 'ref', 'name': 'parent', 'label': 'Parent',
+                                       'ref_types': [public_id - 1], 'summaries': []})
+
+            generic_types.append(self.__type_document(public_id, name, 'fas fa-cube', [
+                {
+                    'type': 'section',
+                    'name': f"{name}-general",
+                    'label': 'General',
+                    'fields': general_fields,
+                },
+                {
+                    'type': 'multi-data-section',
+                    'name': f"{name}-interfaces",
+                    'label': 'Interfaces',
+                    'fields': [
+                        {'type': 'text', 'name': 'interface_name', 'label': 'Interface'},
+                        {'type': 'number', 'name': 'interface_speed', 'label': 'Speed'},
+                        {'type': 'select', 'name': 'interface_status', 'label': 'Status', 'options': STATUS_OPTIONS},
+                    ],
+                    'hidden_fields': [],
+                },
+                {
+                    'type': 'ref-section',
+                    'name': f"{name}-site-section",
+                    'label': 'Site details',
+                    'reference': {
+                        'type_id': first_type_id,
+                        'section_name': f"{site_name}-general",
+                        'selected_fields': ['name', 'city'],
+                    },
+                    'fields': [
+                        {'type': 'ref-section-field', 'name': f"{name}-site-section-field", 'label': 'Site details'},
+                    ],
+                },
+            ], index % 2 == 1))
+
+        self.dbm.bulk_write(CmdbType.COLLECTION, self.db_name,
+                            [InsertOne(type_document) for type_document in [site_type, *generic_types]])
+
+        LOGGER.info("Generated %s types", count + 1)
+
+        return site_type, generic_types
+
+
+    def __type_document(self, public_id: int, name: str, icon: str, sections: list[dict], acl: bool) -> dict:
+        """
+        Creates a type document, the fields of the sections are moved to the fields of the type
+
+        Args:
+            public_id (int): public_id of the type
+            name (str): Name of the type
+            icon (str): Icon of the type
+            sections (list[dict]): The sections with the complete field definitions
+            acl (bool): Activates the ACL with all rights for the admin group
+
+        Returns:
+            dict: The type document
+        """
+        fields = []
+        render_sections = []
+
+        for section in sections:
+            fields.extend(section['fields'])
+            render_sections.append({**section, 'fields': [field['name'] for field in section['fields']]})
+
+        return {
+            'public_id': public_id,
+            'name': name,
+            'label': name.replace('_', ' ').title(),
+            'description': f"Generated type {name}",
+            'version': '1.0.0',
+            'active': True,
+            'selectable_as_parent': True,
+            'global_template_ids': [],
+            'author_id': ADMIN_USER_ID,
+            'creation_time': self.now,
+            'editor_id': None,
+            'last_edit_time': None,
+            'fields': fields,
+            'render_meta': {
+                'icon': icon,
+                'sections': render_sections,
+                'externals': [],
+                'summary': {'fields': ['name']},
+            },
+            'acl': {
+                'activated': acl,
+                'groups': {'includes': {str(ADMIN_GROUP_ID): ['CREATE', 'READ', 'UPDATE', 'DELETE']} if acl else {}},
+            },
+            'ci_explorer_label': None,
+            'ci_explorer_color': f"#{self.rand.randint(0, 0xFFFFFF):06X}",
+        }
+
+# ------------------------------------------------------ OBJECTS ----------------------------------------------------- #
+
+    def __reserve_object_ids(self,
+                             site_type: dict,
+                             generic_types: list[dict],
+                             objects: int,
+                             site_count: int) -> dict[int, range]:
+        """
+        Reserves the public_ids of all objects as one range and splits it between the types, so references
+        between the types are known before the objects are written
+
+        Args:
+            site_type (dict): The site type
+            generic_types (list[dict]): The generic types
+            objects (int): Number of objects including the sites
+            site_count (int): Number of sites
+
+        Returns:
+            dict[int, range]: The range of object public_ids per type
+        """
+        first_object_id = self.dbm.reserve_public_ids(CmdbObject.COLLECTION, self.db_name, objects)
+        per_type, remainder = divmod(objects - site_count, len(generic_types))
+
+        object_ids = {site_type['public_id']: range(first_object_id, first_object_id + site_count)}
+        next_id = first_object_id + site_count
+
+        for index, type_document in enumerate(generic_types):
+            count = per_type + (1 if index < remainder else 0)
+            object_ids[type_document['public_id']] = range(next_id, next_id + count)
+            next_id += count
+
+        return object_ids
+
+
+    def __create_objects(self,
+                         type_document: dict,
+                         object_ids: dict[int, range],
+                         mds_entries: int,
+                         location_ratio: float,
+                         logs: bool) -> None:
+        """
+        Writes the objects of a type batch by batch together with their locations and logs. Sites are always
+        placed below the root location, other objects are placed below a random location with the given ratio
+
+        Args:
+            type_document (dict): The type of the objects
+            object_ids (dict[int, range]): The range of object public_ids per type
+            mds_entries (int): Entries of the multi data section of every object
+            location_ratio (float): Share of the objects which are placed in the location tree
+            logs (bool): Writes the creation log of every object
+        """
+        type_id = type_document['public_id']
+        is_site = type_id == self.__site_type_id
+        type_fields = {field['name']: field for field in type_document['fields']}
+        public_ids = object_ids[type_id]
+
+        for batch_start in range(0, len(public_ids), self.batch_size):
+            batch = public_ids[batch_start:batch_start + self.batch_size]
+            located = [public_id for public_id in batch if self.rand.random() < location_ratio]
+
+            first_location_id = (self.dbm.reserve_public_ids(CmdbLocation.COLLECTION, self.db_name, len(located))
+                                 if located else 0)
+            location_ids = {public_id: first_location_id + offset for offset, public_id in enumerate(located)}
+
+            object_documents = []
+            location_documents = []
+
+            for public_id in batch:
+                parent_location = None
+
+                if public_id in location_ids:
+                    parent_location = (self.__parent_locations[0] if is_site
+                                       else self.rand.choice(self.__parent_locations))
+                    location_documents.append(
+                        self.__location_document(location_ids[public_id], public_id, type_document, parent_location)
+                    )
+
+                object_documents.append(self.__object_document(public_id,
+                                                               type_document,
+                                                               type_fields,
+                                                               object_ids,
+                                                               mds_entries,
+                                                               parent_location[0] if parent_location else None))
+
+            self.dbm.bulk_write(CmdbObject.COLLECTION, self.db_name,
+                                [InsertOne(document) for document in object_documents])
+
+            if location_documents:
+                self.dbm.bulk_write(CmdbLocation.COLLECTION, self.db_name,
+                                    [InsertOne(document) for document in location_documents])
+
+            if logs:
+                self.__create_object_logs(object_documents, type_document)
+
+        LOGGER.info("Generated %s objects of type %s", len(public_ids), type_document['name'])
+
+
+    def __object_document(self,
+                          public_id: int,
+                          type_document: dict,
+                          type_fields: dict[str, dict],
+                          object_ids: dict[int, range],
+                          mds_entries: int,
+                          parent_location_id: int) -> dict:
+        """
+        Creates an object with values for all fields of its type
+
+        Args:
+            public_id (int): public_id of the object
+            type_document (dict): The type of the object
+            type_fields (dict[str, dict]): The field definitions of the type by their name
+            object_ids (dict[int, range]): The range of object public_ids per type
+            mds_entries (int): Entries of the multi data section
+            parent_location_id (int): Location selected in the location field, None if the object has no location
+
+        Returns:
+            dict: The object document
+        """
+        rand = self.rand
+        fields = []
+        multi_data_sections = []
+
+        for section in type_document['render_meta']['sections']:
+            if section['type'] == 'multi-data-section':
+                multi_data_sections.append({
+                    'section_id': section['name'],
+                    'highest_id': mds_entries,
+                    'values': [
+                        {
+                            'multi_data_id': entry,
+                            'data': [
+                                {'name': 'interface_name', 'value': f"eth{entry}"},
+                                {'name': 'interface_speed', 'value': rand.choice((100, 1000, 10000))},
+                                {'name': 'interface_status', 'value': rand.choice(STATUS_OPTIONS)['name']},
+                            ],
+                        } for entry in range(mds_entries)
+                    ],
+                })
+                continue
+
+            for field_name in section['fields']:
+                fields.append({
+                    'name': field_name,
+                    'value': self.__field_value(public_id,
+                                                type_document,
+                                                type_fields[field_name],
+                                                object_ids,
+                                                parent_location_id),
+                })
+
+        return {
+            'public_id': public_id,
+            'type_id': type_document['public_id'],
+            'version': '1.0.0',
+            'creation_time': self.now,
+            'author_id': ADMIN_USER_ID,
+            'last_edit_time': None,
+            'editor_id': None,
+            'active': True,
+            'fields': fields,
+            'ci_explorer_tooltip': None,
+            'multi_data_sections': multi_data_sections,
+        }
+
+
+    def __field_value(self,
+                      public_id: int,
+                      type_document: dict,
+                      field: dict,
+                      object_ids: dict[int, range],
+                      parent_location_id: int):
+        """
+        Creates a random value matching the kind of the field
+
+        Args:
+            public_id (int): public_id of the object
+            type_document (dict): The type of the object
+            field (dict): The field definition of the type
+            object_ids (dict[int, range]): The range of object public_ids per type
+            parent_location_id (int): Location selected in the location field
+
+        Returns:
+            Any: The value of the field
+        """
+        rand = self.rand
+        field_type = field['type']
+
+        if field_type == 'text':
+            return f"{type_document['name']} {public_id}" if field['name'] == 'name' else f"{field['name']} {public_id}"
+
+        if field_type == 'textarea':
+            return f"Generated {field['label'].lower()} of object {public_id}\nsecond line"
+
+        if field_type == 'password':
+            return f"secret-{rand.getrandbits(32):08x}"
+
+        if field_type == 'number':
+            return rand.randint(1, 10000)
+
+        if field_type == 'checkbox':
+            return rand.random() < 0.5
+
+        if field_type in ('radio', 'select'):
+            return rand.choice(field['options'])['name']
+
+        if field_type == 'date':
+            return self.now - timedelta(days=rand.randint(0, 3650))
+
+        if field_type == 'location':
+            return parent_location_id
+
+        if field_type == 'ref':
+            target_ids = object_ids.get(field['ref_types'][0])
+            return rand.choice(target_ids) if target_ids else None
+
+        if field_type == 'ref-section-field':
+            return rand.choice(object_ids[self.__site_type_id])
+
+        return None
+
+
+    def __location_document(self,
+                            public_id: int,
+                            object_id: int,
+                            type_document: dict,
+                            parent_location: tuple[int, list[int]]) -> dict:
+        """
+        Creates the location of an object and registers it as parent for following locations
+
+        Args:
+            public_id (int): public_id of the location
+            object_id (int): public_id of the object
+            type_document (dict): The type of the object
+            parent_location (tuple[int, list[int]]): public_id and path of the parent location
+
+        Returns:
+            dict: The location document
+        """
+        parent_id, parent_path = parent_location
+        path = [*parent_path, parent_id]
+
+        if len(path) < MAX_LOCATION_DEPTH:
+            self.__parent_locations.append((public_id, path))
+
+        return {
+            'public_id': public_id,
+            'name': f"{type_document['name']} {object_id}",
+            'parent': parent_id,
+            'object_id': object_id,
+            'type_id': type_document['public_id'],
+            'type_label': type_document['label'],
+            'type_icon': type_document['render_meta']['icon'],
+            'type_selectable': type_document['selectable_as_parent'],
+            'path': path,
+        }
+
+
+    def __create_object_logs(self, object_documents: list[dict], type_document: dict) -> None:
+        """
+        Writes the creation logs of objects. The objects are new, so their render_states are stored as snapshots
+        without looking up previous logs like LogsManager.insert_logs() does
+
+        Args:
+            object_documents (list[dict]): The objects
+            type_document (dict): The type of the objects
+        """
+        first_public_id = self.dbm.reserve_public_ids(CmdbObjectLog.COLLECTION, self.db_name, len(object_documents))
+        log_documents = []
+
+        for offset, object_document in enumerate(object_documents):
+            log_document = self.__object_log(object_document, type_document)
+            log_document['public_id'] = first_public_id + offset
+            log_documents.append(InsertOne(log_document))
+
+        self.dbm.bulk_write(CmdbObjectLog.COLLECTION, self.db_name, log_documents)
+
+
+    def __object_log(self, object_document: dict, type_document: dict) -> dict:
+        """
+        Builds the creation log of an object. The render_state contains the information and fields of the
+        object without resolving its references, so no object has to be read back
+
+        Args:
+            object_document (dict): The object
+            type_document (dict): The type of the object
+
+        Returns:
+            dict: The log document
+        """
+        values = {field['name']: field['value'] for field in object_document['fields']}
+
+        render_result = RenderResult()
+        render_result.object_information = {
+            'object_id': object_document['public_id'],
+            'creation_time': object_document['creation_time'],
+            'last_edit_time': None,
+            'author_id': ADMIN_USER_ID,
+            'author_name': ADMIN_USER_NAME,
+            'editor_id': None,
+            'editor_name': None,
+            'active': True,
+            'version': object_document['version'],
+        }
+        render_result.type_information = {
+            'type_id': type_document['public_id'],
+            'type_name': type_document['name'],
+            'type_label': type_document['label'],
+            'creation_time': type_document['creation_time'],
+            'author_id': ADMIN_USER_ID,
+            'author_name': ADMIN_USER_NAME,
+            'icon': type_document['render_meta']['icon'],
+            'active': True,
+            'version': type_document['version'],
+            'acl': type_document['acl'],
+        }
+        render_result.fields = [{**field, 'value': values[field['name']]}
+                                for field in type_document['fields'] if field['name'] in values]
+        render_result.sections = type_document['render_meta']['sections']
+        render_result.summary_line = values.get('name', '')
+        render_result.multi_data_sections = object_document['multi_data_sections']
+
+        log_document = self.logs_manager.build_log_document(
+            LogAction.CREATE,
+            CmdbObjectLog.__name__,
+            object_id=object_document['public_id'],
+            version=object_document['version'],
+            user_id=ADMIN_USER_ID,
+            user_name=ADMIN_USER_NAME,
+            comment='Object was generated'
+        )
+        log_document.update(RenderStateCodec.encode(json.loads(json.dumps(render_result, default=default))))
+
+        return log_document
+
+# ----------------------------------------------------- RELATIONS ---------------------------------------------------- #
+
+    def __create_relations(self, generic_types: list[dict], object_ids: dict[int, range], count: int) -> None:
+        """
+        Creates a relation between all generic types and object relations between random objects
+
+        Args:
+            generic_types (list[dict]): The generic types
+            object_ids (dict[int, range]): The range of object public_ids per type
+            count (int): Number of object relations
+        """
+        if not count:
+            return
+
+        type_ids = [type_document['public_id'] for type_document in generic_types
+                    if object_ids[type_document['public_id']]]
+        relation_id = self.dbm.reserve_public_ids(CmdbRelation.COLLECTION, self.db_name, 1)
+
+        self.dbm.bulk_write(CmdbRelation.COLLECTION, self.db_name, [InsertOne({
+            'public_id': relation_id,
+            'relation_name': f"{self.prefix}_connected_to",
+            'parent_type_ids': type_ids,
+            'child_type_ids': type_ids,
+            'relation_name_parent': 'connected to',
+            'relation_name_child': 'connected from',
+            'description': 'Generated relation',
+            'relation_icon_parent': 'fas fa-link',
+            'relation_color_parent': '#1e88e5',
+            'relation_icon_child': 'fas fa-link',
+            'relation_color_child': '#43a047',
+            'sections': [{
+                'type': 'section',
+                'name': f"{self.prefix}_connection",
+                'label': 'Connection',
+                'fields': ['bandwidth', 'comment'],
+            }],
+            'fields': [
+                {'type': 'number', 'name': 'bandwidth', 'label': 'Bandwidth'},
+                {'type': 'text', 'name': 'comment', 'label': 'Comment'},
+            ],
+        })])
+
+        rand = self.rand
+        first_public_id = self.dbm.reserve_public_ids(CmdbObjectRelation.COLLECTION, self.db_name, count)
+
+        for batch_start in range(0, count, self.batch_size):
+            documents = []
+
+            for offset in range(batch_start, min(batch_start + self.batch_size, count)):
+                parent_type_id, child_type_id = rand.choice(type_ids), rand.choice(type_ids)
+
+                documents.append(InsertOne({
+                    'public_id': first_public_id + offset,
+                    'relation_id': relation_id,
+                    'relation_parent_id': rand.choice(object_ids[parent_type_id]),
+                    'relation_parent_type_id': parent_type_id,
+                    'relation_child_id': rand.choice(object_ids[child_type_id]),
+                    'relation_child_type_id': child_type_id,
+                    'author_id': ADMIN_USER_ID,
+                    'creation_time': self.now,
+                    'last_edit_time': None,
+                    'field_values': [
+                        {'name': 'bandwidth', 'value': rand.choice((100, 1000, 10000))},
+                        {'name': 'comment', 'value': f"generated relation {first_public_id + offset}"},
+                    ],
+                }))
+
+            self.dbm.bulk_write(CmdbObjectRelation.COLLECTION, self.db_name, documents)
+
+        # Running workers rebuild their RelationGraph with the generated relations
+        self.dbm.increase_collection_generation(CmdbObjectRelation.COLLECTION, self.db_name)
+
+        LOGGER.info("Generated %s object relations", count)
+
+# ------------------------------------------------------- ISMS ------------------------------------------------------- #
+
+    def __create_isms(self, count: int, object_ids: dict[int, range]) -> None:
+        """
+        Creates a 3x3 risk matrix with its likelihoods, impacts and risk classes, risks and IsmsRiskAssessments
+        of random objects
+
+        Args:
+            count (int): Number of IsmsRiskAssessments
+            object_ids (dict[int, range]): The range of object public_ids per type
+        """
+        levels = (('Low', 1.0), ('Medium', 2.0), ('High', 3.0))
+
+        likelihood_id = self.dbm.reserve_public_ids(IsmsLikelihood.COLLECTION, self.db_name, len(levels))
+        impact_id = self.dbm.reserve_public_ids(IsmsImpact.COLLECTION, self.db_name, len(levels))
+        risk_class_id = self.dbm.reserve_public_ids(IsmsRiskClass.COLLECTION, self.db_name, len(levels))
+
+        self.dbm.bulk_write(IsmsLikelihood.COLLECTION, self.db_name, [
+            InsertOne({'public_id': likelihood_id + index, 'name': f"{self.prefix} {name}", 'description': None,
+                       'calculation_basis': value})
+            for index, (name, value) in enumerate(levels)
+        ])
+        self.dbm.bulk_write(IsmsImpact.COLLECTION, self.db_name, [
+            InsertOne({'public_id': impact_id + index, 'name': f"{self.prefix} {name}", 'description': None,
+                       'calculation_basis': value})
+            for index, (name, value) in enumerate(levels)
+        ])
+        self.dbm.bulk_write(IsmsRiskClass.COLLECTION, self.db_name, [
+            InsertOne({'public_id': risk_class_id + index, 'name': f"{self.prefix} {name}", 'description': None,
+                       'color': '#cccccc', 'sort': index})
+            for index, (name, _) in enumerate(levels)
+        ])
+
+        self.dbm.upsert_set(IsmsRiskMatrix.COLLECTION, self.db_name, {
+            'public_id': 1,
+            'matrix_unit': None,
+            'risk_matrix': [
+                {
+                    'row': impact,
+                    'column': likelihood,
+                    'impact_id': impact_id + impact,
+                    'likelihood_id': likelihood_id + likelihood,
+                    'risk_class_id': risk_class_id + (impact + likelihood) // 2,
+                    'calculated_value': levels[impact][1] * levels[likelihood][1],
+                } for impact in range(len(levels)) for likelihood in range(len(levels))
+            ],
+        })
+
+        rand = self.rand
+        risk_count = max(20, count // 50)
+        first_risk_id = self.dbm.reserve_public_ids(IsmsRisk.COLLECTION, self.db_name, risk_count)
+
+        self.dbm.bulk_write(IsmsRisk.COLLECTION, self.db_name, [InsertOne({
+            'public_id': first_risk_id + offset,
+            'name': f"{self.prefix} risk {offset + 1}",
+            'risk_type': 'THREAT_X_VULNERABILITY',
+            'protection_goals': [1, 2, 3],
+            'threats': [],
+            'vulnerabilities': [],
+            'identifier': None,
+            'consequences': None,
+            'description': None,
+            'category_id': None,
+        }) for offset in range(risk_count)])
+
+        all_object_ids = [public_ids for public_ids in object_ids.values() if public_ids]
+
+        def risk_calculation() -> dict:
+            likelihood, impact = rand.randrange(len(levels)), rand.randrange(len(levels))
+
+            return {
+                'likelihood_id': likelihood_id + likelihood,
+                'likelihood_value': levels[likelihood][1],
+                'impacts': [],
+                'maximum_impact_id': impact_id + impact,
+                'maximum_impact_value': levels[impact][1],
+                'risk_level_value': levels[likelihood][1] * levels[impact][1],
+            }
+
+        first_public_id = self.dbm.reserve_public_ids(IsmsRiskAssessment.COLLECTION, self.db_name, count)
+
+        for batch_start in range(0, count, self.batch_size):
+            self.dbm.bulk_write(IsmsRiskAssessment.COLLECTION, self.db_name, [InsertOne({
+                'public_id': first_public_id + offset,
+                'risk_id': first_risk_id + rand.randrange(risk_count),
+                'object_id_ref_type': 'OBJECT',
+                'object_id': rand.choice(rand.choice(all_object_ids)),
+                'risk_calculation_before': risk_calculation(),
+                'risk_calculation_after': risk_calculation(),
+                'risk_assessor_id': None,
+                'risk_owner_id_ref_type': None,
+                'risk_owner_id': None,
+                'interviewed_persons': [],
+                'risk_assessment_date': self.now,
+                'additional_info': None,
+                'risk_treatment_option': 'AVOID',
+                'responsible_persons_id_ref_type': None,
+                'responsible_persons_id': None,
+                'risk_treatment_description': None,
+                'planned_implementation_date': None,
+                'implementation_status': None,
+                'finished_implementation_date': None,
+                'required_resources': None,
+                'costs_for_implementation': None,
+                'costs_for_implementation_currency': None,
+                'priority': None,
+                'audit_done_date': None,
+                'auditor_id_ref_type': None,
+                'auditor_id': None,
+                'audit_result': None,
+            }) for offset in range(batch_start, min(batch_start + self.batch_size, count))])
+
+        # Running workers recompute their cached risk matrices with the generated data
+        self.dbm.increase_collection_generation(IsmsRiskMatrix.COLLECTION, self.db_name)
+        self.dbm.increase_collection_generation(IsmsRiskAssessment.COLLECTION, self.db_name)
+
+        LOGGER.info("Generated %s risk assessments of %s risks", count, risk_count)
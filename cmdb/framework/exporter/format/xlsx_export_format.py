@@ -20,11 +20,14 @@
 import json
 import re
 import tempfile
-from openpyxl import Workbook
+from typing import TYPE_CHECKING
 
 from cmdb.framework.exporter.format.base_exporter_format import BaseExporterFormat
 from cmdb.framework.exporter.config.exporter_config_type_enum import ExporterConfigType
 from cmdb.framework.rendering.render_result import RenderResult
+
+if TYPE_CHECKING:
+    from openpyxl import Workbook
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -67,7 +70,7 @@ def export(self, data: list[RenderResult], *args) -> bytes:
             return tmp.read()
 
 
-    def create_xls_object(self, data: list[RenderResult], args) -> Workbook:
+    def create_xls_object(self, data: list[RenderResult], args) -> "Workbook":
         """
         Creates an XLSX workbook with the provided data
 
@@ -81,6 +84,10 @@ def create_xls_object(self, data: list[RenderResult], args) -> Workbook:
         Returns:
             Workbook: The created XLSX workbook
         """
+        # openpyxl is only imported when an XLSX file is exported
+        #pylint: disable=import-outside-toplevel
+        from openpyxl import Workbook
+
         # Create workbook
         workbook = Workbook()
 
@@ -17,7 +17,6 @@
 Implementation of ExcelObjectParser
 """
 import logging
-from openpyxl import load_workbook
 
 from cmdb.framework.importer.content_types import XLSXContent
 from cmdb.framework.importer.parser.base_object_parser import BaseObjectParser
@@ -59,6 +58,10 @@ def parse(self, file) -> ExcelObjectParserResponse:
         except (IndexError, ValueError, KeyError) as err:
             raise ParserRuntimeError(f"[ExcelObjectParser] An error occured: {err}") from err
 
+        # openpyxl is only imported when an XLSX file is parsed
+        #pylint: disable=import-outside-toplevel
+        from openpyxl import load_workbook
+
         wb = load_workbook(file)
 
         try:
@@ -0,0 +1,294 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the BufferedLogWriter which persists logs in batches outside of the request
+"""
+import os
+import time
+import queue
+import atexit
+import logging
+import threading
+from typing import Callable, Optional
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from cmdb.utils.configurable import Configurable
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                               BufferedLogWriter - CLASS                                              #
+# -------------------------------------------------------------------------------------------------------------------- #
+class BufferedLogWriter(Configurable):
+    """
+    Collects log documents in an in-process queue and persists them in batches with a background thread
+
+    The writer is enabled with configure(), which receives the options of the optional [Logs] section of the
+    config file. Without 'strict' the request returns as soon as the log is queued. With 'strict' the request
+    waits until the batch containing its log was written, which still saves the round-trips of single inserts.
+    If the queue is full, enqueue() returns None and the log has to be written directly
+    """
+    CONFIG_SECTION = 'Logs'
+
+    DEFAULT_OPTIONS = {
+        'buffered': False,
+        'strict': False,
+        'batch_size': 100,
+        'flush_interval': 1.0,
+        'queue_size': 10000,
+    }
+
+    __instance: Optional["BufferedLogWriter"] = None
+    __instance_lock = threading.Lock()
+
+
+    def __init__(self, flush: Callable[[str, list[dict]], list[int]], options: dict):
+        """
+        Initializes the BufferedLogWriter
+
+        Args:
+            flush (Callable[[str, list[dict]], list[int]]): Writes the log documents of a database and returns
+                                                             their public_ids
+            options (dict): The options of the writer
+        """
+        self.__flush = flush
+        self.strict: bool = options['strict']
+        self.__batch_size: int = options['batch_size']
+        self.__flush_interval: float = options['flush_interval']
+        self.__queue: queue.Queue = queue.Queue(maxsize=options['queue_size'])
+        self.__shutdown = threading.Event()
+        self.__thread: threading.Thread = None
+        self.__pid: int = None
+        self.__start_lock = threading.Lock()
+        atexit.register(self.stop)
+
+
+    @classmethod
+    def configure(cls, options: dict) -> None:
+        """
+        Sets the options of the writer, the writer of this process is created again with the new options
+
+        Args:
+            options (dict): Options of the [Logs] section of the config file
+        """
+        with cls.__instance_lock:
+            super().configure(options)
+            cls.__instance = None
+
+
+    @classmethod
+    def is_active(cls) -> bool:
+        """
+        Checks if logs are written in batches
+
+        Returns:
+            bool: True if buffered logs are enabled
+        """
+        return cls._options['buffered']
+
+
+    @classmethod
+    def get_instance(cls, flush: Callable[[str, list[dict]], list[int]]) -> Optional["BufferedLogWriter"]:
+        """
+        Retrieves the writer of this process
+
+        Args:
+            flush (Callable[[str, list[dict]], list[int]]): Writes the log documents of a database, only used when
+                                                             the writer is created
+
+        Returns:
+            Optional[BufferedLogWriter]: The writer, None if buffered logs are not enabled
+        """
+        if not cls.is_active():
+            return None
+
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls(flush, cls._options)
+
+        return cls.__instance
+
+
+    def enqueue(self, db_name: str, log_document: dict) -> Optional[Future]:
+        """
+        Queues a log document for the next batch
+
+        Args:
+            db_name (str): Database of the log
+            log_document (dict): The log document without a public_id
+
+        Returns:
+            Optional[Future]: Resolves to the public_id of the log once it was written, None if the queue is full
+        """
+        self.__ensure_started()
+        written = Future()
+
+        try:
+            self.__queue.put_nowait((db_name, log_document, written))
+        except queue.Full:
+            LOGGER.warning("[BufferedLogWriter] Queue is full, writing log directly!")
+            return None
+
+        return written
+
+
+    def flush(self, timeout: float = 10) -> bool:
+        """
+        Waits until the logs which were queued before this call are written
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait for the queued logs. Defaults to 10
+
+        Returns:
+            bool: True if the queued logs were written in time
+        """
+        self.__ensure_started()
+        flushed = Future()
+
+        try:
+            # The marker is resolved after the batch containing it, the batches are written in the queued order
+            self.__queue.put((None, None, flushed), timeout=timeout)
+            flushed.result(timeout)
+        except (queue.Full, FutureTimeoutError):
+            LOGGER.warning("[BufferedLogWriter] Queued logs were not written within %s seconds!", timeout)
+            return False
+
+        return True
+
+
+    def stop(self, timeout: float = 10) -> None:
+        """
+        Writes the remaining logs and stops the background thread
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait for the remaining logs. Defaults to 10
+        """
+        self.__shutdown.set()
+
+        if self.__thread and self.__thread.is_alive():
+            self.__thread.join(timeout)
+
+# ------------------------------------------------------ HELPERS ----------------------------------------------------- #
+
+    def __ensure_started(self) -> None:
+        """
+        Starts the background thread. Threads do not survive a fork, so the thread is started again in every
+        process which uses the writer
+        """
+        if self.__pid == os.getpid() and self.__thread.is_alive():
+            return
+
+        with self.__start_lock:
+            if self.__pid == os.getpid() and self.__thread.is_alive():
+                return
+
+            self.__pid = os.getpid()
+            self.__shutdown.clear()
+            self.__thread = threading.Thread(target=self.__run, name='buffered-log-writer', daemon=True)
+            self.__thread.start()
+
+
+    def __run(self) -> None:
+        """
+        Collects batches from the queue and writes them until the writer is stopped and the queue is empty
+        """
+        while not (self.__shutdown.is_set() and self.__queue.empty()):
+            batch = self.__collect_batch()
+
+            if batch:
+                self.__write_batch(batch)
+
+
+    def __collect_batch(self) -> list[tuple]:
+        """
+        Waits for the first queued log and collects further logs until the batch is full, the flush interval
+        has passed or a flush() is waiting for the batch
+
+        Returns:
+            list[tuple]: The queued (db_name, log_document, future) entries of the batch
+        """
+        try:
+            batch = [self.__queue.get(timeout=self.__flush_interval)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.__flush_interval
+
+        while len(batch) < self.__batch_size and batch[-1][0] is not None:
+            remaining = 0 if self.__shutdown.is_set() else deadline - time.monotonic()
+
+            try:
+                batch.append(self.__queue.get(timeout=remaining) if remaining > 0 else self.__queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+
+    def __write_batch(self, batch: list[tuple]) -> None:
+        """
+        Writes the logs of a batch grouped by their database and resolves their futures. If a batch of a database
+        can not be written, its logs are written one by one, so a single invalid log does not drop the whole batch
+
+        Args:
+            batch (list[tuple]): The queued (db_name, log_document, future) entries, flush() markers have no db_name
+        """
+        databases: dict[str, list[tuple]] = {}
+
+        for entry in batch:
+            if entry[0] is not None:
+                databases.setdefault(entry[0], []).append(entry)
+
+        for db_name, entries in databases.items():
+            if len(entries) == 1:
+                self.__write_entry(*entries[0])
+                continue
+
+            try:
+                # The flush encodes the documents, the originals are kept for the single inserts
+                public_ids = self.__flush(db_name, [dict(log_document) for _, log_document, _ in entries])
+            except Exception as err:
+                LOGGER.warning("[BufferedLogWriter] Failed to write %s logs to '%s', writing them one by one. "
+                               "Error: %s", len(entries), db_name, err)
+
+                for entry in entries:
+                    self.__write_entry(*entry)
+
+                continue
+
+            for (_, _, written), public_id in zip(entries, public_ids):
+                written.set_result(public_id)
+
+        for db_name, _, flushed in batch:
+            if db_name is None:
+                flushed.set_result(None)
+
+
+    def __write_entry(self, db_name: str, log_document: dict, written: Future) -> None:
+        """
+        Writes a single log and resolves its future
+
+        Args:
+            db_name (str): Database of the log
+            log_document (dict): The log document without a public_id
+            written (Future): Resolves to the public_id of the log
+        """
+        try:
+            written.set_result(self.__flush(db_name, [log_document])[0])
+        except Exception as err:
+            LOGGER.error("[BufferedLogWriter] Failed to write log to '%s'. Error: %s", db_name, err)
+            written.set_exception(err)
@@ -35,6 +35,7 @@ class MediaFile(BaseMediaFile):
     """Media Libary File"""
 
     COLLECTION = 'media.libary'
+    UPLOADS_COLLECTION = 'media.libary.uploads'
     REQUIRED_INIT_KEYS = ['name']
 
     INDEX_KEYS = [
@@ -0,0 +1,68 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of MediaFileBlob
+"""
+import logging
+from pymongo import IndexModel
+
+from cmdb.framework.media_library.base_media_file import BaseMediaFile
+from cmdb.models.cmdb_dao import CmdbDAO
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                 MediaFileBlob - CLASS                                                #
+# -------------------------------------------------------------------------------------------------------------------- #
+class MediaFileBlob(BaseMediaFile):
+    """
+    Deduplicated content of MediaFiles
+
+    Every distinct content is stored once in this GridFS bucket and identified by its SHA-256 hash.
+    MediaFiles reference the blob with their `blob_id` and the blob counts its references in `ref_count`
+    """
+
+    COLLECTION = 'media.libary.blobs'
+
+    SUPER_INDEX_KEYS = []
+
+    INDEX_KEYS = [
+        {
+            'keys': [('sha256', CmdbDAO.DAO_ASCENDING)],
+            'name': 'sha256',
+            'unique': True
+        }
+    ]
+
+    CHUNK_INDEX_KEYS = [
+        {
+            'keys': [('files_id', CmdbDAO.DAO_ASCENDING), ('n', CmdbDAO.DAO_ASCENDING)],
+            'name': 'files_id_n',
+            'unique': True
+        }
+    ]
+
+
+    @classmethod
+    def get_chunk_index_keys(cls) -> list[IndexModel]:
+        """
+        Return a list of MongoDB index models for the chunks collection of the bucket
+
+        Returns:
+            list[IndexModel]: A list of `IndexModel` objects representing database indexes
+        """
+        return [IndexModel(**index) for index in cls.CHUNK_INDEX_KEYS]
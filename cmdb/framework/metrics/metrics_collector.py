@@ -0,0 +1,465 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the MetricsCollector which records request and database metrics for Prometheus
+"""
+import os
+import glob
+import json
+import time
+import fcntl
+import atexit
+import logging
+import tempfile
+import threading
+from bisect import bisect_left
+
+from cmdb.utils.configurable import Configurable
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the histogram buckets, '+Inf' is added when the metrics are rendered
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Name of a metric: (type, help text)
+METRICS = {
+    'datagerry_http_request_duration_seconds': ('histogram', 'Duration of REST API requests'),
+    'datagerry_http_requests_total': ('counter', 'REST API requests by status code'),
+    'datagerry_mongodb_command_duration_seconds': ('histogram', 'Duration of MongoDB commands'),
+    'datagerry_mongodb_command_failures_total': ('counter', 'Failed MongoDB commands'),
+}
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                               MetricsCollector - CLASS                                               #
+# -------------------------------------------------------------------------------------------------------------------- #
+class MetricsCollector(Configurable):
+    """
+    Records the metrics of this process and renders the metrics of all processes in the Prometheus text format
+
+    The collector is enabled with configure(), which receives the options of the optional [Metrics] section of the
+    config file. Every gunicorn worker writes its metrics at most every 'flush_interval' seconds to an own file in
+    'directory', the metrics endpoint sums up the files of all workers. The files of workers which do not run anymore
+    are folded into the ARCHIVE_FILE, so the counters stay monotonic while the directory does not grow with every
+    recycled worker
+    """
+    CONFIG_SECTION = 'Metrics'
+
+    DEFAULT_OPTIONS = {
+        'active': False,
+        'directory': os.path.join(tempfile.gettempdir(), 'datagerry_metrics'),
+        'flush_interval': 5.0,
+    }
+
+    ARCHIVE_FILE = 'archived.json'
+
+    LOCK_FILE = '.lock'
+
+    __lock = threading.Lock()
+    __pid: int = None
+    __last_flush: float = 0.0
+
+    # (name, labels): [bucket counts..., sum, count]
+    __histograms: dict[tuple, list[float]] = {}
+    # (name, labels): value
+    __counters: dict[tuple, float] = {}
+
+
+    @classmethod
+    def configure(cls, options: dict) -> None:
+        """
+        Sets the options of the collector and creates the metrics directory if the collector is active
+
+        Args:
+            options (dict): Options of the [Metrics] section of the config file
+        """
+        with cls.__lock:
+            super().configure(options)
+
+        if cls.is_active():
+            os.makedirs(cls._options['directory'], exist_ok=True)
+
+# --------------------------------------------------- OBSERVATIONS --------------------------------------------------- #
+
+    @classmethod
+    def observe_request(cls, method: str, route: str, status: int, duration: float) -> None:
+        """
+        Records a finished REST API request
+
+        Args:
+            method (str): HTTP method of the request
+            route (str): The url rule of the route, e.g. '/objects/<int:public_id>'
+            status (int): Status code of the response
+            duration (float): Duration of the request in seconds
+        """
+        labels = (('method', method), ('route', route))
+
+        with cls.__lock:
+            cls.__reset_after_fork()
+            cls.__observe('datagerry_http_request_duration_seconds', labels, duration)
+            cls.__increase('datagerry_http_requests_total', labels + (('status', str(status)),))
+
+        cls.__flush_if_due()
+
+
+    @classmethod
+    def observe_command(cls, command: str, collection: str, duration: float, failed: bool = False) -> None:
+        """
+        Records a finished MongoDB command
+
+        Args:
+            command (str): Name of the command, e.g. 'find' or 'aggregate'
+            collection (str): Collection of the command, empty if the command has none
+            duration (float): Duration of the command in seconds
+            failed (bool, optional): True if the command failed. Defaults to False
+        """
+        labels = (('command', command), ('collection', collection))
+
+        with cls.__lock:
+            cls.__reset_after_fork()
+            cls.__observe('datagerry_mongodb_command_duration_seconds', labels, duration)
+
+            if failed:
+                cls.__increase('datagerry_mongodb_command_failures_total', labels)
+
+# ------------------------------------------------------ EXPORT ------------------------------------------------------ #
+
+    @classmethod
+    def render(cls) -> str:
+        """
+        Sums up the metrics of all processes and renders them in the Prometheus text format
+
+        Returns:
+            str: The metrics in the Prometheus text format version 0.0.4
+        """
+        cls.flush()
+        cls.archive_dead_processes()
+
+        histograms: dict[tuple, list[float]] = {}
+        counters: dict[tuple, float] = {}
+
+        for path in glob.glob(os.path.join(cls._options['directory'], '*.json')):
+            snapshot = cls.__read_snapshot(path)
+
+            if snapshot:
+                cls.__merge_snapshot(snapshot, histograms, counters)
+
+        lines = []
+
+        for name, (metric_type, help_text) in METRICS.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+            if metric_type == 'histogram':
+                for (metric_name, labels), values in sorted(histograms.items()):
+                    if metric_name == name:
+                        lines.extend(cls.__render_histogram(name, labels, values))
+            else:
+                for (metric_name, labels), value in sorted(counters.items()):
+                    if metric_name == name:
+                        lines.append(f"{name}{cls.__render_labels(labels)} {cls.__render_value(value)}")
+
+        return '\n'.join(lines) + '\n'
+
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Writes the metrics of this process to its file in the metrics directory
+        """
+        if not cls.is_active():
+            return
+
+        with cls.__lock:
+            cls.__reset_after_fork()
+            snapshot = {
+                'histograms': [[name, labels, values] for (name, labels), values in cls.__histograms.items()],
+                'counters': [[name, labels, value] for (name, labels), value in cls.__counters.items()],
+            }
+            cls.__last_flush = time.monotonic()
+
+        path = os.path.join(cls._options['directory'], f"{os.getpid()}.json")
+
+        try:
+            cls.__write_snapshot(path, snapshot)
+        except OSError as err:
+            LOGGER.error("[flush] Failed to write metrics to '%s': %s", path, err)
+
+
+    @classmethod
+    def clear_directory(cls) -> None:
+        """
+        Deletes the metrics files of previous runs, called by the gunicorn master before the workers are started
+        """
+        if not cls.is_active():
+            return
+
+        for path in glob.glob(os.path.join(cls._options['directory'], '*.json*')):
+            try:
+                os.remove(path)
+            except OSError as err:
+                LOGGER.warning("[clear_directory] Failed to delete '%s': %s", path, err)
+
+
+    @classmethod
+    def archive_dead_processes(cls) -> None:
+        """
+        Folds the metrics files of processes which do not run anymore into the ARCHIVE_FILE and deletes them
+
+        The directory is locked while the files are folded, so concurrent calls of multiple workers do not count
+        the metrics of a dead process twice
+        """
+        if not cls.is_active():
+            return
+
+        directory = cls._options['directory']
+
+        try:
+            with open(os.path.join(directory, cls.LOCK_FILE), 'w', encoding='utf-8') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+                dead_paths = [
+                    path for path in glob.glob(os.path.join(directory, '*.json'))
+                    if not cls.__is_running(os.path.basename(path)[:-len('.json')])
+                ]
+
+                if not dead_paths:
+                    return
+
+                archive_path = os.path.join(directory, cls.ARCHIVE_FILE)
+                histograms: dict[tuple, list[float]] = {}
+                counters: dict[tuple, float] = {}
+
+                for path in [archive_path] + dead_paths:
+                    snapshot = cls.__read_snapshot(path) if os.path.exists(path) else None
+
+                    if snapshot:
+                        cls.__merge_snapshot(snapshot, histograms, counters)
+
+                cls.__write_snapshot(archive_path, {
+                    'histograms': [[name, labels, values] for (name, labels), values in histograms.items()],
+                    'counters': [[name, labels, value] for (name, labels), value in counters.items()],
+                })
+
+                for path in dead_paths:
+                    for dead_file in (path, f"{path}.tmp"):
+                        if os.path.exists(dead_file):
+                            os.remove(dead_file)
+        except OSError as err:
+            LOGGER.warning("[archive_dead_processes] Failed to archive metrics in '%s': %s", directory, err)
+
+# ------------------------------------------------------ HELPERS ----------------------------------------------------- #
+
+    @staticmethod
+    def __is_running(pid: str) -> bool:
+        """
+        Checks if the process which owns a metrics file is still running
+
+        Args:
+            pid (str): Name of the metrics file without the extension, the process id or the archive
+
+        Returns:
+            bool: True if the process runs or the name is not a process id
+        """
+        if not pid.isdigit():
+            return True
+
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            # The process exists but belongs to another user
+            return True
+
+        return True
+
+
+    @staticmethod
+    def __read_snapshot(path: str) -> dict:
+        """
+        Reads a metrics file
+
+        Args:
+            path (str): Path of the metrics file
+
+        Returns:
+            dict: The snapshot of the file, empty if it could not be read
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as metrics_file:
+                return json.load(metrics_file)
+        except (OSError, ValueError) as err:
+            LOGGER.debug("[__read_snapshot] Skipped metrics file '%s': %s", path, err)
+            return {}
+
+
+    @staticmethod
+    def __write_snapshot(path: str, snapshot: dict) -> None:
+        """
+        Writes a metrics file through a temporary file, so that it is never read partially written
+
+        Args:
+            path (str): Path of the metrics file
+            snapshot (dict): The histograms and counters
+        """
+        with open(f"{path}.tmp", 'w', encoding='utf-8') as metrics_file:
+            json.dump(snapshot, metrics_file)
+
+        os.replace(f"{path}.tmp", path)
+
+
+    @staticmethod
+    def __merge_snapshot(snapshot: dict, histograms: dict[tuple, list[float]], counters: dict[tuple, float]) -> None:
+        """
+        Adds the histograms and counters of a metrics file to the totals
+
+        Args:
+            snapshot (dict): The content of a metrics file
+            histograms (dict[tuple, list[float]]): Summed histograms by (name, labels), extended by this call
+            counters (dict[tuple, float]): Summed counters by (name, labels), extended by this call
+        """
+        for name, labels, values in snapshot.get('histograms', []):
+            key = (name, tuple(tuple(label) for label in labels))
+            merged = histograms.setdefault(key, [0.0] * len(values))
+            histograms[key] = [total + value for total, value in zip(merged, values)]
+
+        for name, labels, value in snapshot.get('counters', []):
+            key = (name, tuple(tuple(label) for label in labels))
+            counters[key] = counters.get(key, 0.0) + value
+
+
+    @classmethod
+    def __reset_after_fork(cls) -> None:
+        """
+        Drops the metrics inherited from the parent process, they are already recorded in the file of the parent
+        """
+        if cls.__pid == os.getpid():
+            return
+
+        cls.__pid = os.getpid()
+        cls.__histograms = {}
+        cls.__counters = {}
+        cls.__last_flush = time.monotonic()
+
+
+    @classmethod
+    def __observe(cls, name: str, labels: tuple, value: float) -> None:
+        """
+        Adds a value to a histogram, the lock has to be held by the caller
+
+        Args:
+            name (str): Name of the histogram
+            labels (tuple): The (name, value) pairs of the labels
+            value (float): The observed value
+        """
+        values = cls.__histograms.get((name, labels))
+
+        if values is None:
+            values = [0.0] * (len(BUCKETS) + 3)
+            cls.__histograms[(name, labels)] = values
+
+        # Bucket counts are stored per bucket, the last bucket before sum and count is '+Inf'
+        values[bisect_left(BUCKETS, value)] += 1
+        values[-2] += value
+        values[-1] += 1
+
+
+    @classmethod
+    def __increase(cls, name: str, labels: tuple) -> None:
+        """
+        Increases a counter by one, the lock has to be held by the caller
+
+        Args:
+            name (str): Name of the counter
+            labels (tuple): The (name, value) pairs of the labels
+        """
+        cls.__counters[(name, labels)] = cls.__counters.get((name, labels), 0.0) + 1
+
+
+    @classmethod
+    def __flush_if_due(cls) -> None:
+        """
+        Writes the metrics of this process if the flush interval has passed since the last write
+        """
+        if time.monotonic() - cls.__last_flush >= cls._options['flush_interval']:
+            cls.flush()
+
+
+    @classmethod
+    def __render_histogram(cls, name: str, labels: tuple, values: list[float]) -> list[str]:
+        """
+        Renders a histogram with cumulative buckets
+
+        Args:
+            name (str): Name of the histogram
+            labels (tuple): The (name, value) pairs of the labels
+            values (list[float]): The bucket counts followed by sum and count
+
+        Returns:
+            list[str]: The lines of the histogram
+        """
+        lines = []
+        cumulative = 0.0
+
+        for upper_bound, bucket_count in zip(BUCKETS + ('+Inf',), values[:-2]):
+            cumulative += bucket_count
+            bucket_labels = labels + (('le', str(upper_bound)),)
+            lines.append(f"{name}_bucket{cls.__render_labels(bucket_labels)} {cls.__render_value(cumulative)}")
+
+        lines.append(f"{name}_sum{cls.__render_labels(labels)} {values[-2]}")
+        lines.append(f"{name}_count{cls.__render_labels(labels)} {cls.__render_value(values[-1])}")
+
+        return lines
+
+
+    @staticmethod
+    def __render_labels(labels: tuple) -> str:
+        """
+        Renders the labels of a sample with escaped values
+
+        Args:
+            labels (tuple): The (name, value) pairs of the labels
+
+        Returns:
+            str: The labels in curly braces, empty if there are none
+        """
+        if not labels:
+            return ''
+
+        escaped = [
+            (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+            for name, value in labels
+        ]
+
+        return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+    @staticmethod
+    def __render_value(value: float) -> str:
+        """
+        Renders counts without a fractional part
+
+        Args:
+            value (float): The value of the sample
+
+        Returns:
+            str: The rendered value
+        """
+        return str(int(value)) if float(value).is_integer() else str(value)
+
+
+atexit.register(MetricsCollector.flush)
@@ -0,0 +1,126 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the MongoCommandListener which records the durations of MongoDB commands
+"""
+import logging
+import threading
+from pymongo import monitoring
+
+from cmdb.framework.metrics.metrics_collector import MetricsCollector
+from cmdb.framework.metrics.request_profiler import RequestProfiler
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# Commands of the connection handshake and the server monitoring which are not recorded
+IGNORED_COMMANDS = ('hello', 'ismaster', 'ping', 'endsessions', 'buildinfo')
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                             MongoCommandListener - CLASS                                             #
+# -------------------------------------------------------------------------------------------------------------------- #
+class MongoCommandListener(monitoring.CommandListener):
+    """
+    Forwards the durations of MongoDB commands per command and collection to the MetricsCollector and to the
+    RequestProfiler. pymongo publishes the events in the thread which executes the command, so the RequestProfiler
+    can assign them to the profiled request of the thread
+    """
+    def __init__(self):
+        # (connection_id, request_id): collection of the started command
+        self.__collections: dict[tuple, str] = {}
+        self.__lock = threading.Lock()
+
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        """
+        Remembers the collection of a started command, the finished events do not contain the command anymore
+
+        Args:
+            event (CommandStartedEvent): The started command
+        """
+        if self.__is_ignored(event.command_name):
+            return
+
+        collection = event.command.get(event.command_name)
+
+        if not isinstance(collection, str):
+            # getMore references the collection in a separate field, other commands have none
+            collection = event.command.get('collection', '')
+
+        with self.__lock:
+            self.__collections[(event.connection_id, event.request_id)] = str(collection)
+
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        """
+        Records the duration of a succeeded command
+
+        Args:
+            event (CommandSucceededEvent): The succeeded command
+        """
+        self.__record(event, failed=False)
+
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        """
+        Records the duration of a failed command
+
+        Args:
+            event (CommandFailedEvent): The failed command
+        """
+        self.__record(event, failed=True)
+
+
+    def __record(self, event, failed: bool) -> None:
+        """
+        Hands over a finished command to the MetricsCollector and the RequestProfiler
+
+        Args:
+            event (CommandSucceededEvent | CommandFailedEvent): The finished command
+            failed (bool): True if the command failed
+        """
+        if self.__is_ignored(event.command_name):
+            return
+
+        with self.__lock:
+            collection = self.__collections.pop((event.connection_id, event.request_id), '')
+
+        duration = event.duration_micros / 1e6
+
+        try:
+            if MetricsCollector.is_active():
+                MetricsCollector.observe_command(event.command_name, collection, duration, failed)
+
+            RequestProfiler.record_command(event.command_name, collection, duration)
+        except Exception as err:
+            # A listener must never break the command it observes
+            LOGGER.debug("[__record] Failed to record command '%s': %s", event.command_name, err)
+
+
+    @staticmethod
+    def __is_ignored(command_name: str) -> bool:
+        """
+        Checks if a command belongs to the handshake, authentication or server monitoring
+
+        Args:
+            command_name (str): Name of the command
+
+        Returns:
+            bool: True if the command is not recorded
+        """
+        command_name = command_name.lower()
+
+        return command_name in IGNORED_COMMANDS or command_name.startswith('sasl')
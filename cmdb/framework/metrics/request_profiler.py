@@ -0,0 +1,313 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the RequestProfiler which profiles single requests on demand
+"""
+import os
+import re
+import hmac
+import glob
+import json
+import time
+import uuid
+import pstats
+import cProfile
+import logging
+import tempfile
+import threading
+import tracemalloc
+from typing import Optional
+from datetime import datetime, timezone
+
+from cmdb.utils.configurable import Configurable
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+PROFILE_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                RequestProfiler - CLASS                                               #
+# -------------------------------------------------------------------------------------------------------------------- #
+class RequestProfiler(Configurable):
+    """
+    Profiles a single request with cProfile and tracemalloc and counts its MongoDB round-trips
+
+    The profiler is enabled with configure(), which receives the options of the optional [Profiling] section of the
+    config file. Only requests which send the configured 'token' in the PROFILE_HEADER are profiled. The results
+    are written as JSON files to 'directory', so they can be retrieved by their profile id from every worker
+    """
+    CONFIG_SECTION = 'Profiling'
+
+    PROFILE_HEADER = 'X-Profile-Token'
+
+    PROFILE_ID_HEADER = 'X-Profile-Id'
+
+    DEFAULT_OPTIONS = {
+        'active': False,
+        'token': '',
+        'directory': os.path.join(tempfile.gettempdir(), 'datagerry_profiles'),
+        'max_profiles': 100,
+        'top': 30,
+        'trace_allocations': True,
+    }
+
+    __tracemalloc_lock = threading.Lock()
+    __tracemalloc_users: int = 0
+    # Profile of the request which is handled by the current thread
+    __current = threading.local()
+
+
+    def __init__(self):
+        self.profile_id = uuid.uuid4().hex
+        self.__start = time.perf_counter()
+        self.__profiler: Optional[cProfile.Profile] = cProfile.Profile()
+        self.__snapshot: Optional[tracemalloc.Snapshot] = None
+        # (command, collection): [count, duration in seconds]
+        self.__commands: dict[tuple, list] = {}
+
+
+    @classmethod
+    def configure(cls, options: dict) -> None:
+        """
+        Sets the options of the profiler and creates the profile directory if the profiler is active
+
+        Args:
+            options (dict): Options of the [Profiling] section of the config file
+        """
+        super().configure(options)
+
+        if cls.is_active():
+            os.makedirs(cls._options['directory'], exist_ok=True)
+
+
+    @classmethod
+    def is_active(cls) -> bool:
+        """
+        Checks if requests can be profiled, a token is required because profiling slows down the request
+
+        Returns:
+            bool: True if the profiler is active
+        """
+        return cls._options['active'] and bool(cls._options['token'])
+
+
+    @classmethod
+    def is_requested(cls, header_value: Optional[str]) -> bool:
+        """
+        Checks if the profile header of a request contains the configured token
+
+        Args:
+            header_value (Optional[str]): Value of the PROFILE_HEADER of the request
+
+        Returns:
+            bool: True if the request should be profiled
+        """
+        if not cls.is_active():
+            return False
+
+        # Constant time comparison, the token enables profiling on production workers. Compared as bytes because
+        # compare_digest() rejects strings with non-ASCII characters
+        return hmac.compare_digest((header_value or '').encode('utf-8'), cls._options['token'].encode('utf-8'))
+
+# ----------------------------------------------------- PROFILING ---------------------------------------------------- #
+
+    @classmethod
+    def start(cls) -> Optional["RequestProfiler"]:
+        """
+        Starts profiling the request of the current thread
+
+        Returns:
+            Optional[RequestProfiler]: The running profile, None if another profiler is already active
+        """
+        profile = cls()
+
+        try:
+            profile.__profiler.enable()
+        except ValueError as err:
+            # Python 3.12+ allows only one active profiler for all threads
+            LOGGER.warning("[start] Request is not profiled: %s", err)
+            return None
+
+        if cls._options['trace_allocations']:
+            with cls.__tracemalloc_lock:
+                if cls.__tracemalloc_users == 0:
+                    tracemalloc.start()
+
+                cls.__tracemalloc_users += 1
+
+            profile.__snapshot = tracemalloc.take_snapshot()
+
+        cls.__current.profile = profile
+
+        return profile
+
+
+    @classmethod
+    def record_command(cls, command: str, collection: str, duration: float) -> None:
+        """
+        Counts a MongoDB command for the profile of the current thread
+
+        Args:
+            command (str): Name of the command
+            collection (str): Collection of the command
+            duration (float): Duration of the command in seconds
+        """
+        profile: Optional[RequestProfiler] = getattr(cls.__current, 'profile', None)
+
+        if profile is None:
+            return
+
+        stats = profile.__commands.setdefault((command, collection), [0, 0.0])
+        stats[0] += 1
+        stats[1] += duration
+
+
+    def finish(self, request_info: dict) -> None:
+        """
+        Stops the profile and writes its results
+
+        Args:
+            request_info (dict): Method, route, path and status code of the profiled request
+        """
+        self.__profiler.disable()
+        duration = time.perf_counter() - self.__start
+        RequestProfiler.__current.profile = None
+
+        allocations = []
+
+        if self.__snapshot is not None:
+            allocations = self.__top_allocations(tracemalloc.take_snapshot())
+
+            with RequestProfiler.__tracemalloc_lock:
+                RequestProfiler.__tracemalloc_users -= 1
+
+                if RequestProfiler.__tracemalloc_users == 0:
+                    tracemalloc.stop()
+
+        commands = sorted(self.__commands.items(), key=lambda item: item[1][0], reverse=True)
+
+        profile = {
+            'profile_id': self.profile_id,
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            **request_info,
+            'duration_ms': round(duration * 1000, 2),
+            'functions': self.__top_functions(),
+            'allocations': allocations,
+            'database': {
+                'round_trips': sum(count for count, _ in self.__commands.values()),
+                'duration_ms': round(sum(seconds for _, seconds in self.__commands.values()) * 1000, 2),
+                'commands': [
+                    {
+                        'command': command,
+                        'collection': collection,
+                        'count': count,
+                        'duration_ms': round(seconds * 1000, 2),
+                    } for (command, collection), (count, seconds) in commands
+                ],
+            },
+        }
+
+        RequestProfiler.__write(profile)
+
+
+    def __top_functions(self) -> list[dict]:
+        """
+        Lists the functions with the highest cumulative time
+
+        Returns:
+            list[dict]: Location, calls, own time and cumulative time of the functions
+        """
+        stats = pstats.Stats(self.__profiler).stats
+        top_stats = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:RequestProfiler._options['top']]
+
+        return [
+            {
+                'function': f"{file_name}:{line}({function_name})",
+                'calls': calls,
+                'total_time_ms': round(total_time * 1000, 3),
+                'cumulative_time_ms': round(cumulative_time * 1000, 3),
+            } for (file_name, line, function_name), (_, calls, total_time, cumulative_time, _) in top_stats
+        ]
+
+
+    def __top_allocations(self, snapshot: tracemalloc.Snapshot) -> list[dict]:
+        """
+        Lists the source lines which allocated the most memory during the request. Allocations of concurrently
+        handled requests of the same worker are included, because tracemalloc traces the whole process
+
+        Args:
+            snapshot (tracemalloc.Snapshot): Snapshot at the end of the request
+
+        Returns:
+            list[dict]: Location, allocated size and number of allocated blocks of the source lines
+        """
+        differences = snapshot.compare_to(self.__snapshot, 'lineno')
+
+        return [
+            {
+                'location': str(difference.traceback),
+                'size_kib': round(difference.size_diff / 1024, 2),
+                'blocks': difference.count_diff,
+            } for difference in differences[:RequestProfiler._options['top']] if difference.size_diff > 0
+        ]
+
+# ------------------------------------------------------ STORAGE ----------------------------------------------------- #
+
+    @classmethod
+    def __write(cls, profile: dict) -> None:
+        """
+        Writes a profile to the profile directory and deletes the oldest profiles above 'max_profiles'
+
+        Args:
+            profile (dict): The results of the profile
+        """
+        directory = cls._options['directory']
+        path = os.path.join(directory, f"{profile['profile_id']}.json")
+
+        try:
+            with open(f"{path}.tmp", 'w', encoding='utf-8') as profile_file:
+                json.dump(profile, profile_file)
+
+            os.replace(f"{path}.tmp", path)
+
+            paths = sorted(glob.glob(os.path.join(directory, '*.json')), key=os.path.getmtime)
+
+            for outdated_path in paths[:-cls._options['max_profiles']]:
+                os.remove(outdated_path)
+        except OSError as err:
+            LOGGER.error("[__write] Failed to write profile '%s': %s", path, err)
+
+
+    @classmethod
+    def get_profile(cls, profile_id: str) -> Optional[dict]:
+        """
+        Retrieves a written profile
+
+        Args:
+            profile_id (str): The profile id which was returned in the PROFILE_ID_HEADER of the response
+
+        Returns:
+            Optional[dict]: The profile, None if it does not exist
+        """
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+
+        try:
+            with open(os.path.join(cls._options['directory'], f"{profile_id}.json"), 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
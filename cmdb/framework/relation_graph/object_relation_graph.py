@@ -0,0 +1,329 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the ObjectRelationGraph, an in-memory adjacency structure of all CmdbObjectRelations
+"""
+import logging
+from array import array
+from collections import deque
+from typing import Iterator, Optional
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                              ObjectRelationGraph - CLASS                                             #
+# -------------------------------------------------------------------------------------------------------------------- #
+class ObjectRelationGraph:
+    """
+    Directed graph of CmdbObjects where every CmdbObjectRelation is an edge from the parent to the child
+
+    The neighbours of an object are stored as compact integer arrays keyed by the public_id of the object, with a
+    parallel array holding the public_ids of the CmdbObjectRelations. Queries accept a 'towards_children' flag:
+    True follows edges from parent to child, False from child to parent and None follows both directions
+
+    A copy shares the arrays of the original graph and only replaces the arrays it changes, so a graph which is
+    read by other threads is never changed in place
+    """
+    TYPECODE = 'q'
+
+
+    def __init__(self, generation: int = 0):
+        """
+        Initializes an empty ObjectRelationGraph
+
+        Args:
+            generation (int, optional): Generation of the CmdbObjectRelations this graph represents. Defaults to 0
+        """
+        self.generation = generation
+
+        # public_id of the CmdbObjectRelation => (parent_id, child_id, relation_id)
+        self._edges: dict[int, tuple[int, int, int]] = {}
+
+        self._children: dict[int, array] = {}
+        self._children_edges: dict[int, array] = {}
+        self._parents: dict[int, array] = {}
+        self._parents_edges: dict[int, array] = {}
+
+        # Arrays of these adjacency dicts and keys were created by this graph and can be changed in place
+        self._owned: set[tuple[int, int]] = set()
+
+
+    def copy(self) -> "ObjectRelationGraph":
+        """
+        Creates a copy of the graph which shares the adjacency arrays until they are changed by the copy
+
+        Returns:
+            ObjectRelationGraph: The copy of the graph
+        """
+        graph = ObjectRelationGraph(self.generation)
+
+        graph._edges = dict(self._edges)
+        graph._children = dict(self._children)
+        graph._children_edges = dict(self._children_edges)
+        graph._parents = dict(self._parents)
+        graph._parents_edges = dict(self._parents_edges)
+
+        return graph
+
+
+    @property
+    def edge_count(self) -> int:
+        """
+        Number of CmdbObjectRelations in the graph
+        """
+        return len(self._edges)
+
+# --------------------------------------------------- GRAPH CHANGES -------------------------------------------------- #
+
+    def add(self, object_relation: dict) -> None:
+        """
+        Adds a CmdbObjectRelation as edge, an existing edge with the same public_id is replaced
+
+        Args:
+            object_relation (dict): The CmdbObjectRelation
+        """
+        public_id = object_relation['public_id']
+
+        if public_id in self._edges:
+            self.remove(public_id)
+
+        parent_id = object_relation['relation_parent_id']
+        child_id = object_relation['relation_child_id']
+
+        self._edges[public_id] = (parent_id, child_id, object_relation.get('relation_id'))
+
+        self.__append(self._children, self._children_edges, parent_id, child_id, public_id)
+        self.__append(self._parents, self._parents_edges, child_id, parent_id, public_id)
+
+
+    def remove(self, public_id: int) -> None:
+        """
+        Removes the edge of a CmdbObjectRelation, unknown public_ids are ignored
+
+        Args:
+            public_id (int): public_id of the CmdbObjectRelation
+        """
+        edge = self._edges.pop(public_id, None)
+
+        if not edge:
+            return
+
+        parent_id, child_id, _ = edge
+
+        self.__discard(self._children, self._children_edges, parent_id, public_id)
+        self.__discard(self._parents, self._parents_edges, child_id, public_id)
+
+# ------------------------------------------------------ QUERIES ----------------------------------------------------- #
+
+    def fan_out(self, object_id: int) -> int:
+        """
+        Number of CmdbObjectRelations where the CmdbObject is the parent
+
+        Args:
+            object_id (int): public_id of the CmdbObject
+
+        Returns:
+            int: The number of outgoing edges
+        """
+        return len(self._children.get(object_id, ()))
+
+
+    def fan_in(self, object_id: int) -> int:
+        """
+        Number of CmdbObjectRelations where the CmdbObject is the child
+
+        Args:
+            object_id (int): public_id of the CmdbObject
+
+        Returns:
+            int: The number of incoming edges
+        """
+        return len(self._parents.get(object_id, ()))
+
+
+    def neighbours(self,
+                   object_id: int,
+                   towards_children: Optional[bool],
+                   relation_ids: set[int] = None) -> Iterator[tuple[int, int]]:
+        """
+        Yields the direct neighbours of a CmdbObject
+
+        Args:
+            object_id (int): public_id of the CmdbObject
+            towards_children (Optional[bool]): Direction of the edges, None for both directions
+            relation_ids (set[int], optional): Only follow CmdbObjectRelations of these CmdbRelations
+
+        Yields:
+            tuple[int, int]: public_id of the neighbour and of the CmdbObjectRelation leading to it
+        """
+        adjacencies = []
+
+        if towards_children is not False:
+            adjacencies.append((self._children, self._children_edges))
+
+        if towards_children is not True:
+            adjacencies.append((self._parents, self._parents_edges))
+
+        for nodes, edges in adjacencies:
+            for neighbour_id, edge_id in zip(nodes.get(object_id, ()), edges.get(object_id, ())):
+                if relation_ids and self._edges[edge_id][2] not in relation_ids:
+                    continue
+
+                yield neighbour_id, edge_id
+
+
+    def reachable(self,
+                  object_id: int,
+                  towards_children: Optional[bool],
+                  max_depth: int = 0,
+                  relation_ids: set[int] = None) -> dict[int, int]:
+        """
+        Retrieves all CmdbObjects which are reachable from a CmdbObject with a breadth-first search
+
+        Args:
+            object_id (int): public_id of the CmdbObject where the search starts
+            towards_children (Optional[bool]): Direction of the edges, None for both directions
+            max_depth (int, optional): Maximum number of hops, 0 for no limit. Defaults to 0
+            relation_ids (set[int], optional): Only follow CmdbObjectRelations of these CmdbRelations
+
+        Returns:
+            dict[int, int]: The distance of every reachable CmdbObject, the start object is not included
+        """
+        distances = {object_id: 0}
+        queue = deque([object_id])
+
+        while queue:
+            current_id = queue.popleft()
+            distance = distances[current_id] + 1
+
+            if max_depth and distance > max_depth:
+                continue
+
+            for neighbour_id, _ in self.neighbours(current_id, towards_children, relation_ids):
+                if neighbour_id not in distances:
+                    distances[neighbour_id] = distance
+                    queue.append(neighbour_id)
+
+        del distances[object_id]
+
+        return distances
+
+
+    def shortest_path(self,
+                      source_id: int,
+                      target_id: int,
+                      towards_children: Optional[bool],
+                      relation_ids: set[int] = None) -> Optional[tuple[list[int], list[int]]]:
+        """
+        Retrieves the shortest path between two CmdbObjects with a breadth-first search
+
+        Args:
+            source_id (int): public_id of the CmdbObject where the path starts
+            target_id (int): public_id of the CmdbObject where the path ends
+            towards_children (Optional[bool]): Direction of the edges, None for both directions
+            relation_ids (set[int], optional): Only follow CmdbObjectRelations of these CmdbRelations
+
+        Returns:
+            Optional[tuple[list[int], list[int]]]: public_ids of the CmdbObjects on the path and of the
+                                                   CmdbObjectRelations between them, None if there is no path
+        """
+        # object_id => (previous object_id, public_id of the CmdbObjectRelation)
+        predecessors: dict[int, Optional[tuple[int, int]]] = {source_id: None}
+        queue = deque([source_id])
+
+        while queue and target_id not in predecessors:
+            current_id = queue.popleft()
+
+            for neighbour_id, edge_id in self.neighbours(current_id, towards_children, relation_ids):
+                if neighbour_id not in predecessors:
+                    predecessors[neighbour_id] = (current_id, edge_id)
+                    queue.append(neighbour_id)
+
+        if target_id not in predecessors:
+            return None
+
+        object_ids = [target_id]
+        object_relation_ids = []
+
+        while predecessors[object_ids[-1]]:
+            previous_id, edge_id = predecessors[object_ids[-1]]
+            object_ids.append(previous_id)
+            object_relation_ids.append(edge_id)
+
+        return object_ids[::-1], object_relation_ids[::-1]
+
+# -------------------------------------------------- HELPER METHODS -------------------------------------------------- #
+
+    def __append(self, nodes: dict[int, array], edges: dict[int, array], key: int, node_id: int, edge_id: int):
+        """
+        Appends a neighbour and its edge to the arrays of a CmdbObject
+
+        Args:
+            nodes (dict[int, array]): Neighbour arrays by public_id of the CmdbObject
+            edges (dict[int, array]): Edge arrays by public_id of the CmdbObject
+            key (int): public_id of the CmdbObject
+            node_id (int): public_id of the neighbour
+            edge_id (int): public_id of the CmdbObjectRelation
+        """
+        if key not in nodes:
+            nodes[key] = array(self.TYPECODE)
+            edges[key] = array(self.TYPECODE)
+            self._owned.add((id(nodes), key))
+        else:
+            self.__own(nodes, edges, key)
+
+        nodes[key].append(node_id)
+        edges[key].append(edge_id)
+
+
+    def __discard(self, nodes: dict[int, array], edges: dict[int, array], key: int, edge_id: int):
+        """
+        Removes an edge and its neighbour from the arrays of a CmdbObject
+
+        Args:
+            nodes (dict[int, array]): Neighbour arrays by public_id of the CmdbObject
+            edges (dict[int, array]): Edge arrays by public_id of the CmdbObject
+            key (int): public_id of the CmdbObject
+            edge_id (int): public_id of the CmdbObjectRelation
+        """
+        self.__own(nodes, edges, key)
+        index = edges[key].index(edge_id)
+
+        del nodes[key][index]
+        del edges[key][index]
+
+        if not edges[key]:
+            del nodes[key]
+            del edges[key]
+            self._owned.discard((id(nodes), key))
+
+
+    def __own(self, nodes: dict[int, array], edges: dict[int, array], key: int):
+        """
+        Replaces the arrays of a CmdbObject which are shared with another graph by private copies
+
+        Args:
+            nodes (dict[int, array]): Neighbour arrays by public_id of the CmdbObject
+            edges (dict[int, array]): Edge arrays by public_id of the CmdbObject
+            key (int): public_id of the CmdbObject
+        """
+        if (id(nodes), key) in self._owned:
+            return
+
+        nodes[key] = array(self.TYPECODE, nodes[key])
+        edges[key] = array(self.TYPECODE, edges[key])
+        self._owned.add((id(nodes), key))
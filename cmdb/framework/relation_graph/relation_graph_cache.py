@@ -0,0 +1,252 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the RelationGraphCache which keeps one ObjectRelationGraph per database in memory
+"""
+import time
+import logging
+from typing import Optional
+from threading import Lock
+from collections import OrderedDict
+
+from cmdb.database import MongoDatabaseManager
+
+from cmdb.models.object_relation_model.cmdb_object_relation import CmdbObjectRelation
+
+from cmdb.framework.relation_graph.object_relation_graph import ObjectRelationGraph
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                              RelationGraphCache - CLASS                                              #
+# -------------------------------------------------------------------------------------------------------------------- #
+class RelationGraphCache:
+    """
+    Keeps an ObjectRelationGraph per database in memory and updates it incrementally on changes
+
+    Every change of CmdbObjectRelations increments the collection generation in the database. A process applies a
+    change to its graph only if the graph was on the previous generation, otherwise another worker changed the
+    relations in between and the graph is rebuilt with the next query
+
+    Published graphs are never changed. A change is applied to a copy of the graph which replaces it afterwards,
+    so queries can walk a graph without holding a lock while other threads change the relations. Builds and changes
+    are serialized per database, the lock over all databases guards the creation of these locks and the cache itself
+
+    In cloud mode a worker can serve many databases. At most MAX_GRAPHS graphs are kept, the least recently used
+    graph is evicted first and graphs which were not used for GRAPH_TTL seconds are evicted as well
+    """
+    MAX_GRAPHS = 32
+    GRAPH_TTL = 1800
+
+    # Graphs by database, ordered from the least to the most recently used one
+    _graphs: OrderedDict[str, ObjectRelationGraph] = OrderedDict()
+    _last_used: dict[str, float] = {}
+    _locks: dict[str, Lock] = {}
+    _lock = Lock()
+
+
+    @classmethod
+    def get_graph(cls, dbm: MongoDatabaseManager, db_name: str) -> ObjectRelationGraph:
+        """
+        Retrieves the ObjectRelationGraph of a database, it is built from all CmdbObjectRelations if it is missing
+        or outdated
+
+        The returned graph is a snapshot which is not changed anymore and can be queried without a lock
+
+        Args:
+            dbm (MongoDatabaseManager): Database interaction manager
+            db_name (str): Name of the database
+
+        Returns:
+            ObjectRelationGraph: The current ObjectRelationGraph
+        """
+        generation = dbm.get_collection_generation(CmdbObjectRelation.COLLECTION, db_name)
+        graph = cls.__get_cached_graph(db_name)
+
+        if graph and graph.generation == generation:
+            return graph
+
+        with cls.__get_database_lock(db_name):
+            # Another thread could have built or updated the graph in the meantime
+            graph = cls.__get_cached_graph(db_name)
+
+            if graph and graph.generation >= generation:
+                return graph
+
+            graph = cls.__build_graph(dbm, db_name, generation)
+            cls.__cache_graph(db_name, graph)
+
+            return graph
+
+
+    @classmethod
+    def apply_change(cls,
+                     dbm: MongoDatabaseManager,
+                     db_name: str,
+                     removed_ids: list[int] = None,
+                     added_relations: list[dict] = None) -> None:
+        """
+        Registers a change of CmdbObjectRelations which was already written to the database. Errors are only logged
+        because the change itself succeeded, the graph is rebuilt with the next query then
+
+        Args:
+            dbm (MongoDatabaseManager): Database interaction manager
+            db_name (str): Name of the database
+            removed_ids (list[int], optional): public_ids of removed CmdbObjectRelations
+            added_relations (list[dict], optional): Inserted CmdbObjectRelations or new versions of updated ones
+        """
+        with cls.__get_database_lock(db_name):
+            try:
+                generation = dbm.increase_collection_generation(CmdbObjectRelation.COLLECTION, db_name)
+
+                graph = cls.__get_cached_graph(db_name)
+
+                if not graph or graph.generation != generation - 1:
+                    cls.__discard_graph(db_name)
+                    return
+
+                graph = graph.copy()
+
+                for public_id in removed_ids or []:
+                    graph.remove(public_id)
+
+                for object_relation in added_relations or []:
+                    graph.add(object_relation)
+
+                graph.generation = generation
+                cls.__cache_graph(db_name, graph)
+            except Exception as err:
+                LOGGER.error("[apply_change] RelationGraph of '%s' invalidated: %s. Type: %s", db_name, err, type(err))
+                cls.__discard_graph(db_name)
+
+# -------------------------------------------------- HELPER METHODS -------------------------------------------------- #
+
+    @classmethod
+    def __get_database_lock(cls, db_name: str) -> Lock:
+        """
+        Retrieves the lock which serializes builds and changes of the ObjectRelationGraph of a database
+
+        Args:
+            db_name (str): Name of the database
+
+        Returns:
+            Lock: The lock of the database
+        """
+        with cls._lock:
+            return cls._locks.setdefault(db_name, Lock())
+
+
+    @classmethod
+    def __get_cached_graph(cls, db_name: str) -> Optional[ObjectRelationGraph]:
+        """
+        Retrieves the cached ObjectRelationGraph of a database and marks it as most recently used
+
+        Args:
+            db_name (str): Name of the database
+
+        Returns:
+            Optional[ObjectRelationGraph]: The cached graph, None if there is none or it expired
+        """
+        with cls._lock:
+            cls.__evict_expired_graphs()
+            graph = cls._graphs.get(db_name)
+
+            if graph:
+                cls._graphs.move_to_end(db_name)
+                cls._last_used[db_name] = time.monotonic()
+
+            return graph
+
+
+    @classmethod
+    def __cache_graph(cls, db_name: str, graph: ObjectRelationGraph) -> None:
+        """
+        Stores the ObjectRelationGraph of a database and evicts the least recently used graphs above MAX_GRAPHS
+
+        Args:
+            db_name (str): Name of the database
+            graph (ObjectRelationGraph): The current graph of the database
+        """
+        with cls._lock:
+            cls._graphs[db_name] = graph
+            cls._graphs.move_to_end(db_name)
+            cls._last_used[db_name] = time.monotonic()
+
+            while len(cls._graphs) > cls.MAX_GRAPHS:
+                evicted_db_name, _ = cls._graphs.popitem(last=False)
+                cls._last_used.pop(evicted_db_name, None)
+
+
+    @classmethod
+    def __discard_graph(cls, db_name: str) -> None:
+        """
+        Removes the ObjectRelationGraph of a database from the cache
+
+        Args:
+            db_name (str): Name of the database
+        """
+        with cls._lock:
+            cls._graphs.pop(db_name, None)
+            cls._last_used.pop(db_name, None)
+
+
+    @classmethod
+    def __evict_expired_graphs(cls) -> None:
+        """
+        Removes the graphs which were not used for GRAPH_TTL seconds, the caller holds the lock over all databases
+        """
+        expired_before = time.monotonic() - cls.GRAPH_TTL
+
+        # The least recently used graphs come first
+        while cls._graphs:
+            db_name = next(iter(cls._graphs))
+
+            if cls._last_used.get(db_name, 0) >= expired_before:
+                break
+
+            cls._graphs.pop(db_name)
+            cls._last_used.pop(db_name, None)
+
+
+    @classmethod
+    def __build_graph(cls, dbm: MongoDatabaseManager, db_name: str, generation: int) -> ObjectRelationGraph:
+        """
+        Builds the ObjectRelationGraph from all CmdbObjectRelations of a database
+
+        Args:
+            dbm (MongoDatabaseManager): Database interaction manager
+            db_name (str): Name of the database
+            generation (int): The generation read before the CmdbObjectRelations are loaded
+
+        Returns:
+            ObjectRelationGraph: The new ObjectRelationGraph
+        """
+        graph = ObjectRelationGraph(generation)
+
+        object_relations = dbm.find(
+            CmdbObjectRelation.COLLECTION,
+            db_name,
+            filter={},
+            projection={'_id': 0, 'public_id': 1, 'relation_id': 1, 'relation_parent_id': 1, 'relation_child_id': 1}
+        )
+
+        for object_relation in object_relations:
+            graph.add(object_relation)
+
+        LOGGER.debug("[__build_graph] Built RelationGraph of '%s' with %s edges", db_name, graph.edge_count)
+
+        return graph
@@ -0,0 +1,127 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of RetentionPolicy
+"""
+import logging
+from typing import Optional
+
+from cmdb.manager.system_manager.system_config_reader import SystemConfigReader
+from cmdb.framework.retention.retention_target import RetentionTarget
+
+from cmdb.errors.system_config import SectionError
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                RetentionPolicy - CLASS                                               #
+# -------------------------------------------------------------------------------------------------------------------- #
+class RetentionPolicy:
+    """
+    Defines what happens to the documents of a RetentionTarget after they reached a certain age
+
+    Modes:
+        KEEP: Documents are kept forever
+        TTL: Documents are deleted
+        ARCHIVE: Documents are moved to compressed segments in the GridFS archive
+    """
+    KEEP = 'keep'
+    TTL = 'ttl'
+    ARCHIVE = 'archive'
+
+    MODES = [KEEP, TTL, ARCHIVE]
+    CONFIG_SECTION = 'Retention'
+
+
+    def __init__(self, target: RetentionTarget, mode: str = KEEP, days: int = 0):
+        """
+        Initializes a RetentionPolicy
+
+        Args:
+            target (RetentionTarget): The documents to which the policy applies
+            mode (str, optional): One of MODES. Defaults to KEEP
+            days (int, optional): Age in days after which the documents are deleted or archived
+        """
+        self.target = target
+        self.mode = mode
+        self.days = days
+
+
+    def is_active(self) -> bool:
+        """
+        Checks if the policy removes documents from the collection of its target
+
+        Returns:
+            bool: True if documents are deleted or archived
+        """
+        return self.mode != self.KEEP and self.days > 0
+
+
+    @classmethod
+    def from_config(cls, target: RetentionTarget) -> "RetentionPolicy":
+        """
+        Reads the policy of a target from the optional [Retention] section of the config file
+
+        Example:
+            [Retention]
+            object_logs = archive
+            object_logs_days = 365
+            webhook_events = ttl
+            webhook_events_days = 30
+
+        Args:
+            target (RetentionTarget): The target of the policy
+
+        Returns:
+            RetentionPolicy: The configured policy, a KEEP policy if none is configured
+        """
+        mode = cls.__get_option(target.name)
+
+        if not mode:
+            return cls(target)
+
+        mode = str(mode).lower()
+        days = cls.__get_option(f'{target.name}_days')
+
+        try:
+            days = int(days)
+        except (TypeError, ValueError):
+            days = 0
+
+        if mode not in cls.MODES or (mode != cls.KEEP and days <= 0):
+            LOGGER.warning("Invalid retention policy for '%s': %s after %s days. Keeping documents!",
+                           target.name, mode, days)
+            return cls(target)
+
+        return cls(target, mode, days)
+
+
+    @classmethod
+    def __get_option(cls, name: str) -> Optional[str]:
+        """
+        Retrieves an option of the [Retention] section
+
+        Args:
+            name (str): Name of the option
+
+        Returns:
+            Optional[str]: The value of the option, None if it is not configured
+        """
+        try:
+            return SystemConfigReader().get_value(name, cls.CONFIG_SECTION)
+        except (SectionError, KeyError):
+            return None
@@ -0,0 +1,248 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the LogRetentionService which applies the retention policies of logs and webhook events
+"""
+import logging
+from datetime import datetime, timedelta, timezone
+from pymongo import IndexModel
+
+import cmdb
+
+from cmdb.database import MongoDatabaseManager
+from cmdb.manager import LogsManager, LogArchiveManager
+from cmdb.manager.system_manager.system_config_reader import SystemConfigReader, get_section_options
+from cmdb.process_management.service import AbstractCmdbService
+
+from cmdb.framework.retention.retention_target import RETENTION_TARGETS, RetentionTarget
+from cmdb.framework.retention.retention_policy import RetentionPolicy
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                              LogRetentionService - CLASS                                             #
+# -------------------------------------------------------------------------------------------------------------------- #
+class LogRetentionService(AbstractCmdbService):
+    """
+    Applies the retention policies of the [Retention] section of the config file
+
+    Targets with a TTL policy are expired by a MongoDB TTL index on their time field. Object logs can store their
+    render_state as delta to a previous log, therefore they are deleted by the service, which converts remaining
+    dependent logs to snapshots first. Targets with an archive policy are moved in segments to the GridFS archive
+    """
+    DEFAULT_OPTIONS = {
+        'interval': 3600,
+        'segment_size': 10000,
+    }
+
+    INDEX_NAME = 'retention_time'
+    SYSTEM_DATABASES = ('admin', 'config', 'local')
+
+
+    def __init__(self):
+        super().__init__()
+        self._name = "retention"
+        self._threaded_service = True
+        self._multiprocessing = True
+
+        self.__options: dict = {}
+        self.__dbm: MongoDatabaseManager = None
+
+
+    def _run(self):
+        self.__options = self.__load_options()
+        policies = [RetentionPolicy.from_config(target) for target in RETENTION_TARGETS]
+
+        mode = 'cloud' if cmdb.__CLOUD_MODE__ and not cmdb.__LOCAL_MODE__ else 'local'
+        self.__dbm = MongoDatabaseManager(
+            **SystemConfigReader().get_all_values_from_section('Database'),
+            mode=mode
+        )
+
+        while not self._event_shutdown.is_set():
+            try:
+                for db_name in self.__get_database_names():
+                    for policy in policies:
+                        if self._event_shutdown.is_set():
+                            break
+
+                        self.__apply_policy(db_name, policy)
+            except Exception as err:
+                LOGGER.error("[LogRetentionService] Exception: %s. Type: %s", err, type(err), exc_info=True)
+
+            self._event_shutdown.wait(self.__options['interval'])
+
+
+    def _handle_event(self, event):
+        """ignore incomming events"""
+
+# ------------------------------------------------------ HELPERS ----------------------------------------------------- #
+
+    def __load_options(self) -> dict:
+        """
+        Reads the options of the service from the optional [Retention] section of the config file
+
+        Returns:
+            dict: The options of the service
+        """
+        options = get_section_options(RetentionPolicy.CONFIG_SECTION, self.DEFAULT_OPTIONS)
+
+        return {**self.DEFAULT_OPTIONS, **(options or {})}
+
+
+    def __get_database_names(self) -> list[str]:
+        """
+        Retrieves the databases whose logs should be processed
+
+        Returns:
+            list[str]: The configured database in local mode, all tenant databases in cloud mode
+        """
+        if self.__dbm.mode != 'cloud':
+            return [self.__dbm.db_name]
+
+        return [name for name in self.__dbm.connector.client.list_database_names()
+                if name not in self.SYSTEM_DATABASES]
+
+
+    def __apply_policy(self, db_name: str, policy: RetentionPolicy) -> None:
+        """
+        Applies a retention policy to the documents of its target in a database
+
+        Args:
+            db_name (str): Name of the database
+            policy (RetentionPolicy): The policy which should be applied
+        """
+        self.__ensure_time_index(db_name, policy)
+
+        if not policy.is_active() or (policy.mode == RetentionPolicy.TTL and policy.target.native_ttl):
+            return
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=policy.days)
+        processed = 0
+
+        while not self._event_shutdown.is_set():
+            documents = self.__get_expired_documents(db_name, policy.target, cutoff)
+
+            if not documents:
+                break
+
+            if policy.mode == RetentionPolicy.ARCHIVE:
+                self.__archive_documents(db_name, policy.target, documents)
+            else:
+                self.__delete_documents(db_name, policy.target, documents)
+
+            processed += len(documents)
+
+            if len(documents) < self.__options['segment_size']:
+                break
+
+        if processed:
+            LOGGER.info("[LogRetentionService] %s: %s %s documents older than %s days in database '%s'",
+                        policy.target.name, policy.mode, processed, policy.days, db_name)
+
+
+    def __ensure_time_index(self, db_name: str, policy: RetentionPolicy) -> None:
+        """
+        Creates, updates or removes the index on the time field of a target according to its policy. The index
+        expires the documents itself if the policy is a TTL policy and the target supports TTL indexes
+
+        Args:
+            db_name (str): Name of the database
+            policy (RetentionPolicy): The policy of the target
+        """
+        target = policy.target
+        current_index = self.__dbm.get_index_info(target.collection, db_name).get(self.INDEX_NAME)
+
+        if not policy.is_active():
+            if current_index:
+                self.__dbm.get_collection(target.collection, db_name).drop_index(self.INDEX_NAME)
+            return
+
+        expire_after = None
+
+        if policy.mode == RetentionPolicy.TTL and target.native_ttl:
+            expire_after = policy.days * 86400
+
+        if current_index:
+            if current_index.get('expireAfterSeconds') == expire_after:
+                return
+
+            self.__dbm.get_collection(target.collection, db_name).drop_index(self.INDEX_NAME)
+
+        index_options = {'expireAfterSeconds': expire_after} if expire_after is not None else {}
+        self.__dbm.create_indexes(
+            target.collection,
+            db_name,
+            [IndexModel([(target.time_field, 1)], name=self.INDEX_NAME, **index_options)]
+        )
+
+
+    def __get_expired_documents(self, db_name: str, target: RetentionTarget, cutoff: datetime) -> list[dict]:
+        """
+        Retrieves the next segment of documents of a target which are older than the cutoff
+
+        Args:
+            db_name (str): Name of the database
+            target (RetentionTarget): The target of the documents
+            cutoff (datetime): Documents created before this time are expired
+
+        Returns:
+            list[dict]: The oldest expired documents
+        """
+        return list(self.__dbm.get_collection(target.collection, db_name).find(
+            {**target.criteria, target.time_field: {'$lt': cutoff}},
+            sort=[(target.time_field, 1)],
+            limit=self.__options['segment_size'],
+        ))
+
+
+    def __archive_documents(self, db_name: str, target: RetentionTarget, documents: list[dict]) -> None:
+        """
+        Writes documents as segment to the archive and removes them from their collection afterwards
+
+        Args:
+            db_name (str): Name of the database
+            target (RetentionTarget): The target of the documents
+            documents (list[dict]): The expired documents
+        """
+        if not target.native_ttl:
+            # Archived object logs are not part of a delta chain anymore
+            LogsManager(self.__dbm, db_name).decode_render_states(documents)
+
+        LogArchiveManager(self.__dbm, db_name).write_segment(target.name,
+                                                             target.key_field,
+                                                             target.time_field,
+                                                             documents)
+        self.__delete_documents(db_name, target, documents)
+
+
+    def __delete_documents(self, db_name: str, target: RetentionTarget, documents: list[dict]) -> None:
+        """
+        Removes documents from the collection of a target
+
+        Args:
+            db_name (str): Name of the database
+            target (RetentionTarget): The target of the documents
+            documents (list[dict]): The expired documents
+        """
+        if not target.native_ttl:
+            LogsManager(self.__dbm, db_name).delete_logs([document['public_id'] for document in documents])
+            return
+
+        self.__dbm.get_collection(target.collection, db_name).delete_many(
+            {'_id': {'$in': [document['_id'] for document in documents]}}
+        )
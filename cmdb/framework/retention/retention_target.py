@@ -0,0 +1,69 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of RetentionTarget and the targets to which retention policies can be applied
+"""
+from cmdb.models.log_model.cmdb_meta_log import CmdbMetaLog
+from cmdb.models.log_model.cmdb_object_log import CmdbObjectLog
+from cmdb.models.log_model.cmdb_object_relation_log import CmdbObjectRelationLog
+from cmdb.models.webhook_model.cmdb_webhook_event import CmdbWebhookEvent
+# -------------------------------------------------------------------------------------------------------------------- #
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                RetentionTarget - CLASS                                               #
+# -------------------------------------------------------------------------------------------------------------------- #
+class RetentionTarget:
+    """
+    A kind of log documents to which a RetentionPolicy can be applied
+    """
+
+    def __init__(self,
+                 name: str,
+                 collection: str,
+                 time_field: str,
+                 key_field: str,
+                 criteria: dict = None,
+                 native_ttl: bool = True):
+        """
+        Initializes a RetentionTarget
+
+        Args:
+            name (str): Name of the target in the [Retention] section of the config file
+            collection (str): Collection of the documents
+            time_field (str): Field with the creation time of a document
+            key_field (str): Field by which archived documents are usually requested
+            criteria (dict, optional): Filter which selects the documents of the target inside the collection
+            native_ttl (bool, optional): If expired documents can be removed by a MongoDB TTL index. Object logs
+                                         are deleted by the LogRetentionService instead, because the render_state
+                                         of later logs can be stored as delta to them. Defaults to True
+        """
+        self.name = name
+        self.collection = collection
+        self.time_field = time_field
+        self.key_field = key_field
+        self.criteria = criteria or {}
+        self.native_ttl = native_ttl
+
+
+OBJECT_LOGS = RetentionTarget(
+    'object_logs', CmdbMetaLog.COLLECTION, 'log_time', 'object_id', {'log_type': CmdbObjectLog.__name__}, False
+)
+OBJECT_RELATION_LOGS = RetentionTarget(
+    'object_relation_logs', CmdbObjectRelationLog.COLLECTION, 'creation_time', 'object_relation_id'
+)
+WEBHOOK_EVENTS = RetentionTarget('webhook_events', CmdbWebhookEvent.COLLECTION, 'event_time', 'webhook_id')
+
+RETENTION_TARGETS: list[RetentionTarget] = [OBJECT_LOGS, OBJECT_RELATION_LOGS, WEBHOOK_EVENTS]
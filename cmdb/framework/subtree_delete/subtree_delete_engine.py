@@ -0,0 +1,181 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the SubtreeDeleteEngine which deletes a CmdbObject together with its location subtree
+"""
+import json
+import logging
+
+from cmdb.database.database_utils import default
+from cmdb.manager.manager_provider_model import ManagerProvider, ManagerType
+from cmdb.manager import (
+    LocationsManager,
+    LogsManager,
+    ObjectsManager,
+    ObjectLinksManager,
+    ObjectRelationsManager,
+    ObjectRelationLogsManager,
+)
+
+from cmdb.models.user_model import CmdbUser
+from cmdb.models.object_model import CmdbObject
+from cmdb.models.type_model import CmdbType
+from cmdb.models.log_model.log_action_enum import LogAction
+from cmdb.models.log_model.cmdb_object_log import CmdbObjectLog
+from cmdb.security.acl.permission import AccessControlPermission
+from cmdb.framework.rendering.cmdb_render import CmdbRender
+
+from cmdb.errors.manager import BaseManagerInsertError
+from cmdb.errors.manager.object_links_manager import ObjectLinksManagerDeleteError
+from cmdb.errors.manager.objects_manager import ObjectsManagerDeleteError
+from cmdb.errors.manager.object_relations_manager import ObjectRelationsManagerDeleteError
+from cmdb.errors.manager.object_relation_logs_manager import ObjectRelationLogsManagerBuildError
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                              SubtreeDeleteEngine - CLASS                                             #
+# -------------------------------------------------------------------------------------------------------------------- #
+class SubtreeDeleteEngine:
+    """
+    Deletes a CmdbObject and its location subtree with one batched operation per collection
+
+    The ids of all affected CmdbLocations and CmdbObjects are computed up front from the materialized location
+    paths. Afterwards the objects, risk assessments, references, links, relations and locations are removed with
+    'delete_many'/'update_many' and the logs are written as bulk inserts
+    """
+    def __init__(self, request_user: CmdbUser):
+        """
+        Initializes the SubtreeDeleteEngine
+
+        Args:
+            request_user (CmdbUser): The user requesting the deletion
+        """
+        self.request_user = request_user
+
+        self.objects_manager: ObjectsManager = ManagerProvider.get_manager(ManagerType.OBJECTS, request_user)
+        self.locations_manager: LocationsManager = ManagerProvider.get_manager(ManagerType.LOCATIONS, request_user)
+        self.logs_manager: LogsManager = ManagerProvider.get_manager(ManagerType.LOGS, request_user)
+        self.object_links_manager: ObjectLinksManager = ManagerProvider.get_manager(ManagerType.OBJECT_LINKS,
+                                                                                    request_user)
+        self.object_relations_manager: ObjectRelationsManager = ManagerProvider.get_manager(
+                                                                            ManagerType.OBJECT_RELATIONS,
+                                                                            request_user)
+        self.object_relation_logs_manager: ObjectRelationLogsManager = ManagerProvider.get_manager(
+                                                                            ManagerType.OBJECT_RELATION_LOGS,
+                                                                            request_user)
+
+
+    def delete(self, object_id: int, location: dict, with_child_objects: bool) -> bool:
+        """
+        Deletes the CmdbObject, its CmdbLocation and all descendant CmdbLocations. If 'with_child_objects' is set
+        the CmdbObjects of the descendant CmdbLocations are deleted as well
+
+        Args:
+            object_id (int): public_id of the CmdbObject at the root of the subtree
+            location (dict): The CmdbLocation of the CmdbObject
+            with_child_objects (bool): If True the CmdbObjects of the descendant CmdbLocations are also deleted
+
+        Raises:
+            AccessDeniedError: If the user is not allowed to delete one of the CmdbObjects, nothing is deleted then
+            ObjectsManagerDeleteError: If the CmdbObjects could not be deleted
+            LocationsManagerGetError: If the subtree could not be retrieved
+            LocationsManagerDeleteError: If the CmdbLocations could not be deleted
+
+        Returns:
+            bool: True if the CmdbObject at the root of the subtree was deleted
+        """
+        descendants = self.locations_manager.get_subtree(location['public_id'])
+
+        location_ids = [location['public_id']] + [child['public_id'] for child in descendants]
+        object_ids = [object_id]
+
+        if with_child_objects:
+            object_ids += [child['object_id'] for child in descendants if child.get('object_id')]
+            object_ids = list(dict.fromkeys(object_ids))
+
+        # The render states of the logs have to be created while the objects still exist
+        log_documents = self.__build_deletion_logs(object_ids)
+
+        deleted_count = self.objects_manager.delete_many_with_follow_up(object_ids,
+                                                                        self.request_user,
+                                                                        AccessControlPermission.DELETE)
+
+        try:
+            self.object_links_manager.delete_links_of_objects(object_ids)
+            self.objects_manager.delete_all_references_to_objects(object_ids)
+        except (ObjectLinksManagerDeleteError, ObjectsManagerDeleteError) as err:
+            LOGGER.error("[delete] Links + References of the subtree not deleted: %s", err, exc_info=True)
+
+        try:
+            deleted_object_relations = self.object_relations_manager.delete_relations_of_objects(object_ids)
+            self.object_relation_logs_manager.build_deletion_logs(self.request_user, deleted_object_relations)
+        except (ObjectRelationsManagerDeleteError, ObjectRelationLogsManagerBuildError) as err:
+            LOGGER.error("[delete] ObjectRelations of the subtree not deleted: %s", err, exc_info=True)
+
+        self.locations_manager.delete_locations(location_ids)
+
+        try:
+            self.logs_manager.insert_logs(log_documents)
+        except BaseManagerInsertError as err:
+            LOGGER.error("[delete] Failed to create the ObjectLogs of the subtree: %s", err)
+
+        LOGGER.info("[delete] Deleted %s objects and %s locations of the subtree of Object-ID: %s",
+                    deleted_count, len(location_ids), object_id)
+
+        return deleted_count > 0
+
+# -------------------------------------------------- HELPER METHODS -------------------------------------------------- #
+
+    def __build_deletion_logs(self, object_ids: list[int]) -> list[dict]:
+        """
+        Renders the CmdbObjects and builds their DELETE logs, each CmdbType is only retrieved once
+
+        Args:
+            object_ids (list[int]): public_ids of the CmdbObjects which will be deleted
+
+        Returns:
+            list[dict]: The log documents, objects which could not be rendered are skipped
+        """
+        log_documents = []
+        types: dict[int, CmdbType] = {}
+
+        for object_data in self.objects_manager.find(criteria={'public_id': {'$in': object_ids}}):
+            try:
+                object_instance = CmdbObject.from_data(object_data)
+                type_id = object_instance.get_type_id()
+
+                if type_id not in types:
+                    types[type_id] = self.objects_manager.get_object_type(type_id)
+
+                render_result = CmdbRender(object_instance, types[type_id], self.request_user, False).result()
+
+                log_documents.append(self.logs_manager.build_log_document(
+                    LogAction.DELETE,
+                    CmdbObjectLog.__name__,
+                    object_id=object_instance.get_public_id(),
+                    version=render_result.object_information['version'],
+                    user_id=self.request_user.get_public_id(),
+                    user_name=self.request_user.get_display_name(),
+                    comment='Object was deleted',
+                    render_state=json.dumps(render_result, default=default).encode('UTF-8')
+                ))
+            except Exception as err:
+                LOGGER.error("[__build_deletion_logs] Object-ID: %s not rendered: %s. Type: %s",
+                             object_data.get('public_id'), err, type(err))
+
+        return log_documents
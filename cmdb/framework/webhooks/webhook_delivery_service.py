@@ -0,0 +1,370 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the WebhookDeliveryService which delivers the webhook events of the outbox
+"""
+import json
+import random
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+
+import cmdb
+
+from cmdb.database import MongoDatabaseManager
+from cmdb.database.database_utils import default
+from cmdb.manager import WebhooksManager, WebhooksEventManager, WebhookDeliveriesManager
+from cmdb.manager.system_manager.system_config_reader import SystemConfigReader, get_section_options
+from cmdb.process_management.service import AbstractCmdbService
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                            WebhookDeliveryService - CLASS                                            #
+# -------------------------------------------------------------------------------------------------------------------- #
+class WebhookDeliveryService(AbstractCmdbService):
+    """
+    Delivers the webhook events which are queued in the outbox by the WebhooksManager
+
+    Deliveries are sent in parallel over a pooled HTTP session. The number of parallel requests to the same
+    endpoint is limited, failed deliveries are retried with an exponential backoff and the final outcome of
+    every delivery is recorded as a CmdbWebhookEvent
+    """
+    CONFIG_SECTION = 'Webhooks'
+
+    DEFAULT_OPTIONS = {
+        'workers': 10,
+        'endpoint_concurrency': 2,
+        'timeout': 10,
+        'max_attempts': 5,
+        'backoff_base': 5,
+        'backoff_max': 3600,
+        'poll_interval': 1,
+        'claim_timeout': 300,
+    }
+
+    SYSTEM_DATABASES = ('admin', 'config', 'local')
+
+
+    def __init__(self):
+        super().__init__()
+        self._name = "webhooks"
+        self._threaded_service = True
+        self._multiprocessing = True
+
+        self.__options: dict = {}
+        self.__dbm: MongoDatabaseManager = None
+        self.__session: requests.Session = None
+        self.__worker_slots: threading.BoundedSemaphore = None
+        self.__endpoint_slots: dict[str, threading.BoundedSemaphore] = {}
+        self.__record_lock = threading.Lock()
+        self.__last_stale_check: datetime = None
+
+
+    def _run(self):
+        self.__options = self.__load_options()
+
+        mode = 'cloud' if cmdb.__CLOUD_MODE__ and not cmdb.__LOCAL_MODE__ else 'local'
+        self.__dbm = MongoDatabaseManager(
+            **SystemConfigReader().get_all_values_from_section('Database'),
+            mode=mode
+        )
+
+        workers = self.__options['workers']
+        self.__session = self.__create_session(workers)
+        self.__worker_slots = threading.BoundedSemaphore(workers)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self._name) as executor:
+            while not self._event_shutdown.is_set():
+                dispatched = 0
+
+                try:
+                    release_stale = self.__is_stale_check_due()
+
+                    for db_name in self.__get_database_names():
+                        if release_stale:
+                            self.__release_stale_deliveries(db_name)
+
+                        dispatched += self.__dispatch(executor, db_name)
+                except Exception as err:
+                    LOGGER.error("[WebhookDeliveryService] Exception: %s. Type: %s", err, type(err), exc_info=True)
+
+                if not dispatched:
+                    self._event_shutdown.wait(self.__options['poll_interval'])
+
+        self.__session.close()
+
+
+    def _handle_event(self, event):
+        """ignore incomming events"""
+
+# ------------------------------------------------------ HELPERS ----------------------------------------------------- #
+
+    def __load_options(self) -> dict:
+        """
+        Reads the options of the service from the optional [Webhooks] section of the config file
+
+        Returns:
+            dict: The options of the service
+        """
+        return {**self.DEFAULT_OPTIONS, **(get_section_options(self.CONFIG_SECTION, self.DEFAULT_OPTIONS) or {})}
+
+
+    def __create_session(self, pool_size: int) -> requests.Session:
+        """
+        Creates a HTTP session which keeps the connections to the webhook endpoints alive
+
+        Args:
+            pool_size (int): Maximum number of connections per endpoint
+
+        Returns:
+            requests.Session: The pooled session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'Content-Type': 'application/json'})
+
+        return session
+
+
+    def __get_database_names(self) -> list[str]:
+        """
+        Retrieves the databases whose outbox should be processed
+
+        Returns:
+            list[str]: The configured database in local mode, all tenant databases in cloud mode
+        """
+        if self.__dbm.mode != 'cloud':
+            return [self.__dbm.db_name]
+
+        return [name for name in self.__dbm.connector.client.list_database_names()
+                if name not in self.SYSTEM_DATABASES]
+
+
+    def __is_stale_check_due(self) -> bool:
+        """
+        Checks if the outboxes should be searched for stale deliveries, which is done once per claim timeout
+
+        Returns:
+            bool: True if the check is due
+        """
+        now = datetime.now(timezone.utc)
+
+        if self.__last_stale_check and now - self.__last_stale_check < self.__get_claim_timeout():
+            return False
+
+        self.__last_stale_check = now
+
+        return True
+
+
+    def __get_claim_timeout(self) -> timedelta:
+        """
+        Retrieves the time after which a claimed delivery is considered stale
+
+        Returns:
+            timedelta: The claim timeout
+        """
+        return timedelta(seconds=self.__options['claim_timeout'])
+
+
+    def __release_stale_deliveries(self, db_name: str) -> None:
+        """
+        Puts deliveries back into the outbox whose worker stopped before finishing them
+
+        Args:
+            db_name (str): Name of the database
+        """
+        claimed_before = datetime.now(timezone.utc) - self.__get_claim_timeout()
+        released = WebhookDeliveriesManager(self.__dbm, db_name).release_stale_deliveries(claimed_before)
+
+        if released:
+            LOGGER.info("Released %s stale webhook deliveries of database: %s", released, db_name)
+
+
+    def __dispatch(self, executor: ThreadPoolExecutor, db_name: str) -> int:
+        """
+        Claims due deliveries of a database and hands them to the executor as long as workers are available
+
+        Args:
+            executor (ThreadPoolExecutor): The executor sending the requests
+            db_name (str): Name of the database
+
+        Returns:
+            int: Number of dispatched deliveries
+        """
+        deliveries_manager = WebhookDeliveriesManager(self.__dbm, db_name)
+        saturated_urls = set()
+        dispatched = 0
+
+        while not self._event_shutdown.is_set():
+            if not self.__worker_slots.acquire(timeout=self.__options['poll_interval']):
+                break
+
+            try:
+                delivery = deliveries_manager.claim_due_delivery(saturated_urls)
+            except Exception:
+                self.__worker_slots.release()
+                raise
+
+            if not delivery:
+                self.__worker_slots.release()
+                break
+
+            endpoint_slot = self.__get_endpoint_slot(delivery['url'])
+
+            # The endpoint already receives the maximum number of parallel requests
+            if not endpoint_slot.acquire(blocking=False):
+                self.__worker_slots.release()
+                saturated_urls.add(delivery['url'])
+                deliveries_manager.release_delivery(delivery['_id'])
+                continue
+
+            executor.submit(self.__deliver, db_name, delivery, endpoint_slot)
+            dispatched += 1
+
+        return dispatched
+
+
+    def __get_endpoint_slot(self, url: str) -> threading.BoundedSemaphore:
+        """
+        Retrieves the semaphore which limits the parallel requests to an endpoint
+
+        Args:
+            url (str): The url of the endpoint
+
+        Returns:
+            threading.BoundedSemaphore: The semaphore of the endpoint
+        """
+        if url not in self.__endpoint_slots:
+            self.__endpoint_slots[url] = threading.BoundedSemaphore(self.__options['endpoint_concurrency'])
+
+        return self.__endpoint_slots[url]
+
+
+    def __deliver(self, db_name: str, delivery: dict, endpoint_slot: threading.BoundedSemaphore) -> None:
+        """
+        Sends a delivery to its endpoint and either schedules a retry or records the outcome
+
+        Deliveries of batching webhooks are sent together with the other pending deliveries of the webhook
+
+        Args:
+            db_name (str): Name of the database
+            delivery (dict): The claimed delivery
+            endpoint_slot (threading.BoundedSemaphore): The acquired semaphore of the endpoint
+        """
+        try:
+            deliveries_manager = WebhookDeliveriesManager(self.__dbm, db_name)
+            deliveries = [delivery]
+            payload = delivery['payload']
+
+            batch_size = delivery.get('batch_size', 1)
+            if batch_size > 1:
+                deliveries += deliveries_manager.claim_batch_deliveries(delivery['webhook_id'], batch_size - 1)
+                payload = WebhooksManager.build_batch_payload(
+                    [batched_delivery['payload'] for batched_delivery in deliveries]
+                )
+
+            attempts = delivery.get('attempts', 0) + 1
+            response_code = None
+
+            try:
+                response = self.__session.post(
+                    delivery['url'],
+                    data=json.dumps(payload, default=default, ensure_ascii=False, indent=2),
+                    timeout=self.__options['timeout'],
+                )
+                response_code = response.status_code
+                last_error = f"HTTP {response_code}"
+            except requests.RequestException as err:
+                last_error = str(err)
+
+            success = response_code is not None and 200 <= response_code < 300
+            # Connection errors, server errors and rate limits are worth another attempt
+            retryable = response_code is None or response_code == 429 or response_code >= 500
+
+            if not success and retryable and attempts < self.__options['max_attempts']:
+                next_attempt = datetime.now(timezone.utc) + self.__get_backoff(attempts)
+
+                for failed_delivery in deliveries:
+                    deliveries_manager.release_delivery(
+                        failed_delivery['_id'],
+                        next_attempt=next_attempt,
+                        attempts=attempts,
+                        last_error=last_error,
+                    )
+                return
+
+            if not success:
+                LOGGER.warning(
+                    "Webhook delivery to '%s' failed after %s attempts: %s", delivery['url'], attempts, last_error
+                )
+
+            for finished_delivery in deliveries:
+                self.__record_event(db_name, finished_delivery, response_code, success)
+                deliveries_manager.delete_delivery(finished_delivery['_id'])
+        except Exception as err:
+            LOGGER.error("[__deliver] Exception: %s. Type: %s", err, type(err), exc_info=True)
+        finally:
+            endpoint_slot.release()
+            self.__worker_slots.release()
+
+
+    def __get_backoff(self, attempts: int) -> timedelta:
+        """
+        Calculates the exponential backoff with jitter before the next attempt
+
+        Args:
+            attempts (int): Number of failed attempts
+
+        Returns:
+            timedelta: Time to wait before the next attempt
+        """
+        backoff = min(self.__options['backoff_base'] * 2 ** (attempts - 1), self.__options['backoff_max'])
+
+        return timedelta(seconds=random.uniform(backoff / 2, backoff))
+
+
+    def __record_event(self, db_name: str, delivery: dict, response_code: int, success: bool) -> None:
+        """
+        Stores the outcome of a delivery as CmdbWebhookEvent
+
+        Args:
+            db_name (str): Name of the database
+            delivery (dict): The finished delivery
+            response_code (int): HTTP status code of the last attempt, None if the endpoint was not reachable
+            success (bool): True if the endpoint accepted the event
+        """
+        webhook_event = dict(delivery['payload'])
+
+        # public_ids are assigned from a counter and must not be taken by two workers at once
+        with self.__record_lock:
+            webhooks_event_manager = WebhooksEventManager(self.__dbm, db_name)
+
+            webhook_event.update({
+                'public_id': webhooks_event_manager.get_next_public_id(),
+                'webhook_id': delivery['webhook_id'],
+                'response_code': response_code,
+                'status': success,
+            })
+
+            webhooks_event_manager.insert_webhook_event(webhook_event)
@@ -135,11 +135,14 @@ def validate(cls, schema=None):
                 - If the incoming request body is not valid JSON
                 - If the data does not conform to the provided schema
         """
-        validator = Validator(schema, purge_unknown=True)
+        # The schema is checked once, every request validates with an own Validator because a Validator keeps the
+        # state of its last validation and requests of gthread workers run concurrently
+        definition_schema = Validator(schema, purge_unknown=True).schema
 
         def _validate(f):
             @wraps(f)
             def _decorate(*args, **kwargs):
+                validator = Validator(definition_schema, purge_unknown=True)
                 data = request.get_json()
                 # LOGGER.debug("validation data: %s", data)
                 try:
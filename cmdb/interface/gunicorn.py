@@ -72,6 +72,14 @@ def _run(self):
 
         # start gunicorn as own process
         webserver = HTTPServer(app, options)
+
+        # Every thread of a worker can hold one pooled connection of the worker's MongoClient
+        if webserver.options['threads'] > dbm.client_options['maxPoolSize']:
+            LOGGER.warning(
+                "%s threads per worker exceed the MongoDB maxPoolSize of %s, requests will wait for connections!",
+                webserver.options['threads'],
+                dbm.client_options['maxPoolSize']
+            )
         self.__webserver_proc = multiprocessing.Process(target=webserver.run)
         self.__webserver_proc.start()
         self.__webserver_proc.join()
@@ -14,9 +14,12 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
-Implementation of Gunicorn post fork method
+Implementation of the Gunicorn server hooks
 """
+import gc
 import logging
+
+from cmdb.framework.metrics.metrics_collector import MetricsCollector
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -24,6 +27,28 @@
 # -------------------------------------------------------------------------------------------------------------------- #
 
 
+def when_ready(server):
+    """
+    Prepares the master process for forking the workers
+
+    The metrics files of a previous run are deleted, otherwise the metrics of workers which do not exist anymore
+    would be added to the metrics endpoint
+
+    When the app is preloaded, everything which exists now was built once in the master process: the imported route
+    modules, the app, the rights and the validation schemas. Freezing these objects moves them out of the garbage
+    collector, otherwise every collection in a worker would write to their memory pages and copy them into the worker
+    """
+    MetricsCollector.clear_directory()
+
+    if not server.cfg.preload_app:
+        return
+
+    gc.collect()
+    gc.freeze()
+
+    LOGGER.info("Preloaded app, %s objects are shared with the workers", gc.get_freeze_count())
+
+
 def post_fork(server, worker):
     """
     Ensures MongoDB connections are properly reinitialized after forking
@@ -32,5 +57,5 @@ def post_fork(server, worker):
     if hasattr(worker, 'app') and\
        hasattr(worker.app, 'application') and\
        hasattr(worker.app.application, 'database_manager'):
-        # Access the `database_manager` and reset the connection
-        worker.app.application.database_manager.reset_connection()
+        # Only the MongoConnector is renewed, the inherited MongoClient must not be used by multiple processes
+        worker.app.application.database_manager.reconnect_after_fork()
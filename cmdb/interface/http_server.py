@@ -22,11 +22,21 @@
 
 from cmdb import __MODE__
 from cmdb.utils.logger import get_logging_conf
-from cmdb.interface.gunicorn_config import post_fork
+from cmdb.utils.cast import auto_cast
+from cmdb.interface.gunicorn_config import when_ready, post_fork
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
 
+# Worker classes which can be selected with the 'worker_class' option of the [WebServer] section
+SUPPORTED_WORKER_CLASSES = ('sync', 'gthread')
+
+# Defaults of the [WebServer] options which are set if they are missing in the config
+DEFAULT_WORKER_CLASS = 'sync'
+DEFAULT_GTHREAD_THREADS = 4
+DEFAULT_KEEPALIVE = 2
+DEFAULT_TIMEOUT = 120
+
 # -------------------------------------------------------------------------------------------------------------------- #
 #                                                  HTTPServer - CLASS                                                  #
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -39,20 +49,19 @@ def __init__(self, app, options=None):
         if 'host' in self.options and 'port' in self.options:
             self.options['bind'] = f"{self.options['host']}:{self.options['port']}"
 
-        if 'workers' not in self.options:
-            self.options['workers'] = HTTPServer.number_of_workers()
+        self.__init_worker_options()
 
-        # Explicitly disable preload
-        self.options['preload_app'] = False  # Disable preload
-        self.options['worker_class'] = 'sync'
+        self.options['preload_app'] = auto_cast(str(self.options.get('preload_app', False))) is True
         self.options['disable_existing_loggers'] = False
         self.options['logconfig_dict'] = get_logging_conf()
-        self.options['timeout'] = 120
         self.options['daemon'] = True
 
+        self.options['when_ready'] = when_ready
         self.options['post_fork'] = post_fork
 
         if __MODE__ in ('DEBUG','TESTING'):
+            # Reloaded code would never reach workers which are forked from a preloaded master
+            self.options['preload_app'] = False
             self.options['reload'] = True
             self.options['check_config'] = True
             LOGGER.debug("Gunicorn starting with auto reload option")
@@ -62,6 +71,72 @@ def __init__(self, app, options=None):
         super().__init__()
 
 
+    def __init_worker_options(self) -> None:
+        """
+        Sets the worker model from the [WebServer] section of the config
+
+        'sync' workers handle one request per process. 'gthread' workers handle 'threads' requests per process
+        concurrently, which keeps the CPU busy while requests wait for MongoDB, LDAP or webhooks. Invalid values are
+        replaced with their defaults
+        """
+        worker_class = str(self.options.get('worker_class', DEFAULT_WORKER_CLASS)).lower()
+
+        if worker_class not in SUPPORTED_WORKER_CLASSES:
+            LOGGER.warning(
+                "Unsupported worker_class '%s', supported are %s. Using '%s'!",
+                worker_class,
+                SUPPORTED_WORKER_CLASSES,
+                DEFAULT_WORKER_CLASS
+            )
+            worker_class = DEFAULT_WORKER_CLASS
+
+        default_threads = DEFAULT_GTHREAD_THREADS if worker_class == 'gthread' else 1
+
+        self.options['worker_class'] = worker_class
+        self.options['workers'] = self.__get_positive_int('workers', HTTPServer.number_of_workers())
+        self.options['threads'] = self.__get_positive_int('threads', default_threads)
+        self.options['keepalive'] = self.__get_positive_int('keepalive', DEFAULT_KEEPALIVE)
+        self.options['timeout'] = self.__get_positive_int('timeout', DEFAULT_TIMEOUT)
+
+        LOGGER.info(
+            "Gunicorn workers: %s x '%s' with %s thread(s), keepalive: %ss, timeout: %ss",
+            self.options['workers'],
+            worker_class,
+            self.options['threads'],
+            self.options['keepalive'],
+            self.options['timeout']
+        )
+
+
+    def __get_positive_int(self, option: str, default: int) -> int:
+        """
+        Retrieves an option as a positive integer
+
+        Args:
+            option (str): Name of the option
+            default (int): Value if the option is missing or invalid
+
+        Returns:
+            int: The value of the option
+        """
+        value = self.options.get(option)
+
+        if value is None:
+            return default
+
+        try:
+            value = int(value)
+
+            if value > 0:
+                return value
+        except (TypeError, ValueError):
+            pass
+
+        LOGGER.warning("Invalid value '%s' for option '%s' in [WebServer]. Using %s!", value, option, default)
+
+        return default
+
+
     def load_config(self):
         config = {key: value for key, value in self.options.items() if key in self.cfg.settings and value is not None}
 
@@ -18,7 +18,7 @@
 """
 import logging
 import os
-import google.generativeai as genai
+from threading import Lock
 from dotenv import load_dotenv
 # -------------------------------------------------------------------------------------------------------------------- #
 
@@ -28,9 +28,34 @@
 
 load_dotenv()
 
-# LOGGER.debug(f"GOOGLE-API-KEY: {os.getenv('GOOGLE_API_KEY')}")
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                              GeminiModelProvider - CLASS                                             #
+# -------------------------------------------------------------------------------------------------------------------- #
+class GeminiModelProvider:
+    """
+    Creates the Gemini model once on first use. Importing google.generativeai takes longer than importing all other
+    modules of the REST API, so it is skipped at startup when the type assistant is not used
+    """
+    _model = None
+    _lock = Lock()
+
+
+    @classmethod
+    def get_model(cls):
+        """
+        Retrieves the Gemini model, it is created with the first call
+
+        Returns:
+            GenerativeModel: The Gemini model
+        """
+        with cls._lock:
+            if cls._model is None:
+                #pylint: disable=import-outside-toplevel
+                import google.generativeai as genai
+
+                # LOGGER.debug(f"GOOGLE-API-KEY: {os.getenv('GOOGLE_API_KEY')}")
 
-genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+                genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+                cls._model = genai.GenerativeModel("gemini-2.5-flash")
 
-# Create the model once
-gemini_model = genai.GenerativeModel("gemini-2.5-flash")
+            return cls._model
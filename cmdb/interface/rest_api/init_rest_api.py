@@ -19,11 +19,16 @@
 import logging
 import sys
 import copy
+import time
+from typing import Optional
 from datetime import datetime, timezone
-# from flask import request
+from flask import g, request, Response
 from flask_cors import CORS
 
 from cmdb.database import MongoDatabaseManager
+from cmdb.database.slow_query_recorder import SlowQueryRecorder
+from cmdb.database.circuit_breaker import CircuitBreaker
+from cmdb.database.query_budget import QueryBudget
 from cmdb.database.database_services import (
     get_db_names_from_service_portal,
     CollectionValidator,
@@ -48,7 +53,10 @@
     service_unavailable,
 )
 
-from cmdb.manager.system_manager.system_config_reader import SystemConfigReader
+from cmdb.manager.system_manager.system_config_reader import SystemConfigReader, get_section_options
+from cmdb.framework.log_writer.buffered_log_writer import BufferedLogWriter
+from cmdb.framework.metrics.metrics_collector import MetricsCollector
+from cmdb.framework.metrics.request_profiler import RequestProfiler
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -68,7 +76,7 @@ def create_rest_api(database_maanger: MongoDatabaseManager) -> BaseCmdbApp:
     app.url_map.strict_slashes = True
 
     # Import App Extensions
-    CORS(app=app, expose_headers=['X-API-Version', 'X-Total-Count'])
+    CORS(app=app, expose_headers=['X-API-Version', 'X-Total-Count', RequestProfiler.PROFILE_ID_HEADER])
 
     if cmdb.__MODE__ == 'DEBUG':
         config = app_config['development']
@@ -108,7 +116,13 @@ def create_rest_api(database_maanger: MongoDatabaseManager) -> BaseCmdbApp:
     with app.app_context():
         register_converters(app)
         register_error_pages(app)
+        configure_metrics(app)
+        configure_profiling(app)
+        configure_slow_query_recorder()
+        configure_circuit_breaker(app)
+        configure_query_budgets(app)
         register_blueprints(app)
+        configure_log_writer()
 
         if cmdb.__MODE__ != 'TESTING':
             try:
@@ -267,6 +281,18 @@ def register_blueprints(app: BaseCmdbApp):
         from cmdb.interface.rest_api.routes.debug_routes import debug_blueprint
         app.register_blueprint(debug_blueprint)
 
+    if MetricsCollector.is_active():
+        from cmdb.interface.rest_api.routes.metrics_routes import metrics_blueprint
+        app.register_blueprint(metrics_blueprint)
+
+    if SlowQueryRecorder.is_active():
+        from cmdb.interface.rest_api.routes.slow_query_routes import slow_query_blueprint
+        app.register_blueprint(slow_query_blueprint)
+
+    if RequestProfiler.is_active():
+        from cmdb.interface.rest_api.routes.profile_routes import profile_blueprint
+        app.register_blueprint(profile_blueprint)
+
     # LOGGER.debug(f"routes: {app.url_map}")
 
 
@@ -287,6 +313,147 @@ def register_error_pages(app: BaseCmdbApp):
     app.register_error_handler(500, internal_server_error)
     app.register_error_handler(503, service_unavailable)
 
+
+def configure_log_writer() -> None:
+    """
+    Configures the BufferedLogWriter with the optional [Logs] section of the config file
+    """
+    options = get_section_options(BufferedLogWriter.CONFIG_SECTION, BufferedLogWriter.DEFAULT_OPTIONS)
+
+    if options is not None:
+        BufferedLogWriter.configure(options)
+
+
+def configure_slow_query_recorder() -> None:
+    """
+    Configures the SlowQueryRecorder with the optional [SlowQueries] section of the config file
+    """
+    options = get_section_options(SlowQueryRecorder.CONFIG_SECTION, SlowQueryRecorder.DEFAULT_OPTIONS)
+
+    if options is not None:
+        SlowQueryRecorder.configure(options)
+
+
+def configure_circuit_breaker(app: BaseCmdbApp) -> None:
+    """
+    Configures the CircuitBreakers of the MongoDatabaseManagers with the optional [CircuitBreaker] section of the
+    config file and registers the hook which starts the retry time of every request
+
+    Params:
+        app (BaseCmdbApp): Flask app whose database operations are retried
+    """
+    options = get_section_options(CircuitBreaker.CONFIG_SECTION, CircuitBreaker.DEFAULT_OPTIONS)
+
+    if options is not None:
+        CircuitBreaker.configure(options)
+
+    @app.before_request
+    def begin_retry_time():
+        CircuitBreaker.begin_request()
+
+
+def configure_query_budgets(app: BaseCmdbApp) -> None:
+    """
+    Configures the QueryBudget with the optional [QueryBudgets] section of the config file and registers the hook
+    which starts every request with the interactive budget
+
+    Params:
+        app (BaseCmdbApp): Flask app whose requests are limited
+    """
+    options = get_section_options(QueryBudget.CONFIG_SECTION, QueryBudget.DEFAULT_OPTIONS)
+
+    if options is not None:
+        QueryBudget.configure(options)
+
+    if not QueryBudget.is_active():
+        return
+
+
+    @app.before_request
+    def begin_query_budget():
+        QueryBudget.begin(QueryBudget.INTERACTIVE)
+
+
+def configure_metrics(app: BaseCmdbApp) -> None:
+    """
+    Configures the MetricsCollector with the optional [Metrics] section of the config file and registers the hooks
+    which record the duration and status code of every request
+
+    Params:
+        app (BaseCmdbApp): Flask app whose requests are recorded
+    """
+    options = get_section_options(MetricsCollector.CONFIG_SECTION, MetricsCollector.DEFAULT_OPTIONS)
+
+    if options is None:
+        return
+
+    MetricsCollector.configure(options)
+
+    if not MetricsCollector.is_active():
+        return
+
+
+    @app.before_request
+    def start_request_timer():
+        g.request_start = time.perf_counter()
+
+
+    @app.after_request
+    def record_request_metrics(response: Response) -> Response:
+        if 'request_start' in g:
+            # The url rule keeps the number of routes bounded, unmatched paths would add one label per path
+            route = request.url_rule.rule if request.url_rule else '<unmatched>'
+
+            MetricsCollector.observe_request(
+                request.method,
+                route,
+                response.status_code,
+                time.perf_counter() - g.request_start
+            )
+
+        return response
+
+
+def configure_profiling(app: BaseCmdbApp) -> None:
+    """
+    Configures the RequestProfiler with the optional [Profiling] section of the config file and registers the hooks
+    which profile requests sending the profile token
+
+    Params:
+        app (BaseCmdbApp): Flask app whose requests are profiled
+    """
+    options = get_section_options(RequestProfiler.CONFIG_SECTION, RequestProfiler.DEFAULT_OPTIONS)
+
+    if options is None:
+        return
+
+    RequestProfiler.configure(options)
+
+    if not RequestProfiler.is_active():
+        return
+
+
+    @app.before_request
+    def start_request_profile():
+        if RequestProfiler.is_requested(request.headers.get(RequestProfiler.PROFILE_HEADER)):
+            g.request_profile = RequestProfiler.start()
+
+
+    @app.after_request
+    def finish_request_profile(response: Response) -> Response:
+        profile: Optional[RequestProfiler] = g.pop('request_profile', None)
+
+        if profile:
+            profile.finish({
+                'method': request.method,
+                'route': request.url_rule.rule if request.url_rule else None,
+                'path': request.path,
+                'status': response.status_code,
+            })
+            response.headers[RequestProfiler.PROFILE_ID_HEADER] = profile.profile_id
+
+        return response
+
 # -------------------------------------------------------------------------------------------------------------------- #
 
 def start_datagerry_setup(dbm: MongoDatabaseManager) -> None:
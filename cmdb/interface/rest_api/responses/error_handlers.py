@@ -39,10 +39,18 @@
     InternalServerError,
     ServiceUnavailable,
 )
+
+from cmdb.database.query_budget import QueryBudget
+from cmdb.errors.database import DatabaseUnavailableError
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
 
+DATABASE_UNAVAILABLE_MESSAGE = "The database is currently unavailable, please try again later"
+
+QUERY_BUDGET_EXCEEDED_MESSAGE = "Query budget exceeded, the request took too long and was cancelled. Please narrow " \
+                                "the request or try again later"
+
 # -------------------------------------------------------------------------------------------------------------------- #
 #                                                 ErrorResponse - CLASS                                                #
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -81,9 +89,41 @@ def make_error(self, error: HTTPException) -> dict:
         return resp
 
 
+def _is_caused_by_unavailable_database(error: BaseException) -> bool:
+    """
+    Checks if an error was raised while handling a DatabaseUnavailableError. Routes usually abort() inside the
+    except block of the failed operation, so the DatabaseUnavailableError is found in the context of the error
+    """
+    seen = set()
+
+    while error is not None and id(error) not in seen:
+        if isinstance(error, DatabaseUnavailableError):
+            return True
+
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__ or getattr(error, 'original_exception', None)
+
+    return False
+
+
+def _query_budget_exceeded():
+    """
+    Answers a request whose database operation was cancelled by MongoDB because it exceeded its QueryBudget with a
+    503, like a request rejected during a database outage
+    """
+    LOGGER.warning("Query budget exceeded: %s %s", request.method, request.path)
+
+    return service_unavailable(ServiceUnavailable(description=QUERY_BUDGET_EXCEEDED_MESSAGE))
+
+
 # 4xx Client errors
 def bad_request(error):
     """400 Bad Request"""
+    if _is_caused_by_unavailable_database(error):
+        return service_unavailable(ServiceUnavailable(description=DATABASE_UNAVAILABLE_MESSAGE))
+
+    if QueryBudget.is_exceeded(error):
+        return _query_budget_exceeded()
 
     resp = ErrorResponse(status=400, prefix='Bad Request', description=BadRequest.description,
                             message=error.description, joke='... cause the access was nuts!')
@@ -135,6 +175,12 @@ def page_gone(error):
 # 5xx Server errors
 def internal_server_error(error):
     """500 Internal Server Error"""
+    if _is_caused_by_unavailable_database(error):
+        return service_unavailable(ServiceUnavailable(description=DATABASE_UNAVAILABLE_MESSAGE))
+
+    if QueryBudget.is_exceeded(error):
+        return _query_budget_exceeded()
+
     resp = ErrorResponse(status=500, prefix='Internal Server Error', description=InternalServerError.description,
                          message=error.description, joke='Are you nuts?')
     return resp.make_error(error)
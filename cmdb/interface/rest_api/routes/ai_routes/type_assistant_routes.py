@@ -23,7 +23,7 @@
 
 from cmdb.models.user_model import CmdbUser
 
-from cmdb.interface.rest_api.ai_models.gemini_model import gemini_model
+from cmdb.interface.rest_api.ai_models.gemini_model import GeminiModelProvider
 from cmdb.interface.blueprints import APIBlueprint
 from cmdb.interface.rest_api.api_level_enum import ApiLevel
 from cmdb.interface.route_utils import insert_request_user, verify_api_access
@@ -60,7 +60,7 @@ def send_message_ai(request_user: CmdbUser):
 
         full_prompt = f"{PROMT_TEXT}\n\n{user_message}"
 
-        response = gemini_model.generate_content(full_prompt)
+        response = GeminiModelProvider.get_model().generate_content(full_prompt)
 
         # LOGGER.debug("response text: %s", response.text)
         return DefaultResponse(response.text).make_response()
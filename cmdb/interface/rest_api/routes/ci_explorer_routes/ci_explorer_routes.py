@@ -61,6 +61,12 @@
 LOGGER = logging.getLogger(__name__)
 
 ci_explorer_blueprint = APIBlueprint('ci_explorer', __name__)
+
+CI_EXPLORER_MAX_DEPTH = 5
+CI_EXPLORER_DEFAULT_MAX_NODES = 250
+CI_EXPLORER_MAX_NODES = 1000
+# Limit of traversed relations per requested node, nodes can be connected by multiple relations
+CI_EXPLORER_EDGES_PER_NODE = 4
 # --------------------------------------------------- CRUD - CREATE -------------------------------------------------- #
 
 @ci_explorer_blueprint.route('/profile', methods=['POST'])
@@ -164,6 +170,8 @@ def get_ci_explorer_nodes_edges(request_user: CmdbUser):
             "target_id" (int): # public_id of target CmdbObject
             "target_type" (str): # Enum with PARENT, CHILD or BOTH
             "with_root" (bool): True # If True then the target Object will be part of the Response
+            "depth" (int): 1 # Number of hops which are traversed from the target Object
+            "max_nodes" (int): # Maximum number of returned nodes, closer nodes are preferred
 
     Args:
         request_user (CmdbUser): User requesting this data
@@ -175,6 +183,8 @@ def get_ci_explorer_nodes_edges(request_user: CmdbUser):
         target_id = request.args.get("target_id", type=int)
         target_type = request.args.get("target_type", default="BOTH").upper()
         with_root = request.args.get("with_root", default="false").lower() == "true"
+        depth = request.args.get("depth", default=1, type=int)
+        max_nodes = request.args.get("max_nodes", default=CI_EXPLORER_DEFAULT_MAX_NODES, type=int)
 
         types_filter = parse_int_list_filter("types_filter")
         relations_filter = parse_int_list_filter("relations_filter")
@@ -185,6 +195,12 @@ def get_ci_explorer_nodes_edges(request_user: CmdbUser):
         if not NodeType.is_valid(target_type):
             abort(400, f"Invalid target_type '{target_type}'. Need one of: {', '.join(NodeType.__members__.keys())}")
 
+        if not 1 <= depth <= CI_EXPLORER_MAX_DEPTH:
+            abort(400, f"Invalid depth '{depth}'. Must be between 1 and {CI_EXPLORER_MAX_DEPTH}!")
+
+        if not 1 <= max_nodes <= CI_EXPLORER_MAX_NODES:
+            abort(400, f"Invalid max_nodes '{max_nodes}'. Must be between 1 and {CI_EXPLORER_MAX_NODES}!")
+
         objects_manager: ObjectsManager = ManagerProvider.get_manager(ManagerType.OBJECTS, request_user)
         types_manager: TypesManager = ManagerProvider.get_manager(ManagerType.TYPES, request_user)
         relations_manager: RelationsManager = ManagerProvider.get_manager(ManagerType.RELATIONS, request_user)
@@ -196,47 +212,29 @@ def get_ci_explorer_nodes_edges(request_user: CmdbUser):
         root_object = objects_manager.get_object(target_id) if with_root else None
         root_type_info = types_manager.get_type(root_object['type_id']) if root_object else None
 
-        object_relations = list(object_relations_manager.find(
-            criteria={"$or": [
-                {"relation_parent_id": target_id},
-                {"relation_child_id": target_id}
-            ]}
-        ))
-
-        if relations_filter:
-            object_relations = [rel for rel in object_relations if rel['relation_id'] in relations_filter]
+        # Traverse each requested direction server side and select the nodes closest to the target Object
+        directions = [node_type == NodeType.CHILD for node_type in (NodeType.CHILD, NodeType.PARENT)
+                      if target_type in (NodeType.BOTH, node_type)]
+
+        object_relations, included_ids, truncated = object_relations_manager.traverse_nearest(
+                                                                            target_id,
+                                                                            depth,
+                                                                            directions,
+                                                                            relations_filter,
+                                                                            types_filter,
+                                                                            max_nodes,
+                                                                            CI_EXPLORER_EDGES_PER_NODE
+                                                                        )
 
-        relation_ids = set(rel['relation_id'] for rel in object_relations)
+        relation_ids = set(rel['relation_id'] for _, rel in object_relations)
         relations_list = relations_manager.find(criteria={"public_id": {"$in": list(relation_ids)}})
         relations_by_id = {rel['public_id']: rel for rel in relations_list}
 
-        linked_object_ids = set()
-        for rel in object_relations:
-            if rel['relation_parent_id'] != target_id:
-                linked_object_ids.add(rel['relation_parent_id'])
-            if rel['relation_child_id'] != target_id:
-                linked_object_ids.add(rel['relation_child_id'])
+        linked_object_ids = included_ids - {target_id}
 
         linked_objects_cursor = objects_manager.find(criteria={"public_id": {"$in": list(linked_object_ids)}})
         linked_objects = {obj['public_id']: obj for obj in linked_objects_cursor}
 
-        # Apply types_filter to both linked_objects and relations
-        if types_filter:
-            allowed_object_ids = {
-                obj_id for obj_id, obj in linked_objects.items()
-                if obj.get("type_id") in types_filter
-            }
-
-            object_relations = [
-                rel for rel in object_relations
-                if rel['relation_parent_id'] in allowed_object_ids or rel['relation_child_id'] in allowed_object_ids
-            ]
-
-            linked_objects = {
-                obj_id: obj for obj_id, obj in linked_objects.items()
-                if obj_id in allowed_object_ids
-            }
-
         type_ids = {obj['type_id'] for obj in linked_objects.values()}
         if root_type_info:
             type_ids.add(root_type_info['public_id'])
@@ -244,102 +242,18 @@ def get_ci_explorer_nodes_edges(request_user: CmdbUser):
         types_list = types_manager.find(criteria={"public_id": {"$in": list(type_ids)}})
         types_by_id = {t['public_id']: t for t in types_list}
 
-        def get_title(obj: dict, obj_type: dict):
-            label_field = obj_type.get('ci_explorer_label')
-            if not label_field:
-                return None
-            for field in obj.get('fields', []):
-                if field.get('name') == label_field:
-                    return field.get('value')
-            return None
-
         response = {}
 
         if with_root and root_object and root_type_info:
-            root_title = get_title(root_object, root_type_info)
-            response['root_node'] = {
-                "linked_object": root_object,
-                "title": root_title,
-                "type_info": {
-                    "type_id": root_type_info['public_id'],
-                    "type_color": root_type_info.get('ci_explorer_color'),
-                    "label": root_type_info.get('label'),
-                    "icon": root_type_info['render_meta'].get('icon'),
-                    "fields": root_type_info.get('fields', {}),
-                },
-                "relation_color": None,
-            }
-
-        child_nodes = {}
-        child_edges = []
-        parent_nodes = {}
-        parent_edges = []
-
-        for obj_rel in object_relations:
-            relation = relations_by_id.get(obj_rel['relation_id'])
-            if not relation:
-                continue
-
-            is_parent = obj_rel['relation_parent_id'] == target_id
-            is_child = obj_rel['relation_child_id'] == target_id
-
-            if is_parent:
-                linked_id = obj_rel['relation_child_id']
-                linked_type_id = obj_rel['relation_child_type_id']
-                relation_color = relation.get('relation_color_parent')
-                edge_from = target_id
-                edge_to = linked_id
-                edge_relation_name = relation.get('relation_name_parent')
-                edge_relation_icon = relation.get('relation_icon_parent')
-            elif is_child:
-                linked_id = obj_rel['relation_parent_id']
-                linked_type_id = obj_rel['relation_parent_type_id']
-                relation_color = relation.get('relation_color_child')
-                edge_from = linked_id
-                edge_to = target_id
-                edge_relation_name = relation.get('relation_name_child')
-                edge_relation_icon = relation.get('relation_icon_child')
-            else:
-                continue
-
-            linked_object = linked_objects.get(linked_id)
-            linked_type = types_by_id.get(linked_type_id)
-
-            if not linked_object or not linked_type:
-                continue
-
-            node_title = get_title(linked_object, linked_type)
-            node_dict = {
-                "linked_object": linked_object,
-                "title": node_title,
-                "type_info": {
-                    "type_id": linked_type['public_id'],
-                    "type_color": linked_type.get('ci_explorer_color'),
-                    "label": linked_type['label'],
-                    "icon": linked_type['render_meta'].get('icon'),
-                    "fields": linked_type.get('fields', {}),
-                },
-                "relation_color": relation_color
-            }
-
-            edge_dict = {
-                "from": edge_from,
-                "to": edge_to,
-                "metadata": {
-                    "relation_id": relation['public_id'],
-                    "relation_name": relation['relation_name'],
-                    "relation_label": edge_relation_name,
-                    "relation_icon": edge_relation_icon,
-                    "relation_color": relation_color,
-                }
-            }
+            response['root_node'] = build_ci_explorer_node(root_object, root_type_info, None)
 
-            if is_parent:
-                child_nodes[linked_id] = node_dict
-                child_edges.append(edge_dict)
-            elif is_child:
-                parent_nodes[linked_id] = node_dict
-                parent_edges.append(edge_dict)
+        child_nodes, parent_nodes = build_ci_explorer_nodes(object_relations,
+                                                            relations_by_id,
+                                                            linked_objects,
+                                                            types_by_id)
+        child_edges, parent_edges = build_ci_explorer_edges(object_relations,
+                                                            relations_by_id,
+                                                            set(child_nodes) | set(parent_nodes) | {target_id})
 
         if target_type in (NodeType.BOTH, NodeType.CHILD):
             response['children_nodes'] = list(child_nodes.values())
@@ -348,6 +262,8 @@ def get_title(obj: dict, obj_type: dict):
             response['parent_nodes'] = list(parent_nodes.values())
             response['parent_edges'] = parent_edges
 
+        response['truncated'] = truncated
+
         return DefaultResponse(response).make_response()
 
     except HTTPException as http_err:
@@ -540,3 +456,166 @@ def parse_int_list_filter(arg_name: str) -> set[int]:
         return {int(x) for x in parsed}
     except (SyntaxError, ValueError, TypeError):
         abort(400, f"Invalid format for '{arg_name}'. Must be a list of integers like [1,2,3].")
+
+
+def get_relation_side(object_relation: dict, relation: dict, towards_children: bool) -> tuple[int, int, dict]:
+    """
+    Retrieves the CmdbObject a traversed CmdbObjectRelation leads to and how the CmdbRelation is displayed from
+    the side of this CmdbObject
+
+    Args:
+        object_relation (dict): The traversed CmdbObjectRelation
+        relation (dict): The CmdbRelation of the CmdbObjectRelation
+        towards_children (bool): True if the relation was followed from parent to child
+
+    Returns:
+        tuple[int, int, dict]: public_id and type_id of the linked CmdbObject and the color, label and icon of the
+                               relation
+    """
+    if towards_children:
+        return object_relation['relation_child_id'], object_relation['relation_child_type_id'], {
+            "relation_color": relation.get('relation_color_parent'),
+            "relation_label": relation.get('relation_name_parent'),
+            "relation_icon": relation.get('relation_icon_parent'),
+        }
+
+    return object_relation['relation_parent_id'], object_relation['relation_parent_type_id'], {
+        "relation_color": relation.get('relation_color_child'),
+        "relation_label": relation.get('relation_name_child'),
+        "relation_icon": relation.get('relation_icon_child'),
+    }
+
+
+def get_ci_explorer_title(obj: dict, obj_type: dict):
+    """
+    Retrieves the value of the field which the CmdbType uses as label in the CI Explorer
+
+    Args:
+        obj (dict): The CmdbObject
+        obj_type (dict): The CmdbType of the CmdbObject
+
+    Returns:
+        Any: The value of the label field, None if the CmdbType has no label field
+    """
+    label_field = obj_type.get('ci_explorer_label')
+    if not label_field:
+        return None
+    for field in obj.get('fields', []):
+        if field.get('name') == label_field:
+            return field.get('value')
+    return None
+
+
+def build_ci_explorer_node(obj: dict, obj_type: dict, relation_color: str, depth: int = None) -> dict:
+    """
+    Builds a node of the CI Explorer
+
+    Args:
+        obj (dict): The CmdbObject of the node
+        obj_type (dict): The CmdbType of the CmdbObject
+        relation_color (str): Color of the relation which leads to the node, None for the root node
+        depth (int, optional): Number of hops from the target Object, the root node has no depth
+
+    Returns:
+        dict: The node
+    """
+    node = {
+        "linked_object": obj,
+        "title": get_ci_explorer_title(obj, obj_type),
+        "type_info": {
+            "type_id": obj_type['public_id'],
+            "type_color": obj_type.get('ci_explorer_color'),
+            "label": obj_type.get('label'),
+            "icon": obj_type['render_meta'].get('icon'),
+            "fields": obj_type.get('fields', {}),
+        },
+        "relation_color": relation_color,
+    }
+
+    if depth is not None:
+        node['depth'] = depth
+
+    return node
+
+
+def build_ci_explorer_nodes(
+        object_relations: list[tuple[bool, dict]],
+        relations_by_id: dict[int, dict],
+        linked_objects: dict[int, dict],
+        types_by_id: dict[int, dict]) -> tuple[dict[int, dict], dict[int, dict]]:
+    """
+    Builds the nodes of the CmdbObjects which are reached by the traversed CmdbObjectRelations
+
+    Args:
+        object_relations (list[tuple[bool, dict]]): The selected (towards_children, CmdbObjectRelation) pairs
+        relations_by_id (dict[int, dict]): The CmdbRelations of the CmdbObjectRelations by their public_id
+        linked_objects (dict[int, dict]): The reached CmdbObjects by their public_id
+        types_by_id (dict[int, dict]): The CmdbTypes of the reached CmdbObjects by their public_id
+
+    Returns:
+        tuple[dict[int, dict], dict[int, dict]]: The child nodes and the parent nodes by the public_id of their
+                                                 CmdbObject
+    """
+    child_nodes = {}
+    parent_nodes = {}
+
+    for towards_children, obj_rel in object_relations:
+        relation = relations_by_id.get(obj_rel['relation_id'])
+        if not relation:
+            continue
+
+        linked_id, linked_type_id, relation_side = get_relation_side(obj_rel, relation, towards_children)
+        linked_object = linked_objects.get(linked_id)
+        linked_type = types_by_id.get(linked_type_id)
+
+        # Paths which lead back to the target Object only add an edge
+        if not linked_object or not linked_type:
+            continue
+
+        node = build_ci_explorer_node(linked_object, linked_type, relation_side['relation_color'], obj_rel['hop'] + 1)
+        (child_nodes if towards_children else parent_nodes).setdefault(linked_id, node)
+
+    return child_nodes, parent_nodes
+
+
+def build_ci_explorer_edges(
+        object_relations: list[tuple[bool, dict]],
+        relations_by_id: dict[int, dict],
+        node_ids: set[int]) -> tuple[list[dict], list[dict]]:
+    """
+    Builds the edges of the traversed CmdbObjectRelations which lead to a node
+
+    Args:
+        object_relations (list[tuple[bool, dict]]): The selected (towards_children, CmdbObjectRelation) pairs
+        relations_by_id (dict[int, dict]): The CmdbRelations of the CmdbObjectRelations by their public_id
+        node_ids (set[int]): public_ids of the CmdbObjects which have a node, including the target Object
+
+    Returns:
+        tuple[list[dict], list[dict]]: The child edges and the parent edges
+    """
+    child_edges = []
+    parent_edges = []
+
+    for towards_children, obj_rel in object_relations:
+        relation = relations_by_id.get(obj_rel['relation_id'])
+        if not relation:
+            continue
+
+        linked_id, _, relation_side = get_relation_side(obj_rel, relation, towards_children)
+
+        if linked_id not in node_ids:
+            continue
+
+        edge = {
+            "from": obj_rel['relation_parent_id'],
+            "to": obj_rel['relation_child_id'],
+            "metadata": {
+                "relation_id": relation['public_id'],
+                "relation_name": relation['relation_name'],
+                **relation_side,
+            }
+        }
+
+        (child_edges if towards_children else parent_edges).append(edge)
+
+    return child_edges, parent_edges
@@ -40,17 +40,23 @@ def connection_test_frontend():
     """
     Connection check for frontend ({{url}}/rest/)
 
+    While the circuit breaker of the database is open, MongoDB is not contacted and the status code is 503
+
     Returns:
-        DefaultResponse: Dict with infos about Datagerry(title, version and connection status of db)
+        DefaultResponse: Dict with infos about Datagerry(title, version, connection status of db and state of the
+                         circuit breaker)
     """
     try:
+        breaker_open = dbm.circuit_breaker.is_active() and dbm.circuit_breaker.is_open()
+
         infos = {
             'title': __title__,
             'version': __version__,
-            'connected': dbm.status()
+            'connected': False if breaker_open else dbm.status(),
+            'circuit_breaker': dbm.circuit_breaker.get_state(),
         }
 
-        return DefaultResponse(infos).make_response()
+        return DefaultResponse(infos).make_response(503 if breaker_open else 200)
     except Exception as err:
         LOGGER.debug("[connection_test_frontend] Exception: %s", err)
         abort(500, "Could not connect to REST API!")
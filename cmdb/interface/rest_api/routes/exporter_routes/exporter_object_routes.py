@@ -19,6 +19,7 @@
 import logging
 from flask import abort, current_app
 
+from cmdb.database.query_budget import QueryBudget
 from cmdb.models.user_model import CmdbUser
 from cmdb.framework.exporter.config.exporter_config import ExporterConfig
 from cmdb.framework.exporter.writer.base_export_writer import BaseExportWriter
@@ -63,6 +64,7 @@ def get_export_file_types():
 @insert_request_user
 @verify_api_access(required_api_level=ApiLevel.LOCKED)
 @exporter_blueprint.protect(auth=True, right='base.framework.object.view')
+@QueryBudget.scope(QueryBudget.EXPORT)
 def export_objects(params: CollectionParameters, request_user: CmdbUser):
     """
     Export objects based on the provided parameters and the requesting user's permissions.
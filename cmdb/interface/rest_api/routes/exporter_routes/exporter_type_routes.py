@@ -24,6 +24,7 @@
 from werkzeug.exceptions import HTTPException
 
 from cmdb.database.database_utils import default
+from cmdb.database.query_budget import QueryBudget
 from cmdb.manager.manager_provider_model import ManagerProvider, ManagerType
 from cmdb.manager import TypesManager
 
@@ -43,6 +44,7 @@
 @type_export_blueprint.route('/', methods=['POST'])
 @insert_request_user
 @verify_api_access(required_api_level=ApiLevel.LOCKED)
+@QueryBudget.scope(QueryBudget.EXPORT)
 def export_cmdb_types(request_user: CmdbUser):
     """
     Export all CMDB types as a downloadable JSON file.
@@ -79,6 +81,7 @@ def export_cmdb_types(request_user: CmdbUser):
 @type_export_blueprint.route('/<string:public_ids>', methods=['POST'])
 @insert_request_user
 @verify_api_access(required_api_level=ApiLevel.LOCKED)
+@QueryBudget.scope(QueryBudget.EXPORT)
 def export_cmdb_types_by_ids(public_ids, request_user: CmdbUser):
     """
     Export specific CMDB types by their public IDs as a downloadable JSON file.
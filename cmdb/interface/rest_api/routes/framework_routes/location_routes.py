@@ -203,20 +203,7 @@ def get_cmdb_locations_tree(params: CollectionParameters, request_user: CmdbUser
 
         location_list: list[dict] = [CmdbLocation.to_json(location) for location in iteration_result.results]
 
-        # get all root locations
-        filtered_location_list = []
-        root_locations: list[LocationNode] = []
-
-        for location in location_list:
-            if location['parent'] == 1:
-                root_locations.append(LocationNode(location))
-            else:
-                filtered_location_list.append(location)
-
-        # get all children for each root location
-        for root_location in root_locations:
-            children = root_location.get_children(root_location.public_id, filtered_location_list)
-            root_location.children = children
+        root_locations = LocationNode.build_tree(CmdbLocation.ROOT_ID, location_list)
 
         # pack the root locations
         packed_locations = []
@@ -239,6 +226,41 @@ def get_cmdb_locations_tree(params: CollectionParameters, request_user: CmdbUser
         abort(500, "Internal server error!")
 
 
+@location_blueprint.route('/tree/<int:public_id>', methods=['GET', 'HEAD'])
+@insert_request_user
+@verify_api_access(required_api_level=ApiLevel.LOCKED)
+@location_blueprint.protect(auth=True, right='base.framework.object.view')
+def get_cmdb_locations_tree_level(public_id: int, request_user: CmdbUser):
+    """
+    Returns one level of the location tree, the direct children of a CmdbLocation with the number of their own
+    children. The tree is expanded lazily by requesting the level of a child, starting with the root location (1)
+
+    Args:
+        public_id (int): public_id of the parent CmdbLocation
+        request_user (CmdbUser): User requesting the data
+
+    Returns:
+        list: The direct children as location nodes with the key 'children_count'
+    """
+    try:
+        locations_manager: LocationsManager = ManagerProvider.get_manager(ManagerType.LOCATIONS, request_user)
+
+        tree_level = []
+
+        for location in locations_manager.get_tree_level(public_id):
+            location_node = LocationNode.to_json(LocationNode(location))
+            location_node['children_count'] = location['children_count']
+            tree_level.append(location_node)
+
+        return DefaultResponse(tree_level).make_response()
+    except LocationsManagerGetError as err:
+        LOGGER.error("[get_cmdb_locations_tree_level] LocationsManagerGetError: %s", err, exc_info=True)
+        abort(400, f"Failed to retrieve the children of the Location with ID: {public_id} from the database!")
+    except Exception as err:
+        LOGGER.error("[get_cmdb_locations_tree_level] Exception: %s. Type: %s", err, type(err), exc_info=True)
+        abort(500, "Internal server error!")
+
+
 @location_blueprint.route('/<int:public_id>', methods=['GET'])
 @insert_request_user
 @verify_api_access(required_api_level=ApiLevel.ADMIN)
@@ -17,6 +17,8 @@
 Definition of all routes for Logs
 """
 import logging
+from typing import Optional
+from datetime import datetime, timezone
 from flask import request, abort
 
 from cmdb.manager.query_builder import BuilderParameters
@@ -32,7 +34,12 @@
 from cmdb.interface.rest_api.responses.response_parameters import CollectionParameters
 from cmdb.interface.blueprints import APIBlueprint
 
-from cmdb.errors.manager import BaseManagerIterationError, BaseManagerGetError, BaseManagerDeleteError
+from cmdb.errors.manager import (
+    BaseManagerIterationError,
+    BaseManagerGetError,
+    BaseManagerUpdateError,
+    BaseManagerDeleteError,
+)
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -57,7 +64,7 @@ def get_log(public_id: int, request_user: CmdbUser):
     logs_manager: LogsManager = ManagerProvider.get_manager(ManagerType.LOGS, request_user)
 
     try:
-        requested_log: CmdbObjectLog = logs_manager.get_one(public_id)
+        requested_log: CmdbObjectLog = logs_manager.get_log(public_id)
     except BaseManagerGetError:
         abort(404, "Could not retrieve the requested log from database!")
 
@@ -144,7 +151,8 @@ def get_object_delete_logs(params: CollectionParameters, request_user: CmdbUser)
     Retrives all logs of objects being deleted
 
     Args:
-        params (CollectionParameters): filter for documents
+        params (CollectionParameters): filter for documents, 'archived=true' retrieves the archived logs, which
+                                       requires a 'start_time' and/or 'end_time' (ISO 8601)
     Returns:
         GetMultiResponse: with all object deleted logs
     """
@@ -153,11 +161,22 @@ def get_object_delete_logs(params: CollectionParameters, request_user: CmdbUser)
     try:
         query = {
             'log_type': CmdbObjectLog.__name__,
+            'object_deleted': True,
             'action': LogAction.DELETE.value
         }
 
         builder_params = BuilderParameters(query, params.limit, params.skip, params.sort, params.order)
-        object_logs = logs_manager.iterate(builder_params)
+
+        if is_archive_requested(params):
+            start_time, end_time = get_archive_time_range(params)
+
+            if start_time is None and end_time is None:
+                abort(400, "Archived logs of deleted objects require a 'start_time' or an 'end_time'!")
+
+            object_logs = logs_manager.iterate_archived(builder_params, start_time, end_time)
+        else:
+            object_logs = logs_manager.iterate(builder_params)
+
         logs = [CmdbObjectLog.to_json(_) for _ in object_logs.results]
 
         api_response = GetMultiResponse(logs,
@@ -183,7 +202,7 @@ def get_logs_by_object(object_id: int, params: CollectionParameters, request_use
 
     Args:
         object_id (int): public_id of the object
-        params (CollectionParameters): Filter for documents
+        params (CollectionParameters): Filter for documents, 'archived=true' retrieves the archived logs
     Returns:
         GetMultiResponse: with all logs of the object
     """
@@ -196,7 +215,10 @@ def get_logs_by_object(object_id: int, params: CollectionParameters, request_use
                                            params.sort,
                                            params.order)
 
-        iteration_result = logs_manager.iterate(builder_params)
+        if is_archive_requested(params):
+            iteration_result = logs_manager.iterate_archived(builder_params)
+        else:
+            iteration_result = logs_manager.iterate(builder_params)
 
         logs = [CmdbObjectLog.to_json(_) for _ in iteration_result.results]
 
@@ -212,6 +234,34 @@ def get_logs_by_object(object_id: int, params: CollectionParameters, request_use
     return api_response.make_response()
 
 
+@logs_blueprint.route('/object/<int:object_id>/version/<string:version>', methods=['GET'])
+@insert_request_user
+@verify_api_access(required_api_level=ApiLevel.LOCKED)
+@logs_blueprint.protect(auth=True, right='base.framework.log.view')
+def get_object_render_state_at_version(object_id: int, version: str, request_user: CmdbUser):
+    """
+    Retrieves the render state of an object at the given version
+
+    Args:
+        object_id (int): public_id of the object
+        version (str): version of the object
+    Returns:
+        dict: The render state of the object at the given version
+    """
+    logs_manager: LogsManager = ManagerProvider.get_manager(ManagerType.LOGS, request_user)
+
+    try:
+        render_state = logs_manager.get_render_state_at_version(object_id, version)
+    except BaseManagerGetError as err:
+        LOGGER.debug("[get_object_render_state_at_version] %s", err)
+        abort(400, f"Could not reconstruct the object with ID:{object_id} at version {version}!")
+
+    if render_state is None:
+        abort(404, f"No log found for the object with ID:{object_id} at version {version}!")
+
+    return DefaultResponse(render_state).make_response()
+
+
 @logs_blueprint.route('/<int:public_id>/corresponding', methods=['GET', 'HEAD'])
 @insert_request_user
 @verify_api_access(required_api_level=ApiLevel.LOCKED)
@@ -268,14 +318,57 @@ def delete_log(public_id: int, request_user: CmdbUser):
     logs_manager: LogsManager = ManagerProvider.get_manager(ManagerType.LOGS, request_user)
 
     try:
-        deleted = logs_manager.delete({'public_id':public_id})
+        deleted = logs_manager.delete_log(public_id)
 
         api_response = DefaultResponse(deleted)
 
         return api_response.make_response()
-    except BaseManagerDeleteError as err:
+    except (BaseManagerDeleteError, BaseManagerUpdateError) as err:
         LOGGER.error("[delete_log] %s", err)
         abort(400, f"Could not delete the log with the ID:{public_id}!")
     except Exception as err:
         LOGGER.debug("[delete_log] Exception: %s. Type: %s", err, type(err))
         abort(500, f"Could not delete the log with the ID:{public_id}!")
+
+# ------------------------------------------------------ HELPERS ----------------------------------------------------- #
+
+def is_archive_requested(params: CollectionParameters) -> bool:
+    """
+    Checks if the request explicitly asks for logs which were moved to the archive by the retention service
+
+    Args:
+        params (CollectionParameters): The parameters of the request
+
+    Returns:
+        bool: True if the archived logs are requested
+    """
+    return params.optional.get('archived', False) in ['True', 'true']
+
+
+def get_archive_time_range(params: CollectionParameters) -> tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Retrieves the time range of a request for archived logs from the optional 'start_time' and 'end_time'
+
+    Args:
+        params (CollectionParameters): The parameters of the request
+
+    Returns:
+        tuple[Optional[datetime], Optional[datetime]]: The UTC start and end time, None if not given
+    """
+    time_range = []
+
+    for name in ('start_time', 'end_time'):
+        value = params.optional.get(name)
+
+        if not value:
+            time_range.append(None)
+            continue
+
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            abort(400, f"The '{name}' must be an ISO 8601 date!")
+
+        time_range.append(parsed.astimezone(timezone.utc) if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc))
+
+    return time_range[0], time_range[1]
@@ -44,7 +44,6 @@
 from cmdb.models.object_relation_model import CmdbObjectRelation
 from cmdb.models.user_model import CmdbUser
 from cmdb.models.webhook_model.webhook_event_type_enum import WebhookEventType
-from cmdb.models.location_model.cmdb_location import CmdbLocation
 from cmdb.models.object_model import CmdbObject
 from cmdb.models.log_model.log_action_enum import LogAction
 from cmdb.models.log_model.cmdb_object_log import CmdbObjectLog
@@ -53,6 +52,7 @@
 from cmdb.framework.results import IterationResult
 from cmdb.framework.rendering.cmdb_render import CmdbRender
 from cmdb.framework.rendering.render_list import RenderList
+from cmdb.framework.subtree_delete.subtree_delete_engine import SubtreeDeleteEngine
 from cmdb.interface.rest_api.api_level_enum import ApiLevel
 from cmdb.interface.route_utils import insert_request_user, sync_config_items, verify_api_access
 from cmdb.interface.blueprints import APIBlueprint
@@ -1235,13 +1235,10 @@ def delete_cmdb_object_with_child_locations(public_id: int, request_user: CmdbUs
     Deletes a CmdbObject along with its associated child locations.
 
     This function performs the following steps:
-    1. Verifies the existence of the CMDB object
-    2. Removes all links and references associated with the CmdbObject
-    3. Checks for the location associated with the CmdbObject
-    4. If a location exists, retrieves and deletes all child locations
-    5. Deletes the CmdbObject and its location
-    6. Synchronizes configuration items if running in cloud mode
-    7. Removes invalid CmdbObjectRelations
+    1. Verifies the existence of the CMDB object and its location
+    2. Deletes the CmdbObject, its location and all child locations with the SubtreeDeleteEngine, which
+       also removes links, references and CmdbObjectRelations of the CmdbObject
+    3. Synchronizes configuration items if running in cloud mode
 
     Args:
         public_id (int): The public_id of the CmdbObject object to be deleted
@@ -1253,72 +1250,28 @@ def delete_cmdb_object_with_child_locations(public_id: int, request_user: CmdbUs
     try:
         locations_manager: LocationsManager = ManagerProvider.get_manager(ManagerType.LOCATIONS, request_user)
         objects_manager: ObjectsManager = ManagerProvider.get_manager(ManagerType.OBJECTS, request_user)
-        object_relations_manager: ObjectRelationsManager = ManagerProvider.get_manager(
-                                                                            ManagerType.OBJECT_RELATIONS,
-                                                                            request_user)
-        object_relation_logs_manager: ObjectRelationLogsManager = ManagerProvider.get_manager(
-                                                                            ManagerType.OBJECT_RELATION_LOGS,
-                                                                            request_user)
 
         # check if object exists
-        current_object_instance = objects_manager.get_object(public_id)
-
-        if not current_object_instance:
+        if not objects_manager.get_object(public_id):
             abort(404, f"Object with ID:{public_id} not found!")
 
-        current_object_instance = CmdbObject.from_data(current_object_instance)
-
-        # Remove object links and references
-        try:
-            delete_object_links(public_id, request_user)
-            objects_manager.delete_all_object_references(public_id)
-        except Exception as error:
-            LOGGER.error(
-                "[delete_cmdb_object_with_child_locations] Links + Refenreces Exception: %s. Type: %s",
-                error, type(error), exc_info=True
-            )
-
         # check if location for this object exists
         current_location = locations_manager.get_location_for_object(public_id)
 
-        deleted = None
-        if current_location:
-            # get all child locations for this location
-            build_params = BuilderParameters([{"$match":{"public_id":{"$gt":1}}}])
-
-            iteration_result: IterationResult[CmdbLocation] = locations_manager.iterate(build_params)
-
-            all_locations: list[dict] = [location_.__dict__ for location_ in iteration_result.results]
-            all_children = locations_manager.get_all_children(current_location['public_id'], all_locations)
-
-            # delete all child locations
-            for child in all_children:
-                locations_manager.delete_location(child['public_id'])
-
-            # delete the current object and its location
-            locations_manager.delete_location(current_location['public_id'])
+        if not current_location:
+            abort(404, "Location for the Object not found!")
 
-            deleted = objects_manager.delete_with_follow_up(public_id,
-                                                            request_user,
-                                                            permission=AccessControlPermission.DELETE)
+        deleted = SubtreeDeleteEngine(request_user).delete(public_id, current_location, with_child_objects=False)
 
-            try:
-                if current_app.cloud_mode:
-                    objects_count = objects_manager.count_objects()
-
-                    sync_config_items(request_user.email, request_user.database, objects_count)
-            except Exception as error:
-                LOGGER.error(
-                    "[delete_cmdb_object_with_child_locations] Could not sync config items count. Error: %s", error
-                )
-        else:
-            abort(404, "Location for the Object not found!")
+        try:
+            if current_app.cloud_mode:
+                objects_count = objects_manager.count_objects()
 
-        # Handle corresponding CmdbObjectRelations
-        delete_invalid_object_relations(public_id,
-                                        request_user,
-                                        object_relations_manager,
-                                        object_relation_logs_manager)
+                sync_config_items(request_user.email, request_user.database, objects_count)
+        except Exception as error:
+            LOGGER.error(
+                "[delete_cmdb_object_with_child_locations] Could not sync config items count. Error: %s", error
+            )
 
         return DefaultResponse(deleted).make_response()
     except HTTPException as http_err:
@@ -1336,7 +1289,6 @@ def delete_cmdb_object_with_child_locations(public_id: int, request_user: CmdbUs
         abort(500, "An internal server error occured while deleting Object with child Locations!")
 
 
-#TODO: REFACTOR-FIX (reduce complexity)
 @objects_blueprint.route('/<int:public_id>/children', methods=['DELETE'])
 @insert_request_user
 @verify_api_access(required_api_level=ApiLevel.LOCKED)
@@ -1344,7 +1296,8 @@ def delete_cmdb_object_with_child_locations(public_id: int, request_user: CmdbUs
 def delete_object_with_child_objects(public_id: int, request_user: CmdbUser):
     """
     Deletes an object and all objects which are child objects of it in the location tree
-    The corresponding locations of each object are also deleted
+    The corresponding locations of each object are also deleted. The whole subtree is deleted by the
+    SubtreeDeleteEngine with batched operations per collection
 
     Args:
         public_id (int): public_id of the CmdbObject which should be deleted with its children
@@ -1357,12 +1310,6 @@ def delete_object_with_child_objects(public_id: int, request_user: CmdbUser):
         locations_manager: LocationsManager = ManagerProvider.get_manager(ManagerType.LOCATIONS, request_user)
         objects_manager: ObjectsManager = ManagerProvider.get_manager(ManagerType.OBJECTS, request_user)
         webhooks_manager: WebhooksManager = ManagerProvider.get_manager(ManagerType.WEBHOOKS, request_user)
-        object_relations_manager: ObjectRelationsManager = ManagerProvider.get_manager(
-                                                                            ManagerType.OBJECT_RELATIONS,
-                                                                            request_user)
-        object_relation_logs_manager: ObjectRelationLogsManager = ManagerProvider.get_manager(
-                                                                            ManagerType.OBJECT_RELATION_LOGS,
-                                                                            request_user)
 
         # check if object exists
         current_object_instance = objects_manager.get_object(public_id)
@@ -1372,80 +1319,32 @@ def delete_object_with_child_objects(public_id: int, request_user: CmdbUser):
 
         current_object_instance = CmdbObject.from_data(current_object_instance)
 
-        # Remove object links and references
-        try:
-            delete_object_links(public_id, request_user)
-            objects_manager.delete_all_object_references(public_id)
-        except Exception as error:
-            LOGGER.error(
-                "[delete_object_with_child_objects] Links + Refenreces Exception: %s. Type: %s",
-                error, type(error), exc_info=True
-            )
-
         # check if location for this object exists
         current_location = locations_manager.get_location_for_object(public_id)
 
-        deleted = None
-        if current_location:
-            # get all child locations for this location
-            builder_params = BuilderParameters([{"$match":{"public_id":{"$gt":1}}}])
-
-            iteration_result: IterationResult[CmdbLocation] = locations_manager.iterate(builder_params)
-
-            all_locations: list[dict] = [location_.__dict__ for location_ in iteration_result.results]
-            all_children_locations = locations_manager.get_all_children(current_location['public_id'], all_locations)
-
-            children_object_ids = []
-
-            # delete all child locations and extract their corresponding object_ids
-            for child in all_children_locations:
-                children_object_ids.append(child['object_id'])
-                locations_manager.delete_location(child['public_id'])
-
-            # # delete the objects of child locations
-            for child_object_id in children_object_ids:
-                objects_manager.delete_with_follow_up(child_object_id,
-                                                      request_user,
-                                                      AccessControlPermission.DELETE)
+        if not current_location:
+            abort(404, "Location for the Object not found!")
 
-                # Handle corresponding CmdbObjectRelations
-                delete_invalid_object_relations(child_object_id,
-                                                request_user,
-                                                object_relations_manager,
-                                                object_relation_logs_manager)
+        deleted = SubtreeDeleteEngine(request_user).delete(public_id, current_location, with_child_objects=True)
 
-            # # delete the current object and its location
-            locations_manager.delete_location(current_location['public_id'])
-            deleted = objects_manager.delete_with_follow_up(public_id,
-                                                            request_user,
-                                                            AccessControlPermission.DELETE)
-
-            # Handle corresponding CmdbObjectRelations
-            delete_invalid_object_relations(public_id,
-                                            request_user,
-                                            object_relations_manager,
-                                            object_relation_logs_manager)
-
-            #EVENT: DELETE-EVENT
-            try:
-                webhooks_manager.send_webhook_event(WebhookEventType.DELETE,
-                                                    object_before=CmdbObject.to_json(current_object_instance))
-            except Exception as error:
-                LOGGER.error(
-                    "[delete_object_with_child_objects] Failed to send webhook event. Error: %s", error
-                )
+        #EVENT: DELETE-EVENT
+        try:
+            webhooks_manager.send_webhook_event(WebhookEventType.DELETE,
+                                                object_before=CmdbObject.to_json(current_object_instance))
+        except Exception as error:
+            LOGGER.error(
+                "[delete_object_with_child_objects] Failed to send webhook event. Error: %s", error
+            )
 
-            try:
-                if current_app.cloud_mode:
-                    objects_count = objects_manager.count_objects()
+        try:
+            if current_app.cloud_mode:
+                objects_count = objects_manager.count_objects()
 
-                    sync_config_items(request_user.email, request_user.database, objects_count)
-            except Exception as error:
-                LOGGER.error(
-                    "[delete_object_with_child_objects] Could not sync config items count. Error: %s", error
-                )
-        else:
-            abort(404, "Location for the Object not found!")
+                sync_config_items(request_user.email, request_user.database, objects_count)
+        except Exception as error:
+            LOGGER.error(
+                "[delete_object_with_child_objects] Could not sync config items count. Error: %s", error
+            )
 
         return DefaultResponse(deleted).make_response()
     except HTTPException as http_err:
@@ -20,6 +20,7 @@
 import re
 from flask import abort
 
+from cmdb.database.query_budget import QueryBudget
 from cmdb.manager.objects_manager import ObjectsManager
 from cmdb.manager.extendable_options_manager import ExtendableOptionsManager
 from cmdb.manager.isms_manager.risk_matrix_manager import RiskMatrixManager
@@ -50,6 +51,7 @@
 @insert_request_user
 @verify_api_access(required_api_level=ApiLevel.LOCKED)
 @isms_report_blueprint.protect(auth=True, right='base.isms.report.view')
+@QueryBudget.scope(QueryBudget.REPORT)
 def get_isms_risk_matrix_report(request_user: CmdbUser):
     """
     HTTP `GET`/`HEAD` route to retrieve the IsmsRiskMatrix report
@@ -89,6 +91,7 @@ def get_isms_risk_matrix_report(request_user: CmdbUser):
 @insert_request_user
 @verify_api_access(required_api_level=ApiLevel.LOCKED)
 @isms_report_blueprint.protect(auth=True, right='base.isms.report.view')
+@QueryBudget.scope(QueryBudget.REPORT)
 def get_isms_risk_treatment_plan_report(request_user: CmdbUser):
     """
     HTTP `GET`/`HEAD` route to retrieve the Risk Treatment Plan report
@@ -365,14 +368,22 @@ def get_isms_risk_treatment_plan_report(request_user: CmdbUser):
         query_result: list[dict] = list(risk_assessment_manager.aggregate(query_pipeline))
 
         # Replace Object public_id with Summary line
-        for item in query_result:
-            if item.get("object") and item.get("object_id_ref_type") == "OBJECT":
-                try:
-                    object_summary = objects_manager.get_summary_line(item["object"], with_type=False)
-                    item["object"] = object_summary
-                except Exception:
-                    item["object"] = "Unknown object"
+        object_items = [
+            item for item in query_result if item.get("object") and item.get("object_id_ref_type") == "OBJECT"
+        ]
+
+        try:
+            object_summaries = objects_manager.get_summary_lines(
+                [item["object"] for item in object_items],
+                with_type=False
+            )
+        except Exception:
+            object_summaries = {}
 
+        for item in object_items:
+            item["object"] = object_summaries.get(item["object"], "Unknown object")
+
+        for item in query_result:
             # Clean up unnecessary internal fields
             item.pop("object_id_ref_type", None)
 
@@ -391,6 +402,7 @@ def get_isms_risk_treatment_plan_report(request_user: CmdbUser):
 @insert_request_user
 @verify_api_access(required_api_level=ApiLevel.LOCKED)
 @isms_report_blueprint.protect(auth=True, right='base.isms.report.view')
+@QueryBudget.scope(QueryBudget.REPORT)
 def get_isms_soa_report(request_user: CmdbUser):
     """
     HTTP `GET`/`HEAD` route to retrieve the Statement of Applicability(SOA) report
@@ -459,6 +471,7 @@ def get_isms_soa_report(request_user: CmdbUser):
 @insert_request_user
 @verify_api_access(required_api_level=ApiLevel.LOCKED)
 @isms_report_blueprint.protect(auth=True, right='base.isms.report.view')
+@QueryBudget.scope(QueryBudget.REPORT)
 def get_isms_risk_assessments_report(request_user: CmdbUser):
     """
     HTTP `GET`/`HEAD` route to retrieve the Statement of Applicability(SOA) report
@@ -1016,13 +1029,21 @@ def get_isms_risk_assessments_report(request_user: CmdbUser):
         query_result: list[dict] = list(risk_assessment_manager.aggregate(pipeline))
 
         # Replace Object public_id with Summary line
-        for item in query_result:
-            if item.get("assigned_object") and item.get("object_id_ref_type") == "OBJECT":
-                try:
-                    object_summary = objects_manager.get_summary_line(item["assigned_object"], with_type=False)
-                    item["assigned_object"] = object_summary
-                except Exception:
-                    item["assigned_object"] = "Unknown object"
+        object_items = [
+            item for item in query_result
+            if item.get("assigned_object") and item.get("object_id_ref_type") == "OBJECT"
+        ]
+
+        try:
+            object_summaries = objects_manager.get_summary_lines(
+                [item["assigned_object"] for item in object_items],
+                with_type=False
+            )
+        except Exception:
+            object_summaries = {}
+
+        for item in object_items:
+            item["assigned_object"] = object_summaries.get(item["assigned_object"], "Unknown object")
 
 
         return DefaultResponse(query_result).make_response()
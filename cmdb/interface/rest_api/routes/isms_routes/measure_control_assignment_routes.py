@@ -197,9 +197,7 @@ def get_isms_control_measure_assignments(params: CollectionParameters, request_u
         object_map = {
             obj_id: objects_manager.get_object(obj_id) for obj_id in object_ids
         }
-        object_summaries = {
-            obj_id: objects_manager.get_summary_line(obj_id) for obj_id in object_ids
-        }
+        object_summaries = objects_manager.get_summary_lines(list(object_ids))
 
         # Collect type_ids from object_map
         type_ids = {obj.get('type_id') for obj in object_map.values() if obj and obj.get('type_id')}
@@ -20,7 +20,9 @@
 import logging
 from typing import Optional
 from flask import request, abort
+from gridfs.grid_file import GridOut
 from werkzeug.datastructures import FileStorage
+from werkzeug.exceptions import RequestedRangeNotSatisfiable
 from werkzeug.wrappers import Request
 
 from cmdb.manager import MediaFilesManager
@@ -145,6 +147,66 @@ def generate_collection_parameters(params: CollectionParameters) -> dict:
     return generate_metadata_filter('metadata', params=param)
 
 
+def generate_file_etag(grid_out: GridOut) -> str:
+    """
+    Generates the ETag of a stored media file
+
+    The SHA-256 hash of deduplicated files or the md5 checksum of older files is used. If neither exists,
+    the ETag is derived from the ObjectId and the upload date which change whenever the file is replaced
+
+    Args:
+        grid_out (GridOut): Handle of the stored file
+
+    Returns:
+        str: The unquoted ETag of the file
+    """
+    checksum = grid_out._file.get('sha256') or grid_out._file.get('md5')
+
+    if checksum:
+        return checksum
+
+    return f"{grid_out._id}-{int(grid_out.upload_date.timestamp() * 1000)}"
+
+
+def get_requested_byte_range(_request: Request, etag: str, length: int) -> Optional[tuple[int, int]]:
+    """
+    Evaluates the 'Range' and 'If-Range' headers of a download request
+
+    Only single byte ranges are supported, multipart ranges are answered with the complete file
+
+    Args:
+        _request (Request): The Flask request
+        etag (str): Current ETag of the requested file
+        length (int): Complete length of the requested file in bytes
+
+    Raises:
+        RequestedRangeNotSatisfiable: If the requested range can not be satisfied
+
+    Returns:
+        Optional[tuple[int, int]]: Start and (exclusive) end of the range or None if the complete file is requested
+    """
+    byte_range = _request.range
+
+    if not byte_range or byte_range.units != 'bytes' or len(byte_range.ranges) != 1:
+        return None
+
+    # A changed file invalidates partial downloads, the client has to fetch the complete file again
+    if_range = _request.if_range
+
+    if if_range.etag and if_range.etag != etag:
+        return None
+
+    requested_range = byte_range.range_for_length(length)
+
+    if requested_range is None:
+        raise RequestedRangeNotSatisfiable(
+            length=length,
+            description=f"Requested range not satisfiable, file length is {length} bytes!"
+        )
+
+    return requested_range
+
+
 def create_attachment_name(name: str, index: int, metadata: dict, media_files_manager: MediaFilesManager) -> str:
     """
     Recursively generates a unique attachment file name if a file with the same name already exists.
@@ -20,6 +20,7 @@
 import logging
 from bson import json_util
 from flask import abort, request, Response
+from werkzeug.exceptions import HTTPException
 
 from cmdb.manager.manager_provider_model import ManagerProvider, ManagerType
 from cmdb.manager import MediaFilesManager
@@ -35,6 +36,8 @@
     get_element_from_data_request,
     get_file_in_request,
     generate_metadata_filter,
+    generate_file_etag,
+    get_requested_byte_range,
     recursive_delete_filter,
     generate_collection_parameters,
     create_attachment_name,
@@ -121,6 +124,9 @@ def add_new_file(request_user: CmdbUser):
     Metadata:
         Metadata are stored under 'request.form["Metadata"]'
 
+    Large files should be uploaded with the chunked upload routes ('/media_file/uploads'), which do not
+    buffer the request body
+
     Raises:
         MediaFileManagerGetError: If the file could not be found.
         MediaFileManagerInsertError: If something went wrong during insert
@@ -146,7 +152,6 @@ def add_new_file(request_user: CmdbUser):
 
         if file_exists:
             exist = media_files_manager.get_file(filter_metadata)
-            media_files_manager.delete_file(exist['public_id'])
 
         # If file exist overwrite the references from previous file
         if exist:
@@ -156,7 +161,8 @@ def add_new_file(request_user: CmdbUser):
         metadata['author_id'] = request_user.public_id
         metadata['mime_type'] = file.mimetype
 
-        result = media_files_manager.insert_file(data=file, metadata=metadata)
+        # An existing file is only removed after the new version was stored
+        result = media_files_manager.insert_file(data=file, metadata=metadata, replaces=exist)
 
         return InsertSingleResponse(result, result['public_id']).make_response()
     except MediaFileManagerGetError as err:
@@ -170,6 +176,200 @@ def add_new_file(request_user: CmdbUser):
         abort(500, "An internal server error occured while adding the file!")
 
 
+# -------------------------------------------------- CHUNKED UPLOADS ------------------------------------------------- #
+
+@media_file_blueprint.route('/uploads', methods=['POST'])
+@insert_request_user
+@verify_api_access(required_api_level=ApiLevel.LOCKED)
+@right_required('base.framework.object.edit')
+def initiate_file_upload(request_user: CmdbUser):
+    """
+    Starts a resumable chunked upload of a file
+
+    The request body is a JSON document with the 'filename', the 'mime_type' and the 'metadata' of the file.
+    Like in `add_new_file()` an existing file with the same name and metadata is replaced when the upload
+    is completed. Only the initiating user can access the upload, it expires without a new part for 24 hours
+
+    Args:
+        request_user (CmdbUser): the instance of the started user
+
+    Returns:
+        The upload session with the 'upload_id' and the 'next_part' which should be uploaded
+    """
+    try:
+        media_files_manager: MediaFilesManager = ManagerProvider.get_manager(ManagerType.MEDIA_FILES,
+                                                                            request_user)
+
+        upload_data = request.get_json(silent=True) or {}
+        filename = upload_data.get('filename')
+        metadata = upload_data.get('metadata') or {}
+
+        if not filename:
+            abort(400, "No filename was provided for the upload!")
+
+        filter_metadata = generate_metadata_filter('metadata', params=metadata)
+        filter_metadata.update({'filename': filename})
+        exist = None
+
+        if media_files_manager.file_exists(filter_metadata):
+            exist = media_files_manager.get_file(filter_metadata)
+            metadata['reference'] = exist['metadata']['reference']
+            metadata['reference_type'] = exist['metadata']['reference_type']
+
+        metadata['author_id'] = request_user.public_id
+        metadata['mime_type'] = upload_data.get('mime_type') or 'application/octet-stream'
+
+        upload = media_files_manager.initiate_upload(filename, metadata, request_user.public_id, replaces=exist)
+
+        return DefaultResponse(upload).make_response(201)
+    except HTTPException as http_err:
+        raise http_err
+    except MediaFileManagerInsertError as err:
+        LOGGER.error("[initiate_file_upload] MediaFileManagerInsertError: %s", err, exc_info=True)
+        abort(400, "Failed to initiate the upload of the File!")
+    except Exception as err:
+        LOGGER.error("[initiate_file_upload] Exception: %s. Type: %s", err, type(err), exc_info=True)
+        abort(500, "An internal server error occured while initiating the upload of the file!")
+
+
+@media_file_blueprint.route('/uploads/<string:upload_id>', methods=['GET'])
+@insert_request_user
+@verify_api_access(required_api_level=ApiLevel.LOCKED)
+@right_required('base.framework.object.edit')
+def get_file_upload(upload_id: str, request_user: CmdbUser):
+    """
+    Retrieves the state of an upload session, used to resume an interrupted upload
+
+    Args:
+        upload_id (str): ID of the upload session
+        request_user (CmdbUser): the instance of the started user
+
+    Returns:
+        The upload session
+    """
+    try:
+        media_files_manager: MediaFilesManager = ManagerProvider.get_manager(ManagerType.MEDIA_FILES,
+                                                                            request_user)
+
+        upload = media_files_manager.get_upload(upload_id, request_user.public_id)
+
+        if not upload:
+            abort(404, f"The Upload with ID: {upload_id} was not found!")
+
+        return DefaultResponse(media_files_manager.to_upload_json(upload)).make_response()
+    except HTTPException as http_err:
+        raise http_err
+    except MediaFileManagerGetError as err:
+        LOGGER.error("[get_file_upload] MediaFileManagerGetError: %s", err, exc_info=True)
+        abort(400, f"Failed to retrieve the Upload with ID: {upload_id} from the database!")
+    except Exception as err:
+        LOGGER.error("[get_file_upload] Exception: %s. Type: %s", err, type(err), exc_info=True)
+        abort(500, f"An internal server error occured while retrieving the Upload with ID: {upload_id}!")
+
+
+@media_file_blueprint.route('/uploads/<string:upload_id>/parts/<int:part_number>', methods=['PUT'])
+@insert_request_user
+@verify_api_access(required_api_level=ApiLevel.LOCKED)
+@right_required('base.framework.object.edit')
+def upload_file_part(upload_id: str, part_number: int, request_user: CmdbUser):
+    """
+    Uploads a part of a file, the raw request body is the content of the part
+
+    The body is streamed into GridFS and never buffered completely. Parts have to be uploaded in order,
+    an already uploaded part is ignored
+
+    Args:
+        upload_id (str): ID of the upload session
+        part_number (int): Number of the part, starting with 1
+        request_user (CmdbUser): the instance of the started user
+
+    Returns:
+        The updated upload session
+    """
+    try:
+        media_files_manager: MediaFilesManager = ManagerProvider.get_manager(ManagerType.MEDIA_FILES,
+                                                                            request_user)
+
+        upload = media_files_manager.upload_part(upload_id, request_user.public_id, part_number, request.stream)
+
+        return DefaultResponse(upload).make_response()
+    except MediaFileManagerGetError as err:
+        LOGGER.error("[upload_file_part] MediaFileManagerGetError: %s", err, exc_info=True)
+        abort(404, f"The Upload with ID: {upload_id} was not found!")
+    except MediaFileManagerInsertError as err:
+        LOGGER.error("[upload_file_part] MediaFileManagerInsertError: %s", err, exc_info=True)
+        abort(409, f"Failed to store part {part_number} of the Upload with ID: {upload_id}!")
+    except Exception as err:
+        LOGGER.error("[upload_file_part] Exception: %s. Type: %s", err, type(err), exc_info=True)
+        abort(500, f"An internal server error occured while uploading part {part_number}!")
+
+
+@media_file_blueprint.route('/uploads/<string:upload_id>/complete', methods=['POST'])
+@insert_request_user
+@verify_api_access(required_api_level=ApiLevel.LOCKED)
+@right_required('base.framework.object.edit')
+def complete_file_upload(upload_id: str, request_user: CmdbUser):
+    """
+    Completes an upload session and publishes the uploaded file
+
+    Args:
+        upload_id (str): ID of the upload session
+        request_user (CmdbUser): the instance of the started user
+
+    Returns:
+        New MediaFile.
+    """
+    try:
+        media_files_manager: MediaFilesManager = ManagerProvider.get_manager(ManagerType.MEDIA_FILES,
+                                                                            request_user)
+
+        result = media_files_manager.complete_upload(upload_id, request_user.public_id)
+
+        return InsertSingleResponse(result, result['public_id']).make_response()
+    except MediaFileManagerGetError as err:
+        LOGGER.error("[complete_file_upload] MediaFileManagerGetError: %s", err, exc_info=True)
+        abort(404, f"The Upload with ID: {upload_id} was not found!")
+    except MediaFileManagerInsertError as err:
+        LOGGER.error("[complete_file_upload] MediaFileManagerInsertError: %s", err, exc_info=True)
+        abort(400, f"Failed to complete the Upload with ID: {upload_id}!")
+    except Exception as err:
+        LOGGER.error("[complete_file_upload] Exception: %s. Type: %s", err, type(err), exc_info=True)
+        abort(500, f"An internal server error occured while completing the Upload with ID: {upload_id}!")
+
+
+@media_file_blueprint.route('/uploads/<string:upload_id>', methods=['DELETE'])
+@insert_request_user
+@verify_api_access(required_api_level=ApiLevel.LOCKED)
+@right_required('base.framework.object.edit')
+def abort_file_upload(upload_id: str, request_user: CmdbUser):
+    """
+    Aborts an upload session and removes all uploaded parts
+
+    Args:
+        upload_id (str): ID of the upload session
+        request_user (CmdbUser): the instance of the started user
+
+    Returns:
+        True if the upload session was removed
+    """
+    try:
+        media_files_manager: MediaFilesManager = ManagerProvider.get_manager(ManagerType.MEDIA_FILES,
+                                                                            request_user)
+
+        if not media_files_manager.abort_upload(upload_id, request_user.public_id):
+            abort(404, f"The Upload with ID: {upload_id} was not found!")
+
+        return DefaultResponse(True).make_response()
+    except HTTPException as http_err:
+        raise http_err
+    except MediaFileManagerDeleteError as err:
+        LOGGER.error("[abort_file_upload] MediaFileManagerDeleteError: %s", err, exc_info=True)
+        abort(400, f"Failed to abort the Upload with ID: {upload_id}!")
+    except Exception as err:
+        LOGGER.error("[abort_file_upload] Exception: %s. Type: %s", err, type(err), exc_info=True)
+        abort(500, f"An internal server error occured while aborting the Upload with ID: {upload_id}!")
+
+
 @media_file_blueprint.route('/', methods=['PUT'])
 @insert_request_user
 @verify_api_access(required_api_level=ApiLevel.LOCKED)
@@ -282,6 +482,9 @@ def download_file(filename: str, request_user: CmdbUser):
     This method download a file to the specified section of the document.
     Any existing value that matches the file name and metadata will be considered.
 
+    The file is streamed chunk by chunk from GridFS. Conditional requests ('If-None-Match') and single
+    byte ranges ('Range', 'If-Range') are supported.
+
     Raises:
         MediaFileManagerGetError: If the file could not be found.
 
@@ -296,16 +499,48 @@ def download_file(filename: str, request_user: CmdbUser):
 
         filter_metadata = generate_metadata_filter('metadata', request)
         filter_metadata.update({'filename': filename})
-        result = media_files_manager.get_file(metadata=filter_metadata, blob=True)
+        grid_out = media_files_manager.open_file(filter_metadata)
+
+        if not grid_out:
+            abort(404, f"The File: {filename} was not found!")
 
-        return Response(
-            result,
+        etag = generate_file_etag(grid_out)
+        headers = {
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Accept-Ranges": "bytes",
+        }
+
+        if request.if_none_match.contains_weak(etag):
+            grid_out.close()
+            response = Response(status=304, headers=headers)
+            response.set_etag(etag)
+
+            return response
+
+        length = grid_out.length
+        byte_range = get_requested_byte_range(request, etag, length)
+        start, end = byte_range or (0, length)
+
+        response = Response(
+            media_files_manager.stream_file(grid_out, start, end),
+            status=206 if byte_range else 200,
             mimetype="application/octet-stream",
-            headers={
-                "Content-Disposition":
-                    f"attachment; filename={filename}"
-            }
+            headers=headers,
+            direct_passthrough=True,
         )
+        response.content_length = end - start
+        response.last_modified = grid_out.upload_date
+        response.set_etag(etag)
+
+        if byte_range:
+            response.headers["Content-Range"] = f"bytes {start}-{end - 1}/{length}"
+
+        return response
+    except HTTPException as http_err:
+        raise http_err
+    except MediaFileManagerGetError as err:
+        LOGGER.error("[download_file] MediaFileManagerGetError: %s", err, exc_info=True)
+        abort(400, f"Failed to retrieve the File: {filename} from the database!")
     except Exception as err:
         LOGGER.error("[download_file] Exception: %s. Type: %s", err, type(err), exc_info=True)
         abort(500, f"An internal server error occured while downloading the file: {filename}!")
@@ -0,0 +1,60 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the Prometheus metrics route
+"""
+import logging
+from flask import Response
+from werkzeug.exceptions import HTTPException, abort
+
+from cmdb.framework.metrics.metrics_collector import MetricsCollector
+
+from cmdb.interface.route_utils import insert_request_user, right_required, verify_api_access
+from cmdb.interface.rest_api.api_level_enum import ApiLevel
+from cmdb.interface.blueprints import RootBlueprint
+from cmdb.models.user_model import CmdbUser
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+metrics_blueprint = RootBlueprint('metrics_rest', __name__, url_prefix='/metrics')
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+@metrics_blueprint.route('', methods=['GET'])
+@insert_request_user
+@verify_api_access(required_api_level=ApiLevel.LOCKED)
+@right_required('base.system.view')
+def get_metrics(request_user: CmdbUser):
+    """
+    Retrieves the request and MongoDB command metrics of all workers in the Prometheus text format
+
+    The route is only registered if the [Metrics] section of the config file is active. Prometheus authenticates
+    with the basic auth credentials of a user with the right 'base.system.view'
+
+    Args:
+        request_user (CmdbUser): User requesting the metrics
+
+    Returns:
+        Response: The metrics in the Prometheus text format
+    """
+    try:
+        return Response(MetricsCollector.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+    except HTTPException as http_err:
+        raise http_err
+    except Exception as err:
+        LOGGER.error("[get_metrics] Exception: %s. Type: %s", err, type(err), exc_info=True)
+        abort(500, "An internal server error occured while rendering the metrics!")
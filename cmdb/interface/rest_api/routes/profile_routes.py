@@ -0,0 +1,66 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the route which retrieves request profiles
+"""
+import logging
+from werkzeug.exceptions import HTTPException, abort
+
+from cmdb.framework.metrics.request_profiler import RequestProfiler
+
+from cmdb.interface.route_utils import insert_request_user, right_required, verify_api_access
+from cmdb.interface.rest_api.api_level_enum import ApiLevel
+from cmdb.interface.rest_api.responses import DefaultResponse
+from cmdb.interface.blueprints import RootBlueprint
+from cmdb.models.user_model import CmdbUser
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+profile_blueprint = RootBlueprint('profile_rest', __name__, url_prefix='/profiles')
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+@profile_blueprint.route('/<string:profile_id>', methods=['GET'])
+@insert_request_user
+@verify_api_access(required_api_level=ApiLevel.LOCKED)
+@right_required('base.system.view')
+def get_request_profile(profile_id: str, request_user: CmdbUser):
+    """
+    Retrieves the profile of a request which was sent with the profile token
+
+    The route is only registered if the [Profiling] section of the config file is active. The profile id is
+    returned in the 'X-Profile-Id' header of the profiled response
+
+    Args:
+        profile_id (str): The id of the profile
+        request_user (CmdbUser): User requesting the profile
+
+    Returns:
+        DefaultResponse: The slowest functions, the largest allocations and the MongoDB round-trips of the request
+    """
+    try:
+        profile = RequestProfiler.get_profile(profile_id)
+
+        if not profile:
+            abort(404, f"The profile with the ID: {profile_id} was not found!")
+
+        return DefaultResponse(profile).make_response()
+    except HTTPException as http_err:
+        raise http_err
+    except Exception as err:
+        LOGGER.error("[get_request_profile] Exception: %s. Type: %s", err, type(err), exc_info=True)
+        abort(500, f"An internal server error occured while retrieving the profile with the ID: {profile_id}!")
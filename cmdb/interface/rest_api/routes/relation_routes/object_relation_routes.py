@@ -17,6 +17,7 @@
 Implementation of all API routes for CmdbObjectRelations
 """
 import logging
+from typing import Optional
 from datetime import datetime, timezone
 from flask import request, abort
 from werkzeug.exceptions import HTTPException
@@ -28,6 +29,7 @@
 from cmdb.models.user_model import CmdbUser
 from cmdb.models.object_relation_model import CmdbObjectRelation
 from cmdb.models.log_model import LogInteraction
+from cmdb.models.ci_explorer_model import NodeType
 
 from cmdb.framework.results import IterationResult
 
@@ -36,6 +38,7 @@
 from cmdb.interface.rest_api.api_level_enum import ApiLevel
 from cmdb.interface.rest_api.responses.response_parameters import CollectionParameters
 from cmdb.interface.rest_api.responses import (
+    DefaultResponse,
     InsertSingleResponse,
     GetMultiResponse,
     GetSingleResponse,
@@ -226,6 +229,116 @@ def get_cmdb_object_relation(public_id: int, request_user: CmdbUser):
         LOGGER.error("[get_cmdb_object_relation] Exception: %s. Type: %s", err, type(err), exc_info=True)
         abort(500, "Internal server error!")
 
+
+@object_relations_blueprint.route('/impact/<int:public_id>', methods=['GET'])
+@insert_request_user
+@verify_api_access(required_api_level=ApiLevel.ADMIN)
+@object_relations_blueprint.protect(auth=True, right='base.framework.objectRelation.view')
+def get_object_relation_impact(public_id: int, request_user: CmdbUser):
+    """
+    HTTP `GET` route to retrieve all CmdbObjects which are reachable from a CmdbObject over CmdbObjectRelations
+
+    Expects the following data via request args:
+            "direction" (str): # CHILD, PARENT or BOTH. Defaults to CHILD
+            "depth" (int): # Maximum number of hops, 0 for no limit. Defaults to 0
+            "relation_ids" (int): # Only follow CmdbObjectRelations of these CmdbRelations, can be repeated
+
+    Args:
+        public_id (int): public_id of the CmdbObject
+        request_user (CmdbUser): User requesting this data
+
+    Returns:
+        DefaultResponse: The reachable CmdbObjects with their distance and the fan-in/fan-out of the CmdbObject
+    """
+    try:
+        towards_children = parse_impact_direction()
+        depth = request.args.get('depth', default=0, type=int)
+        relation_ids = set(request.args.getlist('relation_ids', type=int))
+
+        if depth < 0:
+            abort(400, f"Invalid depth '{depth}'. Must be 0 or greater!")
+
+        object_relations_manager: ObjectRelationsManager = ManagerProvider.get_manager(
+                                                                               ManagerType.OBJECT_RELATIONS,
+                                                                               request_user
+                                                                           )
+
+        relation_graph = object_relations_manager.get_relation_graph()
+        distances = relation_graph.reachable(public_id, towards_children, depth, relation_ids)
+
+        reachable_objects = [{'object_id': object_id, 'distance': distance} for object_id, distance
+                             in sorted(distances.items(), key=lambda item: (item[1], item[0]))]
+
+        return DefaultResponse({
+            'object_id': public_id,
+            'fan_in': relation_graph.fan_in(public_id),
+            'fan_out': relation_graph.fan_out(public_id),
+            'total': len(reachable_objects),
+            'reachable': reachable_objects,
+        }).make_response()
+    except HTTPException as http_err:
+        raise http_err
+    except ObjectRelationsManagerGetError as err:
+        LOGGER.error("[get_object_relation_impact] %s", err, exc_info=True)
+        abort(500, "Failed to load the ObjectRelations from the database!")
+    except Exception as err:
+        LOGGER.error("[get_object_relation_impact] Exception: %s. Type: %s", err, type(err), exc_info=True)
+        abort(500, "Internal server error!")
+
+
+@object_relations_blueprint.route('/impact/<int:public_id>/path/<int:target_id>', methods=['GET'])
+@insert_request_user
+@verify_api_access(required_api_level=ApiLevel.ADMIN)
+@object_relations_blueprint.protect(auth=True, right='base.framework.objectRelation.view')
+def get_object_relation_path(public_id: int, target_id: int, request_user: CmdbUser):
+    """
+    HTTP `GET` route to retrieve the shortest path of CmdbObjectRelations between two CmdbObjects
+
+    Expects the following data via request args:
+            "direction" (str): # CHILD, PARENT or BOTH. Defaults to CHILD
+            "relation_ids" (int): # Only follow CmdbObjectRelations of these CmdbRelations, can be repeated
+
+    Args:
+        public_id (int): public_id of the CmdbObject where the path starts
+        target_id (int): public_id of the CmdbObject where the path ends
+        request_user (CmdbUser): User requesting this data
+
+    Returns:
+        DefaultResponse: public_ids of the CmdbObjects and CmdbObjectRelations on the path
+    """
+    try:
+        towards_children = parse_impact_direction()
+        relation_ids = set(request.args.getlist('relation_ids', type=int))
+
+        object_relations_manager: ObjectRelationsManager = ManagerProvider.get_manager(
+                                                                               ManagerType.OBJECT_RELATIONS,
+                                                                               request_user
+                                                                           )
+
+        path = object_relations_manager.get_relation_graph().shortest_path(public_id,
+                                                                           target_id,
+                                                                           towards_children,
+                                                                           relation_ids)
+
+        if not path:
+            abort(404, f"No path from the Object with ID:{public_id} to the Object with ID:{target_id}!")
+
+        object_ids, object_relation_ids = path
+
+        return DefaultResponse({
+            'object_ids': object_ids,
+            'object_relation_ids': object_relation_ids,
+            'length': len(object_relation_ids),
+        }).make_response()
+    except HTTPException as http_err:
+        raise http_err
+    except ObjectRelationsManagerGetError as err:
+        LOGGER.error("[get_object_relation_path] %s", err, exc_info=True)
+        abort(500, "Failed to load the ObjectRelations from the database!")
+    except Exception as err:
+        LOGGER.error("[get_object_relation_path] Exception: %s. Type: %s", err, type(err), exc_info=True)
+        abort(500, "Internal server error!")
+
 # --------------------------------------------------- CRUD - UPDATE -------------------------------------------------- #
 
 @object_relations_blueprint.route('/<int:public_id>', methods=['PUT', 'PATCH'])
@@ -378,3 +491,22 @@ def delete_cmdb_object_relation(public_id: int, request_user: CmdbUser):
     except Exception as err:
         LOGGER.error("[delete_cmdb_object_relation] Exception: %s. Type: %s", err, type(err), exc_info=True)
         abort(500, "Internal server error!")
+
+# -------------------------------------------------- HELPER METHODS -------------------------------------------------- #
+
+def parse_impact_direction() -> Optional[bool]:
+    """
+    Converts the 'direction' request arg to the direction flag of the ObjectRelationGraph
+
+    Returns:
+        Optional[bool]: True for CHILD, False for PARENT and None for BOTH
+    """
+    direction = request.args.get('direction', default=NodeType.CHILD.value).upper()
+
+    if not NodeType.is_valid(direction):
+        abort(400, f"Invalid direction '{direction}'. Need one of: {', '.join(NodeType.__members__.keys())}")
+
+    if direction == NodeType.BOTH:
+        return None
+
+    return direction == NodeType.CHILD
@@ -25,6 +25,7 @@
 from werkzeug.exceptions import HTTPException
 
 from cmdb.database import MongoDBQueryBuilder
+from cmdb.database.query_budget import QueryBudget
 from cmdb.manager.query_builder import BuilderParameters
 from cmdb.manager.manager_provider_model import ManagerProvider, ManagerType
 from cmdb.manager import (
@@ -203,6 +204,7 @@ def count_cmdb_reports_of_type(public_id: int, request_user: CmdbUser):
 @reports_blueprint.route('/run/<int:public_id>', methods=['GET'])
 @insert_request_user
 @verify_api_access(required_api_level=ApiLevel.ADMIN)
+@QueryBudget.scope(QueryBudget.REPORT)
 def run_cmdb_report_query(public_id: int, request_user: CmdbUser):
     """
     Returns the result of the query of the CmdbReport
@@ -0,0 +1,79 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the route which lists the recorded slow aggregations
+"""
+import logging
+from flask import current_app, request
+from werkzeug.exceptions import HTTPException, abort
+
+from cmdb.database import MongoDatabaseManager
+from cmdb.database.database_constants import SLOW_QUERY_COLLECTION
+
+from cmdb.interface.route_utils import insert_request_user, right_required, verify_api_access
+from cmdb.interface.rest_api.api_level_enum import ApiLevel
+from cmdb.interface.rest_api.responses import DefaultResponse
+from cmdb.interface.blueprints import RootBlueprint
+from cmdb.models.user_model import CmdbUser
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+slow_query_blueprint = RootBlueprint('slow_query_rest', __name__, url_prefix='/slow_queries')
+
+with current_app.app_context():
+    dbm: MongoDatabaseManager = current_app.database_manager
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+@slow_query_blueprint.route('', methods=['GET'])
+@insert_request_user
+@verify_api_access(required_api_level=ApiLevel.LOCKED)
+@right_required('base.system.view')
+def get_slow_queries(request_user: CmdbUser):
+    """
+    Retrieves the most recent slow aggregations with the summaries of their explain plans
+
+    The route is only registered if the [SlowQueries] section of the config file is active. The indexes of a
+    collection can be compared with '/debug/indexes/<collection>' in DEBUG mode
+
+    Args:
+        request_user (CmdbUser): User requesting the slow aggregations
+
+    Returns:
+        DefaultResponse: The slow aggregations, newest first
+    """
+    try:
+        limit = request.args.get('limit', 50, int)
+        collection = request.args.get('collection', None, str)
+
+        if limit < 1:
+            abort(400, "The limit must be a positive number!")
+
+        slow_queries = dbm.find_all(
+            SLOW_QUERY_COLLECTION,
+            request_user.database,
+            {'collection': collection} if collection else {},
+            sort=[('$natural', -1)],
+            limit=limit
+        )
+
+        return DefaultResponse(slow_queries).make_response()
+    except HTTPException as http_err:
+        raise http_err
+    except Exception as err:
+        LOGGER.error("[get_slow_queries] Exception: %s. Type: %s", err, type(err), exc_info=True)
+        abort(500, "An internal server error occured while retrieving the slow queries!")
@@ -30,7 +30,7 @@
 from cmdb.framework.results import IterationResult
 from cmdb.models.group_model import CmdbUserGroup, GroupDeleteMode
 from cmdb.models.user_model import CmdbUser
-from cmdb.models.right_model.all_rights import flat_rights_tree, ALL_RIGHTS
+from cmdb.models.right_model.all_rights import FLAT_RIGHTS
 from cmdb.interface.blueprints import APIBlueprint
 from cmdb.interface.rest_api.responses.response_parameters import (
     GroupDeletionParameters,
@@ -206,7 +206,7 @@ def update_cmdb_user_group(public_id: int, data: dict, request_user: CmdbUser):
         to_update_group = groups_manager.get_group(public_id)
 
         if to_update_group:
-            group = CmdbUserGroup.from_data(data=data, rights=flat_rights_tree(ALL_RIGHTS))
+            group = CmdbUserGroup.from_data(data=data, rights=FLAT_RIGHTS)
             group_dict = CmdbUserGroup.to_json(group)
             group_dict['rights'] = [right.get('name') for right in group_dict.get('rights', [])]
 
@@ -69,10 +69,19 @@ def create_webhook(params: dict, request_user: CmdbUser):
         params['public_id'] = webhooks_manager.get_next_public_id()
         params['event_types'] = literal_eval(params['event_types'])
         params['active'] = params['active'] in ["True", "true"]
+        params['batch_size'] = int(params.get('batch_size', 1))
+        params['batch_window'] = int(params.get('batch_window', 0))
+
+        if params['batch_size'] < 1 or params['batch_window'] < 0:
+            abort(400, "The batch size must be at least 1 and the batch window must not be negative!")
 
         new_webhook_id = webhooks_manager.insert_webhook(params)
 
         return DefaultResponse(new_webhook_id).make_response()
+    except HTTPException as http_err:
+        raise http_err
+    except ValueError:
+        abort(400, "The batch size and the batch window must be integers!")
     except BaseManagerInsertError as err:
         #TODO: ERROR-FIX
         LOGGER.debug("[create_webhook] %s", err, exc_info=True)
@@ -169,6 +178,11 @@ def update_webhook(params: dict, request_user: CmdbUser):
 
         params['event_types'] = literal_eval(params['event_types'])
         params['active'] = params['active'] in ["True", "true"]
+        params['batch_size'] = int(params.get('batch_size', 1))
+        params['batch_window'] = int(params.get('batch_window', 0))
+
+        if params['batch_size'] < 1 or params['batch_window'] < 0:
+            abort(400, "The batch size must be at least 1 and the batch window must not be negative!")
 
         current_webhook = webhooks_manager.get_webhook(params['public_id'])
 
@@ -182,6 +196,8 @@ def update_webhook(params: dict, request_user: CmdbUser):
         return UpdateSingleResponse(current_webhook.__dict__).make_response()
     except HTTPException as http_err:
         raise http_err
+    except ValueError:
+        abort(400, "The batch size and the batch window must be integers!")
     except BaseManagerGetError as err:
         LOGGER.debug("[update_webhook] %s", err, exc_info=True)
         abort(400, f"Could not retrieve CmdbWebhook with ID: {params['public_id']}!")
@@ -20,6 +20,7 @@
 from cmdb.manager.docapi_templates_manager import DocapiTemplatesManager
 from cmdb.manager.groups_manager import GroupsManager
 from cmdb.manager.locations_manager import LocationsManager
+from cmdb.manager.log_archive_manager import LogArchiveManager
 from cmdb.manager.logs_manager import LogsManager
 from cmdb.manager.media_files_manager import MediaFilesManager
 from cmdb.manager.object_links_manager import ObjectLinksManager
@@ -35,6 +36,7 @@
 from cmdb.manager.types_manager import TypesManager
 from cmdb.manager.users_manager import UsersManager
 from cmdb.manager.webhooks_event_manager import WebhooksEventManager
+from cmdb.manager.webhook_deliveries_manager import WebhookDeliveriesManager
 from cmdb.manager.webhooks_manager import WebhooksManager
 from cmdb.manager.extendable_options_manager import ExtendableOptionsManager
 from cmdb.manager.object_groups_manager import ObjectGroupsManager
@@ -67,6 +69,7 @@
     'DocapiTemplatesManager',
     'GroupsManager',
     'LocationsManager',
+    'LogArchiveManager',
     'LogsManager',
     'MediaFilesManager',
     'ObjectLinksManager',
@@ -83,6 +86,7 @@
     'TypesManager',
     'UsersManager',
     'WebhooksEventManager',
+    'WebhookDeliveriesManager',
     'WebhooksManager',
     'RiskClassManager',
     'LikelihoodManager',
@@ -526,6 +526,21 @@ def update_many_pull(self, criteria: dict, update: dict) -> UpdateResult:
         except DocumentUpdateError as err:
             raise BaseManagerUpdateError(err) from err
 
+
+    def increase_generation(self, collection: str = None) -> None:
+        """
+        Marks the documents of a collection as changed so that in-memory caches of all processes which were
+        built from them are rebuilt on their next use. A failed increment is only logged because the write
+        itself already succeeded
+
+        Args:
+            collection (str, optional): Name of the changed collection. Defaults to the collection of the manager
+        """
+        try:
+            self.dbm.increase_collection_generation(collection if collection else self.collection, self.db_name)
+        except DocumentUpdateError as err:
+            LOGGER.error("[increase_generation] %s", err)
+
 # --------------------------------------------------- CRUD - DELETE -------------------------------------------------- #
 
     def delete(self, criteria: dict, collection: str = None) -> bool:
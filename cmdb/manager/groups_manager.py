@@ -23,7 +23,7 @@
 from cmdb.manager.query_builder import BuilderParameters
 from cmdb.manager.base_manager import BaseManager
 
-from cmdb.models.right_model.all_rights import flat_rights_tree, ALL_RIGHTS
+from cmdb.models.right_model.all_rights import FLAT_RIGHTS
 from cmdb.models.group_model import CmdbUserGroup
 from cmdb.framework.results import IterationResult
 
@@ -71,7 +71,7 @@ def __init__(self, dbm: MongoDatabaseManager = None, database :str = None):
             GroupsManagerInitError: If the GroupsManager could not be initialised
         """
         try:
-            self.rights = flat_rights_tree(ALL_RIGHTS)
+            self.rights = FLAT_RIGHTS
 
             super().__init__(CmdbUserGroup.COLLECTION, dbm, database)
         except Exception as err:
@@ -119,6 +119,7 @@ def delete_with_follow_up(self, impact_category_id: int) -> bool:
         # Apply the updates to RiskAssessments
         if updates:
             self.dbm.bulk_write(IsmsRiskAssessment.COLLECTION, self.db_name, updates)
+            self.increase_generation(IsmsRiskAssessment.COLLECTION)
 
         # Delete the ImpactCategory itself through the Manager
         return self.delete_item(impact_category_id)
@@ -143,6 +143,7 @@ def update_with_follow_up(self, public_id: int, new_data: dict) -> None:
         # Bulk execute all updates
         if updates:
             self.dbm.bulk_write(IsmsRiskAssessment.COLLECTION, self.db_name, updates)
+            self.increase_generation(IsmsRiskAssessment.COLLECTION)
 
 # -------------------------------------------------- HELPER METHODS -------------------------------------------------- #
 
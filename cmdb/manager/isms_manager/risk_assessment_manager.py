@@ -17,11 +17,13 @@
 This module contains the implementation of the RiskAssessmentManager
 """
 import logging
+from typing import Union
 
 from cmdb.database import MongoDatabaseManager
 
 from cmdb.manager.generic_manager import GenericManager
 
+from cmdb.models.cmdb_dao import CmdbDAO
 from cmdb.models.isms_model import IsmsRiskAssessment, IsmsControlMeasureAssignment
 
 from cmdb.errors.manager.risk_assessment_manager import RISK_ASSESMENT_MANAGER_ERRORS
@@ -42,8 +44,54 @@ class RiskAssessmentManager(GenericManager):
     def __init__(self, dbm: MongoDatabaseManager, database: str = None):
         super().__init__(dbm, IsmsRiskAssessment, RISK_ASSESMENT_MANAGER_ERRORS, database)
 
+# --------------------------------------------------- CRUD - CREATE -------------------------------------------------- #
+
+    def insert_item(self, document: Union[dict, CmdbDAO]) -> int:
+        """
+        Inserts an IsmsRiskAssessment and marks the cached risk matrix reports as outdated
+
+        Args:
+            document (Union[dict, CmdbDAO]): The IsmsRiskAssessment to insert
+
+        Returns:
+            int: The public_id of the created IsmsRiskAssessment
+        """
+        public_id = super().insert_item(document)
+        self.increase_generation()
+
+        return public_id
+
+# --------------------------------------------------- CRUD - UPDATE -------------------------------------------------- #
+
+    def update_item(self, public_id: int, data: Union[CmdbDAO, dict]) -> None:
+        """
+        Updates an IsmsRiskAssessment and marks the cached risk matrix reports as outdated
+
+        Args:
+            public_id (int): The public_id of the IsmsRiskAssessment to update
+            data (Union[CmdbDAO, dict]): The updated IsmsRiskAssessment
+        """
+        super().update_item(public_id, data)
+        self.increase_generation()
+
 # --------------------------------------------------- CRUD - DELETE -------------------------------------------------- #
 
+    def delete_item(self, public_id: int) -> bool:
+        """
+        Deletes an IsmsRiskAssessment and marks the cached risk matrix reports as outdated
+
+        Args:
+            public_id (int): The public_id of the IsmsRiskAssessment to delete
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        deleted = super().delete_item(public_id)
+        self.increase_generation()
+
+        return deleted
+
+
     def delete_with_followup(self, public_id: int) -> bool:
         """
         Deletes an IsmsRiskAssessment from the database with followup logics
@@ -71,6 +71,7 @@ def delete_with_follow_up(self, public_id: int) -> bool:
 
         # Delete all RiskAssessments referencing this Risk
         self.dbm.get_collection(IsmsRiskAssessment.COLLECTION, self.db_name).delete_many({'risk_id': public_id})
+        self.increase_generation(IsmsRiskAssessment.COLLECTION)
 
         # Delete the Risk itself
         return self.delete_item(public_id)
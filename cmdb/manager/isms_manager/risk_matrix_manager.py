@@ -17,11 +17,13 @@
 This module contains the implementation of the RiskMatrixManager
 """
 import logging
+from typing import Union
 
 from cmdb.database import MongoDatabaseManager
 
 from cmdb.manager.generic_manager import GenericManager
 
+from cmdb.models.cmdb_dao import CmdbDAO
 from cmdb.models.isms_model import IsmsRiskMatrix
 
 from cmdb.errors.manager.risk_matrix_manager import RISK_MATRIX_MANAGER_ERRORS
@@ -40,3 +42,16 @@ class RiskMatrixManager(GenericManager):
     """
     def __init__(self, dbm: MongoDatabaseManager, database: str = None):
         super().__init__(dbm, IsmsRiskMatrix, RISK_MATRIX_MANAGER_ERRORS, database)
+
+# --------------------------------------------------- CRUD - UPDATE -------------------------------------------------- #
+
+    def update_item(self, public_id: int, data: Union[CmdbDAO, dict]) -> None:
+        """
+        Updates the IsmsRiskMatrix and marks the cached risk matrix reports as outdated
+
+        Args:
+            public_id (int): The public_id of the IsmsRiskMatrix to update
+            data (Union[CmdbDAO, dict]): The updated IsmsRiskMatrix
+        """
+        super().update_item(public_id, data)
+        self.increase_generation()
@@ -41,7 +41,6 @@
     LocationsManagerUpdateError,
     LocationsManagerDeleteError,
     LocationsManagerIterationError,
-    LocationsManagerChildrenError,
 )
 # -------------------------------------------------------------------------------------------------------------------- #
 
@@ -91,8 +90,10 @@ def insert_location(self, location: Union[CmdbLocation, dict]) -> int:
             if isinstance(location, CmdbLocation):
                 location = CmdbLocation.to_json(location)
 
+            location['path'] = self.get_child_path(location['parent'])
+
             return self.insert(location)
-        except (BaseManagerInsertError, CmdbLocationToJsonError) as err:
+        except (BaseManagerInsertError, BaseManagerGetError, CmdbLocationToJsonError) as err:
             raise LocationsManagerInsertError(err) from err
         except Exception as err:
             LOGGER.error("[insert_location] Exception: %s. Type: %s", err, type(err))
@@ -190,6 +191,76 @@ def get_locations_by(self, **requirements: dict) -> list[CmdbLocation]:
             LOGGER.error("[get_locations_by] Exception: %s. Type: %s", err, type(err))
             raise LocationsManagerGetError(err) from err
 
+
+    def get_subtree(self, public_id: int) -> list[dict]:
+        """
+        Retrieves all descendants of a CmdbLocation with a single match on the indexed ancestor path
+
+        Args:
+            public_id (int): public_id of the CmdbLocation
+
+        Raises:
+            LocationsManagerGetError: If the descendants could not be retrieved
+
+        Returns:
+            list[dict]: All descendant CmdbLocations
+        """
+        try:
+            return list(self.find(criteria={'path': public_id}))
+        except BaseManagerGetError as err:
+            raise LocationsManagerGetError(err) from err
+
+
+    def get_tree_level(self, parent_id: int) -> list[dict]:
+        """
+        Retrieves the direct children of a CmdbLocation together with the number of their own children, so that
+        the location tree can be expanded one level at a time
+
+        Args:
+            parent_id (int): public_id of the parent CmdbLocation
+
+        Raises:
+            LocationsManagerGetError: If the children could not be retrieved
+
+        Returns:
+            list[dict]: The direct children sorted by name, each with the key 'children_count'
+        """
+        try:
+            children = list(self.find(criteria={'parent': parent_id}, sort=[('name', CmdbLocation.DAO_ASCENDING)]))
+
+            children_counts = {
+                count['_id']: count['count'] for count in self.aggregate([
+                    {'$match': {'parent': {'$in': [child['public_id'] for child in children]}}},
+                    {'$group': {'_id': '$parent', 'count': {'$sum': 1}}},
+                ])
+            }
+
+            for child in children:
+                child['children_count'] = children_counts.get(child['public_id'], 0)
+
+            return children
+        except Exception as err:
+            LOGGER.error("[get_tree_level] Exception: %s. Type: %s", err, type(err))
+            raise LocationsManagerGetError(err) from err
+
+
+    def get_child_path(self, parent_id: int) -> list[int]:
+        """
+        Builds the ancestor path of a CmdbLocation with the given parent
+
+        Args:
+            parent_id (int): public_id of the parent CmdbLocation
+
+        Raises:
+            BaseManagerGetError: If the parent could not be retrieved
+
+        Returns:
+            list[int]: public_ids of all ancestors, starting with the root location
+        """
+        parent = self.get_one(parent_id)
+
+        return [*(parent.get('path') or []), parent_id] if parent else [parent_id]
+
 # --------------------------------------------------- CRUD - UPDATE -------------------------------------------------- #
 
     def update_location(self, object_id:int, data: Union[CmdbLocation, dict], per_object: bool = True) -> None:
@@ -209,8 +280,14 @@ def update_location(self, object_id:int, data: Union[CmdbLocation, dict], per_ob
 
             update_key = 'object_id' if per_object else 'public_id'
 
+            if data.get('parent') is not None:
+                location = self.get_one_by({update_key: object_id})
+
+                if location and location['parent'] != data['parent']:
+                    self.__move_subtree(location, data)
+
             self.update({update_key: object_id}, data)
-        except (BaseManagerUpdateError, CmdbLocationToJsonError) as err:
+        except (BaseManagerUpdateError, BaseManagerGetError, CmdbLocationToJsonError) as err:
             raise LocationsManagerUpdateError(err) from err
         except Exception as err:
             LOGGER.error("[update_location] Exception: %s. Type: %s", err, type(err))
@@ -236,56 +313,56 @@ def delete_location(self, public_id: int) -> bool:
         except BaseManagerDeleteError as err:
             raise LocationsManagerDeleteError(err) from err
 
-# ------------------------------------------------- HELPER FUNCTIONS ------------------------------------------------- #
 
-    def get_all_children(self, public_id: int, all_locations: dict, visited: set = None) -> list[dict]:
+    def delete_locations(self, public_ids: list[int]) -> int:
         """
-        Retrieves all children for a given CmdbLocation with the public_id
+        Deletes multiple CmdbLocations with a single delete operation
 
         Args:
-            public_id (int): public_id of the parent CmdbLocation
-            all_locations (dict): all CmdbLocations
-            visited (set): Set of already visited public_ids
+            public_ids (list[int]): public_ids of the CmdbLocations which should be deleted
+
+        Raises:
+            LocationsManagerDeleteError: When the delete operation fails
 
         Returns:
-            list[dict]: Returns all child CmdbLocations
+            int: Number of deleted CmdbLocations
         """
         try:
-            if visited is None:
-                visited = set()
-
-            # Initialize the list of children with direct children
-            children = [location for location in all_locations if location['parent'] == public_id]
-
-            # Add the current public_id to the visited set to avoid infinite recursion
-            visited.add(public_id)
-
-            # Now recursively find and add all children of each direct child, but skip already visited ones
-            for child in children[:]:  # Iterate over a copy of the list to avoid modifying it during iteration
-                if child['public_id'] not in visited:
-                    children.extend(self.get_all_children(child['public_id'], all_locations, visited))
-
-            return children
-        except Exception as err:
-            LOGGER.error("[get_all_children] Exception: %s. Type: %s", err, type(err))
-            raise LocationsManagerChildrenError(err) from err
-
-        # TODO: REFACTOR-FIX (Validate the new implementation then remove this)
-        # found_children: list[dict] = []
-        # recursive_children: list[dict] = []
+            return self.delete_many({'public_id': {'$in': public_ids}}).deleted_count
+        except BaseManagerDeleteError as err:
+            raise LocationsManagerDeleteError(err) from err
 
-        # # add direct children
-        # for location in all_locations:
-        #     if location['parent'] == public_id:
-        #         found_children.append(location)
+# ------------------------------------------------- HELPER FUNCTIONS ------------------------------------------------- #
 
-        # # search recursive for all children
-        # if len(found_children) > 0:
-        #     for child in found_children:
-        #         recursive_children = self.get_all_children(child['public_id'], all_locations)
+    def __move_subtree(self, location: dict, data: dict) -> None:
+        """
+        Sets the ancestor path for the new parent of a CmdbLocation and updates the paths of all its descendants
+        with a single update
 
-        #         # add recursive children to found_children
-        #         if len(recursive_children) > 0:
-        #             found_children += recursive_children
+        Args:
+            location (dict): The CmdbLocation before the update
+            data (dict): The new data of the CmdbLocation, 'path' is set by this call
 
-        # return found_children
+        Raises:
+            LocationsManagerUpdateError: If the new parent is the CmdbLocation itself or one of its descendants
+            BaseManagerGetError: If the new parent could not be retrieved
+            BaseManagerUpdateError: If the paths of the descendants could not be updated
+        """
+        public_id = location['public_id']
+        data['path'] = self.get_child_path(data['parent'])
+
+        if public_id in data['path']:
+            raise LocationsManagerUpdateError(
+                f"The Location with ID: {public_id} can not be moved below itself or one of its children!"
+            )
+
+        new_prefix = [*data['path'], public_id]
+
+        self.update_many(
+            {'path': public_id},
+            [{'$set': {'path': {'$concatArrays': [
+                new_prefix,
+                {'$slice': ['$path', {'$add': [{'$indexOfArray': ['$path', public_id]}, 1]}, {'$size': '$path'}]},
+            ]}}}],
+            plain=True
+        )
@@ -0,0 +1,248 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module contains the implementation of the LogArchiveManager
+"""
+import gzip
+import json
+import logging
+from typing import Any, Iterator, Optional
+from datetime import datetime, timezone
+
+from cmdb.database import DatabaseGridFS, MongoDatabaseManager
+from cmdb.database.database_utils import default, object_hook
+from cmdb.manager.base_manager import BaseManager
+
+from cmdb.errors.manager import (
+    BaseManagerInsertError,
+    BaseManagerGetError,
+)
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                               LogArchiveManager - CLASS                                              #
+# -------------------------------------------------------------------------------------------------------------------- #
+class LogArchiveManager(BaseManager):
+    """
+    The LogArchiveManager handles the archive of logs and webhook events which exceeded their retention period
+
+    Archived documents are stored in segments. A segment is a gzip compressed file in GridFS which contains one
+    JSON encoded document per line. The metadata of a segment holds the covered time range and the distinct keys
+    (e.g. the object_ids) of its documents, so that a request only needs to decompress the matching segments
+    Extends: BaseManager
+    """
+    COLLECTION = 'framework.logArchive'
+    COMPRESSION_LEVEL = 6
+    # Maximum number of documents returned by a single request
+    MAX_RESULTS = 1000
+
+
+    def __init__(self, dbm: MongoDatabaseManager, database: str = None):
+        """
+        Set the database connection and the GridFS bucket of the archive
+
+        Args:
+            dbm (MongoDatabaseManager): Database connection
+            database (str, optional): Specific database name to switch to
+        """
+        target_db = database if database else dbm.db_name
+        gridfs_database = dbm.connector.get_database(target_db)
+
+        self.fs = DatabaseGridFS(gridfs_database, self.COLLECTION)
+        self.fs_files = gridfs_database[f'{self.COLLECTION}.files']
+        super().__init__(self.COLLECTION, dbm, database)
+
+# --------------------------------------------------- CRUD - CREATE -------------------------------------------------- #
+
+    def write_segment(self, target: str, key_field: str, time_field: str, documents: list[dict]) -> Any:
+        """
+        Writes documents as a new compressed segment into the archive
+
+        Args:
+            target (str): Name of the RetentionTarget of the documents
+            key_field (str): Field whose distinct values are stored in the metadata of the segment
+            time_field (str): Field with the creation time of the documents
+            documents (list[dict]): The documents which should be archived
+
+        Raises:
+            BaseManagerInsertError: If the segment could not be written
+
+        Returns:
+            Any: The _id of the segment
+        """
+        try:
+            times = [document[time_field] for document in documents if document.get(time_field)]
+            keys = sorted({document[key_field] for document in documents if document.get(key_field) is not None})
+
+            lines = '\n'.join(json.dumps(document, default=default) for document in documents)
+            content = gzip.compress(lines.encode('utf-8'), compresslevel=self.COMPRESSION_LEVEL)
+
+            metadata = {
+                'target': target,
+                'start_time': min(times) if times else None,
+                'end_time': max(times) if times else None,
+                'count': len(documents),
+                'keys': keys,
+                'archive_time': datetime.now(timezone.utc),
+            }
+
+            return self.fs.put(content,
+                               filename=f'{target}_{len(documents)}.ndjson.gz',
+                               contentType='application/gzip',
+                               metadata=metadata)
+        except Exception as err:
+            LOGGER.error("[write_segment] Exception: %s. Type: %s", err, type(err))
+            raise BaseManagerInsertError(err) from err
+
+# ---------------------------------------------------- CRUD - READ --------------------------------------------------- #
+
+    def find_archived(self,
+                      target: str,
+                      criteria: dict,
+                      key: Any = None,
+                      time_field: str = None,
+                      start_time: Optional[datetime] = None,
+                      end_time: Optional[datetime] = None,
+                      sort: str = 'public_id',
+                      order: int = 1,
+                      skip: int = 0,
+                      limit: int = 0) -> tuple[list[dict], int]:
+        """
+        Retrieves archived documents which are equal to all values of the criteria. Either a key or a time range
+        is required, so that a request never decompresses the whole archive
+
+        Args:
+            target (str): Name of the RetentionTarget of the documents
+            criteria (dict): Field values which the documents must match
+            key (Any, optional): Value of the key_field of the target, limits the segments which are read
+            time_field (str, optional): Field with the creation time of the documents, required for a time range
+            start_time (Optional[datetime], optional): Only documents created at or after this time
+            end_time (Optional[datetime], optional): Only documents created at or before this time
+            sort (str, optional): Field by which the documents are sorted. Defaults to 'public_id'
+            order (int, optional): 1 for ascending, -1 for descending. Defaults to 1
+            skip (int, optional): Number of documents which are skipped. Defaults to 0
+            limit (int, optional): Maximum number of documents, 0 or more than MAX_RESULTS for MAX_RESULTS.
+                                   Defaults to 0
+
+        Raises:
+            BaseManagerGetError: If neither a key nor a time range is given or the archive could not be read
+
+        Returns:
+            tuple[list[dict], int]: The requested page of documents and the total number of matching documents
+        """
+        has_time_range = time_field is not None and (start_time is not None or end_time is not None)
+
+        if key is None and not has_time_range:
+            raise BaseManagerGetError("Archived documents can only be retrieved by key or time range!")
+
+        try:
+            matches = {}
+
+            for document in self.__iterate_documents(target, key, start_time, end_time):
+                if has_time_range and not self.__is_in_time_range(document.get(time_field), start_time, end_time):
+                    continue
+
+                if all(document.get(field) == value for field, value in criteria.items()):
+                    # A segment can be written twice if the service stopped before the live documents were deleted
+                    matches[document.get('public_id', id(document))] = document
+
+            results = sorted(matches.values(),
+                             key=lambda document: self.__sort_key(document.get(sort)),
+                             reverse=order == -1)
+            limit = min(limit, self.MAX_RESULTS) if limit else self.MAX_RESULTS
+
+            return results[skip:skip + limit], len(results)
+        except Exception as err:
+            LOGGER.error("[find_archived] Exception: %s. Type: %s", err, type(err))
+            raise BaseManagerGetError(err) from err
+
+# ------------------------------------------------------ HELPERS ----------------------------------------------------- #
+
+    def __iterate_documents(self,
+                            target: str,
+                            key: Any = None,
+                            start_time: Optional[datetime] = None,
+                            end_time: Optional[datetime] = None) -> Iterator[dict]:
+        """
+        Decompresses the segments of a target and yields their documents
+
+        Args:
+            target (str): Name of the RetentionTarget of the documents
+            key (Any, optional): Only segments containing this key are read
+            start_time (Optional[datetime], optional): Only segments with documents created at or after this time
+            end_time (Optional[datetime], optional): Only segments with documents created at or before this time
+
+        Yields:
+            Iterator[dict]: The archived documents
+        """
+        segment_filter = {'metadata.target': target}
+
+        if key is not None:
+            segment_filter['metadata.keys'] = key
+
+        if start_time is not None:
+            segment_filter['metadata.end_time'] = {'$gte': start_time}
+
+        if end_time is not None:
+            segment_filter['metadata.start_time'] = {'$lte': end_time}
+
+        for segment in self.fs_files.find(segment_filter, {'_id': 1}).sort('metadata.start_time', 1):
+            content = gzip.decompress(self.fs.get(segment['_id']).read())
+
+            for line in content.decode('utf-8').splitlines():
+                if line:
+                    yield json.loads(line, object_hook=object_hook)
+
+
+    @staticmethod
+    def __is_in_time_range(value: Any, start_time: Optional[datetime], end_time: Optional[datetime]) -> bool:
+        """
+        Checks if the creation time of a document lies in the requested time range
+
+        Args:
+            value (Any): The creation time of the document
+            start_time (Optional[datetime]): Earliest creation time, None for no lower bound
+            end_time (Optional[datetime]): Latest creation time, None for no upper bound
+
+        Returns:
+            bool: True if the document was created in the time range
+        """
+        if not isinstance(value, datetime):
+            return False
+
+        return (start_time is None or value >= start_time) and (end_time is None or value <= end_time)
+
+
+    @staticmethod
+    def __sort_key(value: Any) -> tuple:
+        """
+        Builds a sort key which orders missing values first and does not compare values of different types
+
+        Args:
+            value (Any): The value of the sort field
+
+        Returns:
+            tuple: The sort key
+        """
+        if value is None:
+            return (0, '', 0)
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return (1, '', value)
+
+        return (2, type(value).__name__, value if isinstance(value, (str, datetime)) else str(value))
@@ -16,22 +16,34 @@
 """
 This module contains the implementation of the LogsManager
 """
+import json
 import logging
+from typing import Any, Callable, Optional
 from datetime import datetime, timezone
+from pymongo import InsertOne
 
 from cmdb.database import MongoDatabaseManager
 from cmdb.manager.query_builder import BuilderParameters
 from cmdb.manager.base_manager import BaseManager
+from cmdb.manager.log_archive_manager import LogArchiveManager
 
 from cmdb.models.user_model import CmdbUser
 from cmdb.models.log_model.cmdb_meta_log import CmdbMetaLog
 from cmdb.models.log_model.log_action_enum import LogAction
 from cmdb.models.log_model.cmdb_log import CmdbLog
 from cmdb.models.log_model.cmdb_object_log import CmdbObjectLog
+from cmdb.models.log_model.render_state_codec import RenderStateCodec
 from cmdb.framework.results import IterationResult
+from cmdb.framework.log_writer.buffered_log_writer import BufferedLogWriter
+from cmdb.framework.retention.retention_target import OBJECT_LOGS
 from cmdb.security.acl.permission import AccessControlPermission
 
-from cmdb.errors.manager import BaseManagerIterationError, BaseManagerInsertError
+from cmdb.errors.manager import (
+    BaseManagerIterationError,
+    BaseManagerInsertError,
+    BaseManagerGetError,
+    BaseManagerUpdateError,
+)
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -57,37 +69,177 @@ def __init__(self, dbm: MongoDatabaseManager, database: str = None):
 
 # --------------------------------------------------- CRUD - CREATE -------------------------------------------------- #
 
-    def insert_log(self, action: LogAction, log_type: str, **kwargs) -> int:
+    def insert_log(self, action: LogAction, log_type: str, **kwargs) -> Optional[int]:
         """
         Creates a new log in the database
 
+        If the BufferedLogWriter is enabled, the log is only queued and written with the next batch. In strict mode
+        this call waits until the batch was written
+
+        Args:
+            action (LogAction): The action of the log
+            log_type (str): The log type
+
+        Raises:
+            BaseManagerInsertError: If the log could not be written
+
+        Returns:
+            Optional[int]: New public_id, None if the log was queued by the BufferedLogWriter
+        """
+        try:
+            log_document = self.build_log_document(action, log_type, **kwargs)
+
+            log_writer = BufferedLogWriter.get_instance(self.__get_log_flush(self.dbm))
+            written = log_writer.enqueue(self.db_name, log_document) if log_writer else None
+
+            if written is None:
+                return self.insert_logs([log_document])[0]
+
+            if log_writer.strict:
+                return written.result()
+        except BaseManagerInsertError as err:
+            raise BaseManagerInsertError(err) from err
+
+        return None
+
+
+    def build_log_document(self, action: LogAction, log_type: str, **kwargs) -> dict:
+        """
+        Builds the document of a new log without writing it, used to collect logs for 'insert_logs()'
+
         Args:
             action (LogAction): The action of the log
             log_type (str): The log type
 
         Returns:
-            int: New public_id
+            dict: The log document with a placeholder public_id
         """
         log_init = {}
 
-        # set static values
-        log_init['public_id'] = self.get_next_public_id()
+        # set static values, the public_id is assigned when the log is written
+        log_init['public_id'] = 0
         log_init['action'] = action.value
         log_init['action_name'] = action.name
         log_init['log_type'] = log_type
         log_init['log_time'] = datetime.now(timezone.utc)
+        log_init['object_deleted'] = action == LogAction.DELETE
         log_data = {**log_init, **kwargs}
 
+        return CmdbObjectLog.to_json(CmdbLog(**log_data))
+
+
+    def insert_logs(self, log_documents: list[dict]) -> list[int]:
+        """
+        Writes multiple logs with a single bulk insert. The public_ids are reserved as one range and the
+        render_states of object logs are encoded as delta to the previous log of the object
+
+        Args:
+            log_documents (list[dict]): The logs in the order of their creation
+
+        Raises:
+            BaseManagerInsertError: If the logs could not be written
+
+        Returns:
+            list[int]: The public_ids of the logs
+        """
+        if not log_documents:
+            return []
+
         try:
-            new_log = CmdbLog(**log_data)
-            ack = self.insert(CmdbObjectLog.to_json(new_log))
-        except BaseManagerInsertError as err:
+            first_public_id = self.dbm.reserve_public_ids(self.collection, self.db_name, len(log_documents))
+            # Latest (public_id, state, depth) of every object in this batch
+            latest_states: dict[int, tuple] = {}
+
+            for offset, log_document in enumerate(log_documents):
+                log_document['public_id'] = first_public_id + offset
+
+                if log_document['log_type'] == CmdbObjectLog.__name__ and log_document.get('render_state'):
+                    object_id = log_document['object_id']
+                    state = json.loads(log_document['render_state'])
+
+                    log_document.update(self.__encode_render_state(object_id, state, latest_states.get(object_id)))
+                    latest_states[object_id] = (log_document['public_id'], state, log_document['render_depth'])
+
+            self.dbm.bulk_write(self.collection, self.db_name, [InsertOne(log) for log in log_documents])
+        except Exception as err:
             raise BaseManagerInsertError(err) from err
 
-        return ack
+        deleted_object_ids = [log['object_id'] for log in log_documents
+                              if log['log_type'] == CmdbObjectLog.__name__ and log['action'] == LogAction.DELETE.value]
+
+        if deleted_object_ids:
+            # Runs in the thread of the BufferedLogWriter which can not wait for its own queue, the earlier logs of
+            # the objects were already written anyway
+            self.__flag_logs_of_objects(deleted_object_ids)
+
+        return [log_document['public_id'] for log_document in log_documents]
 
 # ---------------------------------------------------- CRUD - READ --------------------------------------------------- #
 
+    def get_log(self, public_id: int) -> Optional[dict]:
+        """
+        Retrieves a single log with its full render_state
+
+        Args:
+            public_id (int): public_id of the log
+
+        Raises:
+            BaseManagerGetError: If the log or its render_state could not be retrieved
+
+        Returns:
+            Optional[dict]: The log if it exists, else None
+        """
+        requested_log = self.get_one(public_id)
+
+        if requested_log:
+            self.decode_render_states([requested_log])
+
+        return requested_log
+
+
+    def get_render_state_at_version(self, object_id: int, version: str) -> Optional[dict]:
+        """
+        Reconstructs the render_state of an object at the given version
+
+        Args:
+            object_id (int): public_id of the object
+            version (str): The version of the object
+
+        Raises:
+            BaseManagerGetError: If the logs of the object could not be retrieved
+
+        Returns:
+            Optional[dict]: The render_state at the given version, None if no log exists for this version
+        """
+        version_log = next(iter(self.find(
+            criteria={
+                'log_type': CmdbObjectLog.__name__,
+                'object_id': object_id,
+                'version': version,
+                'render_state': {'$ne': None},
+            },
+            sort=[('public_id', CmdbObjectLog.DAO_DESCENDING)],
+            limit=1,
+        )), None)
+
+        if not version_log:
+            return None
+
+        # The delta chain of a log consists of the previous logs of its object
+        known_logs = {log['public_id']: log for log in self.find(
+            criteria={
+                'log_type': CmdbObjectLog.__name__,
+                'object_id': object_id,
+                'public_id': {'$lte': version_log['public_id']},
+                'render_state': {'$ne': None},
+            },
+            sort=[('public_id', CmdbObjectLog.DAO_DESCENDING)],
+            limit=RenderStateCodec.SNAPSHOT_INTERVAL,
+        )}
+
+        return self.reconstruct_render_state(version_log, known_logs=known_logs)
+
+
     def iterate(self,
                 builder_params: BuilderParameters,
                 user: CmdbUser = None,
@@ -106,6 +258,7 @@ def iterate(self,
         """
         try:
             aggregation_result, total = self.iterate_query(builder_params, user, permission)
+            self.decode_render_states(aggregation_result)
 
             iteration_result: IterationResult[CmdbMetaLog] = IterationResult(aggregation_result, total)
             iteration_result.convert_to(CmdbObjectLog)
@@ -113,3 +266,325 @@ def iterate(self,
             return iteration_result
         except Exception as err:
             raise BaseManagerIterationError(err) from err
+
+
+    def iterate_archived(self,
+                         builder_params: BuilderParameters,
+                         start_time: Optional[datetime] = None,
+                         end_time: Optional[datetime] = None) -> IterationResult[CmdbMetaLog]:
+        """
+        Retrieves object logs from the archive which are equal to all values of the criteria. The criteria must
+        contain an 'object_id' or a time range must be given
+
+        Args:
+            builder_params (BuilderParameters): Contains the criteria and the paging of the request
+            start_time (Optional[datetime], optional): Only logs created at or after this time
+            end_time (Optional[datetime], optional): Only logs created at or before this time
+
+        Raises:
+            BaseManagerIterationError: If neither an object_id nor a time range is given or the archive could not
+                                       be read
+
+        Returns:
+            IterationResult[CmdbMetaLog]: Archived logs which match the criteria
+        """
+        try:
+            archive_manager = LogArchiveManager(self.dbm, self.db_name)
+            criteria = builder_params.criteria
+
+            archived_logs, total = archive_manager.find_archived(OBJECT_LOGS.name,
+                                                                 criteria,
+                                                                 key=criteria.get(OBJECT_LOGS.key_field),
+                                                                 time_field=OBJECT_LOGS.time_field,
+                                                                 start_time=start_time,
+                                                                 end_time=end_time,
+                                                                 sort=builder_params.get_sort(),
+                                                                 order=builder_params.get_order(),
+                                                                 skip=builder_params.skip,
+                                                                 limit=builder_params.limit)
+
+            iteration_result: IterationResult[CmdbMetaLog] = IterationResult(archived_logs, total)
+            iteration_result.convert_to(CmdbObjectLog)
+
+            return iteration_result
+        except Exception as err:
+            raise BaseManagerIterationError(err) from err
+
+# --------------------------------------------------- CRUD - UPDATE -------------------------------------------------- #
+
+    def mark_objects_deleted(self, object_ids: list[int]) -> None:
+        """
+        Flags all logs of the given objects as logs of deleted objects. Logs which are still queued by the
+        BufferedLogWriter are written first, otherwise they would be written without the flag afterwards
+
+        Args:
+            object_ids (list[int]): public_ids of the deleted objects
+
+        Raises:
+            BaseManagerUpdateError: If the logs could not be flagged
+        """
+        log_writer = BufferedLogWriter.get_instance(self.__get_log_flush(self.dbm))
+
+        if log_writer and not log_writer.flush():
+            LOGGER.warning("[mark_objects_deleted] Queued logs of Object-IDs: %s might not be flagged", object_ids)
+
+        self.__flag_logs_of_objects(object_ids)
+
+# --------------------------------------------------- CRUD - DELETE -------------------------------------------------- #
+
+    def delete_log(self, public_id: int) -> bool:
+        """
+        Deletes a log. Logs which store their render_state as delta to this log are converted to snapshots first
+
+        Args:
+            public_id (int): public_id of the log
+
+        Raises:
+            BaseManagerUpdateError: If a dependent log could not be converted
+            BaseManagerDeleteError: If the log could not be deleted
+
+        Returns:
+            bool: True if the log was deleted
+        """
+        self.rebase_dependent_logs([public_id])
+
+        return self.delete({'public_id': public_id})
+
+
+    def delete_logs(self, public_ids: list[int]) -> int:
+        """
+        Deletes multiple logs. Remaining logs which store their render_state as delta to one of these logs are
+        converted to snapshots first
+
+        Args:
+            public_ids (list[int]): public_ids of the logs
+
+        Raises:
+            BaseManagerUpdateError: If a dependent log could not be converted
+            BaseManagerDeleteError: If the logs could not be deleted
+
+        Returns:
+            int: Number of deleted logs
+        """
+        if not public_ids:
+            return 0
+
+        self.rebase_dependent_logs(public_ids)
+
+        return self.delete_many({'public_id': {'$in': public_ids}}).deleted_count
+
+
+    def rebase_dependent_logs(self, public_ids: list[int]) -> None:
+        """
+        Converts the logs which store their render_state as delta to one of the given logs into snapshots, so that
+        the given logs can be removed without breaking a delta chain
+
+        Args:
+            public_ids (list[int]): public_ids of the logs which will be removed
+
+        Raises:
+            BaseManagerUpdateError: If a dependent log could not be converted
+        """
+        try:
+            dependent_logs = list(self.find(criteria={
+                'render_base': {'$in': public_ids},
+                'public_id': {'$nin': public_ids},
+            }))
+            known_logs = self.load_delta_chains(dependent_logs)
+            states = {}
+
+            for dependent_log in dependent_logs:
+                snapshot = RenderStateCodec.encode(self.reconstruct_render_state(dependent_log, states, known_logs))
+                self.update({'public_id': dependent_log['public_id']}, snapshot)
+        except BaseManagerGetError as err:
+            raise BaseManagerUpdateError(err) from err
+
+# ------------------------------------------------------ HELPERS ----------------------------------------------------- #
+
+    def __flag_logs_of_objects(self, object_ids: list[int]) -> None:
+        """
+        Flags the stored logs of the given objects as logs of deleted objects
+
+        Args:
+            object_ids (list[int]): public_ids of the deleted objects
+
+        Raises:
+            BaseManagerUpdateError: If the logs could not be flagged
+        """
+        self.update_many(
+            {'log_type': CmdbObjectLog.__name__, 'object_id': {'$in': object_ids}, 'object_deleted': {'$ne': True}},
+            {'object_deleted': True}
+        )
+
+
+    def decode_render_states(self, logs: list[dict]) -> None:
+        """
+        Replaces the stored render_state of the given logs with the full JSON encoded render_state
+
+        Args:
+            logs (list[dict]): Logs as stored in the database
+
+        Raises:
+            BaseManagerGetError: If a base log of a delta could not be retrieved
+        """
+        encoded_logs = [log for log in logs if log.get('render_encoding')]
+        known_logs = self.load_delta_chains(encoded_logs)
+        states = {}
+
+        for log in sorted(encoded_logs, key=lambda log: log['public_id']):
+            log['render_state'] = RenderStateCodec.to_raw(self.reconstruct_render_state(log, states, known_logs))
+
+        for log in encoded_logs:
+            for key in ('render_encoding', 'render_base', 'render_depth'):
+                log.pop(key, None)
+
+
+    def load_delta_chains(self, logs: list[dict]) -> dict:
+        """
+        Retrieves the base logs of the delta chains of the given logs with one query per level of the chains,
+        instead of one query per base log
+
+        Args:
+            logs (list[dict]): Logs as stored in the database
+
+        Raises:
+            BaseManagerGetError: If the base logs could not be retrieved
+
+        Returns:
+            dict: The given logs and their base logs by public_id
+        """
+        known_logs = {log['public_id']: log for log in logs}
+        level_logs = logs
+
+        # A chain has at most SNAPSHOT_INTERVAL - 1 deltas, missing base logs end the loop as well
+        while level_logs:
+            base_ids = {
+                log['render_base'] for log in level_logs
+                if log.get('render_encoding') == RenderStateCodec.DELTA and log['render_base'] not in known_logs
+            }
+
+            if not base_ids:
+                break
+
+            level_logs = list(self.find(criteria={'public_id': {'$in': list(base_ids)}}))
+            known_logs.update({log['public_id']: log for log in level_logs})
+
+        return known_logs
+
+
+    def reconstruct_render_state(self, log: dict, states: dict = None, known_logs: dict = None) -> Any:
+        """
+        Reconstructs the parsed render_state of a log by applying the deltas since the last snapshot
+
+        Args:
+            log (dict): The log as stored in the database
+            states (dict, optional): Already reconstructed states by public_id, is extended by this call
+            known_logs (dict, optional): Logs by public_id which do not need to be retrieved from the database
+
+        Raises:
+            BaseManagerGetError: If a base log of a delta could not be retrieved
+
+        Returns:
+            Any: The parsed render_state of the log
+        """
+        states = {} if states is None else states
+        known_logs = known_logs or {}
+        delta_logs = []
+        current_log = log
+
+        # Walk back to the snapshot or to a state which was already reconstructed
+        while current_log['public_id'] not in states:
+            if current_log.get('render_encoding') != RenderStateCodec.DELTA:
+                states[current_log['public_id']] = self.__parse_render_state(current_log)
+                break
+
+            delta_logs.append(current_log)
+            base_id = current_log['render_base']
+            current_log = known_logs.get(base_id) or self.get_one(base_id)
+
+            if not current_log:
+                raise BaseManagerGetError(f"Base log with ID: {base_id} of log ID: {log['public_id']} not found!")
+
+        state = states[current_log['public_id']]
+
+        for delta_log in reversed(delta_logs):
+            state = RenderStateCodec.patch(state, RenderStateCodec.decompress(delta_log['render_state']))
+            states[delta_log['public_id']] = state
+
+        return state
+
+
+    def __parse_render_state(self, log: dict) -> Any:
+        """
+        Parses the render_state of a snapshot or of a log which was written before the encoding was introduced
+
+        Args:
+            log (dict): The log as stored in the database
+
+        Returns:
+            Any: The parsed render_state of the log
+        """
+        if log.get('render_encoding') == RenderStateCodec.SNAPSHOT:
+            return RenderStateCodec.decompress(log['render_state'])
+
+        return json.loads(log['render_state'])
+
+
+    def __encode_render_state(self, object_id: int, state: Any, previous: tuple = None) -> dict:
+        """
+        Encodes the render_state of a new log as delta to the previous log of the object if possible
+
+        Args:
+            object_id (int): public_id of the object
+            state (Any): The parsed render_state
+            previous (tuple, optional): (public_id, state, depth) of the previous log if it is not yet stored
+
+        Returns:
+            dict: The encoded render_state fields of the log
+        """
+        if previous:
+            return RenderStateCodec.encode(state, *previous)
+
+        try:
+            # The last logs of the object usually contain the whole delta chain of the previous log
+            previous_logs = list(self.find(
+                criteria={
+                    'log_type': CmdbObjectLog.__name__,
+                    'object_id': object_id,
+                    'render_state': {'$ne': None},
+                },
+                sort=[('public_id', CmdbObjectLog.DAO_DESCENDING)],
+                limit=RenderStateCodec.SNAPSHOT_INTERVAL,
+            ))
+
+            if previous_logs:
+                previous_log = previous_logs[0]
+                known_logs = {log['public_id']: log for log in previous_logs}
+
+                return RenderStateCodec.encode(
+                    state,
+                    previous_log['public_id'],
+                    self.reconstruct_render_state(previous_log, known_logs=known_logs),
+                    previous_log.get('render_depth', 0),
+                )
+        except Exception as err:
+            LOGGER.warning("[__encode_render_state] Storing snapshot for Object-ID: %s. Error: %s", object_id, err)
+
+        return RenderStateCodec.encode(state)
+
+
+    @staticmethod
+    def __get_log_flush(dbm: MongoDatabaseManager) -> Callable[[str, list[dict]], list[int]]:
+        """
+        Creates the function with which the BufferedLogWriter writes its batches
+
+        Args:
+            dbm (MongoDatabaseManager): Database connection of the writer
+
+        Returns:
+            Callable[[str, list[dict]], list[int]]: Writes the logs of a database and returns their public_ids
+        """
+        def flush(db_name: str, log_documents: list[dict]) -> list[int]:
+            return LogsManager(dbm, db_name).insert_logs(log_documents)
+
+        return flush
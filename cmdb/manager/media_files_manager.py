@@ -16,10 +16,16 @@
 """
 Implementation of MediaFilesManager
 """
+import hashlib
 import logging
-from datetime import datetime, timezone
-from gridfs.grid_file import GridOutCursor, GridOut
+from typing import IO, Iterator, Optional
+from datetime import datetime, timedelta, timezone
+from bson import Binary, ObjectId
+from bson.errors import InvalidId
+from gridfs.grid_file import DEFAULT_CHUNK_SIZE, GridOutCursor, GridOut
 from gridfs.errors import NoFile
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 from cmdb.database import DatabaseGridFS, MongoDatabaseManager
 from cmdb.manager.base_manager import BaseManager
@@ -27,6 +33,7 @@
 from cmdb.interface.rest_api.responses import GridFsResponse
 from cmdb.framework.media_library.media_file import MediaFile
 from cmdb.framework.media_library.media_file import FileMetadata
+from cmdb.framework.media_library.media_file_blob import MediaFileBlob
 
 from cmdb.errors.manager.media_files_manager import (
     MediaFileManagerGetError,
@@ -47,7 +54,17 @@ class MediaFilesManager(BaseManager):
 
     Provides CRUD operations (Create, Read, Update, Delete) 
     for managing media files and their metadata.
+
+    The content of the media files is deduplicated: Every distinct content is stored once as a blob in the
+    `media.libary.blobs` bucket (identified by its SHA-256 hash) and the files documents of the media files only
+    reference it. Blobs are reference counted and removed with the last media file referencing them. Media files
+    stored before the deduplication keep their own chunks and are still readable.
     """
+    # Chunked uploads without a new part within this time are abandoned and removed together with their chunks
+    UPLOAD_EXPIRATION = timedelta(hours=24)
+    # Attempts to insert or reference a blob while the same content is committed and released concurrently
+    COMMIT_ATTEMPTS = 5
+
 
     def __init__(self, dbm: MongoDatabaseManager, database: str = None):
         """
@@ -58,18 +75,33 @@ def __init__(self, dbm: MongoDatabaseManager, database: str = None):
             database (str, optional): Specific database name to switch to
         """
         target_db = database if database else dbm.db_name
-        self.fs = DatabaseGridFS(dbm.connector.get_database(target_db), MediaFile.COLLECTION)
+        gridfs_database = dbm.connector.get_database(target_db)
+
+        self.fs = DatabaseGridFS(gridfs_database, MediaFile.COLLECTION)
+        self.fs_files = gridfs_database[f'{MediaFile.COLLECTION}.files']
+        self.blob_fs = DatabaseGridFS(gridfs_database, MediaFileBlob.COLLECTION)
+        self.blob_files = gridfs_database[f'{MediaFileBlob.COLLECTION}.files']
+        self.blob_chunks = gridfs_database[f'{MediaFileBlob.COLLECTION}.chunks']
+        self.uploads = gridfs_database[MediaFile.UPLOADS_COLLECTION]
         super().__init__(MediaFile.COLLECTION, dbm, database)
 
 # --------------------------------------------------- CRUD - CREATE -------------------------------------------------- #
 
-    def insert_file(self, data, metadata: dict) -> dict:
+    def insert_file(self, data, metadata: dict, replaces: dict = None) -> dict:
         """
         Inserts a new media file into GridFS
 
+        The content is hashed while it is streamed into a new blob. If a blob with the same content already exists,
+        the new blob is discarded and the existing one is referenced instead.
+
+        When an existing file is replaced, the new version is written first and keeps the public_id of the
+        replaced file. Since GridFS always resolves the latest version, readers switch to the new file with the
+        single insert of its files document and the old version is removed afterwards
+
         Args:
             data: The file-like object containing the media data
             metadata (dict): Metadata describing the media file
+            replaces (dict, optional): The files document of the media file which is replaced by this file
 
         Returns:
             dict: The inserted MediaFile document
@@ -78,16 +110,578 @@ def insert_file(self, data, metadata: dict) -> dict:
             MediaFileManagerInsertError: If the file could not be inserted
         """
         try:
-            with self.fs.new_file(filename=data.filename) as media_file:
-                media_file.write(data)
-                media_file.public_id = self.get_new_media_file_id()
-                media_file.metadata = FileMetadata(**metadata).__dict__
+            blob = self.__store_blob(data)
+
+            try:
+                public_id = replaces['public_id'] if replaces else self.get_new_media_file_id()
+
+                media_file = self.__insert_file_document(
+                    data.filename,
+                    FileMetadata(**metadata).__dict__,
+                    public_id,
+                    blob
+                )
+            except Exception as err:
+                # No media file references the blob, the reference of this upload is removed again
+                self.__release_blob(blob['_id'])
+                raise err
+
+            if replaces:
+                self.__delete_file_document(replaces)
+
+            return media_file
+        except Exception as err:
+            raise MediaFileManagerInsertError(err) from err
+
+
+    def __insert_file_document(self, filename: str, metadata: dict, public_id: int, blob: dict) -> dict:
+        """
+        Inserts the files document of a media file which references the blob with its content
+
+        Args:
+            filename (str): Name of the media file
+            metadata (dict): Metadata describing the media file
+            public_id (int): The public_id of the media file
+            blob (dict): The files document of the blob
+
+        Returns:
+            dict: The inserted MediaFile document
+        """
+        file_document = {
+            '_id': ObjectId(),
+            'filename': filename,
+            'length': blob['length'],
+            'chunkSize': blob['chunkSize'],
+            'uploadDate': datetime.now(timezone.utc),
+            'metadata': metadata,
+            'public_id': public_id,
+            'blob_id': blob['_id'],
+            'sha256': blob['sha256'],
+        }
+
+        self.fs_files.insert_one(file_document)
+
+        return file_document
+
+# ------------------------------------------------------- BLOBS ------------------------------------------------------ #
+
+    def __store_blob(self, stream: IO[bytes]) -> dict:
+        """
+        Streams the content into the chunks of a new blob while computing its SHA-256 hash
+
+        Args:
+            stream (IO[bytes]): Readable stream with the content
+
+        Returns:
+            dict: The files document of the blob holding the content
+        """
+        blob_id = ObjectId()
+        sha256 = hashlib.sha256()
+        length = 0
+
+        try:
+            for chunk_number, chunk in enumerate(self.__read_chunks(stream, DEFAULT_CHUNK_SIZE)):
+                sha256.update(chunk)
+                length += len(chunk)
+                self.blob_chunks.insert_one({'files_id': blob_id, 'n': chunk_number, 'data': Binary(chunk)})
+            return self.__commit_blob(blob_id, length, DEFAULT_CHUNK_SIZE, sha256.hexdigest())
+        except Exception as err:
+            self.blob_chunks.delete_many({'files_id': blob_id})
+            raise err
+
+
+    def __commit_blob(self, blob_id: ObjectId, length: int, chunk_size: int, sha256: str) -> dict:
+        """
+        Publishes a blob whose chunks are completely written
+
+        If a blob with the same content already exists, it is referenced and the given chunks are removed
+
+        Args:
+            blob_id (ObjectId): ID of the written chunks
+            length (int): Length of the content in bytes
+            chunk_size (int): Size of the chunks in bytes
+            sha256 (str): SHA-256 hash of the content
+
+        Returns:
+            dict: The files document of the blob holding the content
+        """
+        for _ in range(self.COMMIT_ATTEMPTS):
+            existing_blob = self.__reference_blob(sha256)
+
+            if existing_blob:
+                # The chunks are only discarded if they are not the chunks of the referenced blob itself
+                if existing_blob['_id'] != blob_id:
+                    self.blob_chunks.delete_many({'files_id': blob_id})
+
+                return existing_blob
+
+            blob = {
+                '_id': blob_id,
+                'length': length,
+                'chunkSize': chunk_size,
+                'uploadDate': datetime.now(timezone.utc),
+                'sha256': sha256,
+                'ref_count': 1,
+            }
+
+            try:
+                self.blob_files.insert_one(blob)
+
+                return blob
+            except DuplicateKeyError:
+                # The same content was committed concurrently, it is referenced with the next attempt. If the
+                # other blob was released in the meantime, this blob is inserted again
+                continue
+
+        raise MediaFileManagerInsertError(f"The blob with the hash: {sha256} could not be committed!")
+
+
+    def __reference_blob(self, sha256: str) -> Optional[dict]:
+        """
+        Adds a reference to the blob with the given content hash
+
+        Args:
+            sha256 (str): SHA-256 hash of the content
+
+        Returns:
+            Optional[dict]: The files document of the blob or None if no blob with this content exists
+        """
+        return self.blob_files.find_one_and_update(
+            {'sha256': sha256},
+            {'$inc': {'ref_count': 1}},
+            return_document=ReturnDocument.AFTER
+        )
+
+
+    def __release_blob(self, blob_id: ObjectId) -> None:
+        """
+        Removes a reference from a blob and deletes the blob when it is not referenced anymore
+
+        The blob is only deleted while its reference counter is still zero, so a concurrent upload of the same
+        content either references the blob before it is deleted or stores a new blob
+
+        Args:
+            blob_id (ObjectId): ID of the blob
+        """
+        self.blob_files.update_one({'_id': blob_id}, {'$inc': {'ref_count': -1}})
+
+        if self.blob_files.delete_one({'_id': blob_id, 'ref_count': {'$lte': 0}}).deleted_count:
+            self.blob_chunks.delete_many({'files_id': blob_id})
+
+
+    def __hash_blob_chunks(self, blob_id: ObjectId) -> str:
+        """
+        Computes the SHA-256 hash of written chunks by streaming them from the database
+
+        Args:
+            blob_id (ObjectId): ID of the written chunks
+
+        Returns:
+            str: The SHA-256 hash of the content
+        """
+        sha256 = hashlib.sha256()
+
+        for chunk in self.blob_chunks.find({'files_id': blob_id}, sort=[('n', 1)], batch_size=8):
+            sha256.update(chunk['data'])
+
+        return sha256.hexdigest()
+
+
+    @staticmethod
+    def __read_chunks(stream: IO[bytes], chunk_size: int, head: bytes = b'') -> Iterator[bytes]:
+        """
+        Reads a stream in chunks of exactly `chunk_size` bytes, only the last chunk can be smaller
+
+        Args:
+            stream (IO[bytes]): Readable stream
+            chunk_size (int): Size of the chunks in bytes
+            head (bytes, optional): Bytes which are prepended to the stream. Defaults to b''
+
+        Returns:
+            Iterator[bytes]: The chunks of the stream
+        """
+        buffer = head
+
+        while True:
+            data = stream.read(chunk_size - len(buffer))
+
+            if not data:
+                break
+
+            buffer += data
+
+            if len(buffer) == chunk_size:
+                yield buffer
+                buffer = b''
+
+        if buffer:
+            yield buffer
+
+# -------------------------------------------------- CHUNKED UPLOADS ------------------------------------------------- #
+
+    def initiate_upload(self, filename: str, metadata: dict, author_id: int, replaces: dict = None) -> dict:
+        """
+        Starts a resumable chunked upload of a media file
+
+        The parts of the upload are written directly into the chunks of a new blob, the file itself only
+        becomes visible when the upload is completed. Expired uploads of all users are removed beforehand
+
+        Args:
+            filename (str): Name of the uploaded file
+            metadata (dict): Metadata describing the media file
+            author_id (int): public_id of the user who uploads the file, the only user who can access the upload
+            replaces (dict, optional): The files document of the media file which is replaced by this upload
+
+        Raises:
+            MediaFileManagerInsertError: If the upload could not be initiated
+
+        Returns:
+            dict: The upload session
+        """
+        try:
+            self.remove_expired_uploads()
+
+            now = datetime.now(timezone.utc)
+            upload = {
+                '_id': ObjectId(),
+                'author_id': author_id,
+                'filename': filename,
+                'metadata': FileMetadata(**metadata).__dict__,
+                'chunk_size': DEFAULT_CHUNK_SIZE,
+                'length': 0,
+                'next_part': 1,
+                'replaces': replaces['public_id'] if replaces else None,
+                'completing': False,
+                'creation_time': now,
+                'update_time': now,
+            }
+
+            self.uploads.insert_one(upload)
+
+            return self.to_upload_json(upload)
+        except Exception as err:
+            raise MediaFileManagerInsertError(err) from err
+
+
+    def get_upload(self, upload_id: str, author_id: int) -> Optional[dict]:
+        """
+        Retrieves an upload session of a user
+
+        Args:
+            upload_id (str): ID of the upload session
+            author_id (int): public_id of the requesting user
+
+        Raises:
+            MediaFileManagerGetError: If the upload session could not be retrieved
+
+        Returns:
+            Optional[dict]: The upload session or None if it does not exist, has expired, belongs to another user
+                            or is being completed
+        """
+        try:
+            return self.uploads.find_one(self.__open_upload_filter(ObjectId(upload_id), author_id))
+        except InvalidId:
+            return None
+        except Exception as err:
+            raise MediaFileManagerGetError(err) from err
+
+
+    def __open_upload_filter(self, upload_id: ObjectId, author_id: int) -> dict:
+        """
+        Builds the filter of an upload session of a user which is neither expired nor claimed for completion
+
+        Args:
+            upload_id (ObjectId): ID of the upload session
+            author_id (int): public_id of the requesting user
+
+        Returns:
+            dict: The filter for the upload session
+        """
+        return {
+            '_id': upload_id,
+            'author_id': author_id,
+            'completing': {'$ne': True},
+            'update_time': {'$gte': datetime.now(timezone.utc) - self.UPLOAD_EXPIRATION},
+        }
+
+
+    def upload_part(self, upload_id: str, author_id: int, part_number: int, stream: IO[bytes]) -> dict:
+        """
+        Appends a part to an upload session
+
+        The stream is read chunk by chunk, so at most one GridFS chunk of the part is held in memory. Parts can
+        have any size and have to be sent in order. Sending an already stored part again is ignored, which allows
+        clients to resume an interrupted upload with the `next_part` of the session
+
+        Args:
+            upload_id (str): ID of the upload session
+            author_id (int): public_id of the requesting user
+            part_number (int): Number of the part, starting with 1
+            stream (IO[bytes]): Readable stream with the content of the part
+
+        Raises:
+            MediaFileManagerGetError: If the upload session does not exist or belongs to another user
+            MediaFileManagerInsertError: If the part is out of order or could not be stored
+
+        Returns:
+            dict: The updated upload session
+        """
+        upload = self.get_upload(upload_id, author_id)
+
+        if not upload:
+            raise MediaFileManagerGetError(f"Upload with ID: {upload_id} does not exist!")
+
+        if part_number < upload['next_part']:
+            return self.to_upload_json(upload)
+
+        if part_number > upload['next_part']:
+            raise MediaFileManagerInsertError(
+                f"Part {part_number} is out of order, expected part {upload['next_part']}!"
+            )
+
+        try:
+            blob_id = upload['_id']
+            chunk_number, offset = divmod(upload['length'], upload['chunk_size'])
+
+            # Remove leftovers of an interrupted attempt to store this part
+            self.blob_chunks.delete_many({'files_id': blob_id, 'n': {'$gt' if offset else '$gte': chunk_number}})
+
+            # The last chunk of the previous part is continued with the data of this part
+            head = b''
+
+            if offset:
+                last_chunk = self.blob_chunks.find_one({'files_id': blob_id, 'n': chunk_number})
+                head = bytes(last_chunk['data'][:offset])
+
+            received = -len(head)
+
+            for chunk in self.__read_chunks(stream, upload['chunk_size'], head):
+                self.__write_chunk(blob_id, chunk_number, chunk)
+                chunk_number += 1
+                received += len(chunk)
+
+            updated_upload = self.uploads.find_one_and_update(
+                {'_id': blob_id, 'next_part': part_number, 'completing': {'$ne': True}},
+                {'$inc': {'length': received, 'next_part': 1}, '$set': {'update_time': datetime.now(timezone.utc)}},
+                return_document=ReturnDocument.AFTER
+            )
+        except Exception as err:
+            raise MediaFileManagerInsertError(err) from err
+
+        if not updated_upload:
+            raise MediaFileManagerInsertError(f"Part {part_number} was uploaded concurrently!")
+
+        return self.to_upload_json(updated_upload)
+
+
+    def complete_upload(self, upload_id: str, author_id: int) -> dict:
+        """
+        Completes an upload session and publishes the uploaded media file
+
+        The uploaded content is deduplicated like in `insert_file()`. If the upload replaces an existing file,
+        the new file takes over its public_id and the old version is removed after the new one is visible
+
+        The session is claimed atomically before the content is hashed. A claimed session is ignored by
+        `upload_part()`, `abort_upload()` and further completions, so the chunks of the published blob (which keeps
+        the ID of the upload) are never removed by another request working on the same upload
+
+        Args:
+            upload_id (str): ID of the upload session
+            author_id (int): public_id of the requesting user
+
+        Raises:
+            MediaFileManagerGetError: If the upload session does not exist or belongs to another user
+            MediaFileManagerInsertError: If the uploaded file is incomplete or could not be published
+
+        Returns:
+            dict: The inserted MediaFile document
+        """
+        try:
+            upload = self.uploads.find_one_and_update(
+                self.__open_upload_filter(ObjectId(upload_id), author_id),
+                {'$set': {'completing': True, 'update_time': datetime.now(timezone.utc)}},
+                return_document=ReturnDocument.AFTER
+            )
+        except InvalidId:
+            upload = None
+        except Exception as err:
+            raise MediaFileManagerGetError(err) from err
+
+        if not upload:
+            raise MediaFileManagerGetError(f"Upload with ID: {upload_id} does not exist!")
+
+        blob_id = upload['_id']
+        blob = None
+        media_file = None
+
+        try:
+            expected_chunks = -(-upload['length'] // upload['chunk_size'])
+
+            if self.blob_chunks.count_documents({'files_id': blob_id}) != expected_chunks:
+                raise MediaFileManagerInsertError(f"Upload with ID: {upload_id} is incomplete!")
+
+            replaced_file = None
+
+            if upload['replaces'] is not None:
+                replaced_file = self.get_file({'public_id': upload['replaces']})
 
-            return media_file._file
+            blob = self.__commit_blob(
+                blob_id,
+                upload['length'],
+                upload['chunk_size'],
+                self.__hash_blob_chunks(blob_id)
+            )
+
+            media_file = self.__insert_file_document(
+                upload['filename'],
+                upload['metadata'],
+                replaced_file['public_id'] if replaced_file else self.get_new_media_file_id(),
+                blob
+            )
+
+            if replaced_file:
+                self.__delete_file_document(replaced_file)
+
+            self.uploads.delete_one({'_id': blob_id})
+
+            return media_file
         except Exception as err:
+            self.__abandon_completion(blob_id, blob, media_file)
+
+            if isinstance(err, MediaFileManagerInsertError):
+                raise err
+
             raise MediaFileManagerInsertError(err) from err
 
 
+    def __abandon_completion(self, upload_id: ObjectId, blob: Optional[dict], media_file: Optional[dict]) -> None:
+        """
+        Cleans up after a failed completion of an upload session
+
+        If nothing was committed yet, the claim is released so the upload can be continued or completed again.
+        Otherwise the chunks belong to the committed blob and the session is removed. The reference of the upload
+        is removed from the blob if no media file was inserted
+
+        Args:
+            upload_id (ObjectId): ID of the upload session
+            blob (Optional[dict]): The committed blob or None if nothing was committed
+            media_file (Optional[dict]): The inserted media file or None if it was not inserted
+        """
+        try:
+            if blob is None:
+                self.uploads.update_one({'_id': upload_id}, {'$set': {'completing': False}})
+                return
+
+            if media_file is None:
+                self.__release_blob(blob['_id'])
+
+            self.uploads.delete_one({'_id': upload_id})
+        except Exception as err:
+            LOGGER.warning("[__abandon_completion] Cleanup of upload with ID: %s failed: %s", upload_id, err)
+
+
+    def abort_upload(self, upload_id: str, author_id: int) -> bool:
+        """
+        Aborts an upload session and removes all stored parts
+
+        Args:
+            upload_id (str): ID of the upload session
+            author_id (int): public_id of the requesting user
+
+        Raises:
+            MediaFileManagerDeleteError: If the upload session could not be removed
+
+        Returns:
+            bool: True if the upload session existed, belonged to the user and was not being completed, else False
+        """
+        try:
+            # The session is removed first, so a concurrent completion can not claim it anymore
+            upload = self.uploads.find_one_and_delete(self.__open_upload_filter(ObjectId(upload_id), author_id))
+
+            if not upload:
+                return False
+
+            self.blob_chunks.delete_many({'files_id': upload['_id']})
+
+            return True
+        except InvalidId:
+            return False
+        except Exception as err:
+            raise MediaFileManagerDeleteError(f"Could not abort upload with ID: {upload_id}. Error: {err}") from err
+
+
+    def remove_expired_uploads(self) -> int:
+        """
+        Removes the upload sessions without a new part within the UPLOAD_EXPIRATION together with their chunks
+
+        Claiming a session for completion refreshes its `update_time`, so sessions which are being completed are
+        not expired. The chunks of a session which was left behind after its blob was published (e.g. after a crash
+        between both steps) belong to that blob and are kept
+
+        Raises:
+            MediaFileManagerDeleteError: If the expired uploads could not be removed
+
+        Returns:
+            int: Number of removed upload sessions
+        """
+        try:
+            expired_ids = self.uploads.distinct(
+                '_id',
+                {'update_time': {'$lt': datetime.now(timezone.utc) - self.UPLOAD_EXPIRATION}}
+            )
+
+            if not expired_ids:
+                return 0
+
+            published_ids = set(self.blob_files.distinct('_id', {'_id': {'$in': expired_ids}}))
+            abandoned_ids = [expired_id for expired_id in expired_ids if expired_id not in published_ids]
+
+            # The chunks are removed first, a failure leaves the sessions to be removed by the next call
+            if abandoned_ids:
+                self.blob_chunks.delete_many({'files_id': {'$in': abandoned_ids}})
+
+            self.uploads.delete_many({'_id': {'$in': expired_ids}})
+
+            return len(expired_ids)
+        except Exception as err:
+            raise MediaFileManagerDeleteError(f"Could not remove expired uploads. Error: {err}") from err
+
+
+    def __write_chunk(self, blob_id: ObjectId, chunk_number: int, data: bytes) -> None:
+        """
+        Writes (or overwrites) a single GridFS chunk of a blob
+
+        Args:
+            blob_id (ObjectId): ID of the blob the chunk belongs to
+            chunk_number (int): Position of the chunk inside the blob
+            data (bytes): Content of the chunk
+        """
+        self.blob_chunks.replace_one(
+            {'files_id': blob_id, 'n': chunk_number},
+            {'files_id': blob_id, 'n': chunk_number, 'data': Binary(data)},
+            upsert=True
+        )
+
+
+    @staticmethod
+    def to_upload_json(upload: dict) -> dict:
+        """
+        Converts an upload session to json conform data
+
+        Args:
+            upload (dict): The upload session
+
+        Returns:
+            dict: The upload session with a string `upload_id`
+        """
+        return {
+            'upload_id': str(upload['_id']),
+            'filename': upload['filename'],
+            'chunk_size': upload['chunk_size'],
+            'length': upload['length'],
+            'next_part': upload['next_part'],
+            'replaces': upload['replaces'],
+        }
 
 # ---------------------------------------------------- CRUD - READ --------------------------------------------------- #
 
@@ -113,9 +707,12 @@ def get_file(self, metadata: dict, blob: bool = False) -> GridOut:
             dict or bytes or None: The file's metadata, raw content, or None if not found
         """
         try:
-            result = self.fs.get_last_version(**metadata)
+            if blob:
+                grid_out = self.open_file(metadata)
+
+                return grid_out.read() if grid_out else None
 
-            return result.read() if blob else result._file
+            return self.fs.get_last_version(**metadata)._file
         except NoFile:
             return None
         except Exception as err:
@@ -123,6 +720,67 @@ def get_file(self, metadata: dict, blob: bool = False) -> GridOut:
             return None
 
 
+    def open_file(self, metadata: dict) -> Optional[GridOut]:
+        """
+        Opens the latest version of a media file without reading its content
+
+        For deduplicated media files the handle of the referenced blob is returned
+
+        Args:
+            metadata (dict): Filter criteria for locating the file
+
+        Raises:
+            MediaFileManagerGetError: If the file could not be opened
+
+        Returns:
+            Optional[GridOut]: A readable handle of the file or None if the file does not exist
+        """
+        try:
+            grid_out = self.fs.get_last_version(**metadata)
+            blob_id = grid_out._file.get('blob_id')
+
+            if blob_id:
+                return self.blob_fs.get(blob_id)
+
+            return grid_out
+        except NoFile:
+            return None
+        except Exception as err:
+            raise MediaFileManagerGetError(err) from err
+
+
+    @staticmethod
+    def stream_file(grid_out: GridOut, start: int = 0, end: int = None) -> Iterator[bytes]:
+        """
+        Yields the content of a media file chunk by chunk so that only one GridFS chunk
+        is held in memory at a time
+
+        Args:
+            grid_out (GridOut): Handle of the file, see `open_file()`
+            start (int, optional): First byte which should be yielded. Defaults to 0
+            end (int, optional): Byte position (exclusive) where streaming stops. Defaults to the file length
+
+        Returns:
+            Iterator[bytes]: The requested byte range of the file
+        """
+        end = grid_out.length if end is None else min(end, grid_out.length)
+        remaining = end - start
+
+        grid_out.seek(start)
+
+        try:
+            while remaining > 0:
+                chunk = grid_out.read(min(grid_out.chunk_size, remaining))
+
+                if not chunk:
+                    break
+
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            grid_out.close()
+
+
     def get_many_media_files(self, metadata: dict, **params: dict):
         """
         Retrieves multiple media files matching the given metadata
@@ -201,9 +859,22 @@ def delete_file(self, public_id) -> bool:
             bool: True if successfully deleted
         """
         try:
-            file_id = self.fs.get_last_version(**{'public_id': public_id})._id
-            self.fs.delete(file_id)
+            self.__delete_file_document(self.fs.get_last_version(**{'public_id': public_id})._file)
 
             return True
         except Exception as err:
-            raise MediaFileManagerDeleteError(f'Could not delete file with ID: {file_id}') from err
+            raise MediaFileManagerDeleteError(f'Could not delete file with ID: {public_id}') from err
+
+
+    def __delete_file_document(self, file_document: dict) -> None:
+        """
+        Deletes the files document of a media file and releases the referenced blob
+
+        Args:
+            file_document (dict): The files document of the media file
+        """
+        # Also removes the chunks of media files which were stored before the deduplication
+        self.fs.delete(file_document['_id'])
+
+        if file_document.get('blob_id'):
+            self.__release_blob(file_document['blob_id'])
@@ -99,6 +99,7 @@ def delete_object_group_from_risk_assessment_cascade(self, deleted_group_id: int
                 self.db_name,
                 **{'public_id': {'$in': risk_assessment_ids}},
             )
+            self.increase_generation(IsmsRiskAssessment.COLLECTION)
 
             # Delete all ControlMeasureAssignments referencing those RiskAssessments
             self.dbm.delete_many(
@@ -217,3 +217,24 @@ def delete_object_link(self, public_id: int) -> bool:
             return self.delete({'public_id':public_id})
         except (BaseManagerGetError, BaseManagerDeleteError) as err:
             raise ObjectLinksManagerDeleteError(err) from err
+
+
+    def delete_links_of_objects(self, object_ids: list[int]) -> int:
+        """
+        Deletes all CmdbObjectLinks where one of the given CmdbObjects is the primary or secondary object
+
+        Args:
+            object_ids (list[int]): public_ids of the CmdbObjects
+
+        Raises:
+            ObjectLinksManagerDeleteError: When the CmdbObjectLinks could not be deleted
+
+        Returns:
+            int: Number of deleted CmdbObjectLinks
+        """
+        try:
+            return self.delete_many(
+                {'$or': [{'primary': {'$in': object_ids}}, {'secondary': {'$in': object_ids}}]}
+            ).deleted_count
+        except BaseManagerDeleteError as err:
+            raise ObjectLinksManagerDeleteError(err) from err
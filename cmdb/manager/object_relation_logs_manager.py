@@ -19,6 +19,7 @@
 import logging
 from typing import Optional
 from datetime import datetime, timezone
+from pymongo import InsertOne
 
 from cmdb.database import MongoDatabaseManager
 
@@ -188,16 +189,7 @@ def build_object_relation_log(
             object_relation = new_object_relation if new_object_relation else old_object_relation
 
             # Initialize log object with common attributes
-            object_relation_log = {
-                "action": action,
-                "creation_time": datetime.now(timezone.utc),
-                "author_id": request_user.get_public_id(),
-                "author_name": request_user.get_display_name(),
-                "object_relation_parent_id": object_relation.get("relation_parent_id"),
-                "object_relation_child_id": object_relation.get("relation_child_id"),
-                "object_relation_id": object_relation.get("public_id"),
-                "changes": {}
-            }
+            object_relation_log = self.__init_object_relation_log(action, request_user, object_relation)
 
             # Handle different actions
             if action == LogInteraction.CREATE:
@@ -225,6 +217,38 @@ def build_object_relation_log(
             raise ObjectRelationLogsManagerBuildError(err) from err
 
 
+    def build_deletion_logs(self, request_user: CmdbUser, deleted_object_relations: list[dict]) -> None:
+        """
+        Creates the DELETE CmdbObjectRelationLogs of multiple CmdbObjectRelations with a single bulk insert
+
+        Args:
+            request_user (CmdbUser): The user who deleted the CmdbObjectRelations
+            deleted_object_relations (list[dict]): The deleted CmdbObjectRelations
+
+        Raises:
+            ObjectRelationLogsManagerBuildError: If the CmdbObjectRelationLogs could not be created
+        """
+        if not deleted_object_relations:
+            return
+
+        try:
+            first_public_id = self.dbm.reserve_public_ids(self.collection,
+                                                          self.db_name,
+                                                          len(deleted_object_relations))
+            operations = []
+
+            for offset, object_relation in enumerate(deleted_object_relations):
+                object_relation_log = self.__init_object_relation_log(LogInteraction.DELETE,
+                                                                      request_user,
+                                                                      object_relation)
+                object_relation_log['public_id'] = first_public_id + offset
+                operations.append(InsertOne(object_relation_log))
+
+            self.dbm.bulk_write(self.collection, self.db_name, operations)
+        except Exception as err:
+            raise ObjectRelationLogsManagerBuildError(err) from err
+
+
     def get_field_value_changes(self, old_fields: list[dict], new_fields: list[dict]) -> dict:
         """
         Compare old and new field_values and return changes
@@ -272,3 +296,31 @@ def check_related_object_changed(self, old_values: dict, new_values: dict) -> bo
         child_id_changed = old_values.get("relation_child_id") != new_values.get("relation_child_id")
 
         return parent_id_changed or child_id_changed
+
+
+    def __init_object_relation_log(
+            self,
+            action: LogInteraction,
+            request_user: CmdbUser,
+            object_relation: dict) -> dict:
+        """
+        Initializes a CmdbObjectRelationLog with the attributes shared by all actions
+
+        Args:
+            action (LogInteraction): The action (CREATE / EDIT / DELETE)
+            request_user (CmdbUser): The user who performed the action
+            object_relation (dict): The CmdbObjectRelation of the log
+
+        Returns:
+            dict: The CmdbObjectRelationLog without changes
+        """
+        return {
+            "action": action,
+            "creation_time": datetime.now(timezone.utc),
+            "author_id": request_user.get_public_id(),
+            "author_name": request_user.get_display_name(),
+            "object_relation_parent_id": object_relation.get("relation_parent_id"),
+            "object_relation_child_id": object_relation.get("relation_child_id"),
+            "object_relation_id": object_relation.get("public_id"),
+            "changes": {}
+        }
@@ -18,15 +18,19 @@
 """
 import logging
 from typing import Optional
+from pymongo.errors import OperationFailure
 
 from cmdb.database import MongoDatabaseManager
 
 from cmdb.manager.base_manager import BaseManager
 from cmdb.manager.query_builder import BuilderParameters
 
+from cmdb.models.object_model import CmdbObject
 from cmdb.models.object_relation_model import CmdbObjectRelation
 
 from cmdb.framework.results import IterationResult
+from cmdb.framework.relation_graph.object_relation_graph import ObjectRelationGraph
+from cmdb.framework.relation_graph.relation_graph_cache import RelationGraphCache
 
 from cmdb.errors.manager import (
     BaseManagerInsertError,
@@ -48,6 +52,15 @@
 
 LOGGER = logging.getLogger(__name__)
 
+# MongoDB error codes of a $graphLookup whose closure exceeds the document size or the stage memory limit
+GRAPH_LOOKUP_LIMIT_CODES = {
+    146,    # ExceededMemoryLimit
+    292,    # QueryExceededMemoryLimitNoDiskUseAllowed
+    10334,  # BSONObjectTooLarge
+    17419,  # Total size of the looked up documents exceeds the maximum document size
+    40099,  # $graphLookup reached its maximum memory consumption
+}
+
 # -------------------------------------------------------------------------------------------------------------------- #
 #                                            ObjectRelationsManager - CLASS                                            #
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -91,7 +104,10 @@ def insert_object_relation(self, object_relation: dict) -> int:
             if isinstance(object_relation, CmdbObjectRelation):
                 object_relation = CmdbObjectRelation.to_json(object_relation)
 
-            return self.insert(object_relation)
+            public_id = self.insert(object_relation)
+            RelationGraphCache.apply_change(self.dbm, self.db_name, added_relations=[object_relation])
+
+            return public_id
         except CmdbObjectRelationToJsonError as err:
             raise ObjectRelationsManagerInsertError(err) from err
         except BaseManagerInsertError as err:
@@ -145,6 +161,265 @@ def iterate(self, builder_params: BuilderParameters) -> IterationResult[CmdbObje
         except Exception as err:
             raise ObjectRelationsManagerIterationError(err) from err
 
+
+    def get_relation_graph(self) -> ObjectRelationGraph:
+        """
+        Retrieves the in-memory ObjectRelationGraph of all CmdbObjectRelations for impact analysis
+
+        Raises:
+            ObjectRelationsManagerGetError: When the ObjectRelationGraph could not be built
+
+        Returns:
+            ObjectRelationGraph: The current ObjectRelationGraph
+        """
+        try:
+            return RelationGraphCache.get_graph(self.dbm, self.db_name)
+        except Exception as err:
+            LOGGER.error("[get_relation_graph] Exception: %s. Type: %s", err, type(err))
+            raise ObjectRelationsManagerGetError(err) from err
+
+
+    #pylint: disable=R0917
+    def traverse(
+            self,
+            object_id: int,
+            depth: int,
+            towards_children: bool,
+            relation_ids: set[int] = None,
+            type_ids: set[int] = None,
+            limit: int = 0) -> list[dict]:
+        """
+        Retrieves the CmdbObjectRelations of all CmdbObjects which are reachable from a CmdbObject within 'depth'
+        hops with a single $graphLookup
+
+        The $graphLookup collects the whole closure before the limit is applied. If the closure of a densely
+        connected CmdbObject exceeds the document size or memory limits of MongoDB, the traversal falls back to
+        one query per hop, where each query is bounded by the remaining limit
+
+        Args:
+            object_id (int): public_id of the CmdbObject where the traversal starts
+            depth (int): Maximum number of hops, 1 only returns the direct relations
+            towards_children (bool): If True the relations are followed from parent to child, else from child to
+                                     parent
+            relation_ids (set[int], optional): Only follow CmdbObjectRelations of these CmdbRelations
+            type_ids (set[int], optional): Only follow CmdbObjectRelations to CmdbObjects of these CmdbTypes
+            limit (int, optional): Maximum number of returned CmdbObjectRelations, 0 for no limit
+
+        Raises:
+            ObjectRelationsManagerIterationError: When the traversal failed
+
+        Returns:
+            list[dict]: The CmdbObjectRelations ordered by their distance to the CmdbObject. The distance is
+                        stored in 'hop', which is 0 for direct relations
+        """
+        try:
+            if towards_children:
+                connect_from = 'relation_child_id'
+                connect_to = 'relation_parent_id'
+                linked_type_field = 'relation_child_type_id'
+            else:
+                connect_from = 'relation_parent_id'
+                connect_to = 'relation_child_id'
+                linked_type_field = 'relation_parent_type_id'
+
+            graph_lookup = {
+                'from': self.collection,
+                'startWith': '$public_id',
+                'connectFromField': connect_from,
+                'connectToField': connect_to,
+                'as': 'relations',
+                'maxDepth': depth - 1,
+                'depthField': 'hop',
+            }
+
+            restrict_search = {}
+
+            if relation_ids:
+                restrict_search['relation_id'] = {'$in': list(relation_ids)}
+
+            if type_ids:
+                restrict_search[linked_type_field] = {'$in': list(type_ids)}
+
+            if restrict_search:
+                graph_lookup['restrictSearchWithMatch'] = restrict_search
+
+            # The traversal is anchored at the CmdbObject itself
+            pipeline = [
+                {'$match': {'public_id': object_id}},
+                {'$limit': 1},
+                {'$project': {'_id': 0, 'public_id': 1}},
+                {'$graphLookup': graph_lookup},
+                {'$unwind': '$relations'},
+                {'$replaceRoot': {'newRoot': '$relations'}},
+                {'$project': {'_id': 0}},
+                {'$sort': {'hop': 1, 'public_id': 1}},
+            ]
+
+            if limit:
+                pipeline.append({'$limit': limit})
+
+            try:
+                return list(self.aggregate_from_other_collection(CmdbObject.COLLECTION, pipeline))
+            except Exception as err:
+                if not self.__exceeds_graph_lookup_limits(err):
+                    raise err
+
+                LOGGER.warning("[traverse] The closure of Object with ID: %s is too large for $graphLookup, "
+                               "falling back to one query per hop", object_id)
+
+            return self.__traverse_levels(object_id, depth, connect_from, connect_to, restrict_search, limit)
+        except Exception as err:
+            raise ObjectRelationsManagerIterationError(err) from err
+
+
+    #pylint: disable=R0917
+    def traverse_nearest(
+            self,
+            object_id: int,
+            depth: int,
+            directions: list[bool],
+            relation_ids: set[int] = None,
+            type_ids: set[int] = None,
+            max_objects: int = 1,
+            relations_per_object: int = 1) -> tuple[list[tuple[bool, dict]], set[int], bool]:
+        """
+        Traverses the CmdbObjectRelations of a CmdbObject in the given directions and selects the ones which lead
+        to the 'max_objects' CmdbObjects closest to it
+
+        Args:
+            object_id (int): public_id of the CmdbObject where the traversal starts
+            depth (int): Maximum number of hops, 1 only returns the direct relations
+            directions (list[bool]): The 'towards_children' of every traversed direction, see `traverse()`
+            relation_ids (set[int], optional): Only follow CmdbObjectRelations of these CmdbRelations
+            type_ids (set[int], optional): Only follow CmdbObjectRelations to CmdbObjects of these CmdbTypes
+            max_objects (int, optional): Maximum number of reached CmdbObjects. Defaults to 1
+            relations_per_object (int, optional): Traversed CmdbObjectRelations per reached CmdbObject, CmdbObjects
+                                                  can be connected by multiple relations. Defaults to 1
+
+        Raises:
+            ObjectRelationsManagerIterationError: When the traversal failed
+
+        Returns:
+            tuple[list[tuple[bool, dict]], set[int], bool]: The selected (towards_children, CmdbObjectRelation)
+                pairs ordered by their distance, the public_ids of the reached CmdbObjects including the
+                CmdbObject itself and True if CmdbObjectRelations were left out
+        """
+        relations_limit = max_objects * relations_per_object
+        traversed_relations = []
+        truncated = False
+
+        for towards_children in directions:
+            relations = self.traverse(object_id, depth, towards_children, relation_ids, type_ids, relations_limit)
+            truncated = truncated or len(relations) >= relations_limit
+            traversed_relations += [(towards_children, relation) for relation in relations]
+
+        traversed_relations.sort(key=lambda traversed: traversed[1]['hop'])
+
+        reached_ids = {object_id}
+        selected_relations = []
+
+        for towards_children, relation in traversed_relations:
+            if towards_children:
+                linked_id, known_id = relation['relation_child_id'], relation['relation_parent_id']
+            else:
+                linked_id, known_id = relation['relation_parent_id'], relation['relation_child_id']
+
+            # The CmdbObject the relation was reached from was left out
+            if known_id not in reached_ids:
+                continue
+
+            if linked_id not in reached_ids:
+                if len(reached_ids) > max_objects:
+                    truncated = True
+                    continue
+
+                reached_ids.add(linked_id)
+
+            selected_relations.append((towards_children, relation))
+
+        return selected_relations, reached_ids, truncated
+
+
+    #pylint: disable=R0917
+    def __traverse_levels(
+            self,
+            object_id: int,
+            depth: int,
+            connect_from: str,
+            connect_to: str,
+            restrict_search: dict,
+            limit: int) -> list[dict]:
+        """
+        Traverses the CmdbObjectRelations hop by hop with one query per hop. Each query only retrieves as many
+        CmdbObjectRelations as are left until the limit is reached, so neither the number of queries nor the
+        number of held CmdbObjectRelations grows with the size of the closure
+
+        The result is the same as the one of the $graphLookup in `traverse()`
+
+        Args:
+            object_id (int): public_id of the CmdbObject where the traversal starts
+            depth (int): Maximum number of hops
+            connect_from (str): Field with the public_id of the CmdbObject which is reached by a relation
+            connect_to (str): Field with the public_id of the CmdbObject from which a relation is followed
+            restrict_search (dict): Additional criteria for followed CmdbObjectRelations
+            limit (int): Maximum number of returned CmdbObjectRelations, 0 for no limit
+
+        Raises:
+            BaseManagerGetError: When the CmdbObjectRelations could not be retrieved
+
+        Returns:
+            list[dict]: The CmdbObjectRelations ordered by their distance to the CmdbObject
+        """
+        relations = []
+        visited_ids = {object_id}
+        frontier = [object_id]
+
+        for hop in range(depth):
+            remaining = limit - len(relations) if limit else 0
+
+            if not frontier or (limit and remaining <= 0):
+                break
+
+            level = list(self.find(
+                criteria={connect_to: {'$in': frontier}, **restrict_search},
+                sort=[('public_id', CmdbObjectRelation.DAO_ASCENDING)],
+                limit=remaining
+            ))
+
+            frontier = []
+
+            for relation in level:
+                relation['hop'] = hop
+                linked_id = relation.get(connect_from)
+
+                if linked_id is not None and linked_id not in visited_ids:
+                    visited_ids.add(linked_id)
+                    frontier.append(linked_id)
+
+            relations += level
+
+        return relations
+
+
+    @staticmethod
+    def __exceeds_graph_lookup_limits(err: Exception) -> bool:
+        """
+        Checks if an error or one of its causes is a MongoDB error about the size limits of a $graphLookup
+
+        Args:
+            err (Exception): The raised error
+
+        Returns:
+            bool: True if the $graphLookup exceeded the document size or memory limits of MongoDB
+        """
+        while err is not None:
+            if isinstance(err, OperationFailure) and err.code in GRAPH_LOOKUP_LIMIT_CODES:
+                return True
+
+            err = err.__cause__
+
+        return False
+
 # --------------------------------------------------- CRUD - UPDATE -------------------------------------------------- #
 
     def update_object_relation(self, public_id:int, data: dict) -> None:
@@ -159,7 +434,13 @@ def update_object_relation(self, public_id:int, data: dict) -> None:
             ObjectRelationsManagerUpdateError: When the update operation fails
         """
         try:
-            self.update({'public_id':public_id}, CmdbObjectRelation.to_json(data))
+            object_relation = CmdbObjectRelation.to_json(data)
+            self.update({'public_id':public_id}, object_relation)
+
+            RelationGraphCache.apply_change(self.dbm,
+                                            self.db_name,
+                                            removed_ids=[public_id],
+                                            added_relations=[{**object_relation, 'public_id': public_id}])
         except Exception as err:
             LOGGER.error("[update_object_relation] Exception: %s. Type: %s", err, type(err))
             raise ObjectRelationsManagerUpdateError(err) from err
@@ -180,10 +461,46 @@ def delete_object_relation(self, public_id: int) -> bool:
             bool: True if deletion was successful
         """
         try:
-            return self.delete({'public_id':public_id})
+            deleted = self.delete({'public_id':public_id})
+
+            if deleted:
+                RelationGraphCache.apply_change(self.dbm, self.db_name, removed_ids=[public_id])
+
+            return deleted
         except BaseManagerDeleteError as err:
             raise ObjectRelationsManagerDeleteError(err) from err
 
+
+    def delete_relations_of_objects(self, object_ids: list[int]) -> list[dict]:
+        """
+        Deletes all CmdbObjectRelations where one of the given CmdbObjects is the parent or child
+
+        Args:
+            object_ids (list[int]): public_ids of the CmdbObjects
+
+        Raises:
+            ObjectRelationsManagerDeleteError: When the CmdbObjectRelations could not be retrieved or deleted
+
+        Returns:
+            list[dict]: The deleted CmdbObjectRelations
+        """
+        try:
+            relations_query = {
+                '$or': [{'relation_parent_id': {'$in': object_ids}}, {'relation_child_id': {'$in': object_ids}}]
+            }
+
+            deleted_object_relations = self.find_all(criteria=relations_query)
+
+            if deleted_object_relations:
+                deleted_ids = [relation['public_id'] for relation in deleted_object_relations]
+
+                self.delete_many({'public_id': {'$in': deleted_ids}})
+                RelationGraphCache.apply_change(self.dbm, self.db_name, removed_ids=deleted_ids)
+
+            return deleted_object_relations
+        except (BaseManagerGetError, BaseManagerDeleteError) as err:
+            raise ObjectRelationsManagerDeleteError(err) from err
+
 # -------------------------------------------------- HELPER METHODS -------------------------------------------------- #
 
     def delete_invalidated_object_relations(
@@ -215,6 +532,10 @@ def delete_invalidated_object_relations(
         for invalid_object_relation in invalid_object_relations:
             self.delete({"public_id": invalid_object_relation['public_id']})
 
+        if invalid_object_relations:
+            invalid_ids = [invalid_object_relation['public_id'] for invalid_object_relation in invalid_object_relations]
+            RelationGraphCache.apply_change(self.dbm, self.db_name, removed_ids=invalid_ids)
+
 
     def update_changed_fields(self, relation_id: int, changed_fields: dict) -> None:
         """
@@ -27,6 +27,7 @@
 from cmdb.manager.query_builder import Builder
 from cmdb.manager.query_builder import BuilderParameters
 from cmdb.manager.base_manager import BaseManager
+from cmdb.manager.logs_manager import LogsManager
 
 from cmdb.models.object_model import CmdbObject
 from cmdb.models.object_group_model import ObjectReferenceType
@@ -712,7 +713,7 @@ def delete_with_follow_up(
             permission: AccessControlPermission = None) -> None:
         """
         Deletes a CmdbObject by its public_id after verifying access and type status and also deletes
-        RiskAssessments using this Object!
+        RiskAssessments using this Object! The logs of the object are flagged as logs of a deleted object
 
         Args:
             public_id (int): public_id of the CmdbObject which should be deleted
@@ -728,7 +729,72 @@ def delete_with_follow_up(
         """
         self.delete_object_from_risk_assessment_cascade(public_id)
 
-        return self.delete_object(public_id, user, permission)
+        deleted = self.delete_object(public_id, user, permission)
+
+        if deleted:
+            try:
+                LogsManager(self.dbm, self.db_name).mark_objects_deleted([public_id])
+            except BaseManagerUpdateError as err:
+                LOGGER.error("[delete_with_follow_up] Logs of Object-ID: %s not flagged as deleted: %s", public_id, err)
+
+        return deleted
+
+
+    def delete_many_with_follow_up(
+            self,
+            public_ids: list[int],
+            user: CmdbUser = None,
+            permission: AccessControlPermission = None) -> int:
+        """
+        Deletes multiple CmdbObjects with a single delete operation after verifying access and type status of
+        each involved CmdbType once. RiskAssessments using these Objects are deleted and the logs of the objects
+        are flagged as logs of deleted objects
+
+        Args:
+            public_ids (list[int]): public_ids of the CmdbObjects which should be deleted
+            user (CmdbUser, optional): The CmdbUser requesting deletion
+            permission (AccessControlPermission, optional): The required permission for deletion
+
+        Raises:
+            AccessDeniedError: If a type is deactivated or the user lacks permission, nothing is deleted then
+            ObjectsManagerDeleteError: If any issue occurs during retrieval or deletion
+
+        Returns:
+            int: Number of deleted CmdbObjects
+        """
+        try:
+            type_ids = self.dbm.get_collection(self.collection, self.db_name).distinct(
+                'type_id',
+                {'public_id': {'$in': public_ids}}
+            )
+
+            for type_id in type_ids:
+                object_type = self.get_object_type(type_id)
+
+                if not object_type.active:
+                    raise AccessDeniedError(
+                        f'Objects cannot be removed because type `{object_type.name}` is deactivated.'
+                    )
+
+                verify_access(object_type, user, permission)
+
+            self.delete_objects_from_risk_assessment_cascade(public_ids)
+
+            deleted_count = self.delete_many({'public_id': {'$in': public_ids}}).deleted_count
+        except AccessDeniedError as err:
+            raise err
+        except (ObjectsManagerGetError, BaseManagerDeleteError) as err:
+            raise ObjectsManagerDeleteError(err) from err
+        except Exception as err:
+            LOGGER.error("[delete_many_with_follow_up] Exception: %s, Type: %s", err, type(err))
+            raise ObjectsManagerDeleteError(err) from err
+
+        try:
+            LogsManager(self.dbm, self.db_name).mark_objects_deleted(public_ids)
+        except BaseManagerUpdateError as err:
+            LOGGER.error("[delete_many_with_follow_up] Logs of deleted Objects not flagged as deleted: %s", err)
+
+        return deleted_count
 
 
     def delete_all_object_references(self, public_id: int) -> None:
@@ -774,6 +840,40 @@ def delete_all_object_references(self, public_id: int) -> None:
             LOGGER.error("[delete_all_object_references] Exception: %s, Type: %s", err, type(err))
             raise ObjectsManagerDeleteError(err) from err
 
+
+    def delete_all_references_to_objects(self, public_ids: list[int]) -> None:
+        """
+        Clears all reference fields of active CmdbObjects which point to one of the given CmdbObjects
+        with a single update operation
+
+        Args:
+            public_ids (list[int]): public_ids of the CmdbObjects whose references should be deleted
+
+        Raises:
+            ObjectsManagerDeleteError: If the references could not be cleared
+        """
+        try:
+            is_deleted_reference = {'$and': [
+                {'$eq': [{'$substrCP': ['$$field.name', 0, 4]}, 'ref-']},
+                {'$in': ['$$field.value', public_ids]}
+            ]}
+
+            self.update_many(
+                {
+                    'active': True,
+                    'public_id': {'$nin': public_ids},
+                    'fields': {'$elemMatch': {'name': {'$regex': '^ref-'}, 'value': {'$in': public_ids}}}
+                },
+                [{'$set': {'fields': {'$map': {
+                    'input': '$fields',
+                    'as': 'field',
+                    'in': {'$cond': [is_deleted_reference, {'$mergeObjects': ['$$field', {'value': ''}]}, '$$field']}
+                }}}}],
+                plain=True
+            )
+        except BaseManagerUpdateError as err:
+            raise ObjectsManagerDeleteError(err) from err
+
 # ------------------------------------------------- HELPER FUNCTIONS ------------------------------------------------- #
 
     def delete_object_from_risk_assessment_cascade(self, deleted_object_id: int) -> None:
@@ -790,10 +890,21 @@ def delete_object_from_risk_assessment_cascade(self, deleted_object_id: int) ->
         Args:
             deleted_group_id (int): The public_id of the deleted CmdbObjectGroup
         """
-        # Find all RiskAssessments referencing this Object
+        self.delete_objects_from_risk_assessment_cascade([deleted_object_id])
+
+
+    def delete_objects_from_risk_assessment_cascade(self, deleted_object_ids: list[int]) -> None:
+        """
+        Deletes all RiskAssessments and their associated ControlMeasureAssignments that reference
+        one of the given CmdbObjects
+
+        Args:
+            deleted_object_ids (list[int]): The public_ids of the deleted CmdbObjects
+        """
+        # Find all RiskAssessments referencing these Objects
         risk_assessment_query = {
             'object_id_ref_type': ObjectReferenceType.OBJECT,
-            'object_id': deleted_object_id
+            'object_id': {'$in': deleted_object_ids}
         }
 
         matching_risk_assessments = list(self.dbm.find(
@@ -816,6 +927,7 @@ def delete_object_from_risk_assessment_cascade(self, deleted_object_id: int) ->
                 self.db_name,
                 **{'public_id': {'$in': risk_assessment_ids}},
             )
+            self.increase_generation(IsmsRiskAssessment.COLLECTION)
 
             # Delete all ControlMeasureAssignments referencing those RiskAssessments
             self.dbm.delete_many(
@@ -925,58 +1037,119 @@ def get_summary_line(self, public_id: int, with_type: bool = True) -> str:
             str: The summary line of the CmdbObject
         """
         try:
-            default_line = ""
-
             if not public_id:
-                return default_line
+                return ""
 
             target_object = self.get_object(public_id)
 
             if not target_object:
-                return default_line
+                return ""
+
+            target_object_type = self.get_object_type(target_object.get('type_id'))
 
-            object_type_id = target_object.get('type_id')
+            return self.__build_summary_line(target_object, target_object_type, with_type)
+        except Exception as err:
+            raise ObjectsManagerSummaryLineError(err) from err
 
-            target_object_type = self.get_object_type(object_type_id)
 
-            if not target_object_type:
-                return default_line
+    def get_summary_lines(self, public_ids: list[int], with_type: bool = True) -> dict[int, str]:
+        """
+        Retrieves the summary lines of multiple CmdbObjects. The CmdbObjects and their CmdbTypes are loaded with
+        one query each instead of two queries per CmdbObject like in 'get_summary_line()'
 
-            if with_type:
-                default_line = f"{target_object_type.label} #{target_object.get('public_id')}"
-            else:
-                default_line = f"#{target_object.get('public_id')}"
+        Args:
+            public_ids (list[int]): public_ids of the CmdbObjects
+            with_type (bool): If True then the Type label should be part of the summary lines
 
-            if not target_object_type.has_summaries():
-                return default_line
+        Raises:
+            ObjectsManagerSummaryLineError: If the summary lines could not be retrieved
 
-            summary_line = default_line
+        Returns:
+            dict[int, str]: The summary line per public_id, an empty string for unknown CmdbObjects
+        """
+        try:
+            public_ids = list({public_id for public_id in public_ids if public_id})
 
-            try:
-                summary_fields = target_object_type.get_summary().fields
-                first = True
-
-                line:dict
-                for line in summary_fields:
-                    field_name = line.get('name')
-                    field_value = next(
-                        (field['value'] for field in target_object['fields'] if field['name'] == field_name), None
-                    )
+            if not public_ids:
+                return {}
+
+            target_objects = self.find_all(
+                criteria={'public_id': {'$in': public_ids}},
+                projection={'_id': 0, 'public_id': 1, 'type_id': 1, 'fields': 1}
+            )
+
+            type_ids = list({target_object.get('type_id') for target_object in target_objects})
 
-                    if first:
-                        summary_line += f' - {field_value}'
-                        first = False
-                    else:
-                        summary_line += f' | {field_value}'
-            except Exception as err:
-                LOGGER.debug(
-                    "Failed to build summary line for Object-ID: %s and Type-ID: %s. Error: %s!",
-                    target_object.get('public_id'),
-                    target_object_type.public_id,
-                    err
+            target_object_types = {
+                object_type['public_id']: CmdbType.from_data(object_type)
+                for object_type in self.get_many_from_other_collection(
+                    CmdbType.COLLECTION,
+                    public_id={'$in': type_ids}
                 )
-                summary_line = default_line
+            }
 
-            return summary_line
+            summary_lines = dict.fromkeys(public_ids, "")
+
+            for target_object in target_objects:
+                target_object_type = target_object_types.get(target_object.get('type_id'))
+
+                summary_lines[target_object['public_id']] = self.__build_summary_line(target_object,
+                                                                                      target_object_type,
+                                                                                      with_type)
+
+            return summary_lines
         except Exception as err:
             raise ObjectsManagerSummaryLineError(err) from err
+
+
+    def __build_summary_line(self, target_object: dict, target_object_type: CmdbType, with_type: bool) -> str:
+        """
+        Builds the summary line of a CmdbObject from its summary fields
+
+        Args:
+            target_object (dict): The CmdbObject
+            target_object_type (CmdbType): The CmdbType of the CmdbObject
+            with_type (bool): If True then the Type label should be part of the summary line
+
+        Returns:
+            str: The summary line of the CmdbObject, an empty string if the CmdbType is missing
+        """
+        if not target_object_type:
+            return ""
+
+        if with_type:
+            default_line = f"{target_object_type.label} #{target_object.get('public_id')}"
+        else:
+            default_line = f"#{target_object.get('public_id')}"
+
+        if not target_object_type.has_summaries():
+            return default_line
+
+        summary_line = default_line
+
+        try:
+            summary_fields = target_object_type.get_summary().fields
+            first = True
+
+            line:dict
+            for line in summary_fields:
+                field_name = line.get('name')
+                field_value = next(
+                    (field['value'] for field in target_object['fields'] if field['name'] == field_name), None
+                )
+
+                if first:
+                    summary_line += f' - {field_value}'
+                    first = False
+                else:
+                    summary_line += f' | {field_value}'
+        except Exception as err:
+            LOGGER.debug(
+                "Failed to build summary line for Object-ID: %s and Type-ID: %s. Error: %s!",
+                target_object.get('public_id'),
+                target_object_type.public_id,
+                err
+            )
+            summary_line = default_line
+
+        return summary_line
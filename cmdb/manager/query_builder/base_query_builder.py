@@ -164,7 +164,8 @@ def __init_query(self, criteria: Union[dict, list[dict]], object_builder_mode: b
 
     def prepare_log_query(self, object_exists: bool = True) -> list[dict]:
         """
-        Prepares the query for logs
+        Prepares the query for logs. Logs are flagged with 'object_deleted' when their object is deleted, so the
+        query can use the index on 'log_type', 'object_deleted' and 'log_time' instead of a lookup of the objects
 
         Args:
             object_exists (bool): If the referenced object of the log still exists
@@ -172,25 +173,10 @@ def prepare_log_query(self, object_exists: bool = True) -> list[dict]:
         Returns:
             list[dict]: the prepared query for object logs
         """
-        query = []
-
-        query.append({'$match': {
+        return [{'$match': {
             'log_type': CmdbObjectLog.__name__,
+            'object_deleted': not object_exists,
             'action': {
                 '$ne': LogAction.DELETE.value
             }
-        }})
-
-        query.append({
-            "$lookup": {
-                "from": "framework.objects",
-                "localField": "object_id",
-                "foreignField": "public_id",
-                "as": "object"
-            }
-        })
-
-        query.append({'$unwind': {'path': '$object', 'preserveNullAndEmptyArrays': True}})
-        query.append({'$match': {'object': {'$exists': object_exists}}})
-
-        return query
+        }}]
@@ -22,7 +22,7 @@
 from cmdb.models.right_model.base_right import BaseRight
 from cmdb.framework.results import IterationResult
 
-from cmdb.models.right_model.all_rights import ALL_RIGHTS
+from cmdb.models.right_model.all_rights import FLAT_RIGHTS
 
 from cmdb.errors.manager.rights_manager import (
     RightsManagerInitError,
@@ -54,7 +54,7 @@ def __init__(self):
             RightsManagerInitError: If the RightsManager could not be initialised
         """
         try:
-            self.rights = RightsManager.flat_tree(ALL_RIGHTS)
+            self.rights = FLAT_RIGHTS
 
             super().__init__()
         except Exception as err:
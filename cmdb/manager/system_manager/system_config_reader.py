@@ -17,10 +17,17 @@
 Implementation of SystemConfigReader
 """
 import os
+import logging
+from typing import Optional
 
 from cmdb.manager.system_manager.config_file_reader import ConfigFileReader
+from cmdb.utils.cast import auto_cast
+
+from cmdb.errors.system_config import SectionError
 # -------------------------------------------------------------------------------------------------------------------- #
 
+LOGGER = logging.getLogger(__name__)
+
 # -------------------------------------------------------------------------------------------------------------------- #
 #                                              SystemConfigReader - CLASS                                              #
 # -------------------------------------------------------------------------------------------------------------------- #
@@ -51,3 +58,33 @@ def __getattr__(self, name):
 
     def __setattr__(self, name, value):
         return setattr(self.instance, name, value)
+
+
+def get_section_options(section_name: str, default_options: dict) -> Optional[dict]:
+    """
+    Reads the options of an optional section of the config file and casts them to the types of their defaults
+
+    Args:
+        section_name (str): Name of the section
+        default_options (dict): The options with their default values
+
+    Returns:
+        Optional[dict]: The valid options of the section, None if the section does not exist
+    """
+    try:
+        section = SystemConfigReader().get_all_values_from_section(section_name)
+    except SectionError:
+        return None
+
+    options = {}
+
+    for name, default_value in default_options.items():
+        if name not in section:
+            continue
+
+        try:
+            options[name] = type(default_value)(auto_cast(section[name]))
+        except (TypeError, ValueError):
+            LOGGER.warning("Invalid option '%s' in [%s], using default: %s", name, section_name, default_value)
+
+    return options
@@ -0,0 +1,374 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module contains the implementation of the WebhookDeliveriesManager
+"""
+import logging
+from typing import Optional
+from datetime import datetime, timedelta, timezone
+from bson import ObjectId
+from pymongo import InsertOne, ReturnDocument
+
+from cmdb.database import MongoDatabaseManager
+from cmdb.manager.base_manager import BaseManager
+
+from cmdb.models.webhook_model.cmdb_webhook_model import CmdbWebhook
+from cmdb.models.webhook_model.cmdb_webhook_delivery import CmdbWebhookDelivery
+
+from cmdb.errors.manager import (
+    BaseManagerInsertError,
+    BaseManagerGetError,
+    BaseManagerUpdateError,
+    BaseManagerDeleteError,
+)
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                           WebhookDeliveriesManager - CLASS                                           #
+# -------------------------------------------------------------------------------------------------------------------- #
+class WebhookDeliveriesManager(BaseManager):
+    """
+    The WebhookDeliveriesManager handles the outbox of webhook events which are delivered by the
+    WebhookDeliveryService
+    Extends: BaseManager
+    """
+
+    def __init__(self, dbm: MongoDatabaseManager, database:str = None):
+        """
+        Set the database connection for the outbox
+
+        Args:
+            dbm (MongoDatabaseManager): Database connection
+        """
+        super().__init__(CmdbWebhookDelivery.COLLECTION, dbm, database)
+
+# --------------------------------------------------- CRUD - CREATE -------------------------------------------------- #
+
+    def enqueue_deliveries(self, webhooks: list[CmdbWebhook], payload: dict, object_id: int = None) -> None:
+        """
+        Writes one delivery of the payload per webhook into the outbox
+
+        Deliveries of batching webhooks are delayed by the batch_window of the webhook. As soon as a webhook has
+        collected batch_size pending deliveries they are released immediately
+
+        Args:
+            webhooks (list[CmdbWebhook]): The webhooks which should receive the payload
+            payload (dict): The event payload
+            object_id (int, optional): public_id of the CmdbObject of the event
+
+        Raises:
+            BaseManagerInsertError: If the deliveries could not be written to the outbox
+        """
+        if not webhooks:
+            return
+
+        try:
+            now = datetime.now(timezone.utc)
+
+            operations = []
+            for webhook in webhooks:
+                next_attempt = now
+
+                if webhook.is_batching():
+                    next_attempt = now + timedelta(seconds=webhook.batch_window)
+
+                operations.append(InsertOne({
+                    'webhook_id': webhook.public_id,
+                    'url': webhook.url,
+                    'object_id': object_id,
+                    'payload': payload,
+                    'batch_size': webhook.batch_size,
+                    'status': CmdbWebhookDelivery.STATUS_PENDING,
+                    'attempts': 0,
+                    'next_attempt': next_attempt,
+                    'creation_time': now,
+                }))
+
+            self.dbm.bulk_write(self.collection, self.db_name, operations)
+
+            for webhook in webhooks:
+                if webhook.is_batching():
+                    self.__release_full_batch(webhook, now)
+        except Exception as err:
+            LOGGER.error("[enqueue_deliveries] Exception: %s. Type: %s", err, type(err))
+            raise BaseManagerInsertError(err) from err
+
+
+# ---------------------------------------------------- CRUD - READ --------------------------------------------------- #
+
+    def claim_due_delivery(self, excluded_urls: list[str] = None) -> Optional[dict]:
+        """
+        Atomically marks the oldest due delivery as processing and returns it
+
+        Args:
+            excluded_urls (list[str], optional): Endpoints for which no delivery should be claimed
+
+        Raises:
+            BaseManagerGetError: If the outbox could not be queried
+
+        Returns:
+            Optional[dict]: The claimed delivery or None if no delivery is due
+        """
+        try:
+            now = datetime.now(timezone.utc)
+
+            criteria = {
+                'status': CmdbWebhookDelivery.STATUS_PENDING,
+                'next_attempt': {'$lte': now},
+            }
+
+            if excluded_urls:
+                criteria['url'] = {'$nin': list(excluded_urls)}
+
+            return self.dbm.get_collection(self.collection, self.db_name).find_one_and_update(
+                criteria,
+                {'$set': {'status': CmdbWebhookDelivery.STATUS_PROCESSING, 'claim_time': now}},
+                sort=[('next_attempt', CmdbWebhookDelivery.DAO_ASCENDING)],
+                return_document=ReturnDocument.AFTER,
+            )
+        except Exception as err:
+            LOGGER.error("[claim_due_delivery] Exception: %s. Type: %s", err, type(err))
+            raise BaseManagerGetError(err) from err
+
+    def claim_batch_deliveries(self, webhook_id: int, limit: int) -> list[dict]:
+        """
+        Atomically marks the oldest pending deliveries of a webhook as processing, regardless of their batch window
+
+        Deliveries which already failed are only claimed once their retry is due, so the backoff is kept.
+        The batch is claimed with a single update which tags the deliveries with a claim token, so claiming a
+        batch costs a constant number of round trips regardless of its size
+
+        Args:
+            webhook_id (int): public_id of the CmdbWebhook
+            limit (int): Maximum number of deliveries which should be claimed
+
+        Raises:
+            BaseManagerGetError: If the outbox could not be queried
+
+        Returns:
+            list[dict]: The claimed deliveries
+        """
+        try:
+            collection = self.dbm.get_collection(self.collection, self.db_name)
+            now = datetime.now(timezone.utc)
+            claim_token = ObjectId()
+
+            criteria = {
+                'webhook_id': webhook_id,
+                'status': CmdbWebhookDelivery.STATUS_PENDING,
+                # Unattempted deliveries only wait for the batch window, which this batch ends early
+                '$or': [{'attempts': 0}, {'next_attempt': {'$lte': now}}],
+            }
+
+            candidate_ids = [
+                delivery['_id'] for delivery in collection.find(
+                    criteria,
+                    {'_id': 1},
+                    sort=[('creation_time', CmdbWebhookDelivery.DAO_ASCENDING)],
+                    limit=limit
+                )
+            ]
+
+            if not candidate_ids:
+                return []
+
+            # The criteria are repeated, deliveries claimed concurrently by another worker are skipped
+            collection.update_many(
+                {'_id': {'$in': candidate_ids}, **criteria},
+                {'$set': {
+                    'status': CmdbWebhookDelivery.STATUS_PROCESSING,
+                    'claim_time': now,
+                    'claim_token': claim_token,
+                }}
+            )
+
+            return list(collection.find(
+                {
+                    'webhook_id': webhook_id,
+                    'status': CmdbWebhookDelivery.STATUS_PROCESSING,
+                    'claim_token': claim_token,
+                },
+                sort=[('creation_time', CmdbWebhookDelivery.DAO_ASCENDING)]
+            ))
+        except Exception as err:
+            LOGGER.error("[claim_batch_deliveries] Exception: %s. Type: %s", err, type(err))
+            raise BaseManagerGetError(err) from err
+
+
+    def get_coalescable_delivery(self, webhook_id: int, object_id: int, operation: str) -> Optional[dict]:
+        """
+        Retrieves a pending delivery of a webhook for the same CmdbObject and operation which was not attempted yet
+
+        Args:
+            webhook_id (int): public_id of the CmdbWebhook
+            object_id (int): public_id of the CmdbObject
+            operation (str): The operation of the event
+
+        Raises:
+            BaseManagerGetError: If the outbox could not be queried
+
+        Returns:
+            Optional[dict]: The pending delivery if one exists
+        """
+        try:
+            return self.get_one_by({
+                'webhook_id': webhook_id,
+                'status': CmdbWebhookDelivery.STATUS_PENDING,
+                'attempts': 0,
+                'object_id': object_id,
+                'payload.operation': operation,
+            })
+        except Exception as err:
+            LOGGER.error("[get_coalescable_delivery] Exception: %s. Type: %s", err, type(err))
+            raise BaseManagerGetError(err) from err
+
+# --------------------------------------------------- CRUD - UPDATE -------------------------------------------------- #
+
+    def replace_pending_payload(self, delivery_id, payload: dict) -> bool:
+        """
+        Replaces the payload of a delivery as long as it was not claimed by the WebhookDeliveryService
+
+        Args:
+            delivery_id (ObjectId): The _id of the delivery
+            payload (dict): The new payload
+
+        Raises:
+            BaseManagerUpdateError: If the delivery could not be updated
+
+        Returns:
+            bool: True if the payload was replaced, False if the delivery is no longer pending
+        """
+        try:
+            result = self.dbm.get_collection(self.collection, self.db_name).update_one(
+                {'_id': delivery_id, 'status': CmdbWebhookDelivery.STATUS_PENDING},
+                {'$set': {'payload': payload}}
+            )
+
+            return result.matched_count == 1
+        except Exception as err:
+            LOGGER.error("[replace_pending_payload] Exception: %s. Type: %s", err, type(err))
+            raise BaseManagerUpdateError(err) from err
+
+
+    def release_delivery(
+            self,
+            delivery_id,
+            next_attempt: datetime = None,
+            attempts: int = None,
+            last_error: str = None) -> None:
+        """
+        Puts a claimed delivery back into the outbox
+
+        Args:
+            delivery_id (ObjectId): The _id of the delivery
+            next_attempt (datetime, optional): Earliest time of the next attempt, unchanged if not set
+            attempts (int, optional): Number of failed attempts, unchanged if not set
+            last_error (str, optional): Description of the last failed attempt
+
+        Raises:
+            BaseManagerUpdateError: If the delivery could not be updated
+        """
+        try:
+            update = {'status': CmdbWebhookDelivery.STATUS_PENDING}
+
+            if next_attempt:
+                update['next_attempt'] = next_attempt
+
+            if attempts is not None:
+                update['attempts'] = attempts
+
+            if last_error:
+                update['last_error'] = last_error
+
+            self.dbm.get_collection(self.collection, self.db_name).update_one(
+                {'_id': delivery_id},
+                {'$set': update, '$unset': {'claim_time': '', 'claim_token': ''}}
+            )
+        except Exception as err:
+            LOGGER.error("[release_delivery] Exception: %s. Type: %s", err, type(err))
+            raise BaseManagerUpdateError(err) from err
+
+
+    def release_stale_deliveries(self, claimed_before: datetime) -> int:
+        """
+        Puts deliveries back into the outbox which were claimed by a worker that stopped before finishing them
+
+        Args:
+            claimed_before (datetime): Deliveries claimed before this time are considered stale
+
+        Raises:
+            BaseManagerUpdateError: If the deliveries could not be updated
+
+        Returns:
+            int: Number of released deliveries
+        """
+        try:
+            result = self.dbm.get_collection(self.collection, self.db_name).update_many(
+                {
+                    'status': CmdbWebhookDelivery.STATUS_PROCESSING,
+                    'claim_time': {'$lt': claimed_before},
+                },
+                {
+                    '$set': {'status': CmdbWebhookDelivery.STATUS_PENDING},
+                    '$unset': {'claim_time': '', 'claim_token': ''}
+                }
+            )
+
+            return result.modified_count
+        except Exception as err:
+            LOGGER.error("[release_stale_deliveries] Exception: %s. Type: %s", err, type(err))
+            raise BaseManagerUpdateError(err) from err
+
+# --------------------------------------------------- CRUD - DELETE -------------------------------------------------- #
+
+    def delete_delivery(self, delivery_id) -> None:
+        """
+        Removes a finished delivery from the outbox
+
+        Args:
+            delivery_id (ObjectId): The _id of the delivery
+
+        Raises:
+            BaseManagerDeleteError: If the delivery could not be deleted
+        """
+        try:
+            self.dbm.get_collection(self.collection, self.db_name).delete_one({'_id': delivery_id})
+        except Exception as err:
+            LOGGER.error("[delete_delivery] Exception: %s. Type: %s", err, type(err))
+            raise BaseManagerDeleteError(err) from err
+
+# ------------------------------------------------------ HELPERS ----------------------------------------------------- #
+
+    def __release_full_batch(self, webhook: CmdbWebhook, now: datetime) -> None:
+        """
+        Makes the pending deliveries of a webhook due once they fill a whole batch
+
+        Args:
+            webhook (CmdbWebhook): The batching webhook
+            now (datetime): The current time
+        """
+        criteria = {
+            'webhook_id': webhook.public_id,
+            'status': CmdbWebhookDelivery.STATUS_PENDING,
+            'attempts': 0,
+        }
+
+        collection = self.dbm.get_collection(self.collection, self.db_name)
+
+        if collection.count_documents(criteria, limit=webhook.batch_size) >= webhook.batch_size:
+            collection.update_many(criteria, {'$min': {'next_attempt': now}})
@@ -17,15 +17,12 @@
 This module contains the implementation of the WebhooksManager
 """
 import logging
-import json
 from datetime import datetime, timezone
-import requests
 
 from cmdb.database import MongoDatabaseManager
-from cmdb.database.database_utils import default
 from cmdb.manager.query_builder import BuilderParameters
 from cmdb.manager.base_manager import BaseManager
-from cmdb.manager import WebhooksEventManager
+from cmdb.manager import WebhooksEventManager, WebhookDeliveriesManager
 
 from cmdb.models.webhook_model.cmdb_webhook_model import CmdbWebhook
 from cmdb.models.webhook_model.webhook_event_type_enum import WebhookEventType
@@ -53,6 +50,7 @@ def __init__(self, dbm: MongoDatabaseManager, database:str = None):
             dbm (MongoDatabaseManager): Database connection
         """
         self.webhooks_event_manager = WebhooksEventManager(dbm, database)
+        self.webhook_deliveries_manager = WebhookDeliveriesManager(dbm, database)
 
         super().__init__(CmdbWebhook.COLLECTION, dbm, database)
 
@@ -140,8 +138,8 @@ def send_webhook_event(
             object_after: dict = None,
             changes: dict = None) -> None:
         """
-        Sends a webhook event to all configured webhook endpoints that are subscribed 
-        to the specified operation type.
+        Queues a webhook event for all configured webhook endpoints that are subscribed
+        to the specified operation type. The event is delivered by the WebhookDeliveryService
 
         Args:
             operation (WebhookEventType, optional): The type of event operation (e.g., create, update, delete)
@@ -152,35 +150,23 @@ def send_webhook_event(
         """
         try:
             builder_params = BuilderParameters({})
-            webhooks: IterationResult[CmdbWebhook] = self.iterate(builder_params).results
+            webhooks: list[CmdbWebhook] = self.iterate(builder_params).results
+
+            # Only webhooks which registered the operation receive the event
+            webhooks = [webhook for webhook in webhooks if operation in webhook.event_types]
 
             if not webhooks:
                 return
 
-            # Check all webhooks
-            webhook: CmdbWebhook
-            for webhook in webhooks:
-                # Check if operation is registered in the webhook
-                if operation not in webhook.event_types:
-                    continue
-
-                payload = self.build_payload(operation, object_before, object_after, changes)
-
-                response: requests.Response = requests.post(
-                    webhook.url,
-                    data=json.dumps(payload, default=default, ensure_ascii=False, indent=2),
-                    headers={'Content-Type': 'application/json'},
-                    timeout=3,
-                )
-
-                payload.update({
-                    'public_id': self.webhooks_event_manager.get_next_public_id(),
-                    'webhook_id': webhook.public_id,
-                    'response_code': response.status_code,
-                    'status': response.status_code == 200
-                })
-
-                self.webhooks_event_manager.insert_webhook_event(payload)
+            payload = self.build_payload(operation, object_before, object_after, changes)
+            object_id = (object_after or object_before or {}).get('public_id')
+
+            # Updates of an object which are still waiting in a batch are merged into one event
+            if operation == WebhookEventType.UPDATE and object_id is not None:
+                webhooks = [webhook for webhook in webhooks
+                            if not (webhook.is_batching() and self.__coalesce_update(webhook, object_id, payload))]
+
+            self.webhook_deliveries_manager.enqueue_deliveries(webhooks, payload, object_id)
         except Exception as err:
             LOGGER.debug("[send_webhook_event] Exception: %s, Type: %s", err, type(err))
 
@@ -210,3 +196,63 @@ def build_payload(
             'object_after': object_after,
             'changes': changes,
         }
+
+
+    @staticmethod
+    def build_batch_payload(events: list[dict]) -> dict:
+        """
+        Constructs the payload dictionary for a batch of webhook events
+
+        Args:
+            events (list[dict]): The payloads of the single events created by `build_payload`
+
+        Returns:
+            dict: A dictionary containing the batched events which is sent to webhook endpoints
+        """
+        return {
+            'event_time': datetime.now(timezone.utc),
+            'operation': 'BATCH',
+            'events': events,
+        }
+
+
+    def __coalesce_update(self, webhook: CmdbWebhook, object_id: int, payload: dict) -> bool:
+        """
+        Merges an update event into a pending update event of the same object for a batching webhook
+
+        The merged event keeps the state before the first update and carries the latest state of the object
+
+        Args:
+            webhook (CmdbWebhook): The batching webhook
+            object_id (int): public_id of the updated object
+            payload (dict): Payload of the new update event
+
+        Returns:
+            bool: True if the event was merged, False if it has to be queued as new event
+        """
+        delivery = self.webhook_deliveries_manager.get_coalescable_delivery(
+            webhook.public_id,
+            object_id,
+            WebhookEventType.UPDATE
+        )
+
+        if not delivery:
+            return False
+
+        pending_payload = delivery['payload']
+        object_before = pending_payload.get('object_before')
+        object_after = payload.get('object_after')
+
+        changes = {**(pending_payload.get('changes') or {}), **(payload.get('changes') or {})}
+
+        # Field changes are recalculated between the first and the latest state
+        if object_before and object_after and ('old' in changes or 'new' in changes):
+            fields_before = object_before.get('fields', [])
+            fields_after = object_after.get('fields', [])
+
+            changes['old'] = [field for field in fields_before if field not in fields_after]
+            changes['new'] = [field for field in fields_after if field not in fields_before]
+
+        coalesced_payload = self.build_payload(WebhookEventType.UPDATE, object_before, object_after, changes)
+
+        return self.webhook_deliveries_manager.replace_pending_payload(delivery['_id'], coalesced_payload)
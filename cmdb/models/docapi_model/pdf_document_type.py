@@ -19,7 +19,6 @@
 import logging
 
 from io import BytesIO
-from xhtml2pdf import pisa
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
@@ -50,6 +49,10 @@ def create_doc(self, input_data: str) -> BytesIO:
         Returns:
             BytesIO: A file-like object containing the generated PDF data
         """
+        # xhtml2pdf pulls in reportlab and pyhanko, it is only imported when a PDF is rendered
+        #pylint: disable=import-outside-toplevel
+        from xhtml2pdf import pisa
+
         output = BytesIO()
 
         pisa.CreatePDF(input_data, dest=output, encoding='utf8')
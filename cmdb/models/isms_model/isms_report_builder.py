@@ -17,23 +17,36 @@
 Implementation of IsmsReportBuilder
 """
 import logging
+from copy import deepcopy
+from threading import Lock
 
 from cmdb.manager.extendable_options_manager import ExtendableOptionsManager
 from cmdb.manager.isms_manager.risk_matrix_manager import RiskMatrixManager
 from cmdb.manager.isms_manager.risk_assessment_manager import RiskAssessmentManager
 
 from cmdb.models.extendable_option_model import OptionType
+from cmdb.models.isms_model.isms_risk_assessment import IsmsRiskAssessment
+from cmdb.models.isms_model.isms_risk_matrix import IsmsRiskMatrix
 # -------------------------------------------------------------------------------------------------------------------- #
 
 LOGGER = logging.getLogger(__name__)
 
+# The matrices of the risk matrix report and the risk calculation of the IsmsRiskAssessments they are based on
+MATRIX_TYPES = ("before_treatment", "current_state", "after_treatment")
+
 # -------------------------------------------------------------------------------------------------------------------- #
 #                                               IsmsReportBuilder - CLASS                                              #
 # -------------------------------------------------------------------------------------------------------------------- #
 class IsmsReportBuilder:
     """
     Builds Reports for ISMS
+
+    The risk matrix report is cached per database until an IsmsRiskAssessment or the IsmsRiskMatrix changes, which
+    is detected with the generations of both collections
     """
+    _risk_matrix_reports: dict[str, tuple[tuple[int, int], dict]] = {}
+    _lock = Lock()
+
     def __init__(
             self,
             risk_assessment_manager: RiskAssessmentManager,
@@ -63,40 +76,44 @@ def build_risk_matrix_report(self) -> dict:
         Returns:
             dict: A dictionary containing the three matrices
         """
-        # Get all IsmsRiskAssessments
-        risk_assessments = self.risk_assessment_manager.find_all()
+        dbm = self.risk_assessment_manager.dbm
+        db_name = self.risk_assessment_manager.db_name
+
+        generations = (
+            dbm.get_collection_generation(IsmsRiskAssessment.COLLECTION, db_name),
+            dbm.get_collection_generation(IsmsRiskMatrix.COLLECTION, db_name),
+        )
+
+        with self._lock:
+            cached_report = self._risk_matrix_reports.get(db_name)
+
+        if cached_report and cached_report[0] == generations:
+            return deepcopy(cached_report[1])
 
         # Get the IsmsRiskMatrix
         risk_matrix_data = self.risk_matrix_manager.get_item(1, as_dict=True)
 
-        # Prepare the three matrices
-        before_treatment_matrix = self._build_matrix(risk_assessments, risk_matrix_data, "before_treatment")
-        current_state_matrix = self._build_matrix(risk_assessments, risk_matrix_data, "current_state")
-        after_treatment_matrix = self._build_matrix(risk_assessments, risk_matrix_data, "after_treatment")
+        # Sort all IsmsRiskAssessments into their (impact_id, likelihood_id) buckets of each matrix
+        buckets = self._bucket_risk_assessments()
 
-        # Return the matrices as a dictionary
-        return {
-            "risk_matrix_before_treatment": before_treatment_matrix,
-            "risk_matrix_current_state": current_state_matrix,
-            "risk_matrix_after_treatment": after_treatment_matrix
+        report = {
+            f"risk_matrix_{matrix_type}": self._build_matrix(buckets[matrix_type], risk_matrix_data)
+            for matrix_type in MATRIX_TYPES
         }
 
+        with self._lock:
+            self._risk_matrix_reports[db_name] = (generations, report)
 
-    def _build_matrix(
-            self,
-            risk_assessments: list[dict],
-            risk_matrix_data: dict,
-            matrix_type: str) -> list[dict]:
-        """
-        Builds a single matrix based on the given matrix type
+        return deepcopy(report)
 
-        Args:
-            risk_assessments (list[dict]): List of risk assessments to evaluate
-            risk_matrix_data (dict): Risk matrix data to map impacts and likelihoods
-            matrix_type (str): The type of matrix to build (before_treatment, current_state, after_treatment)
+
+    def _bucket_risk_assessments(self) -> dict[str, dict[tuple[int, int], list[int]]]:
+        """
+        Sorts the public_ids of all IsmsRiskAssessments in a single pass by their (maximum_impact_id, likelihood_id)
+        for each matrix type. IsmsRiskAssessments without an impact or likelihood are skipped
 
         Returns:
-            list: A list of dictionaries, each representing a matrix cell with counts and risk_assessment_ids
+            dict[str, dict[tuple[int, int], list[int]]]: The buckets of each matrix type
         """
         implemented_status_option = self.extendable_options_manager.get_one_by({
                 'value': 'Implemented',
@@ -106,46 +123,64 @@ def _build_matrix(
 
         implemented_status_id = implemented_status_option['public_id']
 
-        matrix = []
-
-        for cell_data in risk_matrix_data['risk_matrix']:
-            row = cell_data['row']
-            col = cell_data['column']
-            impact_id = cell_data['impact_id']
-            likelihood_id = cell_data['likelihood_id']
-
-            matrix_cell = {
-                'row': row,
-                'column': col,
-                'risk_class_id': cell_data['risk_class_id'],
-                'count': 0,
-                'risk_assessment_ids': []
+        risk_assessments = self.risk_assessment_manager.find(
+            projection={
+                '_id': 0,
+                'public_id': 1,
+                'implementation_status': 1,
+                'risk_calculation_before.maximum_impact_id': 1,
+                'risk_calculation_before.likelihood_id': 1,
+                'risk_calculation_after.maximum_impact_id': 1,
+                'risk_calculation_after.likelihood_id': 1,
             }
+        )
 
-            for risk_assessment in risk_assessments:
-                if matrix_type == "before_treatment":
-                    maximum_impact_id = risk_assessment['risk_calculation_before']['maximum_impact_id']
-                    likelihood_id_assessment = risk_assessment['risk_calculation_before']['likelihood_id']
-                elif matrix_type == "current_state":
-                    if risk_assessment.get('implementation_status') == implemented_status_id:
-                        maximum_impact_id = risk_assessment['risk_calculation_after']['maximum_impact_id']
-                        likelihood_id_assessment = risk_assessment['risk_calculation_after']['likelihood_id']
-                    else:
-                        maximum_impact_id = risk_assessment['risk_calculation_before']['maximum_impact_id']
-                        likelihood_id_assessment = risk_assessment['risk_calculation_before']['likelihood_id']
-                elif matrix_type == "after_treatment":
-                    maximum_impact_id = risk_assessment['risk_calculation_after']['maximum_impact_id']
-                    likelihood_id_assessment = risk_assessment['risk_calculation_after']['likelihood_id']
-                else:
-                    continue
+        buckets = {matrix_type: {} for matrix_type in MATRIX_TYPES}
 
-                if maximum_impact_id is None or likelihood_id_assessment is None:
+        for risk_assessment in risk_assessments:
+            before = risk_assessment.get('risk_calculation_before') or {}
+            after = risk_assessment.get('risk_calculation_after') or {}
+
+            before_key = (before.get('maximum_impact_id'), before.get('likelihood_id'))
+            after_key = (after.get('maximum_impact_id'), after.get('likelihood_id'))
+
+            if risk_assessment.get('implementation_status') == implemented_status_id:
+                current_key = after_key
+            else:
+                current_key = before_key
+
+            for matrix_type, key in zip(MATRIX_TYPES, (before_key, current_key, after_key)):
+                if key[0] is None or key[1] is None:
                     continue
 
-                if impact_id == maximum_impact_id and likelihood_id == likelihood_id_assessment:
-                    matrix_cell['count'] += 1
-                    matrix_cell['risk_assessment_ids'].append(risk_assessment['public_id'])
+                buckets[matrix_type].setdefault(key, []).append(risk_assessment['public_id'])
+
+        return buckets
+
+
+    def _build_matrix(self, buckets: dict[tuple[int, int], list[int]], risk_matrix_data: dict) -> list[dict]:
+        """
+        Builds a single matrix from the buckets of its matrix type
+
+        Args:
+            buckets (dict[tuple[int, int], list[int]]): public_ids of IsmsRiskAssessments per
+                                                        (impact_id, likelihood_id)
+            risk_matrix_data (dict): Risk matrix data to map impacts and likelihoods
+
+        Returns:
+            list: A list of dictionaries, each representing a matrix cell with counts and risk_assessment_ids
+        """
+        matrix = []
+
+        for cell_data in risk_matrix_data['risk_matrix']:
+            risk_assessment_ids = list(buckets.get((cell_data['impact_id'], cell_data['likelihood_id']), []))
 
-            matrix.append(matrix_cell)
+            matrix.append({
+                'row': cell_data['row'],
+                'column': cell_data['column'],
+                'risk_class_id': cell_data['risk_class_id'],
+                'count': len(risk_assessment_ids),
+                'risk_assessment_ids': risk_assessment_ids
+            })
 
         return matrix
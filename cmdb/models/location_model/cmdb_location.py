@@ -42,6 +42,12 @@ class CmdbLocation(CmdbDAO):
     MODEL = 'Location'
     DEFAULT_VERSION: str = '1.0.0'
     REQUIRED_INIT_KEYS = ['name', 'parent', 'object_id', 'type_id', 'type_label']
+    ROOT_ID = 1
+
+    INDEX_KEYS = [
+        {'keys': [('path', CmdbDAO.DAO_ASCENDING)], 'name': 'path'},
+        {'keys': [('parent', CmdbDAO.DAO_ASCENDING)], 'name': 'parent'},
+    ]
 
     SCHEMA: dict = {
         'public_id': {
@@ -72,6 +78,13 @@ class CmdbLocation(CmdbDAO):
             'type': 'boolean',
             'default': True
         },
+        'path': {
+            'type': 'list',
+            'schema': {
+                'type': 'integer'
+            },
+            'default': []
+        },
     }
 
 
@@ -84,7 +97,8 @@ def __init__(self,
                  type_id: int,
                  type_label: str,
                  type_icon: str = "fas fa-cube",
-                 type_selectable: bool = True):
+                 type_selectable: bool = True,
+                 path: list[int] = None):
         """
         Initialises a CmdbLocation
 
@@ -98,6 +112,7 @@ def __init__(self,
             type_icon (str): icon of CmdbType for which this CmdbLocation is set, default is 'fas fa-cube'
             type_selectable (bool): sets if this CmdbType is selectable as a parent for other CmdbLocations.
                                     Defaults to True
+            path (list[int]): public_ids of all ancestor CmdbLocations, starting with the root location
 
         Raises:
             CmdbLocationInitError: If the CmdbLocation could not be initialised
@@ -110,6 +125,7 @@ def __init__(self,
             self.type_label: str = type_label
             self.type_icon: str = type_icon
             self.type_selectable: bool = type_selectable
+            self.path: list[int] = path or []
 
             super().__init__(public_id=public_id)
         except Exception as err:
@@ -141,6 +157,7 @@ def from_data(cls, data: dict) -> "CmdbLocation":
                 type_label = data.get('type_label'),
                 type_icon = data.get('type_icon', 'fas fa-cube'),
                 type_selectable = data.get('type_selectable', True),
+                path = data.get('path', []),
             )
         except Exception as err:
             raise CmdbLocationInitFromDataError(err) from err
@@ -170,6 +187,7 @@ def to_json(cls, instance: "CmdbLocation") -> dict:
                 'type_label': instance.type_label,
                 'type_icon': instance.type_icon,
                 'type_selectable': instance.type_selectable,
+                'path': instance.path,
             }
         except Exception as err:
             raise CmdbLocationToJsonError(err) from err
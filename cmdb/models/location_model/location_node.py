@@ -46,32 +46,38 @@ def __init__(self, params: dict):
         self.children: list[LocationNode] = []
 
 
-    def get_children(self, public_id:int, locations_list: list[dict]) -> list['LocationNode']:
+    @classmethod
+    def build_tree(cls, parent_id: int, locations_list: list[dict]) -> list['LocationNode']:
         """
-        Recursively retrieve all children for a given location
+        Builds the location tree below a parent location with a single pass over all locations
 
         Args:
-            public_id (int): The public ID of the parent location
+            parent_id (int): The public ID of the parent location
             locations_list (list[dict]): List of all location entries
 
         Returns:
-            list[LocationNode]: A list of child LocationNode instances
+            list[LocationNode]: The child LocationNode instances of the parent with their subtrees
         """
-        sorted_children: list["LocationNode"] = []
-        filtered_list: list[dict] = []
+        nodes_by_parent: dict[int, list[LocationNode]] = {}
+
+        for location in locations_list:
+            nodes_by_parent.setdefault(location['parent'], []).append(cls(location))
+
+        top_nodes = nodes_by_parent.get(parent_id, [])
+        pending = list(top_nodes)
+        visited = {parent_id}
+
+        while pending:
+            node = pending.pop()
 
-        if len(locations_list) > 0:
-            for location in locations_list:
-                if location['parent'] == public_id:
-                    sorted_children.append(LocationNode(location))
-                else:
-                    filtered_list.append(location)
+            if node.public_id in visited:
+                continue
 
-            if len(filtered_list) > 0:
-                for child in sorted_children:
-                    child.children = self.get_children(child.get_public_id(), filtered_list)
+            visited.add(node.public_id)
+            node.children = nodes_by_parent.get(node.public_id, [])
+            pending.extend(node.children)
 
-        return sorted_children
+        return top_nodes
 
 
     def get_public_id(self) -> int:
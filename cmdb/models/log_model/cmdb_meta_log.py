@@ -33,6 +33,21 @@ class CmdbMetaLog(CmdbDAO):
     COLLECTION = 'framework.logs'
     MODEL = 'CmdbLog'
 
+    INDEX_KEYS = [
+        {
+            'keys': [('object_id', CmdbDAO.DAO_ASCENDING), ('public_id', CmdbDAO.DAO_ASCENDING)],
+            'name': 'object_id_public_id'
+        },
+        {
+            'keys': [
+                ('log_type', CmdbDAO.DAO_ASCENDING),
+                ('object_deleted', CmdbDAO.DAO_ASCENDING),
+                ('log_time', CmdbDAO.DAO_ASCENDING)
+            ],
+            'name': 'log_type_object_deleted_log_time'
+        }
+    ]
+
     #pylint: disable=too-many-positional-arguments
     def __init__(self, public_id: int, log_type, log_time: datetime, action: LogAction, action_name: str):
         """
@@ -75,6 +75,10 @@ class CmdbObjectLog(CmdbMetaLog):
         'action_name': {
             'type': 'string',
             'required': True
+        },
+        'object_deleted': {
+            'type': 'boolean',
+            'default': False
         }
     }
 
@@ -92,7 +96,8 @@ def __init__(self,
                  user_name: str = None,
                  changes: list = None,
                  comment: str = None,
-                 render_state=None):
+                 render_state=None,
+                 object_deleted: bool = False):
         """
         Initializes a new instance of the CmdbObjectLog class,
         representing a log entry for changes made to a CMDB object.
@@ -111,6 +116,7 @@ def __init__(self,
             changes (list, optional): List detailing the specific changes made to the object
             comment (str, optional): Additional comments or notes regarding the log entry
             render_state (optional): Optional rendering state or snapshot of the object at the time of the log
+            object_deleted (bool, optional): If the object of the log was deleted. Defaults to False
         """
         self.object_id = object_id
         self.version = version
@@ -119,6 +125,7 @@ def __init__(self,
         self.comment = comment
         self.changes = changes or []
         self.render_state = render_state
+        self.object_deleted = object_deleted
 
         super().__init__(
             public_id=public_id,
@@ -145,6 +152,7 @@ def from_data(cls, data: dict) -> "CmdbObjectLog":
             comment=data.get('comment', None),
             action=data.get('action', None),
             action_name=data.get('action_name', None),
+            object_deleted=data.get('object_deleted', False),
         )
 
 
@@ -165,5 +173,6 @@ def to_json(cls, instance: "CmdbObjectLog") -> dict:
             'render_state': instance.render_state,
             'changes': instance.changes,
             'comment': instance.comment,
-            'action_name': instance.action_name
+            'action_name': instance.action_name,
+            'object_deleted': instance.object_deleted
         }
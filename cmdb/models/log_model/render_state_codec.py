@@ -0,0 +1,189 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of RenderStateCodec
+"""
+import copy
+import json
+import zlib
+import logging
+from typing import Any
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                               RenderStateCodec - CLASS                                               #
+# -------------------------------------------------------------------------------------------------------------------- #
+class RenderStateCodec:
+    """
+    Encodes the render_state of CmdbObjectLogs for storage
+
+    Every SNAPSHOT_INTERVAL versions of an object the full state is stored as compressed snapshot. The logs in
+    between only store the compressed delta to the state of their base log, which is referenced by `render_base`.
+    Logs without `render_encoding` were written before and store the raw JSON of the state
+    """
+    SNAPSHOT = 'SNAPSHOT'
+    DELTA = 'DELTA'
+
+    SNAPSHOT_INTERVAL = 10
+    COMPRESSION_LEVEL = 6
+
+    SET = 's'
+
+# ----------------------------------------------------- ENCODING ----------------------------------------------------- #
+
+    @classmethod
+    def encode(cls, state: Any, base_id: int = None, base_state: Any = None, base_depth: int = 0) -> dict:
+        """
+        Encodes a render_state either as delta to the state of the base log or as snapshot
+
+        A snapshot is stored if there is no base, the maximum delta chain length is reached or the delta would
+        not be smaller than the snapshot
+
+        Args:
+            state (Any): The parsed render_state which should be stored
+            base_id (int, optional): public_id of the previous log of the object
+            base_state (Any, optional): The parsed render_state of the previous log
+            base_depth (int, optional): Number of deltas between the previous log and its snapshot
+
+        Returns:
+            dict: The fields `render_state`, `render_encoding`, `render_base` and `render_depth` of the log
+        """
+        snapshot = cls.compress(state)
+
+        if base_id is not None and base_state is not None and base_depth + 1 < cls.SNAPSHOT_INTERVAL:
+            delta = cls.compress(cls.diff(base_state, state))
+
+            if len(delta) < len(snapshot):
+                return {
+                    'render_state': delta,
+                    'render_encoding': cls.DELTA,
+                    'render_base': base_id,
+                    'render_depth': base_depth + 1,
+                }
+
+        return {
+            'render_state': snapshot,
+            'render_encoding': cls.SNAPSHOT,
+            'render_base': None,
+            'render_depth': 0,
+        }
+
+
+    @classmethod
+    def compress(cls, data: Any) -> bytes:
+        """
+        Serializes data to compact JSON and compresses it
+
+        Args:
+            data (Any): JSON conform data
+
+        Returns:
+            bytes: The compressed data
+        """
+        return zlib.compress(json.dumps(data, separators=(',', ':')).encode('UTF-8'), cls.COMPRESSION_LEVEL)
+
+
+    @classmethod
+    def diff(cls, base: Any, target: Any, path: list = None, operations: list = None) -> list:
+        """
+        Calculates the operations which transform the base into the target
+
+        Dicts with the same keys and lists with the same length are compared recursively, everything else is
+        replaced as a whole so that the key order of the target is kept
+
+        Args:
+            base (Any): The previous state
+            target (Any): The new state
+            path (list, optional): Path to the compared values
+            operations (list, optional): Collected operations
+
+        Returns:
+            list: Operations of the form [SET, path, value]
+        """
+        path = path or []
+        operations = [] if operations is None else operations
+
+        if isinstance(base, dict) and isinstance(target, dict) and list(base) == list(target):
+            for key, value in target.items():
+                cls.diff(base[key], value, path + [key], operations)
+        elif isinstance(base, list) and isinstance(target, list) and len(base) == len(target):
+            for index, value in enumerate(target):
+                cls.diff(base[index], value, path + [index], operations)
+        elif type(base) is not type(target) or base != target:
+            operations.append([cls.SET, path, target])
+
+        return operations
+
+# ----------------------------------------------------- DECODING ----------------------------------------------------- #
+
+    @classmethod
+    def decompress(cls, data: bytes) -> Any:
+        """
+        Decompresses and parses data created by `compress`
+
+        Args:
+            data (bytes): The compressed data
+
+        Returns:
+            Any: The parsed data
+        """
+        return json.loads(zlib.decompress(data))
+
+
+    @classmethod
+    def patch(cls, base: Any, operations: list) -> Any:
+        """
+        Applies the operations of a delta to a copy of the base
+
+        Args:
+            base (Any): The state of the base log
+            operations (list): Operations created by `diff`
+
+        Returns:
+            Any: The state after applying the operations
+        """
+        state = copy.deepcopy(base)
+
+        for operation in operations:
+            path = operation[1]
+
+            if not path:
+                state = copy.deepcopy(operation[2])
+                continue
+
+            parent = state
+            for key in path[:-1]:
+                parent = parent[key]
+
+            parent[path[-1]] = operation[2]
+
+        return state
+
+
+    @staticmethod
+    def to_raw(state: Any) -> bytes:
+        """
+        Serializes a parsed render_state to the raw format which is delivered to the clients
+
+        Args:
+            state (Any): The parsed render_state
+
+        Returns:
+            bytes: The JSON encoded render_state
+        """
+        return json.dumps(state).encode('UTF-8')
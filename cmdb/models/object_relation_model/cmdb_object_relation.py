@@ -48,6 +48,11 @@ class CmdbObjectRelation(CmdbDAO):
     MODEL = 'ObjectRelation'
     SCHEMA: dict = get_cmdb_object_relation_schema()
 
+    INDEX_KEYS = [
+        {'keys': [('relation_parent_id', CmdbDAO.DAO_ASCENDING)], 'name': 'relation_parent_id'},
+        {'keys': [('relation_child_id', CmdbDAO.DAO_ASCENDING)], 'name': 'relation_child_id'},
+    ]
+
     #pylint: disable=too-many-arguments
     #pylint: disable=too-many-locals
     def __init__(self,
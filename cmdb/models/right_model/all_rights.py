@@ -383,3 +383,7 @@ def flat_rights_tree(right_tree) -> list[BaseRight]:
             rights.append(right)
 
     return rights
+
+
+# ALL_RIGHTS as flat list, built once on import so that it is shared by all forked gunicorn workers
+FLAT_RIGHTS: list[BaseRight] = flat_rights_tree(ALL_RIGHTS)
@@ -0,0 +1,60 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module contains the implementation of CmdbWebhookDelivery, which is representing
+a pending delivery of a webhook event in the outbox of Datagerry
+"""
+import logging
+
+from cmdb.models.cmdb_dao import CmdbDAO
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                              CmdbWebhookDelivery - CLASS                                             #
+# -------------------------------------------------------------------------------------------------------------------- #
+class CmdbWebhookDelivery(CmdbDAO):
+    """
+    Implementation of CmdbWebhookDelivery
+
+    A delivery is written to the outbox when an event occurs and is removed by the WebhookDeliveryService
+    after the event was delivered to the webhook endpoint or all attempts failed. Deliveries are identified by
+    their ObjectId and therefore have no public_id
+
+    Deliveries of batching webhooks wait `batch_window` seconds in the outbox and are sent together with the
+    other pending deliveries of the same webhook
+
+    Extends: CmdbDAO
+    """
+    COLLECTION = 'framework.webhookDeliveries'
+    MODEL = 'Webhook_Delivery'
+
+    STATUS_PENDING = 'PENDING'
+    STATUS_PROCESSING = 'PROCESSING'
+
+    SUPER_INDEX_KEYS = []
+
+    INDEX_KEYS = [
+        {
+            'keys': [('status', CmdbDAO.DAO_ASCENDING), ('next_attempt', CmdbDAO.DAO_ASCENDING)],
+            'name': 'status_next_attempt',
+        },
+        {
+            'keys': [('webhook_id', CmdbDAO.DAO_ASCENDING), ('status', CmdbDAO.DAO_ASCENDING)],
+            'name': 'webhook_id_status',
+        }
+    ]
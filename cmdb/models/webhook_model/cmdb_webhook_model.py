@@ -63,6 +63,16 @@ class CmdbWebhook(CmdbDAO):
             'type': 'boolean',
             'default': True
         },
+        'batch_size': {
+            'type': 'integer',
+            'min': 1,
+            'default': 1
+        },
+        'batch_window': {
+            'type': 'integer',
+            'min': 0,
+            'default': 0
+        },
     }
 
 # ---------------------------------------------------- CONSTRUCTOR --------------------------------------------------- #
@@ -73,6 +83,8 @@ def __init__(
             url: str,
             event_types: list,
             active: bool,
+            batch_size: int = 1,
+            batch_window: int = 0,
             **kwargs):
         """
         Initializes a new instance of the CmdbWebhook class, representing a webhook configuration
@@ -82,6 +94,9 @@ def __init__(
             url (str): URL endpoint where the webhook will send events
             event_types (list): List of WebhookEventType values that the webhook listens for
             active (bool): Whether the webhook is currently active and should receive events
+            batch_size (int, optional): Maximum number of events which are sent in one payload. Events are
+                                        only batched if this is greater than 1. Defaults to 1
+            batch_window (int, optional): Seconds a batch collects events before it is sent. Defaults to 0
 
         Optional Args:
             **kwargs: Additional fields to pass to the superclass initializer
@@ -90,6 +105,8 @@ def __init__(
         self.url = url
         self.event_types = event_types
         self.active = active
+        self.batch_size = batch_size
+        self.batch_window = batch_window
 
         super().__init__(**kwargs)
 
@@ -106,6 +123,8 @@ def from_data(cls, data: dict) -> "CmdbWebhook":
             url=data.get('url'),
             event_types=data.get('event_types'),
             active=data.get('active'),
+            batch_size=data.get('batch_size', 1),
+            batch_window=data.get('batch_window', 0),
         )
 
 
@@ -118,4 +137,16 @@ def to_json(cls, instance: "CmdbWebhook") -> dict:
             'url': instance.url,
             'event_types': instance.event_types,
             'active': instance.active,
+            'batch_size': instance.batch_size,
+            'batch_window': instance.batch_window,
         }
+
+
+    def is_batching(self) -> bool:
+        """
+        Checks if the events of this webhook are sent in batches
+
+        Returns:
+            bool: True if the batch_size is greater than 1
+        """
+        return self.batch_size > 1
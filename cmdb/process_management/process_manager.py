@@ -61,6 +61,8 @@ def _initialize_service_definitions(self) -> list:
         """
         return [
             CmdbProcess("webapp", "cmdb.interface.gunicorn.WebCmdbService"),
+            CmdbProcess("webhooks", "cmdb.framework.webhooks.webhook_delivery_service.WebhookDeliveryService"),
+            CmdbProcess("retention", "cmdb.framework.retention.retention_service.LogRetentionService"),
         ]
 
 
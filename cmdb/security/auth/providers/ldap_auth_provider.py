@@ -19,8 +19,6 @@
 import logging
 import re
 from datetime import datetime, timezone
-from ldap3 import Server, Connection
-from ldap3.core.exceptions import LDAPExceptionError
 
 from cmdb.manager import (
     UsersManager,
@@ -69,6 +67,10 @@ def __init__(self,
             security_manager (SecurityManager, optional): The security manager instance
             users_manager (UsersManager, optional): The users manager instance
         """
+        # ldap3 is only imported when LDAP authentication is used
+        #pylint: disable=import-outside-toplevel
+        from ldap3 import Server, Connection
+
         self.__ldap_server = Server(**config.server_config)
         self.__ldap_connection = Connection(self.__ldap_server, **config.connection_config)
         super().__init__(config,
@@ -140,6 +142,10 @@ def authenticate(self, user_name: str, password: str) -> CmdbUser:
         Returns:
             CmdbUser: The authenticated CMDB user object
         """
+        #pylint: disable=import-outside-toplevel
+        from ldap3 import Connection
+        from ldap3.core.exceptions import LDAPExceptionError
+
         #TODO: REFACTOR-FIX
         try:
             ldap_connection_status = self.connect()
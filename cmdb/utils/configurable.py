@@ -0,0 +1,68 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of Configurable, the base of all components which are set up by an optional config file section
+"""
+import logging
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                 Configurable - CLASS                                                 #
+# -------------------------------------------------------------------------------------------------------------------- #
+class Configurable:
+    """
+    Base of the components which are set up by an optional section of the config file
+
+    Subclasses name their section in CONFIG_SECTION and define all their options with the default values in
+    DEFAULT_OPTIONS. The options are shared by all instances of a subclass in the process. Subclasses which need to
+    react to new options (e.g. create a directory) extend configure() and call it with super()
+    """
+    CONFIG_SECTION: str = None
+
+    DEFAULT_OPTIONS: dict = {}
+
+    _options: dict = {}
+
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._options = dict(cls.DEFAULT_OPTIONS)
+
+
+    @classmethod
+    def configure(cls, options: dict) -> None:
+        """
+        Sets the options of the class, unknown options are ignored and missing options get their default value
+
+        Args:
+            options (dict): Options of the CONFIG_SECTION of the config file
+        """
+        cls._options = {**cls.DEFAULT_OPTIONS,
+                        **{name: value for name, value in options.items() if name in cls.DEFAULT_OPTIONS}}
+
+
+    @classmethod
+    def is_active(cls) -> bool:
+        """
+        Checks if the component is enabled by its 'active' option
+
+        Returns:
+            bool: True if the component is active
+        """
+        return bool(cls._options.get('active', False))
+
@@ -0,0 +1,115 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Implementation of the startup profiler which reports the import times of the modules needed to start DataGerry
+"""
+import logging
+import os
+import re
+import subprocess
+import sys
+import time
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# Imports everything a worker of the web server needs, the app is set up in TESTING mode without a database
+STARTUP_CODE = """
+import cmdb
+cmdb.__MODE__ = 'TESTING'
+from cmdb.process_management.process_manager import ProcessManager
+from cmdb.interface.gunicorn import WebCmdbService
+from cmdb.interface.cmdb_app import BaseCmdbApp
+from cmdb.interface.rest_api.init_rest_api import register_blueprints
+app = BaseCmdbApp('cmdb')
+with app.app_context():
+    register_blueprints(app)
+"""
+
+# Line format of 'python -X importtime': 'import time: <self us> | <cumulative us> | <indentation><module>'
+IMPORT_TIME_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def profile_startup(limit: int = 30) -> list[dict]:
+    """
+    Starts a fresh interpreter with 'python -X importtime' which imports all modules needed to start DataGerry and
+    prints the modules with the highest cumulative import times
+
+    Args:
+        limit (int, optional): Number of modules which are printed. Defaults to 30
+
+    Returns:
+        list[dict]: Import times of all modules with 'module', 'self_ms', 'cumulative_ms' and 'top_level'
+    """
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.getcwd(), env.get('PYTHONPATH')]))
+
+    start = time.perf_counter()
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP_CODE],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+
+    total_ms = (time.perf_counter() - start) * 1000
+
+    if result.returncode != 0:
+        LOGGER.error("[profile_startup] Startup failed: %s", result.stderr[-2000:])
+
+    import_times = parse_import_times(result.stderr)
+    import_ms = sum(entry['cumulative_ms'] for entry in import_times if entry['top_level'])
+
+    print(f"Startup: {total_ms:.0f} ms, imports: {import_ms:.0f} ms in {len(import_times)} modules\n")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+
+    for entry in sorted(import_times, key=lambda entry: entry['cumulative_ms'], reverse=True)[:limit]:
+        print(f"{entry['cumulative_ms']:>14.1f} {entry['self_ms']:>9.1f}  {entry['module']}")
+
+    return import_times
+
+
+def parse_import_times(output: str) -> list[dict]:
+    """
+    Parses the output of 'python -X importtime'
+
+    Args:
+        output (str): stderr of the interpreter
+
+    Returns:
+        list[dict]: Import times of all modules with 'module', 'self_ms', 'cumulative_ms' and 'top_level'
+    """
+    import_times = []
+
+    for line in output.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+
+        if not match:
+            continue
+
+        self_us, cumulative_us, indentation, module = match.groups()
+
+        import_times.append({
+            'module': module,
+            'self_ms': int(self_us) / 1000,
+            'cumulative_ms': int(cumulative_us) / 1000,
+            'top_level': len(indentation) == 0,
+        })
+
+    return import_times
@@ -69,6 +69,7 @@ def pytest_addoption(parser):
 
 
 pytest_plugins = [
+    'tests.fixtures.fixture_config',
     'tests.fixtures.fixture_database',
     'tests.fixtures.fixture_management',
     'tests.fixtures.fixture_rest_api'
@@ -0,0 +1,67 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+This module defines pytest fixtures for replacing the config file of the components under test
+"""
+import logging
+import pytest
+
+from cmdb.manager.system_manager.config_file_reader import ConfigFileReader
+from cmdb.manager.system_manager.system_config_reader import SystemConfigReader, get_section_options
+
+from cmdb.utils.configurable import Configurable
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+@pytest.fixture(name="configure")
+def fixture_configure(request, monkeypatch):
+    """
+    Provides a function which replaces the config file with one containing the given options in the section of the
+    target. Configurable targets are set up from the section and get their default options back after the test
+
+    Args:
+        request (pytest.FixtureRequest): The request of the test
+        monkeypatch (pytest.MonkeyPatch): Replaces the config of the test
+
+    Returns:
+        Callable: Function taking the target class and its options
+    """
+    configured = set()
+
+    def configure(target: type, **options) -> None:
+        reader = ConfigFileReader(None, None)
+
+        if options:
+            reader.add_section(target.CONFIG_SECTION)
+
+            for name, value in options.items():
+                reader.set(target.CONFIG_SECTION, name, str(value))
+
+        monkeypatch.setattr(SystemConfigReader, 'instance', reader)
+
+        if issubclass(target, Configurable):
+            configured.add(target)
+            target.configure(get_section_options(target.CONFIG_SECTION, target.DEFAULT_OPTIONS) or {})
+
+    def restore_defaults() -> None:
+        for target in configured:
+            target.configure({})
+
+    request.addfinalizer(restore_defaults)
+
+    return configure
@@ -0,0 +1,116 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+BufferedLogWriter - Tests
+"""
+import time
+import logging
+from pytest import fixture, raises
+
+from cmdb.framework.log_writer.buffered_log_writer import BufferedLogWriter
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+DATABASE = 'log-writer-test'
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+class LogCollection:
+    """
+    Stand-in for the flush of the LogsManager which rejects every batch containing an invalid log
+    """
+
+    def __init__(self):
+        self.logs = []
+        self.flushes = []
+
+
+    def flush(self, _db_name: str, log_documents: list[dict]) -> list[int]:
+        """
+        Stores the logs like a bulk insert and encodes them like insert_logs() does
+        """
+        self.flushes.append(len(log_documents))
+
+        if any(log_document.get('invalid') for log_document in log_documents):
+            raise ValueError('invalid log')
+
+        public_ids = []
+
+        for log_document in log_documents:
+            log_document['public_id'] = len(self.logs) + 1
+            self.logs.append(log_document)
+            public_ids.append(log_document['public_id'])
+
+        return public_ids
+
+
+@fixture(name="log_writer")
+def fixture_log_writer(request):
+    """
+    Enables the strict BufferedLogWriter with batches collected over one second, the defaults are restored after
+    the test
+    """
+    BufferedLogWriter.configure({'buffered': True, 'strict': True, 'batch_size': 3, 'flush_interval': 1.0})
+
+    def cleanup():
+        writer = BufferedLogWriter.get_instance(None)
+        BufferedLogWriter.configure({})
+        writer.stop()
+
+    request.addfinalizer(cleanup)
+
+    return BufferedLogWriter
+
+
+class TestBufferedLogWriter:
+    """
+    Tests that the logs of a failed batch are not dropped and that queued logs can be flushed
+    """
+
+    def test_failed_batch_is_written_one_by_one(self, log_writer: BufferedLogWriter):
+        """
+        If a batch can not be written, its valid logs are still written and only the invalid log fails
+        """
+        collection = LogCollection()
+        writer = log_writer.get_instance(collection.flush)
+
+        written = [writer.enqueue(DATABASE, log_document)
+                   for log_document in ({'action': 1}, {'action': 2, 'invalid': True}, {'action': 3})]
+
+        assert written[0].result(timeout=5) == 1
+        assert written[2].result(timeout=5) == 2
+
+        with raises(ValueError):
+            written[1].result(timeout=5)
+
+        assert collection.flushes == [3, 1, 1, 1]
+        assert [log['action'] for log in collection.logs] == [1, 3]
+
+
+    def test_flush_writes_queued_logs(self, log_writer: BufferedLogWriter):
+        """
+        flush() returns once the logs queued before it were written, without waiting for the flush interval
+        """
+        collection = LogCollection()
+        writer = log_writer.get_instance(collection.flush)
+        started = time.monotonic()
+
+        writer.enqueue(DATABASE, {'action': 1})
+
+        assert writer.flush()
+        assert time.monotonic() - started < 1.0
+        assert [log['action'] for log in collection.logs] == [1]
@@ -0,0 +1,319 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+CircuitBreaker and retry_operation - Tests
+"""
+import time
+import logging
+from contextvars import copy_context
+from types import SimpleNamespace
+from pytest import fixture, raises
+from pymongo.errors import AutoReconnect, ExecutionTimeout, OperationFailure
+
+from cmdb.database import circuit_breaker, database_utils
+from cmdb.database.circuit_breaker import CircuitBreaker
+from cmdb.database.database_utils import MAX_RETRIES, retry_operation
+
+from cmdb.errors.database import DatabaseUnavailableError, DocumentGetError
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+FAILURE_THRESHOLD = 3
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def breaker_options(**options) -> dict:
+    """
+    Returns the [CircuitBreaker] options of the tests, the breakers open quickly and probe without delay
+    """
+    return {'failure_threshold': FAILURE_THRESHOLD, 'probe_interval': 0.01, **options}
+
+
+@fixture(name="sleeps")
+def fixture_sleeps(monkeypatch) -> list[float]:
+    """
+    Records the delays between the retries instead of sleeping, the probe threads of the breakers still sleep
+    """
+    sleeps = []
+    monkeypatch.setattr(database_utils, 'time', SimpleNamespace(monotonic=time.monotonic, sleep=sleeps.append))
+
+    return sleeps
+
+
+class DatabaseOperations:
+    """
+    Stand-in for a MongoDatabaseManager whose operation fails with the given errors before it succeeds
+    """
+
+    def __init__(self, errors: list[Exception]):
+        self.errors = errors
+        self.calls = 0
+        self.circuit_breaker = CircuitBreaker(lambda: None)
+
+
+    @retry_operation
+    def find(self) -> str:
+        """
+        Raises the next error or returns a result if all errors were raised
+        """
+        self.calls += 1
+
+        if self.errors:
+            raise self.errors.pop(0)
+
+        return 'result'
+
+
+    @retry_operation
+    def insert(self) -> str:
+        """
+        Calls the decorated find() like insert() calls get_next_public_id() of the MongoDatabaseManager
+        """
+        return self.find()
+
+
+def wait_until_closed(breaker: CircuitBreaker, timeout: float = 5.0) -> None:
+    """
+    Waits until the probe thread closed the breaker
+
+    Args:
+        breaker (CircuitBreaker): The open breaker
+        timeout (float, optional): Maximum time to wait in seconds. Defaults to 5.0
+    """
+    deadline = time.monotonic() + timeout
+
+    while breaker.is_open() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestCircuitBreaker:
+    """
+    Tests the state transitions of the CircuitBreaker
+    """
+
+    def test_open_and_close(self, configure):
+        """
+        The breaker opens at the failure threshold, rejects operations while it is open and is closed by the first
+        successful probe
+        """
+        configure(CircuitBreaker, **breaker_options())
+        probes = []
+
+        def probe():
+            probes.append(time.monotonic())
+
+            if len(probes) < 3:
+                raise AutoReconnect('still unavailable')
+
+        breaker = CircuitBreaker(probe)
+
+        for _ in range(FAILURE_THRESHOLD - 1):
+            breaker.record_failure()
+
+        assert breaker.get_state()['state'] == CircuitBreaker.CLOSED
+        breaker.allow()
+
+        breaker.record_failure()
+
+        assert breaker.is_open()
+        assert breaker.get_state()['opened_at'] is not None
+
+        with raises(DatabaseUnavailableError):
+            breaker.allow()
+
+        assert breaker.get_state()['rejected'] == 1
+
+        wait_until_closed(breaker)
+
+        assert not breaker.is_open()
+        assert len(probes) == 3
+        assert breaker.get_state()['failures'] == 0
+        breaker.allow()
+
+
+    def test_success_resets_failures(self, configure):
+        """
+        Only consecutive failures open the breaker
+        """
+        configure(CircuitBreaker, **breaker_options())
+        breaker = CircuitBreaker(lambda: None)
+
+        for _ in range(3 * FAILURE_THRESHOLD):
+            breaker.record_failure()
+            breaker.record_success()
+
+        assert breaker.get_state()['state'] == CircuitBreaker.CLOSED
+
+
+    def test_reset(self, configure):
+        """
+        A reset closes an open breaker immediately
+        """
+        configure(CircuitBreaker, **breaker_options(probe_interval=60.0))
+        breaker = CircuitBreaker(lambda: None)
+
+        for _ in range(FAILURE_THRESHOLD):
+            breaker.record_failure()
+
+        breaker.reset()
+
+        assert breaker.get_state()['state'] == CircuitBreaker.CLOSED
+        assert breaker.get_state()['opened_at'] is None
+
+
+    def test_connection_errors(self):
+        """
+        Connection failures are also detected if they were wrapped by the database layer
+        """
+        wrapped_error = DocumentGetError('Failed to retrieve documents')
+        wrapped_error.__cause__ = AutoReconnect('connection refused')
+
+        assert CircuitBreaker.is_connection_error(AutoReconnect('connection refused'))
+        assert CircuitBreaker.is_connection_error(wrapped_error)
+        assert not CircuitBreaker.is_connection_error(OperationFailure('duplicate key'))
+        assert not CircuitBreaker.is_connection_error(ValueError())
+
+
+class TestRetryOperation:
+    """
+    Tests the retries of database operations and their interaction with the CircuitBreaker
+    """
+
+    def test_retry_until_success(self, configure, sleeps):
+        """
+        A failed operation is retried with exponential backoff and a success resets the failures of the breaker
+        """
+        configure(CircuitBreaker, **breaker_options(max_retry_time=100.0))
+        operations = DatabaseOperations([AutoReconnect('failover'), AutoReconnect('failover')])
+
+        assert operations.find() == 'result'
+        assert operations.calls == 3
+        assert len(sleeps) == 2
+        assert 1.0 <= sleeps[0] <= 2.0 and 2.0 <= sleeps[1] <= 3.0
+        assert operations.circuit_breaker.get_state()['failures'] == 0
+
+
+    def test_max_retries(self, configure, sleeps):
+        """
+        The operation fails after MAX_RETRIES attempts
+        """
+        configure(CircuitBreaker, **breaker_options(max_retry_time=100.0, failure_threshold=100))
+        operations = DatabaseOperations([OperationFailure('failed')] * (MAX_RETRIES + 1))
+
+        with raises(OperationFailure):
+            operations.find()
+
+        assert operations.calls == MAX_RETRIES
+        assert len(sleeps) == MAX_RETRIES - 1
+
+
+    def test_retry_deadline(self, configure, sleeps):
+        """
+        No retry is made once the next delay would exceed the max_retry_time
+        """
+        configure(CircuitBreaker, **breaker_options(max_retry_time=0.5))
+        operations = DatabaseOperations([AutoReconnect('failover')])
+
+        with raises(AutoReconnect):
+            operations.find()
+
+        assert operations.calls == 1
+        assert not sleeps
+
+
+    def test_retry_deadline_per_request(self, configure, monkeypatch):
+        """
+        The operations of a request share the max_retry_time, a later operation is not retried once the earlier
+        operations used it up
+        """
+        clock = SimpleNamespace(now=0.0)
+
+        def sleep(delay: float) -> None:
+            clock.now += delay
+
+        fake_time = SimpleNamespace(monotonic=lambda: clock.now, sleep=sleep)
+        monkeypatch.setattr(database_utils, 'time', fake_time)
+        monkeypatch.setattr(circuit_breaker, 'time', fake_time)
+        monkeypatch.setattr(database_utils, 'random', SimpleNamespace(uniform=lambda low, high: 0.5))
+        configure(CircuitBreaker, **breaker_options(max_retry_time=2.0))
+
+        def request() -> tuple[int, int]:
+            CircuitBreaker.begin_request()
+            first = DatabaseOperations([AutoReconnect('failover')])
+            second = DatabaseOperations([AutoReconnect('failover')])
+
+            assert first.find() == 'result'
+
+            with raises(AutoReconnect):
+                second.find()
+
+            return first.calls, second.calls
+
+        assert copy_context().run(request) == (2, 1)
+        assert clock.now == 1.5
+
+
+    def test_retry_stops_when_breaker_opens(self, configure, sleeps):
+        """
+        The retries stop once the breaker was opened by the connection failures, further operations are rejected
+        without reaching the database
+        """
+        configure(CircuitBreaker, **breaker_options(max_retry_time=100.0, probe_interval=60.0))
+        operations = DatabaseOperations([AutoReconnect('failover')] * MAX_RETRIES)
+
+        with raises(AutoReconnect):
+            operations.find()
+
+        assert operations.calls == FAILURE_THRESHOLD
+        assert len(sleeps) == FAILURE_THRESHOLD - 1
+
+        with raises(DatabaseUnavailableError):
+            operations.find()
+
+        assert operations.calls == FAILURE_THRESHOLD
+
+
+    def test_nested_operation_counts_one_failure(self, configure, sleeps):
+        """
+        A connection failure inside nested decorated operations is reported to the breaker only once
+        """
+        configure(CircuitBreaker, **breaker_options(max_retry_time=0.5))
+        operations = DatabaseOperations([AutoReconnect('failover')])
+
+        with raises(AutoReconnect):
+            operations.insert()
+
+        assert operations.calls == 1
+        assert operations.circuit_breaker.get_state()['failures'] == 1
+        assert not sleeps
+
+
+    def test_errors_without_retry(self, configure, sleeps):
+        """
+        Exceeded query budgets and errors which are no database errors are raised immediately
+        """
+        configure(CircuitBreaker, **breaker_options(max_retry_time=100.0))
+
+        for error in (ExecutionTimeout('operation exceeded time limit'), ValueError('invalid')):
+            operations = DatabaseOperations([error])
+
+            with raises(type(error)):
+                operations.find()
+
+            assert operations.calls == 1
+
+        assert not sleeps
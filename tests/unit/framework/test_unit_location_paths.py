@@ -0,0 +1,114 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Materialized location paths - Tests
+"""
+import logging
+from pytest import fixture, raises
+
+from cmdb.database import MongoDatabaseManager
+from cmdb.manager import LocationsManager
+
+from cmdb.models.location_model.cmdb_location import CmdbLocation
+
+from cmdb.errors.manager.locations_manager import LocationsManagerUpdateError
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+@fixture(scope='module', name="locations_manager")
+def fixture_locations_manager(request, database_manager: MongoDatabaseManager, database_name: str):
+    """
+    Provides a LocationsManager of the test database, the locations are dropped after the tests
+    """
+    locations_manager = LocationsManager(database_manager, database_name)
+
+    def drop_collection():
+        database_manager.get_collection(CmdbLocation.COLLECTION, database_name).drop()
+
+    request.addfinalizer(drop_collection)
+
+    return locations_manager
+
+
+def insert_location(locations_manager: LocationsManager, name: str, parent: int) -> int:
+    """
+    Inserts a location with the given parent and returns its public_id
+    """
+    return locations_manager.insert_location({
+        'name': name,
+        'parent': parent,
+        'object_id': None,
+        'type_id': 1,
+        'type_label': 'Test',
+    })
+
+
+def get_path(locations_manager: LocationsManager, public_id: int) -> list[int]:
+    """
+    Retrieves the ancestor path of a location
+    """
+    return locations_manager.get_location(public_id)['path']
+
+
+class TestLocationPaths:
+    """
+    Tests the ancestor paths of locations when a subtree is moved
+    """
+
+    def test_move_subtree(self, locations_manager: LocationsManager):
+        """
+        Moving a location rewrites the path of the location and of every descendant, locations outside of the
+        subtree keep their path
+        """
+        site = insert_location(locations_manager, 'site', CmdbLocation.ROOT_ID)
+        site_path = [*get_path(locations_manager, site), site]
+
+        building = insert_location(locations_manager, 'building', site)
+        room = insert_location(locations_manager, 'room', building)
+        rack = insert_location(locations_manager, 'rack', room)
+        server = insert_location(locations_manager, 'server', rack)
+        datacenter = insert_location(locations_manager, 'datacenter', site)
+
+        assert get_path(locations_manager, server) == [*site_path, building, room, rack]
+
+        locations_manager.update_location(room, {'parent': datacenter}, per_object=False)
+
+        assert get_path(locations_manager, room) == [*site_path, datacenter]
+        assert get_path(locations_manager, rack) == [*site_path, datacenter, room]
+        assert get_path(locations_manager, server) == [*site_path, datacenter, room, rack]
+        assert get_path(locations_manager, building) == site_path
+        assert {location['public_id'] for location in locations_manager.get_subtree(datacenter)} == \
+               {room, rack, server}
+
+
+    def test_move_below_descendant(self, locations_manager: LocationsManager):
+        """
+        A location can not be moved below one of its descendants, the paths stay unchanged
+        """
+        site = insert_location(locations_manager, 'site', CmdbLocation.ROOT_ID)
+        site_path = [*get_path(locations_manager, site), site]
+
+        building = insert_location(locations_manager, 'building', site)
+        room = insert_location(locations_manager, 'room', building)
+
+        with raises(LocationsManagerUpdateError):
+            locations_manager.update_location(building, {'parent': room}, per_object=False)
+
+        assert get_path(locations_manager, building) == site_path
+        assert get_path(locations_manager, room) == [*site_path, building]
@@ -0,0 +1,137 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+LogArchiveManager - Tests
+"""
+import gzip
+import json
+import logging
+from io import BytesIO
+from types import SimpleNamespace
+from datetime import datetime, timedelta, timezone
+from pytest import raises
+
+from cmdb.database.database_utils import default
+from cmdb.manager.log_archive_manager import LogArchiveManager
+
+from cmdb.errors.manager import BaseManagerGetError
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+TARGET = 'object_logs'
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+class SegmentFiles:
+    """
+    Stand-in for the GridFS bucket of the archive which records the filters of the requested segments
+    """
+
+    def __init__(self, documents: list[dict]):
+        lines = '\n'.join(json.dumps(document, default=default) for document in documents)
+        self.content = gzip.compress(lines.encode('utf-8'))
+        self.filters = []
+
+
+    def find(self, segment_filter: dict, _projection: dict) -> "SegmentFiles":
+        """
+        Records the filter, the archive consists of a single segment
+        """
+        self.filters.append(segment_filter)
+
+        return self
+
+
+    def sort(self, *_args) -> list[dict]:
+        """
+        Returns the single segment
+        """
+        return [{'_id': 1}]
+
+
+    def get(self, _segment_id: int) -> BytesIO:
+        """
+        Returns the compressed content of the segment
+        """
+        return BytesIO(self.content)
+
+
+def create_archive(documents: list[dict]) -> tuple[LogArchiveManager, SegmentFiles]:
+    """
+    Creates a LogArchiveManager without a database whose archive contains the given documents
+    """
+    segment_files = SegmentFiles(documents)
+    archive_manager = LogArchiveManager.__new__(LogArchiveManager)
+    archive_manager.fs = segment_files
+    archive_manager.fs_files = segment_files
+
+    return archive_manager, segment_files
+
+
+class TestLogArchiveManager:
+    """
+    Tests that archived documents are only read by key or time range and that responses are capped
+    """
+
+    def test_key_or_time_range_required(self):
+        """
+        A request without a key and without a time range does not read any segment
+        """
+        archive_manager, segment_files = create_archive([{'public_id': 1, 'object_id': 1, 'log_time': START}])
+
+        with raises(BaseManagerGetError):
+            archive_manager.find_archived(TARGET, {'action': 3})
+
+        assert not segment_files.filters
+
+
+    def test_time_range(self):
+        """
+        Only segments and documents of the time range are read
+        """
+        documents = [{'public_id': day, 'log_time': START + timedelta(days=day)} for day in range(10)]
+        archive_manager, segment_files = create_archive(documents)
+
+        results, total = archive_manager.find_archived(TARGET,
+                                                       {},
+                                                       time_field='log_time',
+                                                       start_time=START + timedelta(days=2),
+                                                       end_time=START + timedelta(days=4))
+
+        assert [document['public_id'] for document in results] == [2, 3, 4]
+        assert total == 3
+        assert segment_files.filters == [{
+            'metadata.target': TARGET,
+            'metadata.end_time': {'$gte': START + timedelta(days=2)},
+            'metadata.start_time': {'$lte': START + timedelta(days=4)},
+        }]
+
+
+    def test_results_are_capped(self, monkeypatch):
+        """
+        A request without a limit or with a larger limit returns at most MAX_RESULTS documents
+        """
+        monkeypatch.setattr(LogArchiveManager, 'MAX_RESULTS', 2)
+        archive_manager, _ = create_archive([{'public_id': public_id, 'object_id': 7} for public_id in range(5)])
+
+        for limit in (0, 10):
+            results, total = archive_manager.find_archived(TARGET, {'object_id': 7}, key=7, limit=limit)
+
+            assert [document['public_id'] for document in results] == [0, 1]
+            assert total == 5
@@ -0,0 +1,100 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Media file deduplication - Tests
+"""
+import io
+import hashlib
+import logging
+from pytest import fixture, raises
+from werkzeug.datastructures import FileStorage
+
+from cmdb.database import MongoDatabaseManager
+from cmdb.manager import MediaFilesManager
+
+from cmdb.errors.manager.media_files_manager import MediaFileManagerInsertError
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+CONTENT = b'identical content of both media files'
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+@fixture(scope='module', name="media_files_manager")
+def fixture_media_files_manager(request, database_manager: MongoDatabaseManager, database_name: str):
+    """
+    Provides a MediaFilesManager of the test database, the media files and blobs are dropped after the tests
+    """
+    media_files_manager = MediaFilesManager(database_manager, database_name)
+
+    def drop_collections():
+        media_files_manager.fs_files.drop()
+        media_files_manager.blob_files.drop()
+        media_files_manager.blob_chunks.drop()
+
+    request.addfinalizer(drop_collections)
+
+    return media_files_manager
+
+
+class TestMediaFileDeduplication:
+    """
+    Tests that media files with the same content share one reference counted blob
+    """
+
+    def test_same_content_shares_blob(self, media_files_manager: MediaFilesManager):
+        """
+        The second media file with the same content references the blob of the first one, the blob is removed
+        with the last media file referencing it
+        """
+        first_file = media_files_manager.insert_file(FileStorage(io.BytesIO(CONTENT), 'first.txt'), {'author_id': 1})
+        second_file = media_files_manager.insert_file(FileStorage(io.BytesIO(CONTENT), 'second.txt'),
+                                                      {'author_id': 1})
+
+        blob_id = first_file['blob_id']
+
+        assert second_file['blob_id'] == blob_id
+        assert first_file['sha256'] == hashlib.sha256(CONTENT).hexdigest()
+        assert media_files_manager.blob_files.find_one({'_id': blob_id})['ref_count'] == 2
+        assert media_files_manager.get_file({'public_id': second_file['public_id']}, True) == CONTENT
+
+        media_files_manager.delete_file(first_file['public_id'])
+
+        assert media_files_manager.blob_files.find_one({'_id': blob_id})['ref_count'] == 1
+        assert media_files_manager.get_file({'public_id': second_file['public_id']}, True) == CONTENT
+
+        media_files_manager.delete_file(second_file['public_id'])
+
+        assert media_files_manager.blob_files.find_one({'_id': blob_id}) is None
+        assert media_files_manager.blob_chunks.count_documents({'files_id': blob_id}) == 0
+
+
+    def test_failed_insert_releases_blob(self, media_files_manager: MediaFilesManager, monkeypatch):
+        """
+        If the files document can not be inserted, the reference of the upload is removed from the blob again
+        """
+        content = b'content of a media file which is never inserted'
+
+        def failing_insert(*_args, **_kwargs):
+            raise OSError('files document could not be inserted')
+
+        monkeypatch.setattr(media_files_manager, '_MediaFilesManager__insert_file_document', failing_insert)
+
+        with raises(MediaFileManagerInsertError):
+            media_files_manager.insert_file(FileStorage(io.BytesIO(content), 'failed.txt'), {'author_id': 1})
+
+        assert media_files_manager.blob_files.find_one({'sha256': hashlib.sha256(content).hexdigest()}) is None
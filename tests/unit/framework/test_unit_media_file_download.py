@@ -0,0 +1,144 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Media file download ranges and ETags - Tests
+"""
+import logging
+from types import SimpleNamespace
+from datetime import datetime, timezone
+from pytest import fixture, raises
+from werkzeug.test import EnvironBuilder
+from werkzeug.exceptions import RequestedRangeNotSatisfiable
+
+from cmdb.interface.rest_api.routes.media_library_routes.media_file_route_utils import (
+    generate_file_etag,
+    get_requested_byte_range,
+)
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+FILE_LENGTH = 1000
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+@fixture(scope='module', name="build_request")
+def fixture_build_request():
+    """
+    Provides a factory for requests with the given headers
+    """
+    def build_request(**headers):
+        return EnvironBuilder(headers=headers).get_request()
+
+    return build_request
+
+
+@fixture(scope='module', name="grid_out")
+def fixture_grid_out():
+    """
+    Provides a factory for handles of stored files with the given metadata of the files document
+    """
+    def grid_out(**file_document):
+        return SimpleNamespace(
+            _id='65f1c0ffee0000000000beef',
+            _file=file_document,
+            upload_date=datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+        )
+
+    return grid_out
+
+
+class TestRequestedByteRange:
+    """
+    Tests the evaluation of the 'Range' and 'If-Range' headers of media file downloads
+    """
+
+    def test_without_range(self, build_request):
+        """
+        A request without 'Range' header downloads the complete file
+        """
+        assert get_requested_byte_range(build_request(), 'etag', FILE_LENGTH) is None
+
+
+    def test_single_range(self, build_request):
+        """
+        A single byte range is returned with an exclusive end
+        """
+        assert get_requested_byte_range(build_request(Range='bytes=0-99'), 'etag', FILE_LENGTH) == (0, 100)
+        assert get_requested_byte_range(build_request(Range='bytes=900-'), 'etag', FILE_LENGTH) == (900, 1000)
+        assert get_requested_byte_range(build_request(Range='bytes=-100'), 'etag', FILE_LENGTH) == (900, 1000)
+
+
+    def test_range_is_limited_to_length(self, build_request):
+        """
+        A range which ends behind the file ends with the file
+        """
+        assert get_requested_byte_range(build_request(Range='bytes=500-5000'), 'etag', FILE_LENGTH) == (500, 1000)
+
+
+    def test_multiple_ranges(self, build_request):
+        """
+        Multipart ranges are not supported and download the complete file
+        """
+        assert get_requested_byte_range(build_request(Range='bytes=0-9,20-29'), 'etag', FILE_LENGTH) is None
+
+
+    def test_if_range(self, build_request):
+        """
+        The range is only used if the 'If-Range' ETag matches the current ETag of the file
+        """
+        matching_request = build_request(Range='bytes=0-99', **{'If-Range': '"etag"'})
+        changed_request = build_request(Range='bytes=0-99', **{'If-Range': '"outdated"'})
+
+        assert get_requested_byte_range(matching_request, 'etag', FILE_LENGTH) == (0, 100)
+        assert get_requested_byte_range(changed_request, 'etag', FILE_LENGTH) is None
+
+
+    def test_unsatisfiable_range(self, build_request):
+        """
+        A range which starts behind the file raises a 416 error
+        """
+        with raises(RequestedRangeNotSatisfiable):
+            get_requested_byte_range(build_request(Range='bytes=2000-2999'), 'etag', FILE_LENGTH)
+
+
+class TestFileEtag:
+    """
+    Tests the generation of the ETags of stored media files
+    """
+
+    def test_sha256_etag(self, grid_out):
+        """
+        The SHA-256 hash of a deduplicated file is its ETag, also if the file has an md5 checksum
+        """
+        sha256 = 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'
+
+        assert generate_file_etag(grid_out(sha256=sha256, md5='d41d8cd98f00b204e9800998ecf8427e')) == sha256
+
+
+    def test_md5_etag(self, grid_out):
+        """
+        The md5 checksum of a file is its ETag
+        """
+        assert generate_file_etag(grid_out(md5='d41d8cd98f00b204e9800998ecf8427e')) == \
+               'd41d8cd98f00b204e9800998ecf8427e'
+
+
+    def test_fallback_etag(self, grid_out):
+        """
+        Without checksum the ETag is derived from the ObjectId and the upload date
+        """
+        assert generate_file_etag(grid_out()) == '65f1c0ffee0000000000beef-1792411200000'
@@ -0,0 +1,159 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Chunked media file uploads - Tests
+"""
+import io
+import logging
+from datetime import datetime, timezone
+from pytest import fixture, raises
+
+from cmdb.database import MongoDatabaseManager
+from cmdb.manager import MediaFilesManager
+
+from cmdb.errors.manager.media_files_manager import MediaFileManagerGetError, MediaFileManagerInsertError
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+AUTHOR_ID = 1
+OTHER_USER_ID = 2
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+@fixture(scope='module', name="media_files_manager")
+def fixture_media_files_manager(request, database_manager: MongoDatabaseManager, database_name: str):
+    """
+    Provides a MediaFilesManager of the test database, the uploads, media files and blobs are dropped after the tests
+    """
+    media_files_manager = MediaFilesManager(database_manager, database_name)
+
+    def drop_collections():
+        media_files_manager.uploads.drop()
+        media_files_manager.fs_files.drop()
+        media_files_manager.blob_files.drop()
+        media_files_manager.blob_chunks.drop()
+
+    request.addfinalizer(drop_collections)
+
+    return media_files_manager
+
+
+@fixture(name="upload")
+def fixture_upload(media_files_manager: MediaFilesManager) -> dict:
+    """
+    Provides a new upload session of the AUTHOR_ID
+    """
+    return media_files_manager.initiate_upload('upload.txt', {'author_id': AUTHOR_ID}, AUTHOR_ID)
+
+
+class TestChunkedUploads:
+    """
+    Tests the ownership and the expiration of chunked media file uploads
+    """
+
+    def test_complete_upload(self, media_files_manager: MediaFilesManager, upload: dict):
+        """
+        The parts of an upload are published as one media file
+        """
+        media_files_manager.upload_part(upload['upload_id'], AUTHOR_ID, 1, io.BytesIO(b'first part, '))
+        session = media_files_manager.upload_part(upload['upload_id'], AUTHOR_ID, 2, io.BytesIO(b'second part'))
+
+        assert session['next_part'] == 3
+
+        media_file = media_files_manager.complete_upload(upload['upload_id'], AUTHOR_ID)
+
+        assert media_files_manager.get_file({'public_id': media_file['public_id']}, True) == \
+               b'first part, second part'
+        assert media_files_manager.get_upload(upload['upload_id'], AUTHOR_ID) is None
+
+
+    def test_double_complete_upload(self, media_files_manager: MediaFilesManager, upload: dict):
+        """
+        Completing an upload again does neither publish a second media file nor remove the chunks of the blob
+        """
+        media_files_manager.upload_part(upload['upload_id'], AUTHOR_ID, 1, io.BytesIO(b'completed twice'))
+        media_file = media_files_manager.complete_upload(upload['upload_id'], AUTHOR_ID)
+
+        with raises(MediaFileManagerGetError):
+            media_files_manager.complete_upload(upload['upload_id'], AUTHOR_ID)
+
+        assert not media_files_manager.abort_upload(upload['upload_id'], AUTHOR_ID)
+        assert media_files_manager.blob_files.find_one({'_id': media_file['blob_id']})['ref_count'] == 1
+        assert media_files_manager.get_file({'public_id': media_file['public_id']}, True) == b'completed twice'
+
+
+    def test_claimed_upload_is_skipped(self, media_files_manager: MediaFilesManager, upload: dict):
+        """
+        An upload which is claimed for completion can not be changed, aborted or expired and is released again
+        when its completion fails
+        """
+        media_files_manager.upload_part(upload['upload_id'], AUTHOR_ID, 1, io.BytesIO(b'claimed'))
+        session = media_files_manager.get_upload(upload['upload_id'], AUTHOR_ID)
+
+        media_files_manager.uploads.update_one({'_id': session['_id']}, {'$set': {'completing': True}})
+
+        with raises(MediaFileManagerGetError):
+            media_files_manager.upload_part(upload['upload_id'], AUTHOR_ID, 2, io.BytesIO(b'data'))
+
+        assert not media_files_manager.abort_upload(upload['upload_id'], AUTHOR_ID)
+        assert media_files_manager.remove_expired_uploads() == 0
+        assert media_files_manager.blob_chunks.count_documents({'files_id': session['_id']}) == 1
+
+        # An incomplete upload releases its claim
+        media_files_manager.uploads.update_one(
+            {'_id': session['_id']},
+            {'$set': {'completing': False}, '$inc': {'length': session['chunk_size']}}
+        )
+
+        with raises(MediaFileManagerInsertError):
+            media_files_manager.complete_upload(upload['upload_id'], AUTHOR_ID)
+
+        assert media_files_manager.abort_upload(upload['upload_id'], AUTHOR_ID)
+
+
+    def test_upload_of_other_user(self, media_files_manager: MediaFilesManager, upload: dict):
+        """
+        Only the user who initiated an upload can access it
+        """
+        assert media_files_manager.get_upload(upload['upload_id'], OTHER_USER_ID) is None
+        assert not media_files_manager.abort_upload(upload['upload_id'], OTHER_USER_ID)
+
+        with raises(MediaFileManagerGetError):
+            media_files_manager.upload_part(upload['upload_id'], OTHER_USER_ID, 1, io.BytesIO(b'data'))
+
+        with raises(MediaFileManagerGetError):
+            media_files_manager.complete_upload(upload['upload_id'], OTHER_USER_ID)
+
+        assert media_files_manager.abort_upload(upload['upload_id'], AUTHOR_ID)
+
+
+    def test_remove_expired_uploads(self, media_files_manager: MediaFilesManager, upload: dict):
+        """
+        Uploads without a new part within the UPLOAD_EXPIRATION are removed together with their chunks
+        """
+        media_files_manager.upload_part(upload['upload_id'], AUTHOR_ID, 1, io.BytesIO(b'abandoned'))
+        session = media_files_manager.get_upload(upload['upload_id'], AUTHOR_ID)
+
+        media_files_manager.uploads.update_one(
+            {'_id': session['_id']},
+            {'$set': {'update_time': datetime.now(timezone.utc) - 2 * MediaFilesManager.UPLOAD_EXPIRATION}}
+        )
+
+        assert media_files_manager.get_upload(upload['upload_id'], AUTHOR_ID) is None
+        assert media_files_manager.remove_expired_uploads() == 1
+        assert media_files_manager.blob_chunks.count_documents({'files_id': session['_id']}) == 0
+        assert media_files_manager.uploads.count_documents({'_id': session['_id']}) == 0
@@ -0,0 +1,133 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+MetricsCollector - Tests
+"""
+import os
+import json
+import logging
+import subprocess
+from pytest import approx, fixture, mark
+
+from cmdb.framework.metrics.metrics_collector import MetricsCollector
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+REQUEST_DURATION = 'datagerry_http_request_duration_seconds'
+
+REQUEST_LABELS = 'method="GET",route="/objects/<int:public_id>"'
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+@fixture(name="metrics_directory")
+def fixture_metrics_directory(request, monkeypatch, tmp_path) -> str:
+    """
+    Activates the MetricsCollector with an empty directory and without metrics of previous tests
+    """
+    directory = str(tmp_path)
+
+    # Makes the collector drop the metrics recorded so far like in a new worker
+    monkeypatch.setattr(MetricsCollector, '_MetricsCollector__pid', None)
+    MetricsCollector.configure({'active': True, 'directory': directory, 'flush_interval': 3600})
+
+    request.addfinalizer(lambda: MetricsCollector.configure({}))
+
+    return directory
+
+
+@fixture(name="dead_pid")
+def fixture_dead_pid() -> int:
+    """
+    Provides the process id of a process which already exited
+    """
+    with subprocess.Popen(['true']) as process:
+        process.wait()
+
+    return process.pid
+
+
+def samples(metrics: str) -> dict[str, str]:
+    """
+    Parses the samples of the Prometheus text format
+
+    Args:
+        metrics (str): The rendered metrics
+
+    Returns:
+        dict[str, str]: The values by the name and labels of the samples
+    """
+    return dict(line.rsplit(' ', 1) for line in metrics.splitlines() if line and not line.startswith('#'))
+
+
+class TestMetricsCollectorRendering:
+    """
+    Tests the Prometheus text format of the recorded metrics
+    """
+
+    def test_histogram(self, metrics_directory):
+        """
+        Histogram buckets are cumulative, a value equal to an upper bound is counted in its bucket
+        """
+        for duration in (0.003, 0.005, 0.02, 20.0):
+            MetricsCollector.observe_request('GET', '/objects/<int:public_id>', 200, duration)
+
+        metrics = MetricsCollector.render()
+        rendered = samples(metrics)
+
+        assert f"# TYPE {REQUEST_DURATION} histogram" in metrics
+        assert os.path.exists(os.path.join(metrics_directory, f"{os.getpid()}.json"))
+        assert rendered[f'{REQUEST_DURATION}_bucket{{{REQUEST_LABELS},le="0.0025"}}'] == '0'
+        assert rendered[f'{REQUEST_DURATION}_bucket{{{REQUEST_LABELS},le="0.005"}}'] == '2'
+        assert rendered[f'{REQUEST_DURATION}_bucket{{{REQUEST_LABELS},le="0.025"}}'] == '3'
+        assert rendered[f'{REQUEST_DURATION}_bucket{{{REQUEST_LABELS},le="10.0"}}'] == '3'
+        assert rendered[f'{REQUEST_DURATION}_bucket{{{REQUEST_LABELS},le="+Inf"}}'] == '4'
+        assert float(rendered[f'{REQUEST_DURATION}_sum{{{REQUEST_LABELS}}}']) == approx(20.028)
+        assert rendered[f'{REQUEST_DURATION}_count{{{REQUEST_LABELS}}}'] == '4'
+        assert rendered[f'datagerry_http_requests_total{{{REQUEST_LABELS},status="200"}}'] == '4'
+
+
+    @mark.usefixtures('metrics_directory')
+    def test_escaped_labels(self):
+        """
+        Quotes, backslashes and newlines in label values are escaped
+        """
+        MetricsCollector.observe_command('find', 'collection "a"\\b\n', 0.001, True)
+
+        rendered = samples(MetricsCollector.render())
+
+        assert rendered[
+            'datagerry_mongodb_command_failures_total{command="find",collection="collection \\"a\\"\\\\b\\n"}'
+        ] == '1'
+
+
+    def test_dead_processes_are_archived(self, metrics_directory, dead_pid):
+        """
+        The metrics of a process which does not run anymore are folded into the archive and are still counted
+        """
+        dead_file = os.path.join(metrics_directory, f"{dead_pid}.json")
+        counter = ['datagerry_http_requests_total', [['method', 'GET'], ['route', '/objects/'], ['status', '200']]]
+
+        with open(dead_file, 'w', encoding='utf-8') as metrics_file:
+            json.dump({'histograms': [], 'counters': [counter + [5]]}, metrics_file)
+
+        MetricsCollector.observe_request('GET', '/objects/', 200, 0.01)
+        sample = 'datagerry_http_requests_total{method="GET",route="/objects/",status="200"}'
+
+        assert samples(MetricsCollector.render())[sample] == '6'
+        assert not os.path.exists(dead_file)
+        assert os.path.exists(os.path.join(metrics_directory, MetricsCollector.ARCHIVE_FILE))
+        assert samples(MetricsCollector.render())[sample] == '6'
@@ -0,0 +1,174 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+ObjectRelationGraph snapshots and RelationGraphCache eviction - Tests
+"""
+import logging
+from types import SimpleNamespace
+from pytest import fixture
+
+from cmdb.framework.relation_graph import relation_graph_cache
+from cmdb.framework.relation_graph.object_relation_graph import ObjectRelationGraph
+from cmdb.framework.relation_graph.relation_graph_cache import RelationGraphCache
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def object_relation(public_id: int, parent_id: int, child_id: int) -> dict:
+    """
+    Builds a CmdbObjectRelation between two CmdbObjects
+    """
+    return {'public_id': public_id, 'relation_id': 1, 'relation_parent_id': parent_id, 'relation_child_id': child_id}
+
+
+@fixture(name="graph")
+def fixture_graph() -> ObjectRelationGraph:
+    """
+    Provides the graph 1 -> 2 -> 4 and 1 -> 3
+    """
+    graph = ObjectRelationGraph(1)
+
+    graph.add(object_relation(1, 1, 2))
+    graph.add(object_relation(2, 1, 3))
+    graph.add(object_relation(3, 2, 4))
+
+    return graph
+
+
+@fixture(name="clock")
+def fixture_clock(request, monkeypatch) -> SimpleNamespace:
+    """
+    Provides the clock of an empty RelationGraphCache which keeps at most two graphs for 60 seconds, the cache is
+    emptied after the test
+    """
+    clock = SimpleNamespace(now=1000.0)
+
+    def clear_cache():
+        RelationGraphCache._graphs.clear()
+        RelationGraphCache._last_used.clear()
+
+    clear_cache()
+    request.addfinalizer(clear_cache)
+    monkeypatch.setattr(relation_graph_cache, 'time', SimpleNamespace(monotonic=lambda: clock.now))
+    monkeypatch.setattr(RelationGraphCache, 'MAX_GRAPHS', 2)
+    monkeypatch.setattr(RelationGraphCache, 'GRAPH_TTL', 60)
+
+    return clock
+
+
+class GraphDatabases:
+    """
+    Stand-in for a MongoDatabaseManager whose databases have no CmdbObjectRelations, counts the built graphs
+    """
+
+    def __init__(self):
+        self.builds = []
+
+
+    def get_collection_generation(self, _collection: str, _db_name: str) -> int:
+        """
+        The relations of all databases are on their first generation
+        """
+        return 1
+
+
+    def find(self, _collection: str, db_name: str, **_kwargs) -> list[dict]:
+        """
+        Records the build of a graph
+        """
+        self.builds.append(db_name)
+
+        return []
+
+
+class TestObjectRelationGraph:
+    """
+    Tests that changes of a copied ObjectRelationGraph do not change the original graph
+    """
+
+    def test_copy_on_write(self, graph: ObjectRelationGraph):
+        """
+        Removed and added edges of a copy are not visible in the original graph
+        """
+        changed_graph = graph.copy()
+
+        changed_graph.remove(1)
+        changed_graph.add(object_relation(4, 1, 5))
+        changed_graph.add(object_relation(5, 6, 1))
+        changed_graph.generation = 2
+
+        assert graph.generation == 1
+        assert graph.reachable(1, True) == {2: 1, 3: 1, 4: 2}
+        assert not graph.reachable(1, False)
+
+        assert changed_graph.reachable(1, True) == {3: 1, 5: 1}
+        assert changed_graph.reachable(1, False) == {6: 1}
+        assert changed_graph.edge_count == 4
+
+
+    def test_copy_of_copy(self, graph: ObjectRelationGraph):
+        """
+        A copy changes its own arrays in place while they are not shared anymore
+        """
+        first_copy = graph.copy()
+        first_copy.add(object_relation(4, 1, 5))
+        first_copy.add(object_relation(5, 1, 6))
+
+        second_copy = first_copy.copy()
+        second_copy.remove(4)
+
+        assert graph.fan_out(1) == 2
+        assert first_copy.fan_out(1) == 4
+        assert second_copy.fan_out(1) == 3
+        assert first_copy.shortest_path(1, 5, True) == ([1, 5], [4])
+        assert second_copy.shortest_path(1, 5, True) is None
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+class TestRelationGraphCache:
+    """
+    Tests the eviction of the cached ObjectRelationGraphs
+    """
+
+    def test_least_recently_used_graph_is_evicted(self, clock: SimpleNamespace):
+        """
+        Above MAX_GRAPHS the graph which was not used for the longest time is evicted
+        """
+        databases = GraphDatabases()
+
+        for db_name in ('first', 'second', 'first', 'third', 'first', 'second'):
+            RelationGraphCache.get_graph(databases, db_name)
+            clock.now += 1
+
+        assert databases.builds == ['first', 'second', 'third', 'second']
+        assert list(RelationGraphCache._graphs) == ['first', 'second']
+
+
+    def test_unused_graph_expires(self, clock: SimpleNamespace):
+        """
+        A graph which was not used for GRAPH_TTL seconds is built again
+        """
+        databases = GraphDatabases()
+
+        RelationGraphCache.get_graph(databases, 'first')
+        clock.now += 30
+        RelationGraphCache.get_graph(databases, 'first')
+        clock.now += 61
+        RelationGraphCache.get_graph(databases, 'first')
+
+        assert databases.builds == ['first', 'first']
@@ -0,0 +1,146 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+CI Explorer traversal - Tests
+"""
+import logging
+from pytest import fixture
+from pymongo.errors import OperationFailure
+
+from cmdb.database import MongoDatabaseManager
+from cmdb.manager import ObjectRelationsManager
+
+from cmdb.models.object_model import CmdbObject
+from cmdb.models.object_relation_model import CmdbObjectRelation
+
+from cmdb.errors.manager import BaseManagerIterationError
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+HUB_ID = 90000
+CHILDREN = 40
+GRANDCHILDREN_PER_CHILD = 5
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+@fixture(scope='module', name="fan_out_graph")
+def fixture_fan_out_graph(request, database_manager: MongoDatabaseManager, database_name: str) -> list[dict]:
+    """
+    Provides a hub object with CHILDREN children which have GRANDCHILDREN_PER_CHILD children each, the hub and
+    the relations are removed after the tests
+    """
+    objects = database_manager.get_collection(CmdbObject.COLLECTION, database_name)
+    object_relations = database_manager.get_collection(CmdbObjectRelation.COLLECTION, database_name)
+
+    edges = []
+
+    for child_id in range(HUB_ID + 1, HUB_ID + CHILDREN + 1):
+        edges.append((HUB_ID, child_id))
+        edges += [(child_id, child_id * 100 + grandchild) for grandchild in range(GRANDCHILDREN_PER_CHILD)]
+
+    relations = [{
+        'public_id': HUB_ID + index,
+        'relation_id': 1,
+        'relation_parent_id': parent_id,
+        'relation_parent_type_id': 1,
+        'relation_child_id': child_id,
+        'relation_child_type_id': 1,
+    } for index, (parent_id, child_id) in enumerate(edges)]
+
+    objects.insert_one({'public_id': HUB_ID, 'type_id': 1})
+    object_relations.insert_many([dict(relation) for relation in relations])
+
+    def remove_graph():
+        objects.delete_many({'public_id': HUB_ID})
+        object_relations.delete_many({'public_id': {'$gte': HUB_ID, '$lt': HUB_ID + len(relations)}})
+
+    request.addfinalizer(remove_graph)
+
+    return relations
+
+
+@fixture(name="object_relations_manager")
+def fixture_object_relations_manager(database_manager: MongoDatabaseManager, database_name: str):
+    """
+    Provides an ObjectRelationsManager of the test database
+    """
+    return ObjectRelationsManager(database_manager, database_name)
+
+
+def exceed_graph_lookup_limits(monkeypatch, object_relations_manager: ObjectRelationsManager) -> None:
+    """
+    Lets every aggregation of the manager fail like a $graphLookup which reached its memory limit
+    """
+    def exceeded_aggregation(*_args, **_kwargs):
+        try:
+            raise OperationFailure("$graphLookup reached maximum memory consumption", code=40099)
+        except OperationFailure as err:
+            raise BaseManagerIterationError(err) from err
+
+    monkeypatch.setattr(object_relations_manager, 'aggregate_from_other_collection', exceeded_aggregation)
+
+
+class TestTraversal:
+    """
+    Tests the multi-hop traversal of the CI Explorer on a graph with a large fan-out
+    """
+
+    def test_traverse_fan_out(self, object_relations_manager: ObjectRelationsManager, fan_out_graph: list[dict]):
+        """
+        The traversal returns the closest relations first and cuts the result at the limit
+        """
+        relations = object_relations_manager.traverse(HUB_ID, 2, True)
+
+        assert len(relations) == len(fan_out_graph)
+        assert [relation['hop'] for relation in relations[:CHILDREN]] == [0] * CHILDREN
+        assert object_relations_manager.traverse(HUB_ID, 2, True, limit=CHILDREN + 3) == relations[:CHILDREN + 3]
+
+
+    def test_fallback_per_hop(self,
+                              monkeypatch,
+                              object_relations_manager: ObjectRelationsManager,
+                              fan_out_graph: list[dict]):
+        """
+        If the closure is too large for a $graphLookup, the traversal per hop returns the same relations
+        """
+        limits = (0, CHILDREN // 2, CHILDREN + 3)
+        expected = [object_relations_manager.traverse(HUB_ID, 2, True, limit=limit) for limit in limits]
+
+        exceed_graph_lookup_limits(monkeypatch, object_relations_manager)
+
+        assert [object_relations_manager.traverse(HUB_ID, 2, True, limit=limit) for limit in limits] == expected
+        assert len(expected[0]) == len(fan_out_graph)
+        assert object_relations_manager.traverse(HUB_ID, 1, True) == expected[0][:CHILDREN]
+
+
+    def test_traverse_nearest(self, object_relations_manager: ObjectRelationsManager, fan_out_graph: list[dict]):
+        """
+        The selection stops at the maximum number of objects, the closest objects are kept
+        """
+        max_objects = CHILDREN + 3
+        relations, reached_ids, truncated = object_relations_manager.traverse_nearest(HUB_ID,
+                                                                                      2,
+                                                                                      [True, False],
+                                                                                      max_objects=max_objects,
+                                                                                      relations_per_object=4)
+
+        assert truncated
+        assert len(reached_ids) == max_objects + 1
+        assert {relation['relation_child_id'] for _, relation in relations[:CHILDREN]} == \
+               set(range(HUB_ID + 1, HUB_ID + CHILDREN + 1))
+        assert len(relations) < len(fan_out_graph)
+        assert all(towards_children for towards_children, _ in relations)
@@ -0,0 +1,208 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+QueryBudget - Tests
+"""
+import logging
+from contextvars import Context
+from pytest import raises
+from pymongo.errors import ExecutionTimeout, OperationFailure
+
+from cmdb.database.mongo_database_manager import MongoDatabaseManager
+from cmdb.database.query_budget import QueryBudget
+
+from cmdb.errors.database import DocumentGetError, QueryBudgetExceededError
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+class CancelledCollection:
+    """
+    Stand-in for a collection whose find and count operations are cancelled by MongoDB, a find operation is cancelled
+    while its cursor is iterated
+    """
+
+    def find(self, *args, **kwargs):
+        return self
+
+    def limit(self, limit: int):
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        raise ExecutionTimeout('operation exceeded time limit')
+
+    def count_documents(self, *args, **kwargs) -> int:
+        raise ExecutionTimeout('operation exceeded time limit')
+
+
+class CancelledDatabaseManager(MongoDatabaseManager):
+    """
+    MongoDatabaseManager without connection whose collections are CancelledCollections
+    """
+
+    def __init__(self):  # pylint: disable=super-init-not-called
+        self.collection = CancelledCollection()
+
+    def get_collection(self, name: str, db_name: str) -> CancelledCollection:
+        return self.collection
+
+
+class TestQueryBudgetApply:
+    """
+    Tests adding the budget of the current request to the options of operations
+    """
+
+    def test_outside_of_requests(self, configure):
+        """
+        Operations outside of a request have no budget
+        """
+        configure(QueryBudget, active=True)
+
+        assert QueryBudget.get_budget_class() is None
+        assert not QueryBudget.apply({})
+
+
+    def test_inactive_by_default(self, configure):
+        """
+        Without [QueryBudgets] section the operations of a request are not limited
+        """
+        configure(QueryBudget)
+
+        with QueryBudget.scope(QueryBudget.INTERACTIVE):
+            assert not QueryBudget.is_active()
+            assert not QueryBudget.apply({})
+
+
+    def test_budget_classes(self, configure):
+        """
+        The budget of the budget class is added under the option name of the operation
+        """
+        configure(QueryBudget, active=True, interactive_ms=1000, report_ms=2000, export_ms=3000)
+
+        with QueryBudget.scope(QueryBudget.INTERACTIVE):
+            assert QueryBudget.apply({}) == {'maxTimeMS': 1000}
+
+            with QueryBudget.scope(QueryBudget.EXPORT):
+                assert QueryBudget.apply({'batch_size': 10}, 'max_time_ms') == {'batch_size': 10, 'max_time_ms': 3000}
+
+            assert QueryBudget.apply({}) == {'maxTimeMS': 1000}
+
+            with QueryBudget.scope(QueryBudget.REPORT):
+                assert QueryBudget.get_max_time_ms() == 2000
+
+        assert QueryBudget.get_budget_class() is None
+
+
+    def test_own_limit(self, configure):
+        """
+        A limit set by the caller is kept
+        """
+        configure(QueryBudget, active=True)
+
+        with QueryBudget.scope(QueryBudget.INTERACTIVE):
+            assert QueryBudget.apply({'maxTimeMS': 5}) == {'maxTimeMS': 5}
+
+
+    def test_disabled_budgets(self, configure):
+        """
+        A budget of 0 disables the limit of its class, an inactive QueryBudget disables all limits
+        """
+        configure(QueryBudget, active=True, report_ms=0)
+
+        with QueryBudget.scope(QueryBudget.REPORT):
+            assert not QueryBudget.apply({})
+
+        configure(QueryBudget, active=False)
+
+        with QueryBudget.scope(QueryBudget.INTERACTIVE):
+            assert not QueryBudget.apply({})
+
+
+    def test_begin(self, configure):
+        """
+        The budget class set at the start of a request applies to the context of the request only
+        """
+        configure(QueryBudget, active=True)
+
+        def request_context() -> dict:
+            QueryBudget.begin()
+
+            return QueryBudget.apply({})
+
+        assert Context().run(request_context) == {'maxTimeMS': QueryBudget.DEFAULT_OPTIONS['interactive_ms']}
+        assert QueryBudget.get_budget_class() is None
+
+
+class TestQueryBudgetExceeded:
+    """
+    Tests the detection of operations which were cancelled because they exceeded their budget
+    """
+
+    def test_exceeded_errors(self):
+        """
+        Cancelled operations are detected directly, as cause, as context and as original exception of an error
+        """
+        caused_error = DocumentGetError('Failed to retrieve documents')
+        caused_error.__cause__ = ExecutionTimeout('operation exceeded time limit')
+
+        context_error = ValueError('invalid')
+        context_error.__context__ = QueryBudgetExceededError('aggregation exceeded time limit')
+
+        original_error = RuntimeError('failed')
+        original_error.original_exception = caused_error
+
+        for error in (ExecutionTimeout('operation exceeded time limit'), caused_error, context_error, original_error):
+            assert QueryBudget.is_exceeded(error), error
+
+
+    def test_other_errors(self):
+        """
+        Other errors are not reported as exceeded budgets, also not if their chain is cyclic
+        """
+        cyclic_error = DocumentGetError('Failed to retrieve documents')
+        cyclic_error.__cause__ = OperationFailure('failed')
+        cyclic_error.__cause__.__cause__ = cyclic_error
+
+        assert not QueryBudget.is_exceeded(OperationFailure('failed'))
+        assert not QueryBudget.is_exceeded(cyclic_error)
+
+
+    def test_cancelled_operations(self, configure):
+        """
+        The database layer raises a QueryBudgetExceededError for cancelled find and count operations, which is still
+        handled by the callers expecting a DocumentGetError
+        """
+        configure(QueryBudget, active=True)
+        database_manager = CancelledDatabaseManager()
+        operations = (
+            lambda: database_manager.find_all('framework.objects', 'cmdb'),
+            lambda: database_manager.find_one_by('framework.objects', 'cmdb', {'type_id': 1}),
+            lambda: database_manager.find_one('framework.objects', 'cmdb', 1),
+            lambda: database_manager.count('framework.objects', 'cmdb'),
+        )
+
+        with QueryBudget.scope(QueryBudget.INTERACTIVE):
+            for operation in operations:
+                with raises(QueryBudgetExceededError) as error:
+                    operation()
+
+                assert isinstance(error.value, DocumentGetError)
+                assert isinstance(error.value.__cause__, ExecutionTimeout)
@@ -0,0 +1,207 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+RenderStateCodec - Tests
+"""
+import copy
+import logging
+from pytest import fixture
+
+from cmdb.models.log_model.render_state_codec import RenderStateCodec
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+@fixture(name="render_state")
+def fixture_render_state() -> dict:
+    """
+    Provides a render_state of an object with fields, sections and a multi data section
+    """
+    return {
+        'object_information': {'object_id': 1, 'version': '1.0.0', 'active': True, 'editor_id': None},
+        'type_information': {'type_id': 1, 'type_name': 'server', 'icon': 'fas fa-cube'},
+        'fields': [
+            {'name': 'name', 'type': 'text', 'value': f"server {index}"} for index in range(20)
+        ],
+        'sections': [{'type': 'section', 'name': 'general', 'fields': ['name']}],
+        'summary_line': 'server 0',
+        'multi_data_sections': [{'section_id': 'interfaces', 'values': [{'multi_data_id': 0, 'data': []}]}],
+    }
+
+
+def reconstruct(logs: dict[int, dict], public_id: int) -> dict:
+    """
+    Decodes the render_state of a log by walking its delta chain like the LogsManager does
+
+    Args:
+        logs (dict[int, dict]): The encoded logs by their public_id
+        public_id (int): public_id of the requested log
+
+    Returns:
+        dict: The render_state of the log
+    """
+    log = logs[public_id]
+
+    if log['render_encoding'] == RenderStateCodec.SNAPSHOT:
+        return RenderStateCodec.decompress(log['render_state'])
+
+    return RenderStateCodec.patch(reconstruct(logs, log['render_base']),
+                                  RenderStateCodec.decompress(log['render_state']))
+
+
+class TestRenderStateDiff:
+    """
+    Tests that patching the base with the diff always restores the target
+    """
+
+    def test_changed_values(self, render_state: dict):
+        """
+        Changed nested values are stored as single operations
+        """
+        target = copy.deepcopy(render_state)
+        target['object_information']['version'] = '1.0.1'
+        target['fields'][3]['value'] = 'renamed'
+
+        operations = RenderStateCodec.diff(render_state, target)
+
+        assert len(operations) == 2
+        assert RenderStateCodec.patch(render_state, operations) == target
+
+
+    def test_structural_changes(self, render_state: dict):
+        """
+        Lists with another length, dicts with other keys and changed types are replaced as a whole
+        """
+        target = copy.deepcopy(render_state)
+        target['fields'].append({'name': 'cost', 'type': 'number', 'value': 1})
+        target['type_information']['acl'] = {'activated': False}
+        target['object_information']['editor_id'] = 1
+        target['object_information']['active'] = 1
+
+        patched = RenderStateCodec.patch(render_state, RenderStateCodec.diff(render_state, target))
+
+        assert patched == target
+        assert list(patched['type_information']) == list(target['type_information'])
+        assert not isinstance(patched['object_information']['active'], bool)
+
+
+    def test_replaced_root(self, render_state: dict):
+        """
+        A state of another type replaces the complete base
+        """
+        assert RenderStateCodec.patch(render_state, RenderStateCodec.diff(render_state, [1, 2])) == [1, 2]
+
+
+    def test_patch_keeps_base(self, render_state: dict):
+        """
+        Patching does not modify the base
+        """
+        base = copy.deepcopy(render_state)
+        target = copy.deepcopy(render_state)
+        target['fields'][0]['value'] = 'changed'
+
+        RenderStateCodec.patch(render_state, RenderStateCodec.diff(render_state, target))
+
+        assert render_state == base
+
+
+class TestRenderStateEncoding:
+    """
+    Tests the choice between snapshots and deltas and the decoding of delta chains
+    """
+
+    def test_snapshot_without_base(self, render_state: dict):
+        """
+        A state without base is stored as snapshot
+        """
+        encoded = RenderStateCodec.encode(render_state)
+
+        assert encoded['render_encoding'] == RenderStateCodec.SNAPSHOT
+        assert encoded['render_base'] is None
+        assert encoded['render_depth'] == 0
+        assert RenderStateCodec.decompress(encoded['render_state']) == render_state
+
+
+    def test_delta_with_base(self, render_state: dict):
+        """
+        A small change is stored as delta to its base
+        """
+        target = copy.deepcopy(render_state)
+        target['summary_line'] = 'changed'
+
+        encoded = RenderStateCodec.encode(target, 7, render_state, 2)
+
+        assert encoded['render_encoding'] == RenderStateCodec.DELTA
+        assert encoded['render_base'] == 7
+        assert encoded['render_depth'] == 3
+        assert RenderStateCodec.patch(render_state, RenderStateCodec.decompress(encoded['render_state'])) == target
+
+
+    def test_snapshot_at_interval(self, render_state: dict):
+        """
+        The maximum delta chain length forces a snapshot
+        """
+        target = copy.deepcopy(render_state)
+        target['summary_line'] = 'changed'
+
+        encoded = RenderStateCodec.encode(target, 7, render_state, RenderStateCodec.SNAPSHOT_INTERVAL - 1)
+
+        assert encoded['render_encoding'] == RenderStateCodec.SNAPSHOT
+
+
+    def test_snapshot_if_delta_is_larger(self, render_state: dict):
+        """
+        A delta which is not smaller than the snapshot is stored as snapshot
+        """
+        encoded = RenderStateCodec.encode({'value': 2}, 7, render_state, 0)
+
+        assert encoded['render_encoding'] == RenderStateCodec.SNAPSHOT
+
+
+    def test_delta_chain(self, render_state: dict):
+        """
+        Every version of an object is restored from its chain and a snapshot is stored every SNAPSHOT_INTERVAL
+        """
+        logs = {}
+        states = {}
+        previous_id, previous_state, previous_depth = None, None, 0
+
+        for public_id in range(1, 2 * RenderStateCodec.SNAPSHOT_INTERVAL + 2):
+            state = copy.deepcopy(previous_state or render_state)
+            state['object_information']['version'] = f"1.0.{public_id}"
+            state['fields'][public_id % 20]['value'] = f"version {public_id}"
+
+            logs[public_id] = RenderStateCodec.encode(state, previous_id, previous_state, previous_depth)
+            states[public_id] = state
+            previous_id, previous_state, previous_depth = public_id, state, logs[public_id]['render_depth']
+
+        snapshots = [public_id for public_id, log in logs.items()
+                     if log['render_encoding'] == RenderStateCodec.SNAPSHOT]
+
+        assert snapshots == [1, RenderStateCodec.SNAPSHOT_INTERVAL + 1, 2 * RenderStateCodec.SNAPSHOT_INTERVAL + 1]
+
+        for public_id, state in states.items():
+            assert reconstruct(logs, public_id) == state
+
+
+    def test_to_raw(self, render_state: dict):
+        """
+        The raw format is the JSON of the state
+        """
+        assert RenderStateCodec.decompress(RenderStateCodec.compress(render_state)) == render_state
+        assert RenderStateCodec.to_raw({'a': [1, None]}) == b'{"a": [1, null]}'
@@ -0,0 +1,102 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+RequestProfiler - Tests
+"""
+import logging
+from pytest import fixture, mark
+
+from cmdb.framework.metrics.request_profiler import RequestProfiler
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+TOKEN = 'profiling-token'
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+@fixture(name="profile_directory")
+def fixture_profile_directory(request, tmp_path) -> None:
+    """
+    Activates the RequestProfiler with the TOKEN and an empty profile directory
+    """
+    RequestProfiler.configure({'active': True, 'token': TOKEN, 'directory': str(tmp_path),
+                               'trace_allocations': False})
+
+    request.addfinalizer(lambda: RequestProfiler.configure({}))
+
+
+@mark.usefixtures('profile_directory')
+class TestRequestProfilerToken:
+    """
+    Tests that only requests with the configured token are profiled
+    """
+
+    def test_matching_token(self):
+        """
+        A request with the configured token is profiled
+        """
+        assert RequestProfiler.is_requested(TOKEN)
+
+
+    def test_other_tokens(self):
+        """
+        Requests without or with another token are not profiled, also if the header has non-ASCII characters
+        """
+        for header_value in (None, '', 'profiling', f"{TOKEN} ", TOKEN.upper(), 'pröfiling-token'):
+            assert not RequestProfiler.is_requested(header_value), header_value
+
+
+    def test_inactive_profiler(self):
+        """
+        Nothing is profiled if the profiler is inactive or has no token, also not a request without token
+        """
+        RequestProfiler.configure({'active': False, 'token': TOKEN})
+        assert not RequestProfiler.is_requested(TOKEN)
+
+        RequestProfiler.configure({'active': True, 'token': ''})
+        assert not RequestProfiler.is_active()
+        assert not RequestProfiler.is_requested('')
+
+
+@mark.usefixtures('profile_directory')
+class TestRequestProfilerStorage:
+    """
+    Tests writing and reading profiles
+    """
+
+    def test_profile_round_trip(self):
+        """
+        A finished profile can be retrieved by its profile id and counts the recorded MongoDB commands
+        """
+        profile = RequestProfiler.start()
+        RequestProfiler.record_command('find', 'framework.objects', 0.002)
+        RequestProfiler.record_command('find', 'framework.objects', 0.003)
+        profile.finish({'method': 'GET', 'path': '/objects/', 'status': 200})
+
+        stored_profile = RequestProfiler.get_profile(profile.profile_id)
+
+        assert stored_profile['path'] == '/objects/'
+        assert stored_profile['database']['round_trips'] == 2
+        assert stored_profile['database']['commands'][0]['count'] == 2
+
+
+    def test_invalid_profile_id(self):
+        """
+        Profile ids which are no generated ids are rejected before the file system is accessed
+        """
+        assert RequestProfiler.get_profile('../../etc/passwd') is None
+        assert RequestProfiler.get_profile('unknown') is None
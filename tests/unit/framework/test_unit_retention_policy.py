@@ -0,0 +1,91 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+RetentionPolicy - Tests
+"""
+import logging
+
+from cmdb.framework.retention.retention_policy import RetentionPolicy
+from cmdb.framework.retention.retention_target import OBJECT_LOGS, WEBHOOK_EVENTS
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+class TestRetentionPolicyConfig:
+    """
+    Tests reading the retention policies from the [Retention] section
+    """
+
+    def test_without_section(self, configure):
+        """
+        Without [Retention] section all documents are kept
+        """
+        configure(RetentionPolicy)
+        policy = RetentionPolicy.from_config(OBJECT_LOGS)
+
+        assert policy.mode == RetentionPolicy.KEEP
+        assert not policy.is_active()
+
+
+    def test_configured_policies(self, configure):
+        """
+        The mode and the days of every target are read, the mode is case insensitive
+        """
+        configure(RetentionPolicy, object_logs='archive', object_logs_days=365, webhook_events='TTL', webhook_events_days=30)
+
+        object_logs_policy = RetentionPolicy.from_config(OBJECT_LOGS)
+        webhook_events_policy = RetentionPolicy.from_config(WEBHOOK_EVENTS)
+
+        assert (object_logs_policy.mode, object_logs_policy.days) == (RetentionPolicy.ARCHIVE, 365)
+        assert (webhook_events_policy.mode, webhook_events_policy.days) == (RetentionPolicy.TTL, 30)
+        assert object_logs_policy.target is OBJECT_LOGS
+        assert object_logs_policy.is_active()
+        assert webhook_events_policy.is_active()
+
+
+    def test_unconfigured_target(self, configure):
+        """
+        A target without option in the [Retention] section is kept
+        """
+        configure(RetentionPolicy, webhook_events='ttl', webhook_events_days='30')
+
+        assert RetentionPolicy.from_config(OBJECT_LOGS).mode == RetentionPolicy.KEEP
+
+
+    def test_invalid_policies(self, configure):
+        """
+        Unknown modes and deleting modes without a positive number of days fall back to keeping the documents
+        """
+        for options in ({'object_logs': 'shred', 'object_logs_days': '30'},
+                        {'object_logs': 'ttl'},
+                        {'object_logs': 'ttl', 'object_logs_days': '0'},
+                        {'object_logs': 'archive', 'object_logs_days': 'forever'}):
+            configure(RetentionPolicy, **options)
+            policy = RetentionPolicy.from_config(OBJECT_LOGS)
+
+            assert policy.mode == RetentionPolicy.KEEP, options
+            assert not policy.is_active()
+
+
+    def test_keep_policy(self, configure):
+        """
+        An explicit KEEP policy needs no days
+        """
+        configure(RetentionPolicy, object_logs='keep')
+
+        assert not RetentionPolicy.from_config(OBJECT_LOGS).is_active()
@@ -0,0 +1,208 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Slow aggregation recording and explain plan summaries - Tests
+"""
+import time
+import logging
+import threading
+from pytest import fixture
+
+from cmdb.database.slow_query_recorder import SlowQueryRecorder, summarize_explain
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+THRESHOLD_MS = 100
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+class BlockingDatabase:
+    """
+    Stand-in for a pymongo Database whose explain commands block until they are released
+    """
+
+    def __init__(self):
+        self.name = 'slow-query-test'
+        self.commands = []
+        self.entries = []
+        self.explain_started = threading.Event()
+        self.release = threading.Event()
+
+
+    def command(self, command: dict) -> dict:
+        """
+        Records the command and blocks until the database is released
+        """
+        self.commands.append(command)
+        self.explain_started.set()
+        self.release.wait(5)
+
+        return {}
+
+
+    def create_collection(self, *_args, **_kwargs) -> None:
+        """
+        Creating the capped collection always succeeds
+        """
+
+
+    def __getitem__(self, _collection: str):
+        return self
+
+
+    def insert_one(self, entry: dict) -> None:
+        """
+        Records the stored entry
+        """
+        self.entries.append(entry)
+
+
+@fixture(name="recorder")
+def fixture_recorder(request):
+    """
+    Activates the SlowQueryRecorder with a queue for a single aggregation, the defaults are restored after the test
+    """
+    SlowQueryRecorder.configure({
+        'active': True,
+        'threshold_ms': THRESHOLD_MS,
+        'cooldown': 0,
+        'queue_size': 1,
+        'explain_timeout_factor': 2.0,
+    })
+
+    request.addfinalizer(lambda: SlowQueryRecorder.configure({}))
+
+    return SlowQueryRecorder
+
+
+class TestSlowQueryRecorder:
+    """
+    Tests that the explain plans are retrieved by one worker with a bounded queue and a time limit
+    """
+
+    def test_bounded_explain_queue(self, recorder: SlowQueryRecorder):
+        """
+        While the worker explains one aggregation, one more is queued and all others are dropped. Every explain
+        is cancelled by MongoDB after the threshold times the explain_timeout_factor
+        """
+        database = BlockingDatabase()
+        pipeline = [{'$match': {'type_id': 1}}]
+
+        recorder.observe(database, 'first', pipeline, 1.0)
+        assert database.explain_started.wait(5)
+
+        for collection in ('second', 'third', 'fourth'):
+            recorder.observe(database, collection, pipeline, 1.0)
+
+        database.release.set()
+        deadline = time.monotonic() + 5
+
+        while len(database.entries) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert [entry['collection'] for entry in database.entries] == ['first', 'second']
+        assert [command['explain']['maxTimeMS'] for command in database.commands] == [2 * THRESHOLD_MS] * 2
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+class TestSummarizeExplain:
+    """
+    Tests the reduction of explain outputs of different shapes to the values relevant for index tuning
+    """
+
+    def test_pipeline_with_cursor_stage(self):
+        """
+        A pipeline whose first stages run in the query layer reports its plan inside the $cursor stage
+        """
+        explain = {
+            'stages': [
+                {'$cursor': {
+                    'queryPlanner': {'winningPlan': {
+                        'stage': 'FETCH',
+                        'inputStage': {'stage': 'IXSCAN', 'indexName': 'type_id_1'},
+                    }},
+                    'executionStats': {
+                        'nReturned': 10,
+                        'executionTimeMillis': 42,
+                        'totalKeysExamined': 10,
+                        'totalDocsExamined': 10,
+                        'executionStages': {'stage': 'FETCH', 'inputStage': {'stage': 'IXSCAN',
+                                                                             'indexName': 'type_id_1'}},
+                    },
+                }},
+                {'$lookup': {'from': 'framework.types'}},
+                {'$sort': {'public_id': 1}},
+            ],
+        }
+
+        assert summarize_explain(explain) == {
+            'pipeline_stages': ['$cursor', '$lookup', '$sort'],
+            'plan_stages': ['FETCH', 'IXSCAN'],
+            'indexes': ['type_id_1'],
+            'keys_examined': 10,
+            'docs_examined': 10,
+            'returned': 10,
+            'execution_time_ms': 42,
+        }
+
+
+    def test_pushed_down_pipeline(self):
+        """
+        A pipeline which was completely pushed down reports a collection scan in its top level execution stats
+        """
+        explain = {
+            'queryPlanner': {'winningPlan': {'queryPlan': {'stage': 'GROUP', 'inputStage': {'stage': 'COLLSCAN'}}}},
+            'executionStats': {
+                'nReturned': 3,
+                'executionTimeMillis': 900,
+                'totalKeysExamined': 0,
+                'totalDocsExamined': 50000,
+                'executionStages': {'stage': 'GROUP', 'inputStage': {'stage': 'COLLSCAN'}},
+            },
+        }
+
+        summary = summarize_explain(explain)
+
+        assert summary['pipeline_stages'] == []
+        assert summary['plan_stages'] == ['GROUP', 'COLLSCAN']
+        assert summary['indexes'] == []
+        assert (summary['docs_examined'], summary['returned'], summary['execution_time_ms']) == (50000, 3, 900)
+
+
+    def test_sharded_pipeline(self):
+        """
+        The examined documents of all shards are summed up, the execution time is the one of the slowest shard
+        """
+        explain = {
+            'shards': {
+                shard: {'executionStats': {'nReturned': 5, 'executionTimeMillis': time_ms, 'totalKeysExamined': 5,
+                                           'totalDocsExamined': 5}}
+                for shard, time_ms in (('shard-a', 120), ('shard-b', 80))
+            },
+        }
+
+        summary = summarize_explain(explain)
+
+        assert (summary['keys_examined'], summary['docs_examined'], summary['returned']) == (10, 10, 10)
+        assert summary['execution_time_ms'] == 120
+
+
+    def test_empty_explain(self):
+        """
+        An explain output without statistics is summarized with zeros
+        """
+        assert summarize_explain({})['execution_time_ms'] == 0
@@ -0,0 +1,150 @@
+# DATAGERRY - OpenSource Enterprise CMDB
+# Copyright (C) 2025 becon GmbH
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+Webhook event coalescing and batch payloads - Tests
+"""
+import logging
+from pytest import fixture
+
+from cmdb.database import MongoDatabaseManager
+from cmdb.manager import WebhooksManager
+
+from cmdb.models.webhook_model.cmdb_webhook_model import CmdbWebhook
+from cmdb.models.webhook_model.cmdb_webhook_delivery import CmdbWebhookDelivery
+from cmdb.models.webhook_model.webhook_event_type_enum import WebhookEventType
+# -------------------------------------------------------------------------------------------------------------------- #
+
+LOGGER = logging.getLogger(__name__)
+
+OBJECT_ID = 4711
+
+# -------------------------------------------------------------------------------------------------------------------- #
+
+def object_state(value: str) -> dict:
+    """
+    Builds the state of the example object with the given field value
+    """
+    return {'public_id': OBJECT_ID, 'fields': [{'name': 'dummy-field-1', 'value': value}]}
+
+
+def update_changes(old_value: str, new_value: str) -> dict:
+    """
+    Builds the changes of an update of the example object from one field value to another
+    """
+    return {
+        'old': [{'name': 'dummy-field-1', 'value': old_value}],
+        'new': [{'name': 'dummy-field-1', 'value': new_value}],
+    }
+
+
+@fixture(scope='module', name="webhooks_manager")
+def fixture_webhooks_manager(request, database_manager: MongoDatabaseManager, database_name: str):
+    """
+    Provides a WebhooksManager of the test database with one batching webhook, the webhooks and the outbox
+    are dropped after the tests
+    """
+    webhooks_manager = WebhooksManager(database_manager, database_name)
+
+    webhooks_manager.insert_webhook({
+        'public_id': 1,
+        'name': 'batching-webhook',
+        'url': 'http://localhost/webhook',
+        'event_types': [WebhookEventType.UPDATE],
+        'active': True,
+        'batch_size': 10,
+        'batch_window': 60,
+    })
+
+    def drop_collections():
+        database_manager.get_collection(CmdbWebhook.COLLECTION, database_name).drop()
+        database_manager.get_collection(CmdbWebhookDelivery.COLLECTION, database_name).drop()
+
+    request.addfinalizer(drop_collections)
+
+    return webhooks_manager
+
+
+@fixture(name="outbox")
+def fixture_outbox(database_manager: MongoDatabaseManager, database_name: str):
+    """
+    Provides the outbox collection, the deliveries are removed after each test
+    """
+    outbox = database_manager.get_collection(CmdbWebhookDelivery.COLLECTION, database_name)
+
+    yield outbox
+
+    outbox.delete_many({})
+
+
+class TestWebhookCoalescing:
+    """
+    Tests that updates of an object waiting in a batch are merged and batches are sent as one payload
+    """
+
+    def test_updates_are_coalesced(self, webhooks_manager: WebhooksManager, outbox):
+        """
+        A second update of an object is merged into its pending update, the merged event keeps the state before
+        the first update and the field changes are recalculated against the latest state
+        """
+        webhooks_manager.send_webhook_event(WebhookEventType.UPDATE, object_state('v1'), object_state('v2'),
+                                            update_changes('v1', 'v2'))
+        webhooks_manager.send_webhook_event(WebhookEventType.UPDATE, object_state('v2'), object_state('v3'),
+                                            update_changes('v2', 'v3'))
+
+        deliveries = list(outbox.find({'object_id': OBJECT_ID}))
+
+        assert len(deliveries) == 1
+
+        payload = deliveries[0]['payload']
+
+        assert payload['object_before'] == object_state('v1')
+        assert payload['object_after'] == object_state('v3')
+        assert payload['changes'] == update_changes('v1', 'v3')
+
+
+    def test_claimed_update_is_not_coalesced(self, webhooks_manager: WebhooksManager, outbox):
+        """
+        An update is queued as new event once the pending update was claimed for delivery
+        """
+        webhooks_manager.send_webhook_event(WebhookEventType.UPDATE, object_state('v1'), object_state('v2'),
+                                            update_changes('v1', 'v2'))
+
+        outbox.update_many({'object_id': OBJECT_ID}, {'$set': {'status': CmdbWebhookDelivery.STATUS_PROCESSING}})
+
+        webhooks_manager.send_webhook_event(WebhookEventType.UPDATE, object_state('v2'), object_state('v3'),
+                                            update_changes('v2', 'v3'))
+
+        pending = list(outbox.find({'object_id': OBJECT_ID, 'status': CmdbWebhookDelivery.STATUS_PENDING}))
+
+        assert outbox.count_documents({'object_id': OBJECT_ID}) == 2
+        assert len(pending) == 1
+        assert pending[0]['payload']['object_before'] == object_state('v2')
+
+
+    def test_build_batch_payload(self):
+        """
+        The payloads of a batch are sent as ordered list of events in one payload
+        """
+        events = [
+            {'operation': WebhookEventType.UPDATE, 'object_after': object_state('v1')},
+            {'operation': WebhookEventType.UPDATE, 'object_after': object_state('v2')},
+        ]
+
+        payload = WebhooksManager.build_batch_payload(events)
+
+        assert payload['operation'] == 'BATCH'
+        assert payload['events'] == events
+        assert payload['event_time'] is not None